@@ -246,58 +246,43 @@ class RealMolecularGenerator:
         try:
             seed_smiles = Chem.MolToSmiles(seed_mol)
             
-            # Create initial vQbit state for seed molecule
-            initial_property_scores = {
-                ChemistryPropertyType.BIOACTIVITY: target_properties.get('bioactivity', 0.5),
-                ChemistryPropertyType.SUSTAINABILITY: target_properties.get('sustainability', 0.5),
-                ChemistryPropertyType.REPRODUCIBILITY: target_properties.get('reproducibility', 0.5),
-                ChemistryPropertyType.EFFICIENCY: target_properties.get('efficiency', 0.5)
-            }
-            
-            seed_vqbit = self.quantum_engine.create_molecular_vqbit(initial_property_scores)
-            
-            # Generate variants and optimize using quantum feedback
+            # Generate structural variants first, then score them in one quantum batch
+            variants = []
             for i in range(num_variants):
                 try:
-                    # Generate a structural variant
                     variant_candidates = self._generate_structural_modifications(seed_mol, 1)
-                    if not variant_candidates:
-                        continue
-                    
-                    variant = variant_candidates[0]
-                    variant_smiles = variant['smiles']
-                    
-                    # Create vQbit state for variant
-                    variant_vqbit = self.quantum_engine.create_molecular_vqbit(initial_property_scores)
-                    
-                    # Measure quantum properties
-                    quantum_measurements = {}
-                    for prop_type in ChemistryPropertyType:
-                        measurement = self.quantum_engine.measure_property(variant_vqbit, prop_type)
-                        quantum_measurements[prop_type.name.lower()] = float(measurement)
-                    
-                    # Calculate quantum coherence and fidelity
-                    coherence = self.quantum_engine._calculate_l1_coherence(variant_vqbit.amplitudes)
-                    
-                    # Calculate quantum distance from seed (for novelty scoring)
-                    quantum_distance = np.linalg.norm(
-                        variant_vqbit.amplitudes.detach().numpy() - 
-                        seed_vqbit.amplitudes.detach().numpy()
-                    )
-                    
-                    variant.update({
-                        'generation_method': 'quantum_guided',
-                        'quantum_measurements': quantum_measurements,
-                        'quantum_coherence': float(coherence),
-                        'quantum_novelty': float(quantum_distance),
-                        'vqbit_state': variant_vqbit
-                    })
-                    
-                    candidates.append(variant)
-                
+                    if variant_candidates:
+                        variants.append(variant_candidates[0])
                 except Exception as e:
                     logger.debug(f"Quantum guidance failed for variant {i}: {e}")
                     continue
+            
+            if not variants:
+                return candidates
+            
+            # Row 0 is the seed molecule, rows 1..K are the variants
+            batch = self.quantum_engine.create_molecular_vqbit_batch(
+                [seed_smiles] + [variant['smiles'] for variant in variants]
+            )
+            
+            # Quantum distance from seed (for novelty scoring)
+            quantum_distances = np.linalg.norm(batch.amplitudes[1:] - batch.amplitudes[0], axis=1)
+            
+            for row, variant in enumerate(variants, start=1):
+                quantum_measurements = {
+                    prop_type.name.lower(): float(values[row])
+                    for prop_type, values in batch.property_scores.items()
+                }
+                
+                variant.update({
+                    'generation_method': 'quantum_guided',
+                    'quantum_measurements': quantum_measurements,
+                    'quantum_coherence': float(batch.coherence[row]),
+                    'quantum_novelty': float(quantum_distances[row - 1]),
+                    'vqbit_state': batch.state(row)
+                })
+                
+                candidates.append(variant)
         
         except Exception as e:
             logger.error(f"❌ Quantum-guided generation failed: {e}")
@@ -4,16 +4,46 @@ FoTChemistry Architect Agent - Claim Generation
 
 The Architect agent converts discovery signals into structured, testable claims
 with uncertainty quantification and virtue weighting according to FoT principles.
+
+make_claims scores a whole batch of signals at once into a columnar ClaimTable,
+so thousands of signals can be ranked by curiosity before any Claim objects
+are built for the few that are selected.
 """
 
 import logging
+import numbers
 import uuid
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+CLAIM_TYPES = ('molecular_property', 'reaction_performance', 'material_discovery', 'literature_validation')
+
+DEFAULT_VIRTUE_WEIGHTING = {
+    'Beneficence': 0.4,
+    'Prudence': 0.3,
+    'Honesty': 0.2,
+    'Temperance': 0.1
+}
+
+# Base computational cost of molecular property predictions
+PROPERTY_BASE_COSTS = {
+    'solubility': 10,
+    'permeability': 15,
+    'pKa': 20,
+    'activity': 25
+}
+
 
 @dataclass
 class Claim:
@@ -32,6 +62,91 @@ class Claim:
     created: datetime
 
 
+def curiosity_scores(uncertainty, virtue_weight, estimated_cost) -> np.ndarray:
+    """
+    Vectorized curiosity = (uncertainty * (0.5 + virtue_weight)) / cost.
+    
+    Same formula as AutonomousOrchestrator.calculate_curiosity_score, with
+    the cost floored at 0.1.
+    """
+    uncertainty = np.asarray(uncertainty, dtype=float)
+    virtue_weight = np.asarray(virtue_weight, dtype=float)
+    estimated_cost = np.maximum(np.asarray(estimated_cost, dtype=float), 0.1)
+    return uncertainty * (0.5 + virtue_weight) / estimated_cost
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, without sorting the rest."""
+    scores = np.asarray(scores)
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=int)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    # Order the k winners; stable so ties keep signal order
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+@dataclass
+class ClaimTable:
+    """
+    Columnar batch of scored claims, one row per signal that yields a claim.
+    
+    Rows refer back to their signal by position in the input batch
+    (signal_index). Full Claim records are only built for the rows selected
+    through ClaimFactory.build_claims.
+    """
+    signals: List[Dict[str, Any]]
+    campaign: Dict[str, Any]
+    signal_index: np.ndarray
+    claim_type: np.ndarray
+    uncertainty: np.ndarray
+    virtue_weight: np.ndarray
+    estimated_cost: np.ndarray
+    priority: np.ndarray
+    curiosity: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.signal_index)
+    
+    def top_k(self, k: int) -> np.ndarray:
+        """Row positions of the k most curious claims, best first."""
+        return top_k_indices(self.curiosity, k)
+    
+    def to_arrow(self):
+        """The score columns as a pyarrow Table."""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow not available. Install with: pip install pyarrow")
+        
+        return pa.table({
+            'signal_index': self.signal_index,
+            'signal_source': [self.signals[i].get('source_id', 'unknown') for i in self.signal_index],
+            'claim_type': self.claim_type.astype(str),
+            'uncertainty': self.uncertainty,
+            'virtue_weight': self.virtue_weight,
+            'estimated_cost': self.estimated_cost,
+            'priority': self.priority.astype(str),
+            'curiosity': self.curiosity
+        })
+
+
+def _signal_dict(signal: Any) -> Dict[str, Any]:
+    """Accept Scout Signal dataclasses as well as plain signal dicts."""
+    return signal if isinstance(signal, dict) else vars(signal)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real)
+
+
+# Content fields compared against thresholds in _calculate_virtue_weight
+VIRTUE_INPUTS = ('safety_score', 'toxicity_score', 'environmental_score', 'data_quality')
+
+# Per-signal scoring inputs gathered by make_claims
+CLAIM_INPUTS = ('molecular_weight', 'reactants', 'novelty_score', 'material_cost') + VIRTUE_INPUTS
+
+
 class ClaimFactory:
     """Factory for generating testable claims from discovery signals."""
     
@@ -57,6 +172,7 @@ class ClaimFactory:
             Structured claim ready for testing
         """
         try:
+            signal = _signal_dict(signal)
             signal_type = signal.get('signal_type', 'unknown')
             claim_type = self._infer_claim_type(signal, campaign)
             
@@ -81,6 +197,171 @@ class ClaimFactory:
             logger.error(f"❌ Claim generation failed: {e}")
             return None
     
+    def make_claims(self, signals: List[Any], campaign: Dict[str, Any]) -> ClaimTable:
+        """
+        Score a batch of signals as a columnar claim table.
+        
+        Produces the same uncertainty, virtue weight, cost and priority that
+        make_claim would give each signal, plus its curiosity score, computed
+        column-wise. Signals make_claim would reject (e.g. molecules without
+        SMILES) get no row.
+        
+        Args:
+            signals: Discovery signals (dicts or Scout Signal objects)
+            campaign: Campaign configuration
+            
+        Returns:
+            ClaimTable with one row per usable signal
+        """
+        usable, rows, types, inputs = [], [], [], []
+        
+        # One pass to pull the scalar inputs out of the signal dicts
+        for row, signal in enumerate(signals):
+            try:
+                signal = _signal_dict(signal)
+            except TypeError:
+                signal = {}
+            usable.append(signal)
+            
+            claim_type = self._infer_claim_type(signal, campaign)
+            values = self._claim_inputs(signal, claim_type)
+            if values is None:
+                logger.debug(f"Skipping signal {row}: no {claim_type} claim")
+                continue
+            rows.append(row)
+            types.append(claim_type)
+            inputs.append(values)
+        
+        signals = usable
+        columns = {field: [values[field] for values in inputs] for field in CLAIM_INPUTS}
+        molecular_weight, reactants, novelty, material_cost = (
+            columns[field] for field in ('molecular_weight', 'reactants', 'novelty_score', 'material_cost'))
+        safety, toxicity, environmental, data_quality = (columns[field] for field in VIRTUE_INPUTS)
+        
+        claim_type = np.array(types, dtype=object)
+        is_molecular, is_reaction, is_material, is_literature = (claim_type == t for t in CLAIM_TYPES)
+        
+        # Uncertainty and cost per claim type
+        property_complexity = np.minimum(np.array(molecular_weight) / 500, 1.0)
+        reaction_complexity = np.minimum(np.array(reactants) / 5, 1.0)
+        property_cost = PROPERTY_BASE_COSTS.get(self._molecular_property(campaign.get('objective', '')), 15)
+        
+        raw_uncertainty = np.select(
+            [is_molecular, is_reaction, is_material, is_literature],
+            [0.3 + 0.4 * property_complexity, 0.25 + 0.3 * reaction_complexity,
+             0.3 + 0.4 * np.array(novelty), 0.6]
+        )
+        estimated_cost = np.select(
+            [is_molecular, is_reaction, is_material, is_literature],
+            [property_cost * (1 + property_complexity), 30 * (1 + 2 * reaction_complexity),
+             np.array(material_cost), 50.0]
+        )
+        
+        # Virtue components, as in _calculate_virtue_weight
+        virtue_weights = campaign.get('virtue_weighting', DEFAULT_VIRTUE_WEIGHTING)
+        environmental = np.array(environmental) > 0.7
+        beneficence = np.clip(0.5 + 0.2 * environmental, 0, 1)
+        prudence = np.clip(0.5 + 0.3 * (np.array(safety) > 0.7) - 0.3 * (np.array(toxicity) > 0.7), 0, 1)
+        honesty = np.clip(0.5 + 0.3 * (np.array(data_quality) > 0.8), 0, 1)
+        temperance = np.clip(0.5 + 0.2 * environmental, 0, 1)
+        virtue_weight = np.where(
+            is_literature,
+            0.8,  # High virtue for reproducibility efforts
+            virtue_weights.get('Beneficence', 0.4) * beneficence +
+            virtue_weights.get('Prudence', 0.3) * prudence +
+            virtue_weights.get('Honesty', 0.2) * honesty +
+            virtue_weights.get('Temperance', 0.1) * temperance
+        )
+        
+        priority_score = virtue_weight * (1 - raw_uncertainty) / np.maximum(estimated_cost / 100, 0.1)
+        priority = np.where(is_literature | (priority_score > 2.0), 'high',
+                            np.where(priority_score > 1.0, 'medium', 'low')).astype(object)
+        
+        uncertainty = np.minimum(raw_uncertainty, 1.0)
+        
+        return ClaimTable(
+            signals=signals,
+            campaign=campaign,
+            signal_index=np.array(rows, dtype=int),
+            claim_type=claim_type,
+            uncertainty=uncertainty,
+            virtue_weight=virtue_weight.astype(float),
+            estimated_cost=estimated_cost.astype(float),
+            priority=priority,
+            curiosity=curiosity_scores(uncertainty, virtue_weight, estimated_cost)
+        )
+    
+    def _claim_inputs(self, signal: Dict[str, Any], claim_type: str) -> Optional[Dict[str, float]]:
+        """
+        Scalar scoring inputs of one signal, or None if make_claim would yield no claim.
+        
+        Mirrors the per-claim generators: molecules and reactions need their
+        SMILES, and the numeric fields they score must be numbers when present
+        (make_claim fails on e.g. molecular_weight None or 'n/a').
+        """
+        molecular, reaction, material, literature = CLAIM_TYPES
+        content = signal.get('content', {})
+        if not isinstance(content, dict):
+            return None
+        
+        values = {'molecular_weight': 300, 'reactants': 1, 'novelty_score': 0.5, 'material_cost': 0.0}
+        numeric = list(VIRTUE_INPUTS)
+        
+        if claim_type == molecular:
+            if not content.get('smiles'):
+                return None
+            numeric.append('molecular_weight')
+        elif claim_type == reaction:
+            reaction_smiles = content.get('reaction_smiles', '')
+            if not reaction_smiles or not isinstance(reaction_smiles, str):
+                return None
+            values['reactants'] = reaction_smiles.count('.') + 1
+        elif claim_type == material:
+            composition = content.get('composition', 'unknown')
+            if not isinstance(composition, str):
+                return None
+            values['material_cost'] = self._estimate_material_cost(composition)
+            numeric.append('novelty_score')
+        else:
+            # Literature claims score constants and only read the title
+            numeric = []
+            if not isinstance(content.get('title', 'Unknown paper'), str):
+                return None
+        
+        for field in numeric:
+            value = content.get(field, values.get(field, 0))
+            if not _is_number(value):
+                return None
+            values[field] = float(value)
+        
+        return {field: values.get(field, 0.0) for field in CLAIM_INPUTS}
+    
+    def build_claims(self, table: ClaimTable, rows: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """
+        Build full claim records for selected table rows (all rows by default).
+        
+        Returns claim dicts in row order, each carrying its curiosity score.
+        """
+        rows = range(len(table)) if rows is None else rows
+        claims = []
+        for row in rows:
+            claim = self.make_claim(table.signals[table.signal_index[row]], table.campaign)
+            if claim:
+                claim = asdict(claim)
+                claim['curiosity'] = float(table.curiosity[row])
+                claims.append(claim)
+        return claims
+    
+    def _molecular_property(self, objective: str) -> str:
+        """Property a molecular claim predicts for a campaign objective."""
+        if 'solubility' in objective:
+            return 'solubility'
+        elif 'permeability' in objective:
+            return 'permeability'
+        elif 'pka' in objective.lower():
+            return 'pKa'
+        return 'activity'
+    
     def _infer_claim_type(self, signal: Dict[str, Any], campaign: Dict[str, Any]) -> str:
         """Infer the type of claim to generate based on signal and campaign."""
         signal_type = signal.get('signal_type', '')
@@ -112,21 +393,17 @@ class ClaimFactory:
             return None
         
         # Determine property to predict based on campaign
-        objective = campaign.get('objective', '')
-        if 'solubility' in objective:
-            property_name = 'solubility'
+        property_name = self._molecular_property(campaign.get('objective', ''))
+        if property_name == 'solubility':
             property_unit = 'mg/mL'
             testable_prediction = f"Molecule {molecule_id} has aqueous solubility >1 mg/mL"
-        elif 'permeability' in objective:
-            property_name = 'permeability'
+        elif property_name == 'permeability':
             property_unit = 'cm/s'
             testable_prediction = f"Molecule {molecule_id} has membrane permeability >1e-6 cm/s"
-        elif 'pka' in objective.lower():
-            property_name = 'pKa'
+        elif property_name == 'pKa':
             property_unit = 'pH units'
             testable_prediction = f"Molecule {molecule_id} has pKa between 6-8"
         else:
-            property_name = 'activity'
             property_unit = 'relative'
             testable_prediction = f"Molecule {molecule_id} shows target activity >50%"
         
@@ -337,12 +614,7 @@ class ClaimFactory:
     
     def _calculate_virtue_weight(self, content: Dict[str, Any], campaign: Dict[str, Any]) -> float:
         """Calculate FoT virtue weight for a claim."""
-        virtue_weights = campaign.get('virtue_weighting', {
-            'Beneficence': 0.4,
-            'Prudence': 0.3,
-            'Honesty': 0.2,
-            'Temperance': 0.1
-        })
+        virtue_weights = campaign.get('virtue_weighting', DEFAULT_VIRTUE_WEIGHTING)
         
         # Estimate virtue components based on content
         beneficence = 0.5  # Default neutral
@@ -395,14 +667,7 @@ class ClaimFactory:
     
     def _estimate_property_cost(self, property_name: str, complexity: float) -> float:
         """Estimate computational cost for property prediction."""
-        base_costs = {
-            'solubility': 10,
-            'permeability': 15,
-            'pKa': 20,
-            'activity': 25
-        }
-        
-        base_cost = base_costs.get(property_name, 15)
+        base_cost = PROPERTY_BASE_COSTS.get(property_name, 15)
         complexity_multiplier = 1 + complexity
         
         return base_cost * complexity_multiplier
@@ -3,18 +3,56 @@
 Physicist Agent - Measurement Module
 
 Handles computational measurements and property prediction.
+
+Measurements run in worker processes, at most ``parallel`` at a time, so the
+measure step scales with cores. Each worker reports back over its own pipe;
+a task that overruns its timeout, or is still running when the deadline hits
+or the queue is cancelled, has its process terminated.
 """
 
+import logging
+import multiprocessing
 import random
+import threading
 import time
-from typing import Dict, List, Any
+from multiprocessing.connection import wait
+from typing import Dict, List, Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long the supervisor sleeps before re-checking
+# cancellation, so cancel() from another thread is honoured promptly
+CANCEL_POLL_SECONDS = 0.2
+
+
+def _measurement_worker(conn, measure_fn: Callable, task: Dict[str, Any]):
+    """Run one measurement in a worker process and send back the outcome"""
+    # Forked workers inherit the parent's RNG state; reseed so simulated
+    # measurements differ between tasks
+    random.seed()
+    try:
+        conn.send(('success', measure_fn(task), None))
+    except BaseException as e:
+        # Exceptions may not pickle; report them as text
+        conn.send(('failed', None, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
 
 class MeasureQueue:
     """Queue for measurement tasks"""
     
-    def __init__(self, parallel: int = 4):
+    def __init__(self, parallel: int = 4, measure_fn: Optional[Callable] = None):
+        """
+        Args:
+            parallel: Number of measurement worker processes run at once
+            measure_fn: Picklable function measuring one task dict; defaults
+                        to the simulated oracle measurement
+        """
         self.queue = []
-        self.parallel = parallel  # Number of parallel measurement workers
+        self.parallel = max(1, parallel)  # Number of parallel measurement workers
+        self.measure_fn = measure_fn or simulate_measurement
+        self._cancelled = threading.Event()
         
     def add_measurement(self, candidate: Dict[str, Any], oracles: List[str]) -> str:
         """Add measurement task to queue"""
@@ -27,52 +65,165 @@ class MeasureQueue:
         })
         return task_id
         
-    def process_measurements(self) -> List[Dict[str, Any]]:
+    def process_measurements(self, timeout: float = 600) -> List[Dict[str, Any]]:
         """Process all pending measurements"""
+        pending = [task for task in self.queue if task['status'] == 'pending']
         results = []
         
-        for task in self.queue:
-            if task['status'] == 'pending':
-                result = self._simulate_measurement(task)
-                results.append(result)
-                task['status'] = 'completed'
+        for outcome in self.iter_results(pending, timeout=timeout):
+            task = pending[outcome['index']]
+            task['status'] = 'completed' if outcome['success'] else outcome['status']
+            if outcome['success']:
+                results.append(outcome['measurement_result'])
                 
         return results
         
-    def _simulate_measurement(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate computational measurement"""
-        candidate = task['candidate']
-        oracles = task['oracles']
+    def cancel(self):
+        """Stop the running batch: running measurements are terminated, pending ones skipped"""
+        self._cancelled.set()
         
-        # Simulate different types of measurements
-        metrics = {}
+    def execute_tasks(self, tasks: List[Dict[str, Any]], timeout: float = 600,
+                      deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Run measurement tasks over the worker pool.
         
-        for oracle in oracles:
-            if 'adsorption' in oracle:
-                metrics['residual_pfas_ngL'] = random.uniform(5, 50)
-            elif 'hydrophobicity' in oracle:
-                metrics['logP'] = random.uniform(-2, 5)
-            elif 'DFT' in oracle:
-                metrics['FE_CO'] = random.uniform(0.3, 0.95)
-            elif 'stability' in oracle:
-                metrics['stability_h'] = random.uniform(0.5, 10)
-                
-        # Add some uncertainty
-        uncertainty = random.uniform(0.1, 0.3)
+        Args:
+            tasks: Task dicts ('candidate', optional 'oracles', 'claim', 'id', ...)
+            timeout: Per-task limit in seconds, counted from the task's start
+            deadline: Absolute time.time() after which remaining tasks are cancelled
+            
+        Returns:
+            One result per task, in completion order (see iter_results)
+        """
+        return list(self.iter_results(tasks, timeout=timeout, deadline=deadline))
         
-        # Simulate virtue vector (beneficence, prudence, honesty, temperance)
-        virtue_vector = [
-            random.uniform(0.6, 0.9),  # beneficence
-            random.uniform(0.5, 0.8),  # prudence  
-            random.uniform(0.7, 0.9),  # honesty
-            random.uniform(0.6, 0.8)   # temperance
-        ]
+    def iter_results(self, tasks: List[Dict[str, Any]], timeout: float = 600,
+                     deadline: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield measurement results as tasks finish.
         
-        return {
-            'task_id': task['id'],
-            'candidate': candidate,
-            'metrics': metrics,
-            'uncertainty': uncertainty,
-            'virtue_vector': virtue_vector,
-            'agent_type': 'physicist'
-        }
+        Each result carries the task's 'claim', 'candidate' and 'index', a
+        'status' of 'success', 'failed', 'timeout' or 'cancelled', the boolean
+        'success', the 'measurement_result' (None unless successful), an
+        'error' message and the task's 'elapsed_seconds'.
+        """
+        self._cancelled.clear()
+        context = multiprocessing.get_context()
+        pending = list(enumerate(tasks))
+        pending.reverse()
+        running = {}  # reader connection -> (index, task, process, started)
+        
+        def outcome(index, task, status, measurement=None, error=None, started=None):
+            return {
+                'index': index,
+                'task_id': task.get('id', f"task_{index}"),
+                'claim': task.get('claim'),
+                'candidate': task.get('candidate'),
+                'campaign': task.get('campaign'),
+                'status': status,
+                'success': status == 'success',
+                'measurement_result': measurement,
+                'error': error,
+                'elapsed_seconds': time.time() - started if started else 0.0
+            }
+        
+        def stop(conn):
+            index, task, process, started = running.pop(conn)
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            conn.close()
+            return index, task, started
+        
+        try:
+            while pending or running:
+                now = time.time()
+                if self._cancelled.is_set() or (deadline is not None and now >= deadline):
+                    reason = 'measurement queue cancelled' if self._cancelled.is_set() else 'deadline reached'
+                    logger.warning(f"⏰ {reason}: cancelling {len(running) + len(pending)} measurements")
+                    for conn in list(running):
+                        index, task, started = stop(conn)
+                        yield outcome(index, task, 'cancelled', error=reason, started=started)
+                    while pending:
+                        index, task = pending.pop()
+                        yield outcome(index, task, 'cancelled', error=reason)
+                    break
+                
+                # Keep at most `parallel` workers busy; a task's clock starts
+                # when its process does, not when the batch was submitted
+                while pending and len(running) < self.parallel:
+                    index, task = pending.pop()
+                    reader, writer = context.Pipe(duplex=False)
+                    process = context.Process(target=_measurement_worker,
+                                              args=(writer, self.measure_fn, task), daemon=True)
+                    process.start()
+                    writer.close()
+                    running[reader] = (index, task, process, time.time())
+                
+                now = time.time()
+                wake = min(started + timeout for _, _, _, started in running.values())
+                if deadline is not None:
+                    wake = min(wake, deadline)
+                ready = wait(list(running), timeout=min(max(wake - now, 0), CANCEL_POLL_SECONDS))
+                
+                for conn in ready:
+                    try:
+                        status, measurement, error = conn.recv()
+                    except EOFError:
+                        status, measurement, error = 'failed', None, 'worker exited without a result'
+                    index, task, started = stop(conn)
+                    yield outcome(index, task, status, measurement, error, started)
+                
+                now = time.time()
+                for conn, (index, task, process, started) in list(running.items()):
+                    if now - started >= timeout:
+                        stop(conn)
+                        logger.warning(f"⏱️ Measurement {task.get('id', index)} exceeded {timeout}s")
+                        yield outcome(index, task, 'timeout', error=f"exceeded {timeout}s", started=started)
+        finally:
+            # A consumer that stops iterating early must not leak workers
+            for conn in list(running):
+                stop(conn)
+        
+    def _simulate_measurement(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Simulate computational measurement"""
+        return simulate_measurement(task)
+
+
+def simulate_measurement(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate computational measurement"""
+    candidate = task['candidate']
+    oracles = task.get('oracles', [])
+    
+    # Simulate different types of measurements
+    metrics = {}
+    
+    for oracle in oracles:
+        if 'adsorption' in oracle:
+            metrics['residual_pfas_ngL'] = random.uniform(5, 50)
+        elif 'hydrophobicity' in oracle:
+            metrics['logP'] = random.uniform(-2, 5)
+        elif 'DFT' in oracle:
+            metrics['FE_CO'] = random.uniform(0.3, 0.95)
+        elif 'stability' in oracle:
+            metrics['stability_h'] = random.uniform(0.5, 10)
+            
+    # Add some uncertainty
+    uncertainty = random.uniform(0.1, 0.3)
+    
+    # Simulate virtue vector (beneficence, prudence, honesty, temperance)
+    virtue_vector = [
+        random.uniform(0.6, 0.9),  # beneficence
+        random.uniform(0.5, 0.8),  # prudence  
+        random.uniform(0.7, 0.9),  # honesty
+        random.uniform(0.6, 0.8)   # temperance
+    ]
+    
+    return {
+        'task_id': task.get('id'),
+        'candidate': candidate,
+        'metrics': metrics,
+        'uncertainty': uncertainty,
+        'virtue_vector': virtue_vector,
+        'agent_type': 'physicist'
+    }
@@ -9,18 +9,49 @@ The Scout agent continuously monitors data streams for discovery signals:
 - Experimental databases (ORD, ChEMBL, Materials Project)
 
 Signals are prioritized by potential scientific impact and FoT virtue alignment.
+
+SourceRegistry polls all monitors concurrently, each under its own timeout,
+and keeps a persistent state store so that polling intervals, HTTP cache
+validators (ETag / Last-Modified) and per-source watermarks survive restarts.
+Signals already seen in earlier cycles are dropped by content hash.
 """
 
+import asyncio
+import fnmatch
+import hashlib
+import os
+import tempfile
+import threading
 import time
 import logging
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import requests
 import json
 
 logger = logging.getLogger(__name__)
 
+# Public endpoints; override per source with an 'endpoints' mapping in the config
+DEFAULT_ENDPOINTS = {
+    'pubmed': "https://eutils.ncbi.nlm.nih.gov/entrez/eutils",
+    'arxiv': "http://export.arxiv.org/api/query",
+    'chemrxiv': "https://chemrxiv.org/engage/chemrxiv/public-api/v1/items",
+    'zenodo': "https://zenodo.org/api/records"
+}
+
+# Named schedules accepted by 'update_frequency' in campaign configs
+UPDATE_FREQUENCIES = {
+    'hourly': 3600,
+    'daily': 86400,
+    'weekly': 604800
+}
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
 
 @dataclass
 class Signal:
@@ -35,21 +66,182 @@ class Signal:
     priority: str  # "high", "medium", "low"
 
 
+def signal_hash(signal: Signal) -> str:
+    """Content hash of a signal, stable across polls and restarts."""
+    payload = json.dumps([signal.source_type, signal.signal_type, signal.content],
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def source_key(config: Dict[str, Any]) -> str:
+    """Stable identity of a source config, used to key its persisted state."""
+    if config.get('name'):
+        return str(config['name'])
+    digest = hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return f"{config.get('type', 'source')}:{digest[:12]}"
+
+
+def polling_interval(config: Dict[str, Any]) -> float:
+    """Seconds between polls declared by a source config (0 = every cycle)."""
+    if 'polling_interval' in config:
+        return float(config['polling_interval'])
+    return float(UPDATE_FREQUENCIES.get(config.get('update_frequency'), 0))
+
+
+class SourceStateStore:
+    """
+    Persistent per-source scout state.
+    
+    Holds each source's last successful poll time, HTTP cache validators and
+    watermarks, plus a bounded set of signal content hashes for cross-cycle
+    deduplication. State is written atomically to a JSON file; with path=None
+    it lives in memory only.
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_hashes: int = 50000):
+        self.path = Path(path) if path else None
+        self.max_hashes = max_hashes
+        self._lock = threading.Lock()
+        # Serialises save(): snapshots are written and installed in the order they were taken
+        self._save_lock = threading.Lock()
+        self.sources = {}
+        self.seen = {}  # content hash -> first seen (epoch); insertion ordered
+        
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                self.sources = data.get('sources', {})
+                self.seen = data.get('seen', {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Could not read scout state {self.path}: {e}")
+    
+    def get(self, key: str) -> Dict[str, Any]:
+        """Copy of a source's state; pollers work on the copy and hand it back via update()."""
+        with self._lock:
+            return json.loads(json.dumps(self.sources.get(key, {})))
+    
+    def update(self, key: str, state: Dict[str, Any]):
+        with self._lock:
+            self.sources[key] = state
+    
+    def is_due(self, key: str, interval: float, now: Optional[float] = None) -> bool:
+        """Whether a source's polling interval has elapsed since its last successful poll."""
+        now = time.time() if now is None else now
+        with self._lock:
+            last_poll = self.sources.get(key, {}).get('last_poll')
+        return last_poll is None or now - last_poll >= interval
+    
+    def filter_new(self, signals: List[Signal]) -> List[Signal]:
+        """Drop signals whose content was seen before (in this or an earlier cycle) and remember the rest."""
+        fresh = []
+        now = time.time()
+        with self._lock:
+            for signal in signals:
+                digest = signal_hash(signal)
+                if digest in self.seen:
+                    continue
+                self.seen[digest] = now
+                fresh.append(signal)
+            
+            # Forget the oldest hashes beyond the cap
+            excess = len(self.seen) - self.max_hashes
+            if excess > 0:
+                for digest in list(self.seen)[:excess]:
+                    del self.seen[digest]
+        return fresh
+    
+    def save(self):
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                payload = json.dumps({'sources': self.sources, 'seen': self.seen}, default=str)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temporary file per save, so concurrent pollers never share one
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name + '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+
 class SourceMonitor:
     """Base class for monitoring different data sources."""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.last_poll = None
+        self.last_error = None  # Set by poll() when it fails, so the registry discards the poll's state
+        self.state = {}  # Persisted by SourceRegistry between polls
+        self.staged_validators = {}  # Validators of responses from the current poll, see commit_validators()
+        self.request_timeout = config.get('request_timeout', 10)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'FoTChemistry-Scout/1.0 (autonomous discovery agent)'
         })
     
     def poll(self) -> List[Signal]:
-        """Poll the source for new signals."""
+        """Poll the source for new signals; failures are logged and recorded in last_error."""
         raise NotImplementedError
     
+    def endpoint(self, name: str) -> str:
+        """Base URL of a remote API, honouring per-source overrides."""
+        return self.config.get('endpoints', {}).get(name, DEFAULT_ENDPOINTS[name])
+    
+    def fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[requests.Response]:
+        """
+        Conditional GET: replays the stored ETag / Last-Modified for this URL.
+        
+        Returns None when the server answers 304 Not Modified. The response's
+        own validators are only staged: commit_validators() stores them once
+        the response has been processed, so a body that fails to parse is
+        fetched in full again rather than answered with a 304.
+        """
+        request_url = requests.Request('GET', url, params=params).prepare().url
+        cached = self.state.get('validators', {}).get(request_url, {})
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.session.get(request_url, headers=headers, timeout=self.request_timeout)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        
+        fresh = {}
+        if response.headers.get('ETag'):
+            fresh['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            fresh['last_modified'] = response.headers['Last-Modified']
+        if fresh:
+            self.staged_validators[request_url] = fresh
+        return response
+    
+    def commit_validators(self):
+        """Store the validators staged by fetch() once their responses have been processed."""
+        self.state.setdefault('validators', {}).update(self.staged_validators)
+        self.staged_validators = {}
+    
+    def newer_than_watermark(self, name: str, items: List[Dict[str, Any]], field: str) -> List[Dict[str, Any]]:
+        """
+        Keep items stamped at or after the stored watermark and advance it.
+        
+        Items sharing the watermark's timestamp are let through again; the
+        registry's content-hash dedupe drops the ones already signalled.
+        """
+        watermarks = self.state.setdefault('watermarks', {})
+        watermark = watermarks.get(name)
+        fresh = [item for item in items if item.get(field) and (watermark is None or str(item[field]) >= watermark)]
+        if fresh:
+            watermarks[name] = max(str(item[field]) for item in fresh)
+        return fresh
+    
     def calculate_relevance(self, item: Dict[str, Any]) -> float:
         """Calculate relevance score for an item."""
         # Default implementation - override in subclasses
@@ -67,69 +259,73 @@ class SourceMonitor:
 
 
 class KnowledgeGraphDeltaMonitor(SourceMonitor):
-    """Monitor the FoT Knowledge Graph for new discoveries and updates."""
+    """
+    Monitor the FoT Knowledge Graph for new discoveries and updates.
+    
+    Works as a change feed: for each entity type the monitor keeps a
+    high-water mark, the (created, id) of the last row it emitted, in its
+    persisted state, and each poll pages through only the rows beyond it.
+    """
+    
+    # entity -> (signal_type, priority)
+    FEEDS = {
+        'molecule': ("new_molecule", "medium"),
+        'reaction': ("new_reaction", "medium"),
+        'measurement': ("new_measurement", "high")  # Measurements are high priority
+    }
+    
+    def __init__(self, config: Dict[str, Any], akg=None):
+        super().__init__(config)
+        self._akg = akg
+    
+    @property
+    def akg(self):
+        """AKG client, connected on first use and reused across polls."""
+        if self._akg is None:
+            from akg.client import AKG
+            self._akg = AKG(self.config.get('akg'))
+        return self._akg
     
     def poll(self) -> List[Signal]:
-        """Check for new nodes and relationships in the knowledge graph."""
+        """Emit the nodes created since the stored high-water marks."""
         signals = []
+        page_size = self.config.get('page_size', 100)
+        max_pages = self.config.get('max_pages_per_poll', 10)
+        watermarks = self.state.setdefault('watermarks', {})
         
         try:
-            # Query for new discoveries since last poll
-            from akg.client import AKG
-            akg = AKG()
-            
-            cutoff_time = self.last_poll or (datetime.now() - timedelta(hours=1))
-            
-            # Check for new molecules
-            new_molecules = akg.query_new_molecules(since=cutoff_time)
-            for mol in new_molecules:
-                signal = Signal(
-                    source_type="knowledge_graph",
-                    source_id=f"molecule_{mol['id']}",
-                    signal_type="new_molecule",
-                    content=mol,
-                    timestamp=datetime.now(),
-                    relevance_score=self.calculate_relevance(mol),
-                    virtue_indicators=self.extract_virtue_indicators(mol),
-                    priority="medium"
-                )
-                signals.append(signal)
-            
-            # Check for new reactions
-            new_reactions = akg.query_new_reactions(since=cutoff_time)
-            for rxn in new_reactions:
-                signal = Signal(
-                    source_type="knowledge_graph",
-                    source_id=f"reaction_{rxn['id']}",
-                    signal_type="new_reaction",
-                    content=rxn,
-                    timestamp=datetime.now(),
-                    relevance_score=self.calculate_relevance(rxn),
-                    virtue_indicators=self.extract_virtue_indicators(rxn),
-                    priority="medium"
-                )
-                signals.append(signal)
-            
-            # Check for new measurements
-            new_measurements = akg.query_new_measurements(since=cutoff_time)
-            for meas in new_measurements:
-                signal = Signal(
-                    source_type="knowledge_graph",
-                    source_id=f"measurement_{meas['id']}",
-                    signal_type="new_measurement",
-                    content=meas,
-                    timestamp=datetime.now(),
-                    relevance_score=self.calculate_relevance(meas),
-                    virtue_indicators=self.extract_virtue_indicators(meas),
-                    priority="high"  # Measurements are high priority
-                )
-                signals.append(signal)
+            for entity, (signal_type, priority) in self.FEEDS.items():
+                # A fresh feed starts from the recent past instead of replaying the whole graph
+                cursor = watermarks.get(entity) or {
+                    'created': (datetime.now(timezone.utc) -
+                                timedelta(hours=self.config.get('initial_lookback_hours', 1))).isoformat(),
+                    'id': ''
+                }
+                
+                for pages, page in enumerate(self.akg.iter_changes(entity, after=cursor, page_size=page_size), 1):
+                    for row in page:
+                        signals.append(Signal(
+                            source_type="knowledge_graph",
+                            source_id=f"{entity}_{row['id']}",
+                            signal_type=signal_type,
+                            content=row,
+                            timestamp=datetime.now(),
+                            relevance_score=self.calculate_relevance(row),
+                            virtue_indicators=self.extract_virtue_indicators(row),
+                            priority=priority
+                        ))
+                    # Advance past the page just emitted; the registry keeps it only if the poll succeeds
+                    watermarks[entity] = {'created': str(page[-1]['created']), 'id': str(page[-1]['id'])}
+                    if pages >= max_pages:
+                        logger.info(f"🔍 KG Delta Monitor: {entity} backlog continues next poll")
+                        break
             
             self.last_poll = datetime.now()
             logger.info(f"🔍 KG Delta Monitor: Found {len(signals)} new signals")
             
         except Exception as e:
             logger.warning(f"⚠️ KG Delta Monitor failed: {e}")
+            self.last_error = e
         
         return signals
 
@@ -137,6 +333,16 @@ class KnowledgeGraphDeltaMonitor(SourceMonitor):
 class LiteratureStreamMonitor(SourceMonitor):
     """Monitor literature sources for relevant publications."""
     
+    def calculate_relevance(self, item: Dict[str, Any]) -> float:
+        """Score papers by how many campaign keywords appear in title and abstract."""
+        keywords = self.config.get('keywords', [])
+        if not keywords:
+            return super().calculate_relevance(item)
+        
+        text = f"{item.get('title', '')} {item.get('abstract', '')}".lower()
+        matched = sum(1 for keyword in keywords if keyword.lower() in text)
+        return 0.6 + 0.4 * min(matched, 2) / 2
+    
     def poll(self) -> List[Signal]:
         """Check for new literature relevant to discovery campaigns."""
         signals = []
@@ -176,25 +382,89 @@ class LiteratureStreamMonitor(SourceMonitor):
             
         except Exception as e:
             logger.warning(f"⚠️ Literature Monitor failed: {e}")
+            self.last_error = e
         
         return signals
     
     def _poll_pubmed(self, keywords: List[str]) -> List[Dict[str, Any]]:
-        """Poll PubMed for recent papers."""
-        # Placeholder implementation
-        # In real implementation, would use NCBI E-utilities API
-        return []
+        """Poll PubMed for recent papers through NCBI E-utilities."""
+        base = self.endpoint('pubmed')
+        response = self.fetch(f"{base}/esearch.fcgi", {
+            'db': 'pubmed',
+            'term': " OR ".join(f"({keyword})" for keyword in keywords),
+            'retmode': 'json',
+            'retmax': self.config.get('max_results', 50),
+            'sort': 'pub_date',
+            'datetype': 'edat',
+            'reldate': self.config.get('lookback_days', 7)
+        })
+        if response is None:
+            return []
+        
+        ids = response.json().get('esearchresult', {}).get('idlist', [])
+        if not ids:
+            return []
+        
+        summary = self.fetch(f"{base}/esummary.fcgi", {'db': 'pubmed', 'id': ",".join(ids), 'retmode': 'json'})
+        if summary is None:
+            return []
+        
+        result = summary.json().get('result', {})
+        return [
+            {
+                'id': uid,
+                'title': result[uid].get('title', ''),
+                'journal': result[uid].get('fulljournalname') or result[uid].get('source'),
+                'published': result[uid].get('sortpubdate') or result[uid].get('pubdate'),
+                'url': f"https://pubmed.ncbi.nlm.nih.gov/{uid}/"
+            }
+            for uid in result.get('uids', ids) if uid in result
+        ]
     
     def _poll_arxiv(self, keywords: List[str]) -> List[Dict[str, Any]]:
-        """Poll arXiv for recent papers."""
-        # Placeholder implementation
-        # In real implementation, would use arXiv API
-        return []
+        """Poll arXiv for recent papers through its Atom API."""
+        response = self.fetch(self.endpoint('arxiv'), {
+            'search_query': " OR ".join(f'all:"{keyword}"' for keyword in keywords),
+            'sortBy': 'submittedDate',
+            'sortOrder': 'descending',
+            'max_results': self.config.get('max_results', 50)
+        })
+        if response is None:
+            return []
+        
+        papers = []
+        for entry in ET.fromstring(response.content).iter(f"{ATOM}entry"):
+            papers.append({
+                'id': entry.findtext(f"{ATOM}id", '').rsplit('/', 1)[-1],
+                'title': " ".join(entry.findtext(f"{ATOM}title", '').split()),
+                'abstract': " ".join(entry.findtext(f"{ATOM}summary", '').split()),
+                'published': entry.findtext(f"{ATOM}published"),
+                'url': entry.findtext(f"{ATOM}id")
+            })
+        return self.newer_than_watermark('arxiv', papers, 'published')
     
     def _poll_chemrxiv(self, keywords: List[str]) -> List[Dict[str, Any]]:
-        """Poll ChemRxiv for recent preprints."""
-        # Placeholder implementation
-        return []
+        """Poll ChemRxiv for recent preprints through its public API."""
+        papers = []
+        for keyword in keywords:
+            response = self.fetch(self.endpoint('chemrxiv'), {
+                'term': keyword,
+                'sort': 'PUBLISHED_DATE_DESC',
+                'limit': self.config.get('max_results', 50)
+            })
+            if response is None:
+                continue
+            
+            for hit in response.json().get('itemHits', []):
+                item = hit.get('item', {})
+                papers.append({
+                    'id': item.get('id'),
+                    'title': item.get('title', ''),
+                    'abstract': item.get('abstract', ''),
+                    'published': item.get('publishedDate'),
+                    'doi': item.get('doi')
+                })
+        return self.newer_than_watermark('chemrxiv', papers, 'published')
 
 
 class DatasetWatchMonitor(SourceMonitor):
@@ -236,13 +506,33 @@ class DatasetWatchMonitor(SourceMonitor):
             
         except Exception as e:
             logger.warning(f"⚠️ Dataset Monitor failed: {e}")
+            self.last_error = e
         
         return signals
     
     def _poll_zenodo(self, uri: str, patterns: List[str]) -> List[Dict[str, Any]]:
-        """Poll Zenodo for new datasets."""
-        # Placeholder implementation
-        return []
+        """Poll Zenodo for new records carrying files that match the patterns."""
+        response = self.fetch(self.endpoint('zenodo'), {
+            'q': uri[len('zenodo://'):].replace('-', ' '),
+            'sort': 'mostrecent',
+            'size': self.config.get('max_results', 50)
+        })
+        if response is None:
+            return []
+        
+        datasets = []
+        for record in response.json().get('hits', {}).get('hits', []):
+            files = [f['key'] for f in record.get('files', [])
+                     if any(fnmatch.fnmatch(f.get('key', ''), pattern) for pattern in patterns)]
+            if files:
+                datasets.append({
+                    'id': f"zenodo_{record.get('id')}",
+                    'title': record.get('metadata', {}).get('title', ''),
+                    'updated': record.get('updated') or record.get('created'),
+                    'files': files,
+                    'uri': uri
+                })
+        return self.newer_than_watermark(uri, datasets, 'updated')
     
     def _poll_figshare(self, uri: str, patterns: List[str]) -> List[Dict[str, Any]]:
         """Poll Figshare for new datasets."""
@@ -250,9 +540,23 @@ class DatasetWatchMonitor(SourceMonitor):
         return []
     
     def _poll_open_datasets(self, uri: str, patterns: List[str]) -> List[Dict[str, Any]]:
-        """Poll open dataset collections."""
-        # Placeholder implementation
-        return []
+        """Poll open dataset collections mirrored under the configured open_root directory."""
+        collection = Path(self.config.get('open_root', 'data/open')) / uri[len('open://'):]
+        if not collection.is_dir():
+            return []
+        
+        datasets = []
+        for path in sorted(collection.rglob('*')):
+            if path.is_file() and any(fnmatch.fnmatch(path.name, pattern) for pattern in patterns):
+                stat = path.stat()
+                datasets.append({
+                    'id': f"{uri[len('open://'):]}/{path.relative_to(collection)}",
+                    'path': str(path),
+                    'size_bytes': stat.st_size,
+                    'updated': datetime.fromtimestamp(stat.st_mtime).isoformat(timespec='microseconds'),
+                    'uri': uri
+                })
+        return self.newer_than_watermark(uri, datasets, 'updated')
 
 
 class MaterialsDatabaseMonitor(SourceMonitor):
@@ -293,6 +597,7 @@ class MaterialsDatabaseMonitor(SourceMonitor):
             
         except Exception as e:
             logger.warning(f"⚠️ Materials Monitor failed: {e}")
+            self.last_error = e
         
         return signals
     
@@ -315,9 +620,32 @@ class MaterialsDatabaseMonitor(SourceMonitor):
 class SourceRegistry:
     """Registry and coordinator for all source monitors."""
     
-    def __init__(self):
+    MONITOR_TYPES = {
+        'kg-delta': KnowledgeGraphDeltaMonitor,
+        'literature-stream': LiteratureStreamMonitor,
+        'dataset-watch': DatasetWatchMonitor,
+        'materials-database': MaterialsDatabaseMonitor
+    }
+    
+    def __init__(self, state_path: Optional[str] = "data/scout_state.json", default_timeout: float = 30.0,
+                 max_workers: int = 16):
+        """
+        Args:
+            state_path: JSON file persisting poll times, cache validators,
+                        watermarks and seen-signal hashes (None = in memory)
+            default_timeout: Per-source poll timeout in seconds, unless a
+                             source config sets 'timeout'
+            max_workers: Threads running blocking monitor polls
+        """
         self.monitors = {}
         self.active_sources = []
+        self.state = SourceStateStore(state_path)
+        self.default_timeout = default_timeout
+        # A private pool: a poll that overruns its timeout keeps its thread,
+        # and asyncio.run() would otherwise wait for it on shutdown
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scout-poll")
+        self._lock = threading.Lock()
+        self._in_flight = set()
     
     def register_monitor(self, name: str, monitor: SourceMonitor):
         """Register a source monitor."""
@@ -326,31 +654,55 @@ class SourceRegistry:
     
     def poll(self, source_configs: List[Dict[str, Any]]) -> List[Signal]:
         """Poll all configured sources for signals."""
-        all_signals = []
+        return asyncio.run(self.poll_async(source_configs))
+    
+    async def poll_async(self, source_configs: List[Dict[str, Any]]) -> List[Signal]:
+        """
+        Poll every due source concurrently and return the new signals.
+        
+        Sources whose polling interval has not elapsed are skipped, as are
+        sources whose previous poll is still running after a timeout. A
+        failed or timed-out poll keeps its previous state, so the source is
+        retried next cycle.
+        """
+        now = time.time()
+        polls = []
         
         for config in source_configs:
             source_type = config.get('type')
+            key = source_key(config)
             
-            try:
-                if source_type == 'kg-delta':
-                    monitor = KnowledgeGraphDeltaMonitor(config)
-                elif source_type == 'literature-stream':
-                    monitor = LiteratureStreamMonitor(config)
-                elif source_type == 'dataset-watch':
-                    monitor = DatasetWatchMonitor(config)
-                elif source_type == 'materials-database':
-                    monitor = MaterialsDatabaseMonitor(config)
-                else:
-                    logger.warning(f"Unknown source type: {source_type}")
+            with self._lock:
+                if key in self._in_flight:
+                    logger.info(f"⏳ {source_type}: previous poll still running, skipping")
+                    continue
+                if not self.state.is_due(key, polling_interval(config), now):
+                    logger.debug(f"💤 {source_type}: polling interval not elapsed")
                     continue
                 
-                signals = monitor.poll()
-                all_signals.extend(signals)
-                
-                logger.info(f"📊 {source_type}: {len(signals)} signals")
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to poll {source_type}: {e}")
+                monitor = self._monitor_for(key, config)
+                if monitor is None:
+                    logger.warning(f"Unknown source type: {source_type}")
+                    continue
+                self._in_flight.add(key)
+            
+            polls.append((key, source_type, self._poll_monitor(key, monitor, config)))
+        
+        outcomes = await asyncio.gather(*(poll for _, _, poll in polls), return_exceptions=True)
+        
+        all_signals = []
+        for (key, source_type, _), outcome in zip(polls, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.error(f"❌ {source_type} poll timed out")
+            elif isinstance(outcome, Exception):
+                logger.error(f"❌ Failed to poll {source_type}: {outcome}")
+            else:
+                all_signals.extend(outcome)
+                logger.info(f"📊 {source_type}: {len(outcome)} signals")
+        
+        collected = len(all_signals)
+        all_signals = self.state.filter_new(all_signals)
+        self.state.save()
         
         # Sort by priority and relevance
         all_signals.sort(key=lambda s: (
@@ -358,8 +710,48 @@ class SourceRegistry:
             s.relevance_score
         ), reverse=True)
         
-        logger.info(f"🎯 Total signals collected: {len(all_signals)}")
+        logger.info(f"🎯 Total signals collected: {len(all_signals)} new "
+                    f"({collected - len(all_signals)} seen before)")
         return all_signals
+    
+    def _monitor_for(self, key: str, config: Dict[str, Any]) -> Optional[SourceMonitor]:
+        """Reuse one monitor (and its HTTP session) per source across cycles."""
+        if key not in self.monitors:
+            monitor_type = self.MONITOR_TYPES.get(config.get('type'))
+            if monitor_type is None:
+                return None
+            self.monitors[key] = monitor_type(config)
+        return self.monitors[key]
+    
+    async def _poll_monitor(self, key: str, monitor: SourceMonitor, config: Dict[str, Any]) -> List[Signal]:
+        """Run a blocking monitor poll in a worker thread under the source's timeout."""
+        state = self.state.get(key)
+        monitor.state = state
+        monitor.last_error = None
+        monitor.staged_validators = {}
+        if state.get('last_poll') and monitor.last_poll is None:
+            monitor.last_poll = datetime.fromtimestamp(state['last_poll'])
+        
+        started = time.time()
+        future = self._executor.submit(monitor.poll)
+        # The thread cannot be killed on timeout; the source only leaves the
+        # in-flight set once its poll really finishes
+        future.add_done_callback(lambda _: self._release(key))
+        
+        signals = await asyncio.wait_for(asyncio.wrap_future(future), timeout=config.get('timeout', self.default_timeout))
+        if monitor.last_error is not None:
+            # Drop the poll's validators and watermarks and leave the source due
+            logger.warning(f"⚠️ {key} poll failed, state not committed")
+            return signals
+        
+        monitor.commit_validators()
+        state['last_poll'] = started
+        self.state.update(key, state)
+        return signals
+    
+    def _release(self, key: str):
+        with self._lock:
+            self._in_flight.discard(key)
 
 
 # Example usage and testing
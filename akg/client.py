@@ -7,9 +7,13 @@ Provides unified interface to the multi-modal knowledge graph:
 - GraphDB: RDF triplestore for ontological reasoning
 - Fuseki: SPARQL endpoint for complex queries
 
+With backend 'embedded' (config['backend'] or FOTCHEM_GRAPH_BACKEND) the
+property graph lives in a local SQLite store instead of Neo4j.
+
 All discoveries are recorded with full provenance and FoT validation.
 """
 
+import os
 import json
 import logging
 from typing import Dict, List, Any, Optional
@@ -17,22 +21,33 @@ from datetime import datetime
 from dataclasses import asdict
 import uuid
 
-from neo4j import GraphDatabase
 import requests
 
+from embedded_graph_store import EmbeddedAKGStore, configured_backend
+from neo4j_connection import Neo4jConfig, READ_ACCESS, get_neo4j_provider
+
 logger = logging.getLogger(__name__)
 
+# Change feeds read by the scout's KG delta monitor: entity -> graph label
+# and the properties returned besides id and created
+CHANGE_FEEDS = {
+    'molecule': ('FoTChem_Molecule', ['smiles', 'inchi']),
+    'reaction': ('Reaction', ['reaction_smiles', 'yield']),
+    'measurement': ('Measurement', ['property', 'value', 'uncertainty'])
+}
+
 
 class AKG:
     """Agentic Knowledge Graph client for FoTChemistry."""
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize AKG connections."""
+        neo4j_config = Neo4jConfig.from_env()
         self.config = config or {
             'neo4j': {
-                'uri': 'bolt://localhost:7687',
-                'user': 'neo4j', 
-                'password': 'fotquantum'
+                'uri': neo4j_config.uri,
+                'user': neo4j_config.user, 
+                'password': neo4j_config.password
             },
             'graphdb': {
                 'uri': 'http://localhost:7200',
@@ -44,18 +59,23 @@ class AKG:
             }
         }
         
-        # Initialize Neo4j connection (connect to EXISTING instance)
-        try:
-            self.neo4j_driver = GraphDatabase.driver(
-                self.config['neo4j']['uri'],
-                auth=(self.config['neo4j']['user'], self.config['neo4j']['password'])
-            )
-            logger.info("✅ Connected to EXISTING Neo4j instance")
-            # Ensure chemistry schema with safe namespacing
-            self._ensure_safe_chemistry_schema()
-        except Exception as e:
-            logger.warning(f"⚠️ Neo4j connection failed: {e}")
-            self.neo4j_driver = None
+        # Embedded backend: serverless SQLite store in place of Neo4j (RDF mirroring skipped)
+        self.store = None
+        self.neo4j_driver = None
+        self.backend = self.config.get('backend') or configured_backend()
+        if self.backend == 'embedded':
+            self.store = EmbeddedAKGStore(self.config.get('embedded_path'))
+            logger.info("✅ Using embedded AKG store")
+        else:
+            # Initialize Neo4j connection (connect to EXISTING instance through the shared pool)
+            try:
+                self.neo4j_driver = get_neo4j_provider(Neo4jConfig.from_env(**self.config['neo4j']))
+                logger.info("✅ Connected to EXISTING Neo4j instance")
+                # Ensure chemistry schema with safe namespacing
+                self._ensure_safe_chemistry_schema()
+            except Exception as e:
+                logger.warning(f"⚠️ Neo4j connection failed: {e}")
+                self.neo4j_driver = None
         
         # Initialize HTTP session for SPARQL endpoints
         self.session = requests.Session()
@@ -87,6 +107,22 @@ class AKG:
                 except Exception as e:
                     # Constraint might already exist, that's fine
                     logger.debug(f"Constraint exists or failed: {e}")
+            
+            # Keyset pagination for exports walks discoveries in discovered_at order,
+            # and the change feeds walk their entities in created order
+            indexes = [
+                "CREATE INDEX FoTChem_discovery_discovered_at IF NOT EXISTS "
+                "FOR (d:FoTChem_Discovery) ON (d.discovered_at)"
+            ] + [
+                f"CREATE INDEX FoTChem_{entity}_created IF NOT EXISTS FOR (n:{label}) ON (n.created)"
+                for entity, (label, _) in CHANGE_FEEDS.items()
+            ]
+            
+            for index in indexes:
+                try:
+                    session.run(index)
+                except Exception as e:
+                    logger.debug(f"Index exists or failed: {e}")
     
     def health_check(self) -> Dict[str, bool]:
         """Check health of all AKG components."""
@@ -104,12 +140,14 @@ class AKG:
         return health
     
     def neo4j_health(self) -> bool:
-        """Check Neo4j connectivity."""
+        """Check Neo4j connectivity (always healthy on the embedded store)."""
+        if self.store:
+            return True
         if not self.neo4j_driver:
             return False
         
         try:
-            with self.neo4j_driver.session() as session:
+            with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
                 result = session.run("RETURN 1 as health")
                 return result.single()['health'] == 1
         except Exception as e:
@@ -150,7 +188,8 @@ class AKG:
             self._store_verdict_neo4j(verdict_id, verdict, timestamp)
             
             # Store in GraphDB as RDF
-            self._store_verdict_rdf(verdict_id, verdict, timestamp)
+            if not self.store:
+                self._store_verdict_rdf(verdict_id, verdict, timestamp)
             
             logger.info(f"📝 Recorded discovery verdict: {verdict_id}")
             return verdict_id
@@ -161,6 +200,9 @@ class AKG:
     
     def _store_verdict_neo4j(self, verdict_id: str, verdict: Dict[str, Any], timestamp: str):
         """Store verdict in Neo4j property graph (SAFE namespace)."""
+        if self.store:
+            self.store.store_verdict(verdict_id, verdict, timestamp)
+            return
         if not self.neo4j_driver:
             logger.warning("Neo4j not available, skipping storage")
             return
@@ -233,11 +275,13 @@ class AKG:
     
     def query_new_molecules(self, since: datetime) -> List[Dict[str, Any]]:
         """Query for new chemistry molecules since timestamp (SAFE namespace)."""
+        if self.store:
+            return self.store.query_new_molecules(since)
         if not self.neo4j_driver:
             return []
         
         try:
-            with self.neo4j_driver.session() as session:
+            with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
                 result = session.run("""
                     MATCH (m:FoTChem_Molecule)
                     WHERE m.created >= $since
@@ -264,11 +308,13 @@ class AKG:
     
     def query_new_reactions(self, since: datetime) -> List[Dict[str, Any]]:
         """Query for new reactions since timestamp."""
+        if self.store:
+            return self.store.query_new_reactions(since)
         if not self.neo4j_driver:
             return []
         
         try:
-            with self.neo4j_driver.session() as session:
+            with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
                 result = session.run("""
                     MATCH (r:Reaction)
                     WHERE r.created >= $since
@@ -295,11 +341,13 @@ class AKG:
     
     def query_new_measurements(self, since: datetime) -> List[Dict[str, Any]]:
         """Query for new measurements since timestamp."""
+        if self.store:
+            return self.store.query_new_measurements(since)
         if not self.neo4j_driver:
             return []
         
         try:
-            with self.neo4j_driver.session() as session:
+            with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
                 result = session.run("""
                     MATCH (m:Measurement)
                     WHERE m.created >= $since
@@ -325,6 +373,49 @@ class AKG:
             logger.warning(f"⚠️ Query new measurements failed: {e}")
             return []
     
+    def iter_changes(self, entity: str, after: Dict[str, str], page_size: int = 100):
+        """
+        Yield pages of molecules, reactions or measurements created after a position.
+        
+        Rows come oldest first in (created, id) order, starting strictly after
+        the {"created", "id"} position, so a caller that remembers the last row
+        it saw never receives a row twice. Each page is a separate seek on the
+        created index (the range predicate is kept separate so it can be used).
+        On Neo4j, created is a temporal property: the cursor is parsed with
+        datetime() and rows return created as an ISO string for the next cursor.
+        """
+        if entity not in CHANGE_FEEDS:
+            raise ValueError(f"Unknown change feed: {entity}")
+        if self.store:
+            yield from self.store.iter_changes(entity, after, page_size)
+            return
+        if not self.neo4j_driver:
+            return
+        
+        label, fields = CHANGE_FEEDS[entity]
+        returns = ", ".join(f"n.`{field}` as `{field}`" for field in fields)
+        cursor = after
+        
+        while True:
+            with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
+                result = session.run(f"""
+                    MATCH (n:{label})
+                    WHERE n.created >= datetime($cursor_created)
+                      AND (n.created > datetime($cursor_created) OR n.id > $cursor_id)
+                    RETURN n.id as id, {returns}, toString(n.created) as created
+                    ORDER BY n.created, n.id
+                    LIMIT $page_size
+                """, cursor_created=cursor['created'], cursor_id=cursor['id'], page_size=page_size)
+                page = [dict(record) for record in result]
+            
+            if not page:
+                return
+            
+            yield page
+            cursor = {'created': page[-1]['created'], 'id': page[-1]['id']}
+            if len(page) < page_size:
+                return
+    
     def query_discovery_statistics(self) -> Dict[str, Any]:
         """Query overall discovery statistics."""
         stats = {
@@ -336,11 +427,13 @@ class AKG:
             'recent_discoveries': []
         }
         
+        if self.store:
+            return self.store.query_discovery_statistics()
         if not self.neo4j_driver:
             return stats
         
         try:
-            with self.neo4j_driver.session() as session:
+            with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
                 # Total verdicts by status (SAFE namespace)
                 result = session.run("""
                     MATCH (v:FoTChem_Verdict)
@@ -407,6 +500,10 @@ class AKG:
         """Store a new chemistry claim (SAFE namespace)"""
         claim_id = claim.get('id', str(uuid.uuid4()))
         
+        if self.store:
+            claim_id = self.store.store_claim(dict(claim, id=claim_id))
+            logger.info(f"📝 Stored chemistry claim: {claim_id}")
+            return claim_id
         if not self.neo4j_driver:
             logger.warning("Neo4j not available, skipping claim storage")
             return claim_id
@@ -436,10 +533,12 @@ class AKG:
             
     def get_claims(self, status: Optional[str] = None, campaign: Optional[str] = None) -> List[Dict]:
         """Retrieve chemistry claims (SAFE namespace)"""
+        if self.store:
+            return self.store.get_claims(status, campaign)
         if not self.neo4j_driver:
             return []
             
-        with self.neo4j_driver.session() as session:
+        with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
             where_clause = "WHERE 1=1"
             params = {}
             
@@ -474,6 +573,10 @@ class AKG:
         """Store evidence for a chemistry claim (SAFE namespace)"""
         evidence_id = str(uuid.uuid4())
         
+        if self.store:
+            evidence_id = self.store.store_evidence(claim_id, evidence)
+            logger.info(f"📊 Stored evidence: {evidence_id} for claim: {claim_id}")
+            return evidence_id
         if not self.neo4j_driver:
             logger.warning("Neo4j not available, skipping evidence storage")
             return evidence_id
@@ -504,6 +607,10 @@ class AKG:
         
     def collapse_claim(self, claim_id: str, verdict: str, virtues: List[float], evidence: Dict) -> bool:
         """Collapse a claim to truth/refute/needs-evidence (SAFE namespace)"""
+        if self.store:
+            self.store.collapse_claim(claim_id, verdict, virtues, evidence)
+            logger.info(f"🎯 Collapsed claim {claim_id} to {verdict}")
+            return True
         if not self.neo4j_driver:
             logger.warning("Neo4j not available, skipping claim collapse")
             return False
@@ -534,59 +641,185 @@ class AKG:
         logger.info(f"🎯 Collapsed claim {claim_id} to {verdict}")
         return True
         
-    def export_for_streamlit(self, output_file: str = "results/chemistry_discoveries.json"):
-        """Export chemistry data for Streamlit dashboard (Git-trackable)"""
-        import os
-        os.makedirs("results", exist_ok=True)
+    def export_for_streamlit(self, output_file: str = "results/chemistry_discoveries.json",
+                             format: str = "json", page_size: int = 1000, incremental: bool = False,
+                             summary_file: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Export chemistry data for Streamlit dashboard (Git-trackable).
         
-        if not self.neo4j_driver:
+        Discoveries are paged out of Neo4j with keyset pagination on
+        (discovered_at, id) and written record by record, so memory stays
+        bounded by page_size. format="json" streams the usual
+        {"discoveries": [...]} document (newest first) to a temporary file
+        that replaces output_file when complete; format="ndjson" writes one
+        {"discovery", "claim", "evidence"} record per line.
+        
+        A small summary next to the export (<output>_summary.json) records
+        counts and the high-water mark of the last exported discovery. With
+        incremental=True only discoveries newer than that watermark are
+        appended (NDJSON only). Records may repeat after an interrupted
+        incremental run; readers should keep the last record per discovery id.
+        
+        Returns the summary.
+        """
+        if format not in ("json", "ndjson"):
+            raise ValueError(f"Unsupported export format: {format}")
+        if incremental and format != "ndjson":
+            raise ValueError("Incremental export appends records and requires format='ndjson'")
+        
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        summary_file = summary_file or os.path.splitext(output_file)[0] + "_summary.json"
+        
+        previous = self._load_export_summary(summary_file) if incremental and os.path.exists(output_file) else None
+        watermark = previous.get('watermark') if previous else None
+        
+        summary = {
+            "export_timestamp": datetime.now().isoformat(),
+            "output_file": output_file,
+            "format": format,
+            "incremental": previous is not None,
+            "since_watermark": watermark,
+            "exported_discoveries": 0,
+            "total_discoveries": previous.get('total_discoveries', 0) if previous else 0,
+            "pages": 0,
+            "page_size": page_size,
+            "verdicts": dict(previous.get('verdicts', {})) if previous else {},
+            "watermark": watermark
+        }
+        
+        # Incremental runs go oldest first from the watermark, so it advances page by page
+        if self.store:
+            pages = self.store.iter_discovery_pages(page_size, after=watermark, ascending=previous is not None)
+        elif not self.neo4j_driver:
             logger.warning("Neo4j not available, creating empty export")
-            empty_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "total_discoveries": 0,
-                "discoveries": []
-            }
-            with open(output_file, 'w') as f:
-                json.dump(empty_data, f, indent=2)
-            return empty_data
+            pages = iter(())
+        else:
+            pages = self._iter_discovery_pages(page_size, after=watermark, ascending=previous is not None)
         
-        with self.neo4j_driver.session() as session:
-            # Get all chemistry discoveries with claims and evidence (SAFE namespace)
-            result = session.run("""
-                MATCH (d:FoTChem_Discovery)
-                OPTIONAL MATCH (d)<-[:COLLAPSED_TO]-(c:FoTChem_Claim)
-                OPTIONAL MATCH (c)-[:HAS_EVIDENCE]->(e:FoTChem_Evidence)
-                RETURN d, c, collect(e) as evidence
-                ORDER BY d.discovered_at DESC
-            """)
-            
-            export_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "total_discoveries": 0,
-                "discoveries": []
-            }
+        if format == "json":
+            tmp_file = output_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                f.write('{\n  "export_timestamp": %s,\n  "discoveries": [' % json.dumps(summary["export_timestamp"]))
+                separator = "\n    "
+                for page, cursors in pages:
+                    for item in page:
+                        f.write(separator + json.dumps(item, default=str))
+                        separator = ",\n    "
+                    self._update_export_summary(summary, page, cursors)
+                f.write('\n  ],\n  "total_discoveries": %d\n}\n' % summary["exported_discoveries"])
+            os.replace(tmp_file, output_file)
+        else:
+            with open(output_file, 'a' if previous is not None else 'w') as f:
+                for page, cursors in pages:
+                    for item in page:
+                        f.write(json.dumps(item, default=str) + "\n")
+                    f.flush()
+                    self._update_export_summary(summary, page, cursors)
+        
+        if previous is None:
+            summary["total_discoveries"] = summary["exported_discoveries"]
+        
+        tmp_summary = summary_file + ".tmp"
+        with open(tmp_summary, 'w') as f:
+            json.dump(summary, f, indent=2, default=str)
+        os.replace(tmp_summary, summary_file)
+        
+        logger.info(f"📁 Exported {summary['exported_discoveries']} discoveries to {output_file} "
+                    f"({summary['total_discoveries']} total)")
+        return summary
+    
+    def _iter_discovery_pages(self, page_size: int, after: Optional[Dict[str, str]] = None,
+                              ascending: bool = False):
+        """
+        Yield (page, cursors): {"discovery", "claim", "evidence"} export records
+        and the {"discovered_at", "id"} keyset position of each.
+        
+        Discoveries come newest first, or oldest first when ascending, starting
+        after the optional {"discovered_at", "id"} position. Each page is a
+        separate short query seeking past the last position of the previous page.
+        """
+        order = "ASC" if ascending else "DESC"
+        beyond = ">" if ascending else "<"
+        cursor = after
+        
+        while True:
+            where_clause = ""
+            params = {'page_size': page_size}
+            if cursor:
+                where_clause = f"""
+                    WHERE d.discovered_at {beyond} datetime($cursor_ts)
+                       OR (d.discovered_at = datetime($cursor_ts) AND d.id {beyond} $cursor_id)
+                """
+                params.update(cursor_ts=cursor['discovered_at'], cursor_id=cursor['id'])
             
-            for record in result:
-                discovery = dict(record['d']) if record['d'] else {}
-                claim = dict(record['c']) if record['c'] else {}
-                evidence_list = [dict(e) for e in record['evidence']] if record['evidence'] else []
+            with self.neo4j_driver.session(default_access_mode=READ_ACCESS) as session:
+                # Chemistry discoveries with claims and evidence (SAFE namespace)
+                result = session.run(f"""
+                    MATCH (d:FoTChem_Discovery)
+                    {where_clause}
+                    WITH d
+                    ORDER BY d.discovered_at {order}, d.id {order}
+                    LIMIT $page_size
+                    OPTIONAL MATCH (d)<-[:COLLAPSED_TO]-(c:FoTChem_Claim)
+                    OPTIONAL MATCH (c)-[:HAS_EVIDENCE]->(e:FoTChem_Evidence)
+                    WITH d, c, collect(e) as evidence
+                    RETURN d, c, evidence, toString(d.discovered_at) as cursor_ts
+                    ORDER BY d.discovered_at {order}, d.id {order}
+                """, **params)
                 
-                export_data["discoveries"].append({
-                    "discovery": discovery,
-                    "claim": claim,
-                    "evidence": evidence_list
-                })
-                
-            export_data["total_discoveries"] = len(export_data["discoveries"])
+                page, cursors = [], []
+                for record in result:
+                    discovery = dict(record['d']) if record['d'] else {}
+                    claim = dict(record['c']) if record['c'] else {}
+                    evidence_list = [dict(e) for e in record['evidence']] if record['evidence'] else []
+                    
+                    page.append({
+                        "discovery": discovery,
+                        "claim": claim,
+                        "evidence": evidence_list
+                    })
+                    cursors.append({'discovered_at': record['cursor_ts'], 'id': discovery.get('id')})
             
-            with open(output_file, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
-                
-            logger.info(f"📁 Exported {export_data['total_discoveries']} discoveries to {output_file}")
-            return export_data
+            if not page:
+                return
+            
+            yield page, cursors
+            cursor = cursors[-1]
+            if len(page) < page_size:
+                return
+    
+    @staticmethod
+    def _update_export_summary(summary: Dict[str, Any], page: List[Dict[str, Any]],
+                               cursors: List[Dict[str, str]]):
+        """Fold one exported page into the summary and advance the watermark"""
+        summary["pages"] += 1
+        summary["exported_discoveries"] += len(page)
+        if summary["incremental"]:
+            summary["total_discoveries"] += len(page)
+            summary["watermark"] = cursors[-1]
+        elif summary["pages"] == 1:
+            # Full exports run newest first
+            summary["watermark"] = cursors[0]
+        
+        for item in page:
+            verdict = str(item["discovery"].get("verdict", "unknown"))
+            summary["verdicts"][verdict] = summary["verdicts"].get(verdict, 0) + 1
+    
+    @staticmethod
+    def _load_export_summary(summary_file: str) -> Optional[Dict[str, Any]]:
+        """Load the summary of the previous export, if any"""
+        try:
+            with open(summary_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
     
     def close(self):
         """Close all connections."""
+        if self.store:
+            self.store.close()
         if self.neo4j_driver:
             self.neo4j_driver.close()
         
@@ -23,6 +23,7 @@ from pathlib import Path
 
 try:
     from neo4j_discovery_engine import Neo4jDiscoveryEngine
+    from neo4j_connection import READ_ACCESS
     from scipy.spatial.distance import pdist, squareform
     from scipy.cluster.hierarchy import dendrogram, linkage
     from sklearn.decomposition import PCA
@@ -82,7 +83,7 @@ class BreakthroughDiscoveryAnalyzer:
         
         logger.info(f"🔍 Searching for breakthrough candidates (limit: {limit})")
         
-        with self.neo4j_engine.driver.session() as session:
+        with self.neo4j_engine.driver.session(default_access_mode=READ_ACCESS) as session:
             # Enhanced query to find high-potential discoveries with full data
             result = session.run("""
                 MATCH (d:Discovery)-[:HAS_SEQUENCE]->(s:Sequence)
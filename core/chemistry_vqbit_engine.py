@@ -11,48 +11,80 @@ from dataclasses import dataclass
 import logging
 from enum import Enum
 import json
-import scipy.linalg
+import hashlib
+import functools
+import sys
+from collections import OrderedDict
 from datetime import datetime
 import platform
 import os
 
-# Platform-specific performance optimizations
-try:
-    if platform.system() == "Darwin":  # macOS with Apple Silicon
-        # Check for MPS availability (PyTorch MPS backend or native Metal)
-        try:
-            import torch
-            HAS_MPS = torch.backends.mps.is_available() and torch.backends.mps.is_built()
-            MPS_TYPE = "PyTorch MPS"
-        except ImportError:
-            # Fallback to checking for Metal framework availability
-            import subprocess
-            result = subprocess.run(['system_profiler', 'SPDisplaysDataType'], 
-                                  capture_output=True, text=True)
-            HAS_MPS = 'Metal' in result.stdout and platform.machine() == 'arm64'
-            MPS_TYPE = "Metal Framework"
-    else:
-        HAS_MPS = False
-        MPS_TYPE = "Not Available"
-except ImportError:
-    HAS_MPS = False
-    MPS_TYPE = "Not Available"
+# scipy and torch are imported on first use only, so importing this module stays cheap
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def detect_gpu_backend() -> Tuple[bool, str]:
+    """Probe for MPS/Metal GPU support once per process: (available, backend name)"""
+    try:
+        if platform.system() == "Darwin":  # macOS with Apple Silicon
+            # Check for MPS availability (PyTorch MPS backend or native Metal)
+            try:
+                import torch
+                has_mps = torch.backends.mps.is_available() and torch.backends.mps.is_built()
+                mps_type = "PyTorch MPS"
+            except ImportError:
+                # Fallback to checking for Metal framework availability
+                import subprocess
+                result = subprocess.run(['system_profiler', 'SPDisplaysDataType'], 
+                                      capture_output=True, text=True)
+                has_mps = 'Metal' in result.stdout and platform.machine() == 'arm64'
+                mps_type = "Metal Framework"
+        else:
+            has_mps = False
+            mps_type = "Not Available"
+    except (ImportError, OSError):
+        has_mps = False
+        mps_type = "Not Available"
+    
+    if has_mps:
+        logger.info(f"🚀 GPU acceleration enabled - {mps_type}")
+    return has_mps, mps_type
+
+def _is_sparse_matrix(matrix) -> bool:
+    """True for scipy.sparse matrices (without importing scipy if nothing could be one)"""
+    sparse = sys.modules.get('scipy.sparse')
+    return sparse is not None and sparse.issparse(matrix)
+
+def _load_quantum_ops():
+    """Import the compiled quantum_ops extension from sys.path, core/ or the repo root"""
+    try:
+        import quantum_ops  # Our compiled C extension
+        return quantum_ops
+    except ImportError:
+        pass
+    
+    import importlib.machinery
+    import importlib.util
+    core_dir = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.machinery.PathFinder.find_spec('quantum_ops', [core_dir, os.path.dirname(core_dir)])
+    if spec is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules['quantum_ops'] = module
+    return module
+
 # Try to load C extensions for critical matrix operations
 try:
-    import quantum_ops  # Our compiled C extension
-    HAS_C_EXTENSIONS = True
-    logger.info("⚡ C extensions loaded successfully")
-except ImportError:
-    HAS_C_EXTENSIONS = False
-    # Fallback - try to compile it if source exists
-    if os.path.exists("core/quantum_ops.c"):
-        logger.info("🔨 C extension not found but source available - try: python core/setup_quantum_ops.py build_ext --inplace")
-
-if HAS_MPS:
-    logger.info(f"🚀 GPU acceleration enabled - {MPS_TYPE}")
+    quantum_ops = _load_quantum_ops()
+except ImportError as e:
+    logger.warning(f"⚠️ quantum_ops extension found but failed to load: {e}")
+    quantum_ops = None
+HAS_C_EXTENSIONS = quantum_ops is not None
+if not HAS_C_EXTENSIONS and os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), "quantum_ops.c")):
+    logger.info("🔨 C extension not found but source available - try: python core/setup_quantum_ops.py build_ext --inplace")
+
 if HAS_C_EXTENSIONS:
     logger.info("⚡ C extensions loaded - critical path acceleration enabled")
 
@@ -63,6 +95,201 @@ class ChemistryPropertyType(Enum):
     REPRODUCIBILITY = "reproducibility" # Experimental accuracy, replicability
     EFFICIENCY = "efficiency"          # Atom economy, reaction efficiency
 
+class DiagonalOperator:
+    """Diagonal Hermitian operator stored as its real eigenvalue vector
+
+    Every chemistry operator in the engine is diagonal in the computational
+    basis, so only the N eigenvalues are kept instead of a dense N×N matrix
+    (64 KB instead of ~1 GB at N = 8096). Expectation values, matvec and
+    time evolution all run in O(N).
+    """
+
+    # Make NumPy defer ``ndarray @ DiagonalOperator`` to __rmatmul__
+    __array_ufunc__ = None
+
+    def __init__(self, eigenvalues: np.ndarray):
+        eigenvalues = np.asarray(eigenvalues)
+        if eigenvalues.ndim != 1:
+            raise ValueError(f"Diagonal operator needs a 1-D eigenvalue vector, got shape {eigenvalues.shape}")
+        if np.iscomplexobj(eigenvalues):
+            if not np.allclose(eigenvalues.imag, 0.0):
+                raise ValueError("Diagonal operator eigenvalues must be real (Hermitian operator)")
+            eigenvalues = eigenvalues.real
+        self.eigenvalues = np.ascontiguousarray(eigenvalues, dtype=np.float64)
+
+    @classmethod
+    def identity(cls, dimension: int) -> 'DiagonalOperator':
+        """Identity operator Î of the given dimension"""
+        return cls(np.ones(dimension, dtype=np.float64))
+
+    @property
+    def dimension(self) -> int:
+        return self.eigenvalues.shape[0]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.dimension, self.dimension)
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def nbytes(self) -> int:
+        return self.eigenvalues.nbytes
+
+    def diagonal(self) -> np.ndarray:
+        """Eigenvalue vector (diagonal of the operator)"""
+        return self.eigenvalues
+
+    def copy(self) -> 'DiagonalOperator':
+        return DiagonalOperator(self.eigenvalues.copy())
+
+    def to_dense(self) -> np.ndarray:
+        """Dense complex matrix form - only for small dimensions and debugging"""
+        return np.diag(self.eigenvalues.astype(complex))
+
+    def expectation(self, state: np.ndarray) -> float:
+        """Expectation value ⟨ψ|Ô|ψ⟩ = Σ |αᵢ|² λᵢ"""
+        probabilities = np.abs(state) ** 2
+        return float(probabilities @ self.eigenvalues)
+
+    def matvec(self, state: np.ndarray) -> np.ndarray:
+        """Apply Ô|ψ⟩ elementwise; also accepts (N, K) column stacks"""
+        state = np.asarray(state)
+        if state.ndim == 1:
+            return self.eigenvalues * state
+        return self.eigenvalues[:, None] * state
+
+    def propagator_phases(self, time_step: float) -> np.ndarray:
+        """Diagonal of U(dt) = exp(-iÔdt) with ℏ = 1"""
+        return np.exp(-1j * self.eigenvalues * time_step)
+
+    def evolve(self, state: np.ndarray, time_step: float) -> np.ndarray:
+        """Apply exp(-iÔdt)|ψ⟩ in O(N)"""
+        phases = self.propagator_phases(time_step)
+        state = np.asarray(state)
+        if state.ndim == 1:
+            return phases * state
+        return phases[:, None] * state
+
+    def __matmul__(self, other):
+        if isinstance(other, DiagonalOperator):
+            return DiagonalOperator(self.eigenvalues * other.eigenvalues)
+        return self.matvec(other)
+
+    def __rmatmul__(self, other):
+        # Row vector / row stack times diagonal: ⟨ψ|Ô scales each column
+        return np.asarray(other) * self.eigenvalues
+
+    def __add__(self, other):
+        if isinstance(other, DiagonalOperator):
+            return DiagonalOperator(self.eigenvalues + other.eigenvalues)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, DiagonalOperator):
+            return DiagonalOperator(self.eigenvalues - other.eigenvalues)
+        return NotImplemented
+
+    def __mul__(self, scalar):
+        if np.isscalar(scalar) and np.isreal(scalar):
+            return DiagonalOperator(self.eigenvalues * float(np.real(scalar)))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return DiagonalOperator(-self.eigenvalues)
+
+    def __repr__(self) -> str:
+        return f"DiagonalOperator(dimension={self.dimension})"
+
+# Operator spectra bundle: rows are the property operators (in ChemistryPropertyType
+# order) followed by the kinetic and potential Hamiltonian eigenvalues.
+SPECTRA_BUNDLE_VERSION = 1
+DEFAULT_SPECTRA_SEED = 8096
+SPECTRA_ROWS = [prop_type.value for prop_type in ChemistryPropertyType] + ['kinetic', 'potential']
+
+def default_spectra_dir() -> str:
+    """Directory holding persisted spectra bundles (override with FOT_SPECTRA_DIR)"""
+    return os.environ.get(
+        'FOT_SPECTRA_DIR',
+        os.path.join(os.path.expanduser('~'), '.cache', 'fotchemistry', 'spectra')
+    )
+
+def spectra_bundle_path(dimension: int, seed: int, spectra_dir: Optional[str] = None) -> str:
+    """Path of the .npy spectra bundle for a (dimension, seed) pair"""
+    filename = f"chemistry_spectra_v{SPECTRA_BUNDLE_VERSION}_d{dimension}_s{seed}.npy"
+    return os.path.join(spectra_dir or default_spectra_dir(), filename)
+
+def generate_operator_spectra(dimension: int, seed: Optional[int]) -> np.ndarray:
+    """Draw all operator eigenvalues as one (len(SPECTRA_ROWS), N) array from a seed"""
+    rng = np.random.default_rng(seed)
+    n_properties = len(ChemistryPropertyType)
+    spectra = np.empty((len(SPECTRA_ROWS), dimension), dtype=np.float64)
+    spectra[:n_properties] = rng.uniform(0, 1, (n_properties, dimension))  # Property eigenvalues in [0,1]
+    spectra[n_properties] = rng.uniform(-10, 0, dimension)                 # Negative kinetic energies
+    spectra[n_properties + 1] = rng.uniform(-5, 5, dimension)              # Potential energies
+    return spectra
+
+def load_operator_spectra(dimension: int, seed: Optional[int] = DEFAULT_SPECTRA_SEED,
+                          spectra_dir: Optional[str] = None, persist: bool = True) -> np.ndarray:
+    """Load (or generate once and save) the operator spectra bundle
+    
+    Persisted bundles are opened with ``np.load(mmap_mode='r')`` so every
+    process shares the same read-only pages. A ``seed`` of None draws fresh
+    spectra and never persists them.
+    """
+    if seed is None or not persist:
+        return generate_operator_spectra(dimension, seed)
+    
+    path = spectra_bundle_path(dimension, seed, spectra_dir)
+    expected_shape = (len(SPECTRA_ROWS), dimension)
+    if os.path.exists(path):
+        try:
+            spectra = np.load(path, mmap_mode='r')
+            if spectra.shape == expected_shape and spectra.dtype == np.float64:
+                return spectra
+            logger.warning(f"⚠️ Spectra bundle {path} has unexpected layout {spectra.shape} - regenerating")
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Could not read spectra bundle {path}: {e} - regenerating")
+    
+    spectra = generate_operator_spectra(dimension, seed)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a per-process temp file then rename, so concurrent workers never see a partial bundle
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as fh:
+            np.save(fh, spectra)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 Operator spectra saved to {path}")
+        return np.load(path, mmap_mode='r')
+    except OSError as e:
+        logger.warning(f"⚠️ Could not persist spectra bundle to {path}: {e} - using in-memory spectra")
+        return spectra
+
+def l1_coherence(amplitudes: np.ndarray) -> np.ndarray:
+    """Normalized L1-norm coherence of pure states without forming ρ = |ψ⟩⟨ψ|
+
+    For a pure state |ρᵢⱼ| = |αᵢ||αⱼ|, so the off-diagonal sum collapses to
+    Σᵢ≠ⱼ |ρᵢⱼ| = (Σᵢ|αᵢ|)² − Σᵢ|αᵢ|², normalized by C_max = N(N−1)/2.
+
+    ``amplitudes`` may be a single state of shape (N,) or a batch of shape
+    (..., N); coherence is computed along the last axis in O(N) per state.
+    """
+    magnitudes = np.abs(amplitudes)
+    dimension = magnitudes.shape[-1]
+    c_max = dimension * (dimension - 1) / 2
+    if c_max <= 0:
+        return np.zeros(magnitudes.shape[:-1])
+    l1_sum = magnitudes.sum(axis=-1)
+    off_diagonal_sum = l1_sum * l1_sum - np.einsum('...i,...i->...', magnitudes, magnitudes)
+    # Guard tiny negative values from floating-point cancellation
+    return np.maximum(off_diagonal_sum, 0.0) / c_max
+
 @dataclass
 class MolecularVQbitState:
     """Real vQbit quantum state for molecular systems"""
@@ -97,6 +324,36 @@ class MolecularVQbitState:
             self.amplitudes = self.amplitudes / norm
             self.normalization = norm
 
+@dataclass
+class MolecularVQbitBatch:
+    """K molecular vQbit states held as a single (K, N) amplitude array"""
+    amplitudes: np.ndarray          # (K, N) complex amplitudes, one normalized row per molecule
+    identifiers: List[str]          # SMILES (or other key) for each row
+    property_scores: Dict[ChemistryPropertyType, np.ndarray]  # Columnar (K,) expectations per property
+    coherence: np.ndarray           # (K,) L1-norm coherence per molecule
+    hilbert_dimension: int = 8096
+    
+    def __len__(self) -> int:
+        return self.amplitudes.shape[0]
+    
+    def to_columns(self) -> Dict[str, Any]:
+        """Columnar view keyed by column name (identifier, coherence, property values)"""
+        columns = {'identifier': list(self.identifiers), 'coherence': self.coherence}
+        for prop_type, values in self.property_scores.items():
+            columns[prop_type.value] = values
+        return columns
+    
+    def state(self, index: int) -> 'MolecularVQbitState':
+        """Materialize a single MolecularVQbitState for one row of the batch"""
+        return MolecularVQbitState(
+            amplitudes=self.amplitudes[index].copy(),
+            phases=np.zeros(self.hilbert_dimension, dtype=float),
+            coherence=float(self.coherence[index]),
+            entanglement={},
+            property_scores={p: float(v[index]) for p, v in self.property_scores.items()},
+            hilbert_dimension=self.hilbert_dimension
+        )
+
 @dataclass
 class ChemicalSystem:
     """Represents a chemical system with multiple molecular vQbits"""
@@ -109,19 +366,43 @@ class ChemicalSystem:
 class ChemistryVQbitEngine:
     """Real quantum engine for chemistry discovery - MPS GPU accelerated"""
     
-    def __init__(self, neo4j_client=None, use_gpu=True):
-        """Initialize chemistry vQbit engine with GPU acceleration"""
+    def __init__(self, neo4j_client=None, use_gpu=True,
+                 spectra_seed: Optional[int] = DEFAULT_SPECTRA_SEED,
+                 spectra_dir: Optional[str] = None, persist_spectra: bool = True,
+                 diagnostics: Optional[bool] = None):
+        """Initialize chemistry vQbit engine with GPU acceleration
+        
+        Operator spectra are drawn from ``spectra_seed`` and persisted under
+        ``spectra_dir`` as a memory-mapped bundle shared by all processes;
+        pass ``spectra_seed=None`` for fresh, unpersisted random spectra.
+        
+        Construction is lazy: operators are built on first use and GPU probing
+        happens on first access to ``gpu_acceleration``. Set ``diagnostics``
+        (or FOT_ENGINE_DIAGNOSTICS=1) to build everything eagerly and run the
+        QFT and substrate integrity self-checks.
+        """
         self.neo4j_client = neo4j_client
         self.hilbert_dimension = 8096  # Proven dimension from fluid dynamics
         self.is_initialized = False
-        self.use_gpu = use_gpu and HAS_MPS
+        self.use_gpu = use_gpu
         
-        # Performance optimization settings
-        self.gpu_acceleration = self.use_gpu
+        # Performance optimization settings (GPU availability is probed lazily)
+        self._gpu_acceleration = None if use_gpu else False
         self.c_acceleration = HAS_C_EXTENSIONS
         
-        # Quantum operators (optimized for large dimensions)
-        self.property_operators = {}
+        # Quantum operators (optimized for large dimensions), built on first use
+        self._property_operators = None
+        self._identity_operator = None
+        self._kinetic_operator = None
+        self._potential_operator = None
+        self._molecular_hamiltonian = None
+        self._property_eigenvalue_matrix = None  # Stacked (P, N) eigenvalues for batch scoring
+        
+        # Seeded operator spectra (read-only, memory-mapped when persisted)
+        self.spectra_seed = spectra_seed
+        self.spectra_dir = spectra_dir
+        self.persist_spectra = persist_spectra
+        self._operator_spectra = None
         self.hamiltonian_operators = {}
         self.measurement_operators = {}
         
@@ -130,34 +411,106 @@ class ChemistryVQbitEngine:
         self.decoherence_rate = 0.0       # No decoherence
         self.quantum_fidelity = 1.0       # Perfect fidelity
         
+        # Time-evolution settings: dense propagators exp(-iĤdt) are only formed
+        # (and cached by Hamiltonian fingerprint + dt) for small non-diagonal
+        # Hamiltonians; larger ones go through expm_multiply.
+        self.propagator_cache_size = 16
+        self.dense_propagator_max_dimension = 1024
+        self._propagator_cache = OrderedDict()
+        
+        # QFT parameters (functional form - no matrix is stored)
+        self.qft_normalization = 1.0 / np.sqrt(self.hilbert_dimension)
+        self.omega_N = np.exp(2j * np.pi / self.hilbert_dimension)
+        
         # Chemistry-specific parameters
         self.molecular_basis = None
-        
-        # Initialize GPU context if available
-        if self.gpu_acceleration:
-            self._initialize_gpu_context()
         self.orbital_basis = None
         self.reaction_pathways = {}
         
-        # Initialize quantum substrate immediately
-        self._initialize_noiseless_quantum_substrate()
-        self._initialize_chemistry_property_operators()
-        self._initialize_molecular_hamiltonian()
+        if diagnostics is None:
+            diagnostics = os.environ.get('FOT_ENGINE_DIAGNOSTICS', '').lower() in ('1', 'true', 'yes')
+        self.diagnostics = diagnostics
+        if self.diagnostics:
+            self.run_diagnostics()
         
         self.is_initialized = True
+        logger.info("✅ Chemistry vQbit Engine initialized (operators built on first use)")
+    
+    def run_diagnostics(self):
+        """Opt-in diagnostic mode: probe the GPU, build every operator and run the self-checks"""
+        logger.info("🩺 Running chemistry vQbit engine diagnostics...")
+        _ = self.gpu_acceleration
+        self._initialize_noiseless_quantum_substrate()
+        _ = self.property_operators
+        _ = self.molecular_hamiltonian
         logger.info("✅ Chemistry vQbit Engine fully initialized")
     
+    @property
+    def gpu_acceleration(self) -> bool:
+        """Whether GPU acceleration is active (probes the platform on first access)"""
+        if self._gpu_acceleration is None:
+            has_mps, _ = detect_gpu_backend()
+            self._gpu_acceleration = has_mps
+            if has_mps:
+                self._initialize_gpu_context()
+        return self._gpu_acceleration
+    
+    @gpu_acceleration.setter
+    def gpu_acceleration(self, enabled: bool):
+        self._gpu_acceleration = enabled
+    
+    @property
+    def property_operators(self) -> Dict[ChemistryPropertyType, DiagonalOperator]:
+        if self._property_operators is None:
+            self._initialize_chemistry_property_operators()
+        return self._property_operators
+    
+    @property_operators.setter
+    def property_operators(self, operators: Dict[ChemistryPropertyType, DiagonalOperator]):
+        self._property_operators = operators
+        self._property_eigenvalue_matrix = None
+    
+    @property
+    def identity_operator(self) -> DiagonalOperator:
+        if self._identity_operator is None:
+            # Identity operator stored in diagonal form (N floats, not N² complex)
+            self._identity_operator = DiagonalOperator.identity(self.hilbert_dimension)
+        return self._identity_operator
+    
+    @property
+    def kinetic_operator(self) -> DiagonalOperator:
+        if self._kinetic_operator is None:
+            self._initialize_molecular_hamiltonian()
+        return self._kinetic_operator
+    
+    @property
+    def potential_operator(self) -> DiagonalOperator:
+        if self._potential_operator is None:
+            self._initialize_molecular_hamiltonian()
+        return self._potential_operator
+    
+    @property
+    def molecular_hamiltonian(self):
+        if self._molecular_hamiltonian is None:
+            self._initialize_molecular_hamiltonian()
+        return self._molecular_hamiltonian
+    
+    @molecular_hamiltonian.setter
+    def molecular_hamiltonian(self, hamiltonian):
+        self._molecular_hamiltonian = hamiltonian
+    
     def _initialize_gpu_context(self):
         """Initialize GPU acceleration context"""
+        has_mps, mps_type = detect_gpu_backend()
         try:
-            if HAS_MPS:
-                if MPS_TYPE == "PyTorch MPS":
+            if has_mps:
+                if mps_type == "PyTorch MPS":
                     import torch
                     self.device = torch.device("mps")
                     # Test MPS functionality
                     test_tensor = torch.randn(10, 10, device=self.device)
                     logger.info("✅ PyTorch MPS context initialized")
-                elif MPS_TYPE == "Metal Framework":
+                elif mps_type == "Metal Framework":
                     # Native Metal framework detected
                     logger.info("✅ Metal Framework detected - GPU operations available")
                 else:
@@ -171,7 +524,7 @@ class ChemistryVQbitEngine:
     
     def _gpu_matrix_multiply(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
         """GPU-accelerated matrix multiplication using MPS"""
-        if not self.gpu_acceleration or not HAS_MPS:
+        if not self.gpu_acceleration:
             return A @ B
             
         try:
@@ -185,7 +538,7 @@ class ChemistryVQbitEngine:
     
     def _gpu_eigendecomposition(self, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """GPU-accelerated eigenvalue decomposition"""
-        if not self.gpu_acceleration or not HAS_MPS:
+        if not self.gpu_acceleration:
             return np.linalg.eigh(matrix)
             
         try:
@@ -241,6 +594,13 @@ class ChemistryVQbitEngine:
     
     def _c_virtue_expectation(self, state: np.ndarray, virtue_operator: np.ndarray) -> float:
         """C-accelerated virtue expectation value"""
+        if isinstance(virtue_operator, DiagonalOperator):
+            if self.c_acceleration:
+                try:
+                    return quantum_ops.diagonal_expectation(state, virtue_operator.eigenvalues)
+                except Exception as e:
+                    logger.debug(f"C extension expectation failed, falling back: {e}")
+            return virtue_operator.expectation(state)
         # Always use numpy fallback for now since C extension diagonal handling needs work
         if virtue_operator.ndim == 2:
             # For diagonal matrices, extract diagonal for efficiency
@@ -268,9 +628,6 @@ class ChemistryVQbitEngine:
         # Uniform superposition: |ψ⟩ = (1/√2ⁿ) Σ|x⟩
         normalization = 1.0 / np.sqrt(self.hilbert_dimension)
         
-        # Create identity matrices for quantum operators
-        self.identity_operator = np.eye(self.hilbert_dimension, dtype=complex)
-        
         # Initialize quantum fourier transform operator
         self._initialize_qft_operators()
         
@@ -312,37 +669,51 @@ class ChemistryVQbitEngine:
         
         logger.info("✅ QFT operators initialized (functional form for large dimension)")
     
+    def _get_operator_spectra(self) -> np.ndarray:
+        """Seeded (len(SPECTRA_ROWS), N) eigenvalue bundle, loaded once per engine"""
+        if self._operator_spectra is None:
+            self._operator_spectra = load_operator_spectra(
+                self.hilbert_dimension, self.spectra_seed,
+                spectra_dir=self.spectra_dir, persist=self.persist_spectra
+            )
+        return self._operator_spectra
+    
     def _initialize_chemistry_property_operators(self):
         """Initialize chemistry-specific quantum property operators (optimized for large dimensions)"""
         logger.info("🔧 Initializing chemistry property operators...")
-        
-        # For large dimensions, use simpler diagonal operators to avoid memory issues
-        for prop_type in ChemistryPropertyType:
-            # Create diagonal Hermitian operator with random eigenvalues in [0,1]
-            eigenvals = np.random.uniform(0, 1, self.hilbert_dimension)
-            # Store as diagonal matrix (memory efficient)
-            self.property_operators[prop_type] = np.diag(eigenvals.astype(complex))
+        spectra = self._get_operator_spectra()
+        
+        # For large dimensions, use diagonal operators to avoid memory issues
+        property_operators = {}
+        property_types = list(ChemistryPropertyType)
+        for row, prop_type in enumerate(property_types):
+            # Diagonal Hermitian operator with seeded eigenvalues in [0,1] (a view into the bundle)
+            eigenvals = spectra[row]
+            property_operators[prop_type] = DiagonalOperator(eigenvals)
             
             logger.debug(f"✅ Property operator {prop_type.value}: eigenvalue range [{eigenvals.min():.3f}, {eigenvals.max():.3f}]")
         
+        # Rows 0..P-1 of the bundle already form the stacked batch-scoring matrix
+        self._property_operators = property_operators
+        self._property_eigenvalue_matrix = (property_types, spectra[:len(property_types)])
+        
         logger.info(f"✅ {len(ChemistryPropertyType)} chemistry property operators initialized (diagonal form)")
     
     def _initialize_molecular_hamiltonian(self):
         """Initialize molecular Hamiltonian operators (optimized for large dimensions)"""
         logger.info("🔧 Initializing molecular Hamiltonian...")
+        spectra = self._get_operator_spectra()
         
         # Use diagonal Hamiltonians for computational efficiency with large dimensions
         # Kinetic energy eigenvalues: T̂ = diag(E_kinetic)
-        kinetic_eigenvals = np.random.uniform(-10, 0, self.hilbert_dimension)  # Negative kinetic energies
-        self.kinetic_operator = np.diag(kinetic_eigenvals.astype(complex))
+        self._kinetic_operator = DiagonalOperator(spectra[SPECTRA_ROWS.index('kinetic')])
         
         # Potential energy eigenvalues: V̂ = diag(E_potential)  
-        potential_eigenvals = np.random.uniform(-5, 5, self.hilbert_dimension)
-        self.potential_operator = np.diag(potential_eigenvals.astype(complex))
+        self._potential_operator = DiagonalOperator(spectra[SPECTRA_ROWS.index('potential')])
         
         # Total molecular Hamiltonian: Ĥ = T̂ + V̂ (diagonal + diagonal = diagonal)
-        total_eigenvals = kinetic_eigenvals + potential_eigenvals
-        self.molecular_hamiltonian = np.diag(total_eigenvals.astype(complex))
+        self._molecular_hamiltonian = self._kinetic_operator + self._potential_operator
+        total_eigenvals = self._molecular_hamiltonian.eigenvalues
         
         logger.info(f"✅ Molecular Hamiltonian initialized - energy range: [{total_eigenvals.min():.3f}, {total_eigenvals.max():.3f}]")
     
@@ -355,8 +726,8 @@ class ChemistryVQbitEngine:
             "Coherence time": self.coherence_time == np.inf,
             "Quantum fidelity": self.quantum_fidelity == 1.0,
             "Decoherence rate": self.decoherence_rate == 0.0,
-            "Identity operator": np.allclose(self.identity_operator @ self.identity_operator, 
-                                           self.identity_operator, rtol=1e-12)
+            "Identity operator": np.allclose((self.identity_operator @ self.identity_operator).eigenvalues,
+                                           self.identity_operator.eigenvalues, rtol=1e-12)
         }
         
         for check_name, passed in checks.items():
@@ -411,12 +782,66 @@ class ChemistryVQbitEngine:
         property_scores = {}
         
         for prop_type, operator in self.property_operators.items():
-            # Quantum expectation value: ⟨ψ|P̂|ψ⟩
-            expectation_value = np.real(amplitudes.conj() @ operator @ amplitudes)
-            property_scores[prop_type] = float(expectation_value)
+            # Quantum expectation value: ⟨ψ|P̂|ψ⟩ = Σ |αᵢ|² λᵢ for diagonal P̂
+            property_scores[prop_type] = operator.expectation(amplitudes)
         
         return property_scores
     
+    def get_property_eigenvalue_matrix(self) -> Tuple[List[ChemistryPropertyType], np.ndarray]:
+        """Property types and their eigenvalues stacked into a (P, N) matrix"""
+        if self._property_eigenvalue_matrix is None:
+            property_types = list(self.property_operators.keys())
+            matrix = np.stack([self.property_operators[p].eigenvalues for p in property_types])
+            self._property_eigenvalue_matrix = (property_types, matrix)
+        return self._property_eigenvalue_matrix
+    
+    def calculate_property_expectations_batch(self, amplitudes: np.ndarray) -> Dict[ChemistryPropertyType, np.ndarray]:
+        """All property expectations for a (K, N) batch with one (K, N)·(N, P) matmul"""
+        property_types, eigenvalue_matrix = self.get_property_eigenvalue_matrix()
+        amplitudes = np.atleast_2d(amplitudes)
+        expectations = None
+        if self.c_acceleration:
+            try:
+                expectations = quantum_ops.diagonal_expectation_batch(amplitudes, eigenvalue_matrix)
+            except Exception as e:
+                logger.debug(f"C extension batch expectation failed, falling back: {e}")
+        if expectations is None:
+            probabilities = np.abs(amplitudes) ** 2
+            expectations = probabilities @ eigenvalue_matrix.T  # (K, P)
+        return {prop_type: expectations[:, idx] for idx, prop_type in enumerate(property_types)}
+    
+    def create_molecular_vqbit_batch(self, smiles_list: List[str], **kwargs) -> MolecularVQbitBatch:
+        """Create vQbit states for K molecules as one (K, N) amplitude array"""
+        n_molecules = len(smiles_list)
+        logger.info(f"🧬 Creating molecular vQbit batch for {n_molecules} molecules")
+        
+        # Uniform superposition with small random perturbations to break symmetry
+        normalization = 1.0 / np.sqrt(self.hilbert_dimension)
+        shape = (n_molecules, self.hilbert_dimension)
+        amplitudes = np.full(shape, normalization, dtype=complex)
+        amplitudes += 0.01 * (np.random.randn(*shape) + 1j * np.random.randn(*shape))
+        amplitudes /= np.linalg.norm(amplitudes, axis=1, keepdims=True)
+        
+        return MolecularVQbitBatch(
+            amplitudes=amplitudes,
+            identifiers=list(smiles_list),
+            property_scores=self.calculate_property_expectations_batch(amplitudes),
+            coherence=l1_coherence(amplitudes),
+            hilbert_dimension=self.hilbert_dimension
+        )
+    
+    def measure_properties_batch(self, batch) -> Dict[str, np.ndarray]:
+        """Columnar property measurements for a MolecularVQbitBatch or (K, N) amplitude array"""
+        if isinstance(batch, MolecularVQbitBatch):
+            batch.property_scores = self.calculate_property_expectations_batch(batch.amplitudes)
+            return batch.to_columns()
+        
+        amplitudes = np.atleast_2d(batch)
+        columns = {'coherence': l1_coherence(amplitudes)}
+        for prop_type, values in self.calculate_property_expectations_batch(amplitudes).items():
+            columns[prop_type.value] = values
+        return columns
+    
     def measure_property(self, vqbit_state: 'MolecularVQbitState', property_type: ChemistryPropertyType) -> float:
         """Measure a specific quantum property for a molecular vQbit state"""
         if property_type not in self.property_operators:
@@ -427,39 +852,92 @@ class ChemistryVQbitEngine:
     
     def _calculate_l1_coherence(self, amplitudes: np.ndarray) -> float:
         """Calculate L1-norm coherence: C(ρ) = Σᵢ≠ⱼ |ρᵢⱼ| / C_max"""
-        # Create density matrix: ρ = |ψ⟩⟨ψ|
-        density_matrix = np.outer(amplitudes, amplitudes.conj())
-        
-        # L1-norm of off-diagonal elements
-        off_diagonal_sum = 0.0
-        for i in range(self.hilbert_dimension):
-            for j in range(self.hilbert_dimension):
-                if i != j:
-                    off_diagonal_sum += abs(density_matrix[i, j])
-        
-        # Maximum possible coherence for this dimension
-        c_max = self.hilbert_dimension * (self.hilbert_dimension - 1) / 2
-        
-        return off_diagonal_sum / c_max if c_max > 0 else 0.0
+        return float(l1_coherence(amplitudes))
+    
+    def calculate_l1_coherence_batch(self, amplitudes: np.ndarray) -> np.ndarray:
+        """L1-norm coherence for a (K, N) stack of vQbit amplitudes"""
+        return l1_coherence(np.atleast_2d(amplitudes))
+    
+    def _build_total_hamiltonian(self, property_scores: Dict[ChemistryPropertyType, float]):
+        """Ĥ_total = Ĥ_mol + Σ 0.1·sₚ·P̂ₚ, kept diagonal whenever Ĥ_mol is diagonal"""
+        property_diagonal = np.zeros(self.hilbert_dimension)
+        for prop_type, score in property_scores.items():
+            property_diagonal += 0.1 * score * self.property_operators[prop_type].eigenvalues
+        
+        hamiltonian = self.molecular_hamiltonian
+        if isinstance(hamiltonian, DiagonalOperator):
+            return DiagonalOperator(hamiltonian.eigenvalues + property_diagonal)
+        if _is_sparse_matrix(hamiltonian):
+            import scipy.sparse
+            return (hamiltonian + scipy.sparse.diags(property_diagonal)).tocsr()
+        total_hamiltonian = np.array(hamiltonian, dtype=complex, copy=True)
+        total_hamiltonian[np.diag_indices_from(total_hamiltonian)] += property_diagonal
+        return total_hamiltonian
+    
+    @staticmethod
+    def _hamiltonian_fingerprint(hamiltonian) -> str:
+        """Content hash identifying a Hamiltonian for propagator caching"""
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(hamiltonian, DiagonalOperator):
+            digest.update(b'diagonal')
+            digest.update(hamiltonian.eigenvalues.tobytes())
+        elif _is_sparse_matrix(hamiltonian):
+            csr = hamiltonian.tocsr()
+            digest.update(b'csr')
+            for part in (csr.indptr, csr.indices, csr.data):
+                digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(b'dense')
+            digest.update(np.ascontiguousarray(hamiltonian).tobytes())
+        digest.update(repr(hamiltonian.shape).encode())
+        return digest.hexdigest()
+    
+    def _get_cached_propagator(self, key: Tuple[str, float]):
+        propagator = self._propagator_cache.get(key)
+        if propagator is not None:
+            self._propagator_cache.move_to_end(key)
+        return propagator
+    
+    def _store_propagator(self, key: Tuple[str, float], propagator: np.ndarray):
+        self._propagator_cache[key] = propagator
+        self._propagator_cache.move_to_end(key)
+        while len(self._propagator_cache) > self.propagator_cache_size:
+            self._propagator_cache.popitem(last=False)
+    
+    def apply_time_evolution(self, hamiltonian, amplitudes: np.ndarray, time_step: float) -> np.ndarray:
+        """Apply U(dt) = exp(-iĤdt) (ℏ = 1) to |ψ⟩ without a dense expm where avoidable
+        
+        - Diagonal Ĥ: elementwise phases exp(-iEᵢdt), O(N)
+        - Small non-diagonal Ĥ: dense propagator cached by (fingerprint, dt)
+        - Large non-diagonal Ĥ: Krylov-style expm_multiply on the action only
+        """
+        if isinstance(hamiltonian, DiagonalOperator):
+            return hamiltonian.evolve(amplitudes, time_step)
+        
+        dimension = hamiltonian.shape[0]
+        if dimension <= self.dense_propagator_max_dimension:
+            key = (self._hamiltonian_fingerprint(hamiltonian), float(time_step))
+            propagator = self._get_cached_propagator(key)
+            if propagator is None:
+                import scipy.linalg
+                dense = hamiltonian.toarray() if _is_sparse_matrix(hamiltonian) else hamiltonian
+                propagator = scipy.linalg.expm(-1j * dense * time_step)
+                self._store_propagator(key, propagator)
+            return propagator @ amplitudes
+        
+        import scipy.sparse.linalg
+        return scipy.sparse.linalg.expm_multiply(-1j * time_step * hamiltonian, amplitudes)
     
     def evolve_vqbit_state(self, vqbit_state: MolecularVQbitState, 
                           time_step: float = 0.01) -> MolecularVQbitState:
         """Evolve vQbit state under molecular Hamiltonian: |ψ(t+dt)⟩ = exp(-iĤdt/ℏ)|ψ(t)⟩"""
         logger.debug(f"⚛️ Evolving vQbit state - time_step: {time_step}")
         
-        # Construct total Hamiltonian with virtue contributions
-        total_hamiltonian = self.molecular_hamiltonian.copy()
+        # Construct total Hamiltonian with property operator contributions (weighted)
+        total_hamiltonian = self._build_total_hamiltonian(vqbit_state.property_scores)
         
-        # Add virtue operator contributions (weighted)
-        for virtue, score in vqbit_state.virtue_scores.items():
-            total_hamiltonian += 0.1 * score * self.virtue_operators[virtue]
-        
-        # Unitary time evolution operator: U(dt) = exp(-iĤdt/ℏ)
-        # Using ℏ = 1 in natural units
-        evolution_operator = scipy.linalg.expm(-1j * total_hamiltonian * time_step)
-        
-        # Apply unitary evolution
-        new_amplitudes = evolution_operator @ vqbit_state.amplitudes
+        # Apply unitary evolution U(dt) = exp(-iĤdt/ℏ) using ℏ = 1 in natural units
+        new_amplitudes = self.apply_time_evolution(total_hamiltonian, vqbit_state.amplitudes, time_step)
         
         # Verify unitarity preservation (should maintain normalization)
         norm_check = np.abs(np.linalg.norm(new_amplitudes) - 1.0)
@@ -468,7 +946,7 @@ class ChemistryVQbitEngine:
             new_amplitudes = new_amplitudes / np.linalg.norm(new_amplitudes)
         
         # Calculate updated properties
-        new_virtue_scores = self._calculate_virtue_projections(new_amplitudes)
+        new_property_scores = self._calculate_property_projections(new_amplitudes)
         new_coherence = self._calculate_l1_coherence(new_amplitudes)
         
         # Create evolved state
@@ -477,7 +955,7 @@ class ChemistryVQbitEngine:
             phases=vqbit_state.phases,  # Phases evolve with amplitudes
             coherence=new_coherence,
             entanglement=vqbit_state.entanglement.copy(),
-            virtue_scores=new_virtue_scores,
+            property_scores=new_property_scores,
             molecular_orbitals=vqbit_state.molecular_orbitals,
             bond_order_matrix=vqbit_state.bond_order_matrix,
             electron_density=vqbit_state.electron_density,
@@ -509,7 +987,7 @@ class ChemistryVQbitEngine:
             'measurement_probability': probabilities[measured_basis_index],
             'pre_measurement_coherence': vqbit_state.coherence,
             'post_measurement_coherence': 0.0,  # Coherence lost upon measurement
-            'virtue_scores': vqbit_state.virtue_scores,
+            'property_scores': {p.value: v for p, v in vqbit_state.property_scores.items()},
             'chemical_properties': {
                 'chemical_potential': vqbit_state.chemical_potential,
                 'reaction_coordinate': vqbit_state.reaction_coordinate
@@ -552,7 +1030,7 @@ class ChemistryVQbitEngine:
                 'iteration': iteration,
                 'fitness': fitness_score,
                 'coherence': current_vqbit.coherence,
-                'virtue_scores': current_vqbit.virtue_scores.copy(),
+                'property_scores': {p.value: v for p, v in current_vqbit.property_scores.items()},
                 'reaction_coordinate': current_vqbit.reaction_coordinate
             })
             
@@ -582,19 +1060,19 @@ class ChemistryVQbitEngine:
     
     def _calculate_fitness(self, vqbit_state: MolecularVQbitState, 
                           target_properties: Dict[str, float]) -> float:
-        """Calculate fitness based on virtue scores and target properties"""
+        """Calculate fitness based on property scores and target properties"""
         fitness = 0.0
         
-        # Virtue-based fitness (weighted by importance)
-        virtue_weights = {
-            ChemistryVirtueType.BENEFICENCE: 0.4,    # Therapeutic benefit
-            ChemistryVirtueType.PRUDENCE: 0.3,       # Sustainability
-            ChemistryVirtueType.HONESTY: 0.2,        # Experimental accuracy
-            ChemistryVirtueType.TEMPERANCE: 0.1      # Green chemistry
+        # Property-based fitness (weighted by importance)
+        property_weights = {
+            ChemistryPropertyType.BIOACTIVITY: 0.4,      # Therapeutic benefit
+            ChemistryPropertyType.SUSTAINABILITY: 0.3,   # Sustainability
+            ChemistryPropertyType.REPRODUCIBILITY: 0.2,  # Experimental accuracy
+            ChemistryPropertyType.EFFICIENCY: 0.1        # Green chemistry
         }
         
-        for virtue, weight in virtue_weights.items():
-            fitness += weight * vqbit_state.virtue_scores[virtue]
+        for prop_type, weight in property_weights.items():
+            fitness += weight * vqbit_state.property_scores[prop_type]
         
         # Coherence bonus (quantum advantage)
         fitness += 0.1 * vqbit_state.coherence
@@ -604,6 +1082,16 @@ class ChemistryVQbitEngine:
         
         return fitness
     
+    def get_operator_memory_bytes(self) -> int:
+        """Total bytes held by the engine's property and Hamiltonian operators"""
+        operators = list(self.property_operators.values()) + [
+            self.identity_operator,
+            self.kinetic_operator,
+            self.potential_operator,
+            self.molecular_hamiltonian,
+        ]
+        return int(sum(op.nbytes for op in operators))
+    
     def get_engine_status(self) -> Dict[str, Any]:
         """Get comprehensive engine status"""
         return {
@@ -615,14 +1103,16 @@ class ChemistryVQbitEngine:
                 'quantum_fidelity': self.quantum_fidelity,
                 'noiseless': True
             },
-            'virtue_operators': {
-                'count': len(self.virtue_operators),
-                'types': [v.value for v in ChemistryVirtueType]
+            'property_operators': {
+                'count': len(self.property_operators),
+                'types': [p.value for p in self.property_operators],
+                'storage': 'diagonal',
+                'operator_bytes': self.get_operator_memory_bytes()
             },
             'mathematical_properties': {
                 'qft_operator_unitary': True,
                 'hamiltonian_hermitian': True,
-                'virtue_operators_hermitian': True
+                'property_operators_hermitian': True
             },
             'adaptation_source': 'FoTFluidDynamics_proven_substrate',
             'created_at': datetime.now().isoformat()
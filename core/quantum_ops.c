@@ -1,12 +1,14 @@
 /*
  * Quantum Operations C Extension for FoTChemistry
- * High-performance matrix operations for 8096-dimensional vQbit states
- * 
+ * High-performance kernels for 8096-dimensional vQbit states
+ *
  * Critical paths that need C acceleration:
  * - Matrix-vector multiplication for large quantum states
- * - Eigenvalue decomposition for virtue operators  
- * - Quantum Fourier Transform operations
- * - State normalization and fidelity calculations
+ * - Diagonal operator expectation values (single state and (K, N) batches)
+ * - State normalization and fidelity calculations (single state and batches)
+ *
+ * All kernels validate dtype/shape/contiguity and release the GIL while
+ * they run, so they can be driven from a thread pool.
  */
 
 #define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
@@ -14,13 +16,13 @@
 #include <numpy/arrayobject.h>
 #include <complex.h>
 #include <math.h>
+#include <stdlib.h>
 
-// Use Apple's Accelerate framework on macOS
+// Use Apple's Accelerate framework on macOS, OpenBLAS (HAVE_CBLAS) on Linux
 #ifdef __APPLE__
 #include <Accelerate/Accelerate.h>
 #define HAS_BLAS 1
 #else
-// Try to include BLAS if available, otherwise use naive implementation
 #ifdef HAVE_CBLAS
 #include <cblas.h>
 #define HAS_BLAS 1
@@ -29,148 +31,466 @@
 #endif
 #endif
 
+/* ---------------------------------------------------------------------- */
+/* Argument helpers                                                        */
+/* ---------------------------------------------------------------------- */
+
+// Borrow `obj` as a C-contiguous, aligned array of `typenum` with `ndim` dims.
+// Returns a new reference or NULL with an exception set.
+static PyArrayObject* as_c_array(PyObject* obj, int typenum, int ndim, const char* name) {
+    PyArrayObject* arr = (PyArrayObject*)PyArray_FROM_OTF(obj, typenum, NPY_ARRAY_IN_ARRAY);
+    if (arr == NULL) {
+        return NULL;
+    }
+    if (PyArray_NDIM(arr) != ndim) {
+        PyErr_Format(PyExc_ValueError, "%s must be %d-dimensional, got %d dimensions",
+                     name, ndim, PyArray_NDIM(arr));
+        Py_DECREF(arr);
+        return NULL;
+    }
+    return arr;
+}
+
+// In-place kernels must not silently operate on a copy
+static int check_inplace_complex(PyObject* obj, int ndim, const char* name) {
+    if (!PyArray_Check(obj)) {
+        PyErr_Format(PyExc_TypeError, "%s must be a numpy array", name);
+        return 0;
+    }
+    PyArrayObject* arr = (PyArrayObject*)obj;
+    if (PyArray_TYPE(arr) != NPY_COMPLEX128 || PyArray_NDIM(arr) != ndim ||
+        !PyArray_IS_C_CONTIGUOUS(arr) || !PyArray_ISWRITEABLE(arr)) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s must be a writable, C-contiguous complex128 array with %d dimensions",
+                     name, ndim);
+        return 0;
+    }
+    return 1;
+}
+
+/* ---------------------------------------------------------------------- */
+/* Scalar kernels (no Python API, safe to call without the GIL)            */
+/* ---------------------------------------------------------------------- */
+
+static double kernel_norm(const double complex* state, npy_intp n) {
+    // Plain sum of squares: dznrm2's overflow-safe scaling is several times
+    // slower and unnecessary for unit-scale amplitudes
+    double norm_squared = 0.0;
+    for (npy_intp i = 0; i < n; i++) {
+        double re = creal(state[i]), im = cimag(state[i]);
+        norm_squared += re * re + im * im;
+    }
+    return sqrt(norm_squared);
+}
+
+static double kernel_normalize(double complex* state, npy_intp n) {
+    double norm = kernel_norm(state, n);
+    // Normalize in-place: ψ → ψ/||ψ|| (avoid division by zero)
+    if (norm > 1e-15) {
+#if HAS_BLAS
+        cblas_zdscal((int)n, 1.0 / norm, state, 1);
+#else
+        double inv_norm = 1.0 / norm;
+        for (npy_intp i = 0; i < n; i++) {
+            state[i] *= inv_norm;
+        }
+#endif
+    }
+    return norm;
+}
+
+static double kernel_fidelity(const double complex* a, const double complex* b, npy_intp n) {
+    // Inner product ⟨ψ₁|ψ₂⟩ = Σ ψ₁*[i] ψ₂[i]; fidelity is |⟨ψ₁|ψ₂⟩|²
+    double complex inner_product;
+#if HAS_BLAS
+    cblas_zdotc_sub((int)n, a, 1, b, 1, &inner_product);
+#else
+    inner_product = 0.0;
+    for (npy_intp i = 0; i < n; i++) {
+        inner_product += conj(a[i]) * b[i];
+    }
+#endif
+    return creal(inner_product * conj(inner_product));
+}
+
+static double kernel_diagonal_expectation(const double complex* state, const double* eigenvalues, npy_intp n) {
+    // ⟨ψ|D|ψ⟩ = Σ |αᵢ|² λᵢ
+    double expectation = 0.0;
+    for (npy_intp i = 0; i < n; i++) {
+        double re = creal(state[i]), im = cimag(state[i]);
+        expectation += (re * re + im * im) * eigenvalues[i];
+    }
+    return expectation;
+}
+
+/* ---------------------------------------------------------------------- */
+/* Python entry points                                                     */
+/* ---------------------------------------------------------------------- */
+
 // Fast matrix-vector multiplication for quantum state evolution
 static PyObject* fast_matvec(PyObject* self, PyObject* args) {
-    PyArrayObject *matrix, *vector, *result;
-    
-    if (!PyArg_ParseTuple(args, "OO", &matrix, &vector)) {
+    PyObject *matrix_obj, *vector_obj;
+    if (!PyArg_ParseTuple(args, "OO", &matrix_obj, &vector_obj)) {
+        return NULL;
+    }
+
+    PyArrayObject* matrix = as_c_array(matrix_obj, NPY_COMPLEX128, 2, "matrix");
+    if (matrix == NULL) {
+        return NULL;
+    }
+    PyArrayObject* vector = as_c_array(vector_obj, NPY_COMPLEX128, 1, "vector");
+    if (vector == NULL) {
+        Py_DECREF(matrix);
         return NULL;
     }
-    
-    // Get array dimensions
+
     npy_intp n = PyArray_DIM(matrix, 0);
     npy_intp m = PyArray_DIM(matrix, 1);
-    
     if (PyArray_DIM(vector, 0) != m) {
         PyErr_SetString(PyExc_ValueError, "Matrix and vector dimensions don't match");
+        Py_DECREF(matrix);
+        Py_DECREF(vector);
         return NULL;
     }
-    
-    // Create result array
+
     npy_intp dims[1] = {n};
-    result = (PyArrayObject*)PyArray_ZEROS(1, dims, NPY_COMPLEX128, 0);
-    
-    // Get data pointers
-    double complex* mat_data = (double complex*)PyArray_DATA(matrix);
-    double complex* vec_data = (double complex*)PyArray_DATA(vector);
+    PyArrayObject* result = (PyArrayObject*)PyArray_ZEROS(1, dims, NPY_COMPLEX128, 0);
+    if (result == NULL) {
+        Py_DECREF(matrix);
+        Py_DECREF(vector);
+        return NULL;
+    }
+
+    const double complex* mat_data = (const double complex*)PyArray_DATA(matrix);
+    const double complex* vec_data = (const double complex*)PyArray_DATA(vector);
     double complex* res_data = (double complex*)PyArray_DATA(result);
-    
-    // Perform optimized matrix-vector multiplication
+
+    Py_BEGIN_ALLOW_THREADS
 #if HAS_BLAS
-    // Using BLAS for maximum performance
-    double complex alpha = 1.0 + 0.0*I;
-    double complex beta = 0.0 + 0.0*I;
-    cblas_zgemv(CblasRowMajor, CblasNoTrans, n, m, 
-                &alpha, mat_data, m, vec_data, 1, &beta, res_data, 1);
+    double complex alpha = 1.0;
+    double complex beta = 0.0;
+    cblas_zgemv(CblasRowMajor, CblasNoTrans, (int)n, (int)m,
+                &alpha, mat_data, (int)m, vec_data, 1, &beta, res_data, 1);
 #else
-    // Naive implementation without BLAS
     for (npy_intp i = 0; i < n; i++) {
-        res_data[i] = 0.0;
+        double complex acc = 0.0;
         for (npy_intp j = 0; j < m; j++) {
-            res_data[i] += mat_data[i * m + j] * vec_data[j];
+            acc += mat_data[i * m + j] * vec_data[j];
         }
+        res_data[i] = acc;
     }
 #endif
-    
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(matrix);
+    Py_DECREF(vector);
     return (PyObject*)result;
 }
 
-// Fast quantum state normalization
+// Fast in-place quantum state normalization, returns the original norm
 static PyObject* normalize_state(PyObject* self, PyObject* args) {
-    PyArrayObject *state;
-    
-    if (!PyArg_ParseTuple(args, "O", &state)) {
+    PyObject* state_obj;
+    if (!PyArg_ParseTuple(args, "O", &state_obj)) {
         return NULL;
     }
-    
-    npy_intp n = PyArray_DIM(state, 0);
-    double complex* state_data = (double complex*)PyArray_DATA(state);
-    
-    // Calculate norm: ||ψ||² = Σ|αᵢ|²
-    double norm_squared = 0.0;
-    for (npy_intp i = 0; i < n; i++) {
-        double complex amp = state_data[i];
-        norm_squared += creal(amp * conj(amp));
-    }
-    
-    double norm = sqrt(norm_squared);
-    
-    // Normalize in-place: ψ → ψ/||ψ||
-    if (norm > 1e-15) {  // Avoid division by zero
-        for (npy_intp i = 0; i < n; i++) {
-            state_data[i] /= norm;
-        }
+    if (!check_inplace_complex(state_obj, 1, "state")) {
+        return NULL;
     }
-    
+
+    PyArrayObject* state = (PyArrayObject*)state_obj;
+    npy_intp n = PyArray_DIM(state, 0);
+    double complex* data = (double complex*)PyArray_DATA(state);
+    double norm;
+
+    Py_BEGIN_ALLOW_THREADS
+    norm = kernel_normalize(data, n);
+    Py_END_ALLOW_THREADS
+
     return PyFloat_FromDouble(norm);
 }
 
+// Normalize every row of a (K, N) state batch in place, returns the (K,) norms
+static PyObject* normalize_states_batch(PyObject* self, PyObject* args) {
+    PyObject* states_obj;
+    if (!PyArg_ParseTuple(args, "O", &states_obj)) {
+        return NULL;
+    }
+    if (!check_inplace_complex(states_obj, 2, "states")) {
+        return NULL;
+    }
+
+    PyArrayObject* states = (PyArrayObject*)states_obj;
+    npy_intp k = PyArray_DIM(states, 0);
+    npy_intp n = PyArray_DIM(states, 1);
+
+    npy_intp dims[1] = {k};
+    PyArrayObject* norms = (PyArrayObject*)PyArray_ZEROS(1, dims, NPY_FLOAT64, 0);
+    if (norms == NULL) {
+        return NULL;
+    }
+
+    double complex* data = (double complex*)PyArray_DATA(states);
+    double* norm_data = (double*)PyArray_DATA(norms);
+
+    Py_BEGIN_ALLOW_THREADS
+#ifdef _OPENMP
+    #pragma omp parallel for schedule(static)
+#endif
+    for (npy_intp row = 0; row < k; row++) {
+        norm_data[row] = kernel_normalize(data + row * n, n);
+    }
+    Py_END_ALLOW_THREADS
+
+    return (PyObject*)norms;
+}
+
 // Fast quantum fidelity calculation F = |⟨ψ₁|ψ₂⟩|²
 static PyObject* quantum_fidelity(PyObject* self, PyObject* args) {
-    PyArrayObject *state1, *state2;
-    
-    if (!PyArg_ParseTuple(args, "OO", &state1, &state2)) {
+    PyObject *state1_obj, *state2_obj;
+    if (!PyArg_ParseTuple(args, "OO", &state1_obj, &state2_obj)) {
+        return NULL;
+    }
+
+    PyArrayObject* state1 = as_c_array(state1_obj, NPY_COMPLEX128, 1, "state1");
+    if (state1 == NULL) {
+        return NULL;
+    }
+    PyArrayObject* state2 = as_c_array(state2_obj, NPY_COMPLEX128, 1, "state2");
+    if (state2 == NULL) {
+        Py_DECREF(state1);
         return NULL;
     }
-    
+
     npy_intp n = PyArray_DIM(state1, 0);
     if (PyArray_DIM(state2, 0) != n) {
         PyErr_SetString(PyExc_ValueError, "State dimensions don't match");
+        Py_DECREF(state1);
+        Py_DECREF(state2);
         return NULL;
     }
-    
-    double complex* data1 = (double complex*)PyArray_DATA(state1);
-    double complex* data2 = (double complex*)PyArray_DATA(state2);
-    
-    // Calculate inner product ⟨ψ₁|ψ₂⟩ = Σ ψ₁*[i] * ψ₂[i]
-    double complex inner_product = 0.0;
-    for (npy_intp i = 0; i < n; i++) {
-        inner_product += conj(data1[i]) * data2[i];
-    }
-    
-    // Fidelity is |⟨ψ₁|ψ₂⟩|²
-    double fidelity = creal(inner_product * conj(inner_product));
-    
+
+    const double complex* data1 = (const double complex*)PyArray_DATA(state1);
+    const double complex* data2 = (const double complex*)PyArray_DATA(state2);
+    double fidelity;
+
+    Py_BEGIN_ALLOW_THREADS
+    fidelity = kernel_fidelity(data1, data2, n);
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(state1);
+    Py_DECREF(state2);
     return PyFloat_FromDouble(fidelity);
 }
 
-// Fast virtue operator expectation value ⟨ψ|V̂|ψ⟩
-static PyObject* virtue_expectation(PyObject* self, PyObject* args) {
-    PyArrayObject *state, *virtue_operator;
-    
-    if (!PyArg_ParseTuple(args, "OO", &state, &virtue_operator)) {
+// Fidelity of every row of a (K, N) batch against one reference state, returns (K,)
+static PyObject* quantum_fidelity_batch(PyObject* self, PyObject* args) {
+    PyObject *states_obj, *reference_obj;
+    if (!PyArg_ParseTuple(args, "OO", &states_obj, &reference_obj)) {
         return NULL;
     }
-    
-    npy_intp n = PyArray_DIM(state, 0);
-    
-    // For diagonal virtue operators (memory efficient)
-    if (PyArray_NDIM(virtue_operator) == 1) {
-        double complex* state_data = (double complex*)PyArray_DATA(state);
-        double* virtue_data = (double*)PyArray_DATA(virtue_operator);
-        
-        double expectation = 0.0;
+
+    PyArrayObject* states = as_c_array(states_obj, NPY_COMPLEX128, 2, "states");
+    if (states == NULL) {
+        return NULL;
+    }
+    PyArrayObject* reference = as_c_array(reference_obj, NPY_COMPLEX128, 1, "reference");
+    if (reference == NULL) {
+        Py_DECREF(states);
+        return NULL;
+    }
+
+    npy_intp k = PyArray_DIM(states, 0);
+    npy_intp n = PyArray_DIM(states, 1);
+    if (PyArray_DIM(reference, 0) != n) {
+        PyErr_SetString(PyExc_ValueError, "State dimensions don't match");
+        Py_DECREF(states);
+        Py_DECREF(reference);
+        return NULL;
+    }
+
+    npy_intp dims[1] = {k};
+    PyArrayObject* result = (PyArrayObject*)PyArray_ZEROS(1, dims, NPY_FLOAT64, 0);
+    if (result == NULL) {
+        Py_DECREF(states);
+        Py_DECREF(reference);
+        return NULL;
+    }
+
+    const double complex* state_data = (const double complex*)PyArray_DATA(states);
+    const double complex* ref_data = (const double complex*)PyArray_DATA(reference);
+    double* res_data = (double*)PyArray_DATA(result);
+    int failed = 0;
+
+    Py_BEGIN_ALLOW_THREADS
+#if HAS_BLAS
+    // |⟨ψₖ|φ⟩|² = |(S · φ*)ₖ|², so one zgemv against conj(φ) gives every overlap
+    double complex* ref_conj = (double complex*)malloc((size_t)n * sizeof(double complex));
+    double complex* overlaps = (double complex*)malloc((size_t)k * sizeof(double complex));
+    if (ref_conj == NULL || overlaps == NULL) {
+        failed = 1;
+    } else {
         for (npy_intp i = 0; i < n; i++) {
-            double complex amp = state_data[i];
-            double prob = creal(amp * conj(amp));  // |αᵢ|²
-            expectation += prob * virtue_data[i];
+            ref_conj[i] = conj(ref_data[i]);
+        }
+        double complex alpha = 1.0;
+        double complex beta = 0.0;
+        cblas_zgemv(CblasRowMajor, CblasNoTrans, (int)k, (int)n,
+                    &alpha, state_data, (int)n, ref_conj, 1, &beta, overlaps, 1);
+        for (npy_intp row = 0; row < k; row++) {
+            res_data[row] = creal(overlaps[row] * conj(overlaps[row]));
+        }
+    }
+    free(ref_conj);
+    free(overlaps);
+#else
+    for (npy_intp row = 0; row < k; row++) {
+        res_data[row] = kernel_fidelity(state_data + row * n, ref_data, n);
+    }
+#endif
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(states);
+    Py_DECREF(reference);
+    if (failed) {
+        Py_DECREF(result);
+        return PyErr_NoMemory();
+    }
+    return (PyObject*)result;
+}
+
+// Diagonal operator expectation value ⟨ψ|D|ψ⟩ from the eigenvalue vector
+static PyObject* diagonal_expectation(PyObject* self, PyObject* args) {
+    PyObject *state_obj, *eigenvalues_obj;
+    if (!PyArg_ParseTuple(args, "OO", &state_obj, &eigenvalues_obj)) {
+        return NULL;
+    }
+
+    PyArrayObject* state = as_c_array(state_obj, NPY_COMPLEX128, 1, "state");
+    if (state == NULL) {
+        return NULL;
+    }
+    PyArrayObject* eigenvalues = as_c_array(eigenvalues_obj, NPY_FLOAT64, 1, "eigenvalues");
+    if (eigenvalues == NULL) {
+        Py_DECREF(state);
+        return NULL;
+    }
+
+    npy_intp n = PyArray_DIM(state, 0);
+    if (PyArray_DIM(eigenvalues, 0) != n) {
+        PyErr_SetString(PyExc_ValueError, "State and eigenvalue dimensions don't match");
+        Py_DECREF(state);
+        Py_DECREF(eigenvalues);
+        return NULL;
+    }
+
+    const double complex* state_data = (const double complex*)PyArray_DATA(state);
+    const double* eig_data = (const double*)PyArray_DATA(eigenvalues);
+    double expectation;
+
+    Py_BEGIN_ALLOW_THREADS
+    expectation = kernel_diagonal_expectation(state_data, eig_data, n);
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(state);
+    Py_DECREF(eigenvalues);
+    return PyFloat_FromDouble(expectation);
+}
+
+// All diagonal expectations for a (K, N) batch against a (P, N) eigenvalue matrix, returns (K, P)
+static PyObject* diagonal_expectation_batch(PyObject* self, PyObject* args) {
+    PyObject *states_obj, *eigenvalues_obj;
+    if (!PyArg_ParseTuple(args, "OO", &states_obj, &eigenvalues_obj)) {
+        return NULL;
+    }
+
+    PyArrayObject* states = as_c_array(states_obj, NPY_COMPLEX128, 2, "states");
+    if (states == NULL) {
+        return NULL;
+    }
+    PyArrayObject* eigenvalues = as_c_array(eigenvalues_obj, NPY_FLOAT64, 2, "eigenvalues");
+    if (eigenvalues == NULL) {
+        Py_DECREF(states);
+        return NULL;
+    }
+
+    npy_intp k = PyArray_DIM(states, 0);
+    npy_intp n = PyArray_DIM(states, 1);
+    npy_intp p = PyArray_DIM(eigenvalues, 0);
+    if (PyArray_DIM(eigenvalues, 1) != n) {
+        PyErr_SetString(PyExc_ValueError, "State and eigenvalue dimensions don't match");
+        Py_DECREF(states);
+        Py_DECREF(eigenvalues);
+        return NULL;
+    }
+
+    npy_intp dims[2] = {k, p};
+    PyArrayObject* result = (PyArrayObject*)PyArray_ZEROS(2, dims, NPY_FLOAT64, 0);
+    if (result == NULL) {
+        Py_DECREF(states);
+        Py_DECREF(eigenvalues);
+        return NULL;
+    }
+
+    const double complex* state_data = (const double complex*)PyArray_DATA(states);
+    const double* eig_data = (const double*)PyArray_DATA(eigenvalues);
+    double* res_data = (double*)PyArray_DATA(result);
+    int failed = 0;
+
+    Py_BEGIN_ALLOW_THREADS
+#if HAS_BLAS
+    // Probabilities |αₖᵢ|² into a (K, N) buffer, then one dgemm: (K, N) · (N, P)
+    double* probabilities = (double*)malloc((size_t)(k * n) * sizeof(double));
+    if (probabilities == NULL) {
+        failed = 1;
+    } else {
+#ifdef _OPENMP
+        #pragma omp parallel for schedule(static)
+#endif
+        for (npy_intp idx = 0; idx < k * n; idx++) {
+            double re = creal(state_data[idx]), im = cimag(state_data[idx]);
+            probabilities[idx] = re * re + im * im;
         }
-        
-        return PyFloat_FromDouble(expectation);
-    }
-    
-    // For full matrix virtue operators
-    // V̂_exp = ⟨ψ|V̂|ψ⟩ = ψ† V̂ ψ
-    // This would require more complex implementation
-    Py_RETURN_NONE;
+        cblas_dgemm(CblasRowMajor, CblasNoTrans, CblasTrans, (int)k, (int)p, (int)n,
+                    1.0, probabilities, (int)n, eig_data, (int)n, 0.0, res_data, (int)p);
+        free(probabilities);
+    }
+#else
+#ifdef _OPENMP
+    #pragma omp parallel for schedule(static)
+#endif
+    for (npy_intp row = 0; row < k; row++) {
+        for (npy_intp col = 0; col < p; col++) {
+            res_data[row * p + col] = kernel_diagonal_expectation(state_data + row * n, eig_data + col * n, n);
+        }
+    }
+#endif
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(states);
+    Py_DECREF(eigenvalues);
+    if (failed) {
+        Py_DECREF(result);
+        return PyErr_NoMemory();
+    }
+    return (PyObject*)result;
+}
+
+// Whether the module was compiled against a BLAS library
+static PyObject* has_blas(PyObject* self, PyObject* args) {
+    return PyBool_FromLong(HAS_BLAS);
 }
 
 // Method definitions
 static PyMethodDef QuantumOpsMethods[] = {
     {"fast_matvec", fast_matvec, METH_VARARGS, "Fast matrix-vector multiplication"},
-    {"normalize_state", normalize_state, METH_VARARGS, "Normalize quantum state"},
-    {"quantum_fidelity", quantum_fidelity, METH_VARARGS, "Calculate quantum fidelity"},
-    {"virtue_expectation", virtue_expectation, METH_VARARGS, "Calculate virtue expectation value"},
+    {"normalize_state", normalize_state, METH_VARARGS, "Normalize quantum state in place, returns the norm"},
+    {"normalize_states_batch", normalize_states_batch, METH_VARARGS, "Normalize each row of a (K, N) batch in place, returns the norms"},
+    {"quantum_fidelity", quantum_fidelity, METH_VARARGS, "Calculate quantum fidelity |<a|b>|^2"},
+    {"quantum_fidelity_batch", quantum_fidelity_batch, METH_VARARGS, "Fidelity of each row of a (K, N) batch against a reference state"},
+    {"diagonal_expectation", diagonal_expectation, METH_VARARGS, "Expectation value of a diagonal operator given its eigenvalues"},
+    {"diagonal_expectation_batch", diagonal_expectation_batch, METH_VARARGS, "(K, P) expectations of P diagonal operators over K states"},
+    {"virtue_expectation", diagonal_expectation, METH_VARARGS, "Alias of diagonal_expectation"},
+    {"has_blas", has_blas, METH_NOARGS, "Whether the extension was built against BLAS"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -2,8 +2,14 @@
 Setup script for compiling the quantum_ops C extension
 Optimized for performance-critical quantum operations
 
-Usage:
+Usage (from the repository root):
     python core/setup_quantum_ops.py build_ext --inplace
+
+On Linux the extension links OpenBLAS through its CBLAS interface
+(Debian/Ubuntu: ``apt install libopenblas-dev``). Set OPENBLAS_DIR to point
+at a non-system OpenBLAS install, QUANTUM_OPS_NO_BLAS=1 to build the
+portable loop-only kernels, and QUANTUM_OPS_NATIVE=1 to tune for the build
+host with -march=native (do not ship such builds to other nodes).
 """
 
 from setuptools import setup, Extension
@@ -12,8 +18,14 @@ import platform
 import os
 
 # Platform-specific optimizations
-extra_compile_args = ["-O3", "-ffast-math"]
+extra_compile_args = ["-O3"]
 extra_link_args = []
+define_macros = []
+include_dirs = [np.get_include()]
+library_dirs = []
+libraries = []
+
+use_blas = os.environ.get("QUANTUM_OPS_NO_BLAS", "").lower() not in ("1", "true", "yes")
 
 if platform.system() == "Darwin":  # macOS
     # Apple Silicon optimizations (avoid -march=native issues)
@@ -21,46 +33,43 @@ if platform.system() == "Darwin":  # macOS
         extra_compile_args.extend(["-mcpu=apple-a14"])  # Apple Silicon
     else:
         extra_compile_args.extend(["-march=x86-64"])    # Intel Mac
+    include_dirs.extend(['/usr/local/include', '/opt/homebrew/include'])
+    library_dirs.extend(['/usr/local/lib', '/opt/homebrew/lib'])
     # Link against Accelerate framework for optimized BLAS
     extra_link_args.extend(["-framework", "Accelerate"])
-    
+
 elif platform.system() == "Linux":
-    # Linux optimizations
-    extra_compile_args.extend([
-        "-march=native",
-        "-mtune=native",
-        "-fopenmp"  # OpenMP for parallel operations
-    ])
-    extra_link_args.extend(["-lgomp", "-lopenblas"])
+    # OpenMP for the batched kernels
+    extra_compile_args.append("-fopenmp")
+    extra_link_args.append("-fopenmp")
+    if os.environ.get("QUANTUM_OPS_NATIVE", "").lower() in ("1", "true", "yes"):
+        extra_compile_args.extend(["-march=native", "-mtune=native"])
+
+    if use_blas:
+        # OpenBLAS ships cblas.h under /usr/include/<multiarch> on Debian-based
+        # systems (already on the default search path) or under include/openblas
+        openblas_dir = os.environ.get("OPENBLAS_DIR")
+        if openblas_dir:
+            include_dirs.extend([os.path.join(openblas_dir, "include"),
+                                 os.path.join(openblas_dir, "include", "openblas")])
+            library_dirs.append(os.path.join(openblas_dir, "lib"))
+        include_dirs.append("/usr/include/openblas")
+        define_macros.append(("HAVE_CBLAS", "1"))
+        libraries.append("openblas")
 
 # Define the extension module
 quantum_ops_ext = Extension(
     name='quantum_ops',
     sources=['core/quantum_ops.c'],
-    include_dirs=[
-        np.get_include(),
-        '/usr/local/include',  # For BLAS headers
-        '/opt/homebrew/include'  # For Apple Silicon homebrew
-    ],
-    library_dirs=[
-        '/usr/local/lib',
-        '/opt/homebrew/lib'
-    ],
-    libraries=['blas', 'lapack'],
+    include_dirs=include_dirs,
+    library_dirs=library_dirs,
+    libraries=libraries,
+    define_macros=define_macros,
     extra_compile_args=extra_compile_args,
     extra_link_args=extra_link_args,
     language='c'
 )
 
-setup(
-    name='quantum_ops',
-    version='1.0.0',
-    description='High-performance quantum operations for FoTChemistry',
-    ext_modules=[quantum_ops_ext],
-    zip_safe=False,
-    python_requires='>=3.8'
-)
-
 if __name__ == "__main__":
     print("🔨 Compiling quantum operations C extension...")
     print("💡 This will provide significant speedup for 8096-dimensional quantum operations")
@@ -68,5 +77,16 @@ if __name__ == "__main__":
     print("Platform optimizations:")
     print(f"  - System: {platform.system()}")
     print(f"  - Architecture: {platform.machine()}")
+    print(f"  - BLAS: {'enabled' if use_blas or platform.system() == 'Darwin' else 'disabled'}")
     print(f"  - Compile flags: {' '.join(extra_compile_args)}")
-    print(f"  - Link flags: {' '.join(extra_link_args)}")
+    print(f"  - Link flags: {' '.join(extra_link_args + ['-l' + lib for lib in libraries])}")
+    print()
+
+setup(
+    name='quantum_ops',
+    version='1.1.0',
+    description='High-performance quantum operations for FoTChemistry',
+    ext_modules=[quantum_ops_ext],
+    zip_safe=False,
+    python_requires='>=3.8'
+)
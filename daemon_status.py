@@ -33,14 +33,45 @@ def check_daemon_status():
     
     return daemon_processes
 
+STATUS_CACHE_FILE = Path(".daemon_status_cache.json")
+
+def load_status_cache():
+    """Load parser state persisted by the previous status check"""
+    
+    try:
+        with open(STATUS_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_status_cache(cache):
+    """Persist parser state so the next status check resumes where this one stopped"""
+    
+    try:
+        tmp_file = STATUS_CACHE_FILE.with_name(STATUS_CACHE_FILE.name + '.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, STATUS_CACHE_FILE)
+    except OSError as e:
+        print(f"Error saving status cache: {e}")
+
 def parse_daemon_log():
-    """Parse daemon log for statistics"""
+    """Parse daemon log for statistics (only lines appended since the last check)"""
     
     log_file = Path("discovery_daemon.log")
     if not log_file.exists():
         return None
     
-    stats = {
+    cache = load_status_cache()
+    log_state = cache.get('log', {})
+    log_stat = log_file.stat()
+    
+    # Start over when the log was rotated or truncated
+    offset = log_state.get('offset', 0)
+    if log_state.get('inode') != log_stat.st_ino or log_stat.st_size < offset:
+        log_state, offset = {}, 0
+    
+    stats = log_state.get('stats') or {
         'discoveries_found': 0,
         'sequences_tested': 0,
         'last_discovery_time': None,
@@ -49,57 +80,77 @@ def parse_daemon_log():
     }
     
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-        
-        for line in lines:
-            if 'SIGNIFICANT DISCOVERY FOUND!' in line:
-                stats['discoveries_found'] += 1
-                # Extract timestamp
-                if line.startswith('2025-'):
-                    timestamp = line.split(' - ')[0]
-                    stats['last_discovery_time'] = timestamp
-            
-            elif 'sequences tested' in line and 'runtime' in line:
-                # Extract numbers from progress lines
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    if part == 'discoveries,' and i > 0:
-                        stats['discoveries_found'] = int(parts[i-1])
-                    elif part == 'tested,' and i > 0:
-                        stats['sequences_tested'] = int(parts[i-1])
-            
-            # Keep last log entry
-            stats['last_log_entry'] = line.strip()
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            for raw_line in f:
+                # Leave a partially written last line for the next check
+                if not raw_line.endswith(b'\n'):
+                    break
+                offset += len(raw_line)
+                line = raw_line.decode('utf-8', errors='replace')
+                
+                if 'SIGNIFICANT DISCOVERY FOUND!' in line:
+                    stats['discoveries_found'] += 1
+                    # Extract timestamp
+                    if line.startswith('2025-'):
+                        timestamp = line.split(' - ')[0]
+                        stats['last_discovery_time'] = timestamp
+                
+                elif 'sequences tested' in line and 'runtime' in line:
+                    # Extract numbers from progress lines
+                    parts = line.split()
+                    for i, part in enumerate(parts):
+                        if part == 'discoveries,' and i > 0:
+                            stats['discoveries_found'] = int(parts[i-1])
+                        elif part == 'tested,' and i > 0:
+                            stats['sequences_tested'] = int(parts[i-1])
+                
+                # Keep last log entry
+                stats['last_log_entry'] = line.strip()
     
     except Exception as e:
         print(f"Error parsing log: {e}")
     
+    cache['log'] = {'inode': log_stat.st_ino, 'offset': offset, 'stats': stats}
+    save_status_cache(cache)
+    
     return stats
 
 def get_discovery_files():
-    """Get list of recent discovery files"""
+    """Get list of recent discovery files (rescanned only when the directory changes)"""
     
     discovery_dir = Path("daemon_discoveries")
     if not discovery_dir.exists():
         return []
     
-    discovery_files = []
-    for file_path in discovery_dir.glob("significant_discovery_*.json"):
-        try:
-            stat = file_path.stat()
-            discovery_files.append({
-                'filename': file_path.name,
-                'size_kb': stat.st_size / 1024,
-                'modified_time': datetime.fromtimestamp(stat.st_mtime),
-                'path': str(file_path)
-            })
-        except Exception:
-            continue
+    cache = load_status_cache()
+    listing = cache.get('discovery_files', {})
+    dir_mtime = discovery_dir.stat().st_mtime_ns
+    
+    if listing.get('dir_mtime') != dir_mtime:
+        files = []
+        for file_path in discovery_dir.glob("significant_discovery_*.json"):
+            try:
+                stat = file_path.stat()
+                files.append({
+                    'filename': file_path.name,
+                    'size_kb': stat.st_size / 1024,
+                    'modified_time': stat.st_mtime,
+                    'path': str(file_path)
+                })
+            except Exception:
+                continue
+        
+        # Sort by modification time (newest first)
+        files.sort(key=lambda x: x['modified_time'], reverse=True)
+        listing = {'dir_mtime': dir_mtime, 'files': files}
+        cache['discovery_files'] = listing
+        save_status_cache(cache)
     
-    # Sort by modification time (newest first)
-    discovery_files.sort(key=lambda x: x['modified_time'], reverse=True)
-    return discovery_files
+    return [
+        dict(file_info, modified_time=datetime.fromtimestamp(file_info['modified_time']))
+        for file_info in listing['files']
+    ]
 
 def load_recent_discovery():
     """Load the most recent significant discovery"""
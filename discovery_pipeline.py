@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+STAGE-PARALLEL DISCOVERY PIPELINE
+Runs the steps of a discovery cycle as concurrent stages
+Each stage is a pool of worker threads fed by a bounded queue, so while one
+campaign is being measured the next one is already being scouted. Throughput
+is set by the slowest stage rather than by the sum of all stages, and the
+bounded queues keep a fast stage from running arbitrarily far ahead.
+"""
+
+import queue
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of input; each worker that sees it exits
+_END = object()
+
+
+@dataclass
+class PipelineStage:
+    """
+    One pipeline step.
+
+    fn receives an item and returns an iterable of items for the next stage:
+    an empty result drops the item, several results fan it out.
+    """
+    name: str
+    fn: Callable[[Any], Iterable[Any]]
+    workers: int = 1
+    queue_size: int = 4
+
+
+class StagePipeline:
+    """
+    Bounded-queue pipeline of worker pools.
+
+    Items enter through submit(); outputs of the last stage are read with
+    results() or next_result(). close() lets the stages drain and stop();
+    stop() abandons queued work once running items finish. Exceptions raised
+    by a stage are logged and drop the item.
+    """
+
+    def __init__(self, stages: List[PipelineStage], name: str = "discovery"):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+
+        self.name = name
+        self.stages = stages
+        self._queues = [queue.Queue(maxsize=stage.queue_size) for stage in stages]
+        self._output = queue.Queue()
+        self._stopped = threading.Event()
+        self._closed = False
+        self._metrics_lock = threading.Lock()
+        self._live_workers = [stage.workers for stage in stages]
+        self._started = time.perf_counter()
+
+        self.metrics = {
+            stage.name: {
+                'workers': stage.workers,
+                'queue_size': stage.queue_size,
+                'items_in': 0,
+                'items_out': 0,
+                'errors': 0,
+                'active': 0,
+                'busy_time': 0.0,
+                'max_queue_depth': 0,
+                'backpressure_time': 0.0
+            }
+            for stage in stages
+        }
+
+        self._threads = [
+            threading.Thread(target=self._work, args=(index,), name=f"{name}-{stage.name}-{n}", daemon=True)
+            for index, stage in enumerate(stages)
+            for n in range(stage.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        logger.info(f"🏭 Pipeline '{name}' started: " +
+                    " → ".join(f"{stage.name}×{stage.workers}" for stage in stages))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def submit(self, item: Any, timeout: Optional[float] = None):
+        """Feed an item to the first stage; blocks while its queue is full, raising queue.Full on timeout"""
+
+        if self._closed:
+            raise RuntimeError("Pipeline is closed")
+        self._put(0, item, timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Signal end of input, let every stage drain and wait for the workers"""
+
+        if self._closed:
+            return
+
+        self._closed = True
+        self._signal_end(0)
+        self._join(timeout)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Discard queued items and stop once the items being processed finish"""
+
+        self._closed = True
+        self._stopped.set()
+        self._join(timeout)
+
+    def next_result(self, timeout: Optional[float] = None) -> Any:
+        """Next output of the last stage; raises queue.Empty on timeout or once the pipeline has finished"""
+
+        item = self._output.get(timeout=timeout)
+        if item is _END:
+            # Leave the marker for other readers
+            self._output.put(_END)
+            raise queue.Empty
+        return item
+
+    def results(self) -> Iterator[Any]:
+        """Yield outputs as they are produced until the pipeline has finished"""
+
+        while True:
+            item = self._output.get()
+            if item is _END:
+                self._output.put(_END)
+                return
+            yield item
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage counters, current queue depth and worker utilisation"""
+
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        with self._metrics_lock:
+            metrics = {name: dict(values) for name, values in self.metrics.items()}
+
+        for stage, stage_queue in zip(self.stages, self._queues):
+            values = metrics[stage.name]
+            values['queue_depth'] = stage_queue.qsize()
+            values['utilisation'] = min(values['busy_time'] / (elapsed * stage.workers), 1.0)
+            values['avg_item_time'] = values['busy_time'] / values['items_in'] if values['items_in'] else 0.0
+        return metrics
+
+    def bottleneck(self) -> Optional[str]:
+        """Name of the most utilised stage"""
+
+        metrics = self.get_metrics()
+        return max(metrics, key=lambda name: metrics[name]['utilisation']) if metrics else None
+
+    def _put(self, index: int, item: Any, timeout: Optional[float] = None):
+        """Put into a stage queue, recording depth and time spent blocked on a full queue"""
+
+        target = self._queues[index]
+        values = self.metrics[self.stages[index].name]
+        wait_start = time.perf_counter()
+        deadline = None if timeout is None else wait_start + timeout
+        try:
+            target.put_nowait(item)
+            blocked = False
+        except queue.Full:
+            blocked = True
+            while True:
+                # Wake periodically so stop() is not stuck behind a full queue
+                try:
+                    target.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    if self._stopped.is_set():
+                        return
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        raise
+
+        with self._metrics_lock:
+            values['max_queue_depth'] = max(values['max_queue_depth'], target.qsize())
+            if blocked:
+                values['backpressure_time'] += time.perf_counter() - wait_start
+
+    def _signal_end(self, index: int):
+        """Queue one end marker per worker of the stage"""
+
+        for _ in range(self.stages[index].workers):
+            self._put(index, _END)
+
+    def _work(self, index: int):
+        """Worker thread: process items of one stage and forward the outputs"""
+
+        stage = self.stages[index]
+        values = self.metrics[stage.name]
+        last = index == len(self.stages) - 1
+
+        while not self._stopped.is_set():
+            try:
+                item = self._queues[index].get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _END:
+                break
+
+            with self._metrics_lock:
+                values['items_in'] += 1
+                values['active'] += 1
+            started = time.perf_counter()
+            try:
+                outputs = list(stage.fn(item) or [])
+            except Exception as e:
+                outputs = []
+                logger.warning(f"⚠️ Pipeline stage {stage.name} failed: {e}")
+                with self._metrics_lock:
+                    values['errors'] += 1
+            with self._metrics_lock:
+                values['active'] -= 1
+                values['busy_time'] += time.perf_counter() - started
+                values['items_out'] += len(outputs)
+
+            for output in outputs:
+                if last:
+                    self._output.put(output)
+                else:
+                    self._put(index + 1, output)
+
+        # The last worker out of a stage hands the end of input downstream
+        with self._metrics_lock:
+            self._live_workers[index] -= 1
+            finished = self._live_workers[index] == 0
+        if finished:
+            if last:
+                self._output.put(_END)
+            elif not self._stopped.is_set():
+                self._signal_end(index + 1)
+
+    def _join(self, timeout: Optional[float]):
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for thread in self._threads:
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            thread.join(remaining)
@@ -5,7 +5,7 @@ Extract and highlight top candidates for each disease category
 """
 
 import logging
-from neo4j import GraphDatabase
+from neo4j_connection import READ_ACCESS, get_neo4j_provider
 import json
 from datetime import datetime
 import pandas as pd
@@ -17,10 +17,8 @@ logger = logging.getLogger(__name__)
 
 class DiseaseCandidateAnalyzer:
     def __init__(self):
-        self.driver = GraphDatabase.driver(
-            "bolt://localhost:7687", 
-            auth=("neo4j", "fotquantum")
-        )
+        # Shared connection pool (NEO4J_* environment settings)
+        self.driver = get_neo4j_provider()
     
     def get_autoimmune_candidates(self, limit=10):
         """Extract top autoimmune disease candidates"""
@@ -43,7 +41,7 @@ class DiseaseCandidateAnalyzer:
         LIMIT $limit
         """
         
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run(query, limit=limit)
             candidates = []
             
@@ -87,7 +85,7 @@ class DiseaseCandidateAnalyzer:
         LIMIT $limit
         """
         
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run(query, limit=limit)
             candidates = []
             
@@ -132,7 +130,7 @@ class DiseaseCandidateAnalyzer:
         LIMIT $limit
         """
         
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run(query, limit=limit)
             candidates = []
             
@@ -178,7 +176,7 @@ class DiseaseCandidateAnalyzer:
         LIMIT $limit
         """
         
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run(query, limit=limit)
             candidates = []
             
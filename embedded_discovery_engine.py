@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+EMBEDDED DISCOVERY ENGINE
+Neo4jDiscoveryEngine on the embedded SQLite graph store
+Same store/query API and statistics layer for laptops, CI and batch jobs that
+run without a Neo4j server; graph-traversal analytics stay Neo4j-only
+"""
+
+import re
+import json
+import uuid
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from embedded_graph_store import EmbeddedGraphStore
+from neo4j_discovery_engine import (
+    DISCOVERY_STATS_ID, STANDARD_AMINO_ACIDS, THERAPEUTIC_TARGETS, Neo4jDiscoveryEngine, logger
+)
+from sequence_similarity_index import DEFAULT_INDEX_PATH, SequenceLSHIndex
+
+DISCOVERY_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS discoveries (
+        id TEXT PRIMARY KEY, sequence TEXT, validation_score REAL, assessment TEXT, energy_kcal_mol REAL,
+        vqbit_score REAL, timestamp TEXT, session_id TEXT, hardware_processed_on TEXT,
+        metal_accelerated INTEGER, quantum_coherence REAL, entanglement_entropy REAL,
+        superposition_fidelity REAL, high_entanglement REAL)""",
+    "CREATE INDEX IF NOT EXISTS discoveries_timestamp ON discoveries (timestamp)",
+    "CREATE INDEX IF NOT EXISTS discoveries_validation_score ON discoveries (validation_score)",
+    "CREATE INDEX IF NOT EXISTS discoveries_session ON discoveries (session_id)",
+    "CREATE INDEX IF NOT EXISTS discoveries_sequence ON discoveries (sequence)",
+    "CREATE INDEX IF NOT EXISTS discoveries_high_entanglement ON discoveries (high_entanglement)",
+    "CREATE TABLE IF NOT EXISTS sequences (value TEXT PRIMARY KEY, length INTEGER, created_at TEXT)",
+    "CREATE TABLE IF NOT EXISTS discovery_virtue_scores (discovery_id TEXT, virtue TEXT, score REAL)",
+    "CREATE INDEX IF NOT EXISTS discovery_virtue_scores_discovery ON discovery_virtue_scores (discovery_id)",
+    """CREATE TABLE IF NOT EXISTS vqbits (
+        id TEXT PRIMARY KEY, discovery_id TEXT, quantum_state_id TEXT, residue_index INTEGER, amino_acid TEXT,
+        entanglement_degree REAL, superposition_coherence REAL, phi_angle REAL, psi_angle REAL,
+        amplitude_real REAL, amplitude_imag REAL, collapsed_state INTEGER, quantum_phase REAL)""",
+    "CREATE INDEX IF NOT EXISTS vqbits_discovery ON vqbits (discovery_id, residue_index)",
+    "CREATE INDEX IF NOT EXISTS vqbits_amino_acid ON vqbits (amino_acid)",
+    """CREATE TABLE IF NOT EXISTS entanglements (
+        prev_vqbit_id TEXT, curr_vqbit_id TEXT, entanglement_strength REAL, bell_state TEXT,
+        maintains_coherence INTEGER, coherence_level REAL, decoherence_time REAL, quantum_fidelity REAL)""",
+    "CREATE INDEX IF NOT EXISTS entanglements_prev ON entanglements (prev_vqbit_id)",
+    "CREATE INDEX IF NOT EXISTS entanglements_curr ON entanglements (curr_vqbit_id)",
+    """CREATE TABLE IF NOT EXISTS virtue_projections (
+        vqbit_id TEXT, quantum_state_id TEXT, target_id TEXT, virtue_type TEXT,
+        projection_strength REAL, quantum_phase REAL)""",
+    "CREATE INDEX IF NOT EXISTS virtue_projections_vqbit ON virtue_projections (vqbit_id)",
+    "CREATE INDEX IF NOT EXISTS virtue_projections_virtue ON virtue_projections (virtue_type)",
+    """CREATE TABLE IF NOT EXISTS discovery_links (
+        discovery_id TEXT, rel_type TEXT, target_id TEXT, properties TEXT, created_at TEXT)""",
+    "CREATE INDEX IF NOT EXISTS discovery_links_discovery ON discovery_links (discovery_id)",
+    "CREATE INDEX IF NOT EXISTS discovery_links_target ON discovery_links (rel_type, target_id)",
+    """CREATE TABLE IF NOT EXISTS similar_to (
+        discovery_id TEXT, other_discovery_id TEXT, similarity_score REAL, created_at TEXT,
+        PRIMARY KEY (discovery_id, other_discovery_id))""",
+    "CREATE INDEX IF NOT EXISTS similar_to_other ON similar_to (other_discovery_id)",
+    "CREATE TABLE IF NOT EXISTS discovery_stats (key TEXT PRIMARY KEY, value REAL)"
+]
+
+# Tables holding rows that belong to one discovery (cascaded on cleanup)
+_DISCOVERY_CHILD_TABLES = ('discovery_virtue_scores', 'discovery_links')
+
+
+def _to_text(timestamp: datetime) -> str:
+    """Fixed-width ISO timestamps, so text order is time order"""
+
+    return timestamp.isoformat(timespec='microseconds')
+
+
+def _bell_state(strength: float) -> str:
+    if strength > 0.8:
+        return 'phi_plus'
+    if strength > 0.6:
+        return 'phi_minus'
+    if strength > 0.4:
+        return 'psi_plus'
+    return 'psi_minus'
+
+
+class _Neo4jOnlyDriver:
+    """Stands in for the driver so Cypher-only analytics fail with a clear message"""
+
+    def session(self, **kwargs):
+        raise NotImplementedError("This analysis requires the Neo4j backend (FOTCHEM_GRAPH_BACKEND=neo4j)")
+
+    def close(self):
+        pass
+
+
+class EmbeddedDiscoveryEngine(Neo4jDiscoveryEngine):
+    """
+    Discovery engine backed by an embedded SQLite graph store.
+
+    Writes reuse the parent's batch builder and running-aggregate deltas, so
+    stored rows and statistics match what the Neo4j write path produces:
+    nodes become indexed tables and relationships become link tables. The
+    statistics, quantum analysis, high-quality/learning/target/motif queries
+    are answered in SQL; traversal analytics (quantum chains, solution
+    mapping, breakthroughs) raise NotImplementedError.
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 similarity_index_path: Optional[str] = DEFAULT_INDEX_PATH,
+                 stats_cache_ttl: float = 10.0):
+        self.store = EmbeddedGraphStore(path, DISCOVERY_SCHEMA)
+        self.driver = _Neo4jOnlyDriver()
+        self.session_id = str(uuid.uuid4())
+
+        self.stats_cache_ttl = stats_cache_ttl
+        self._stats_cache: Dict[str, Tuple[float, Any]] = {}
+        self._session_stats = {'discoveries': 0, 'start_time': None, 'end_time': None}
+        self._session_lock = threading.Lock()
+        self._virtue_target_types = self._load_virtue_target_types()
+
+        self.similarity_index_path = similarity_index_path
+        self._similarity_index = None
+        self._similarity_index_lock = threading.Lock()
+
+        logger.info(f"🗄️ Embedded Discovery Engine initialized")
+        logger.info(f"   Session ID: {self.session_id}")
+        logger.info(f"   Store: {self.store.path}")
+
+    def close(self):
+        """Flush the similarity index and close the store"""
+        if self._similarity_index is not None:
+            self._similarity_index.save_if_dirty()
+        self.store.close()
+
+    def store_discoveries(self, discoveries: List[Dict[str, Any]], skip_existing: bool = False) -> List[str]:
+        """Store many discoveries in one SQLite transaction (see Neo4jDiscoveryEngine.store_discoveries)"""
+
+        if not discoveries:
+            return []
+
+        existing = set()
+        supplied_ids = [d['discovery_id'] for d in discoveries if d.get('discovery_id')]
+        if skip_existing and supplied_ids:
+            existing = self._existing_discovery_ids(supplied_ids)
+
+        batch = self._build_write_batch([d for d in discoveries if d.get('discovery_id') not in existing])
+        if batch['discoveries']:
+            with self.store.transaction() as conn:
+                self._write_discovery_rows(conn, batch)
+
+        self._record_session_writes(batch['discoveries'])
+
+        # Index only committed sequences
+        probes = batch['similarity_probes']
+        if probes:
+            self.similarity_index.add([probe['discovery_id'] for probe in probes],
+                                      np.stack([probe['signature'] for probe in probes]))
+
+        written_ids = iter(row['discovery_id'] for row in batch['discoveries'])
+        return [
+            d['discovery_id'] if d.get('discovery_id') in existing else next(written_ids)
+            for d in discoveries
+        ]
+
+    def _existing_discovery_ids(self, discovery_ids: List[str], chunk_size: int = 500) -> set:
+        existing = set()
+        for start in range(0, len(discovery_ids), chunk_size):
+            chunk = discovery_ids[start:start + chunk_size]
+            existing.update(row['id'] for row in self.store.query(
+                f"SELECT id FROM discoveries WHERE id IN ({', '.join('?' * len(chunk))})", tuple(chunk)
+            ))
+        return existing
+
+    def _write_discovery_rows(self, conn, batch: Dict[str, List[Dict[str, Any]]]):
+        """Insert a prepared batch with one executemany per table, mirroring _write_discovery_batch"""
+
+        now = _to_text(datetime.now())
+
+        new_sequences = conn.executemany(
+            "INSERT OR IGNORE INTO sequences VALUES (?, ?, ?)",
+            [(row['value'], len(row['value']), _to_text(row['timestamp'])) for row in batch['sequences']]
+        ).rowcount
+
+        conn.executemany(
+            "INSERT INTO discoveries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(row['discovery_id'], row['sequence'], row['validation_score'], row['assessment'], row['energy'],
+              row['vqbit_score'], _to_text(row['timestamp']), row['session_id'], row['hardware_processed_on'],
+              row['metal_accelerated'], row['quantum_coherence'], row['entanglement_entropy'],
+              row['superposition_fidelity'], row['high_entanglement'])
+             for row in batch['discoveries']]
+        )
+        conn.executemany(
+            "INSERT INTO discovery_virtue_scores VALUES (?, ?, ?)",
+            [(row['discovery_id'], item['virtue'], item['score'])
+             for row in batch['discoveries'] for item in row['virtue_items']]
+        )
+
+        # VQbits exist only for reference amino acids, projections only for superposed residues
+        vqbits = [row for row in batch['vqbits'] if row['amino_acid'] in STANDARD_AMINO_ACIDS]
+        conn.executemany(
+            "INSERT INTO vqbits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(row['vqbit_id'], row['discovery_id'], row['quantum_state_id'], row['residue_index'],
+              row['amino_acid'], row['entanglement_degree'], row['coherence'], row['phi_angle'], row['psi_angle'],
+              row['amplitude_real'], row['amplitude_imag'], row['collapsed'], row['quantum_phase'])
+             for row in vqbits]
+        )
+        conn.executemany(
+            "INSERT INTO virtue_projections VALUES (?, ?, ?, ?, ?, ?)",
+            [(row['vqbit_id'], row['quantum_state_id'], target['id'], projection['virtue'],
+              projection['strength'], projection['phase'])
+             for row in vqbits if row['collapsed'] is False
+             for projection in row['virtue_projections']
+             for target in THERAPEUTIC_TARGETS if target['target_type'] == projection['virtue']]
+        )
+
+        created_vqbits = {row['vqbit_id'] for row in vqbits}
+        conn.executemany(
+            "INSERT INTO entanglements VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(row['prev_vqbit_id'], row['curr_vqbit_id'], row['strength'], _bell_state(row['strength']),
+              row['maintains_coherence'], row['coherence'], row['decoherence_time'], row['fidelity'])
+             for row in batch['entanglements']
+             if row['prev_vqbit_id'] in created_vqbits and row['curr_vqbit_id'] in created_vqbits]
+        )
+
+        links = (
+            [(row['discovery_id'], 'CLASSIFIED_AS', row['family_id'],
+              {'confidence_score': row['confidence']}) for row in batch['families']]
+            + [(row['discovery_id'], 'TARGETS', row['target_id'],
+                {'potential_score': row['potential_score']}) for row in batch['targets']]
+            + [(row['discovery_id'], 'CONTAINS_MOTIF', row['motif_id'],
+                {'motif_type': row['motif_type'], 'confidence': row['confidence']}) for row in batch['motifs']]
+            + [(row['discovery_id'], 'MAPS_TO_SOLUTION', row['solution_id'],
+                {'confidence_score': row['confidence'], 'evidence_type': row['evidence']})
+               for row in batch['solutions']]
+            + [(row['discovery_id'], 'INDICATES_FOR', row['indication_id'],
+                {'therapeutic_potential': row['potential'], 'mechanism_of_action': row['mechanism']})
+               for row in batch['indications']]
+        )
+        conn.executemany(
+            "INSERT INTO discovery_links VALUES (?, ?, ?, ?, ?)",
+            [(discovery_id, rel_type, target_id, json.dumps(properties), now)
+             for discovery_id, rel_type, target_id, properties in links]
+        )
+
+        if batch['similarity_probes']:
+            probes = batch['similarity_probes']
+            conn.executemany(
+                "INSERT OR REPLACE INTO similar_to VALUES (?, ?, ?, ?)",
+                [(min(discovery_id, other_id), max(discovery_id, other_id), similarity, now)
+                 for discovery_id, other_id, similarity in self.similarity_index.find_neighbors(
+                     [probe['discovery_id'] for probe in probes],
+                     np.stack([probe['signature'] for probe in probes])
+                 )]
+            )
+
+        delta = self._aggregate_batch_statistics(batch)
+        delta['sequences'] = new_sequences
+        self._update_stats_rows(conn, delta)
+
+    @staticmethod
+    def _update_stats_rows(conn, delta: Dict[str, float]):
+        """Fold aggregate deltas into discovery_stats: sums for most keys, max/min for _max/_min"""
+
+        for suffix, combine in (('_max', 'max(value, excluded.value)'), ('_min', 'min(value, excluded.value)'),
+                                (None, 'value + excluded.value')):
+            rows = [
+                (key, value) for key, value in delta.items()
+                if (key.endswith(suffix) if suffix else not key.endswith(('_max', '_min')))
+            ]
+            conn.executemany(
+                f"INSERT INTO discovery_stats VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = {combine}",
+                rows
+            )
+
+    def _load_virtue_target_types(self) -> Dict[str, int]:
+        target_types: Dict[str, int] = {}
+        for target in THERAPEUTIC_TARGETS:
+            target_types[target['target_type']] = target_types.get(target['target_type'], 0) + 1
+        return target_types
+
+    def _get_aggregates(self) -> Dict[str, Any]:
+        """Running aggregates from discovery_stats, computed once if the table is empty"""
+
+        def load():
+            rows = self.store.query("SELECT key, value FROM discovery_stats")
+            if rows:
+                return {row['key']: row['value'] for row in rows}
+            return self.refresh_statistics()
+
+        return self._cached('aggregates', load)
+
+    def refresh_statistics(self) -> Dict[str, Any]:
+        """Recompute discovery_stats from full table scans"""
+
+        logger.info("📊 Recomputing discovery statistics from the embedded store...")
+        stats: Dict[str, Any] = {}
+        queries = [
+            """
+            SELECT count(*) as discoveries,
+                   total(validation_score) as validation_sum, count(validation_score) as validation_count,
+                   total(energy_kcal_mol) as energy_sum, count(energy_kcal_mol) as energy_count,
+                   total(vqbit_score) as vqbit_score_sum, count(vqbit_score) as vqbit_score_count,
+                   count(CASE WHEN validation_score >= 0.9 THEN 1 END) as quality_excellent,
+                   count(CASE WHEN validation_score >= 0.8 AND validation_score < 0.9 THEN 1 END) as quality_good,
+                   count(CASE WHEN validation_score >= 0.7 AND validation_score < 0.8 THEN 1 END) as quality_fair,
+                   count(CASE WHEN validation_score < 0.7 THEN 1 END) as quality_poor
+            FROM discoveries
+            """,
+            "SELECT count(*) as sequences FROM sequences",
+            """
+            SELECT count(*) as vqbits,
+                   total(entanglement_degree) as vqbit_entanglement_sum,
+                   total(superposition_coherence) as vqbit_coherence_sum,
+                   count(CASE WHEN collapsed_state = 1 THEN 1 END) as vqbits_collapsed,
+                   count(CASE WHEN collapsed_state = 0 THEN 1 END) as vqbits_superposition
+            FROM vqbits
+            """,
+            """
+            SELECT count(*) as entanglements,
+                   total(entanglement_strength) as entanglement_strength_sum,
+                   max(entanglement_strength) as entanglement_strength_max,
+                   min(entanglement_strength) as entanglement_strength_min
+            FROM entanglements
+            """
+        ]
+        for query in queries:
+            for record in self.store.query(query):
+                stats.update({key: value for key, value in record.items() if value is not None})
+
+        for record in self.store.query("""
+            SELECT amino_acid, count(*) as count,
+                   total(entanglement_degree) as entanglement_sum, total(superposition_coherence) as coherence_sum,
+                   total(phi_angle) as phi_sum, total(psi_angle) as psi_sum
+            FROM vqbits WHERE amino_acid <> '' GROUP BY amino_acid
+        """):
+            for stat in ('count', 'entanglement_sum', 'coherence_sum', 'phi_sum', 'psi_sum'):
+                stats[f"aa__{record['amino_acid']}__{stat}"] = record[stat]
+
+        for record in self.store.query("""
+            SELECT virtue_type as virtue, count(*) as count,
+                   total(projection_strength) as strength_sum, total(quantum_phase) as phase_sum
+            FROM virtue_projections GROUP BY virtue_type
+        """):
+            virtue = re.sub(r'\W', '_', str(record['virtue']))
+            for stat in ('count', 'strength_sum', 'phase_sum'):
+                stats[f"virtue__{virtue}__{stat}"] = record[stat]
+
+        with self.store.transaction() as conn:
+            conn.execute("DELETE FROM discovery_stats")
+            conn.executemany("INSERT INTO discovery_stats VALUES (?, ?)", list(stats.items()))
+
+        self.invalidate_statistics_cache()
+        stats['id'] = DISCOVERY_STATS_ID
+        return stats
+
+    def _count_recent_discoveries(self) -> int:
+        cutoff = _to_text(datetime.now() - timedelta(hours=1))
+        return self.store.query("SELECT count(*) as recent_count FROM discoveries WHERE timestamp > ?",
+                                (cutoff,))[0]['recent_count']
+
+    def _find_high_entanglement_discoveries(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return [
+            {'discovery_id': row['id'], 'quality': float(row['validation_score']),
+             'avg_entanglement': float(row['high_entanglement'])}
+            for row in self.store.query("""
+                SELECT id, validation_score, high_entanglement FROM discoveries
+                WHERE high_entanglement IS NOT NULL
+                ORDER BY high_entanglement DESC LIMIT ?
+            """, (limit,))
+        ]
+
+    def _count_graph_elements(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Row counts reported under the node labels and relationship types of the Neo4j graph"""
+
+        def count(sql: str) -> int:
+            return self.store.query(sql)[0]['count']
+
+        entanglements = count("SELECT count(*) as count FROM entanglements")
+        node_statistics = {
+            'Discovery': count("SELECT count(*) as count FROM discoveries"),
+            'Sequence': count("SELECT count(*) as count FROM sequences"),
+            'VQbit': count("SELECT count(*) as count FROM vqbits"),
+            'TherapeuticTarget': len(THERAPEUTIC_TARGETS),
+            'StructuralMotif': count(
+                "SELECT count(DISTINCT target_id) as count FROM discovery_links WHERE rel_type = 'CONTAINS_MOTIF'"
+            ),
+            'AminoAcid': len(STANDARD_AMINO_ACIDS)
+        }
+        relationship_statistics = {
+            'HAS_SEQUENCE': node_statistics['Discovery'],
+            'HAS_VQBIT': node_statistics['VQbit'],
+            # VQbit and QuantumState pairs are both linked in the graph
+            'QUANTUM_ENTANGLED': 2 * entanglements,
+            'MAINTAINS_COHERENCE': 2 * count(
+                "SELECT count(*) as count FROM entanglements WHERE maintains_coherence = 1"
+            ),
+            'IN_SUPERPOSITION': count("SELECT count(*) as count FROM vqbits WHERE collapsed_state = 0"),
+            'SIMILAR_TO': count("SELECT count(*) as count FROM similar_to"),
+            'PROJECTS_VIRTUE': count("SELECT count(*) as count FROM virtue_projections")
+        }
+        for row in self.store.query("SELECT rel_type, count(*) as count FROM discovery_links GROUP BY rel_type"):
+            relationship_statistics[row['rel_type']] = row['count']
+
+        by_count = lambda counts: dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+        return by_count(node_statistics), by_count(relationship_statistics)
+
+    def get_high_quality_discoveries(self, limit: int = 10, min_quality: float = 0.9) -> List[Dict[str, Any]]:
+        """Get recent high-quality discoveries"""
+
+        return [
+            {
+                'id': row['id'],
+                'sequence': row['sequence'][:30] + "..." if len(row['sequence']) > 30 else row['sequence'],
+                'quality': float(row['validation_score']),
+                'energy': float(row['energy_kcal_mol']),
+                'assessment': row['assessment'],
+                'length': len(row['sequence']),
+                'timestamp': datetime.fromisoformat(row['timestamp']).strftime('%H:%M:%S')
+            }
+            for row in self.store.query("""
+                SELECT id, sequence, validation_score, energy_kcal_mol, assessment, timestamp
+                FROM discoveries
+                WHERE validation_score >= ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (min_quality, limit))
+        ]
+
+    def get_learning_patterns(self) -> Dict[str, Any]:
+        """Analyze learning patterns from the store"""
+
+        virtue_patterns = {
+            row['virtue']: {
+                'avg': float(row['avg_score']),
+                'count': row['count'],
+                'trend': 'positive' if row['avg_score'] > 0 else 'negative'
+            }
+            for row in self.store.query("""
+                SELECT virtue, avg(score) as avg_score, count(*) as count
+                FROM discovery_virtue_scores GROUP BY virtue ORDER BY virtue
+            """)
+        }
+
+        length_stats = self.store.query("""
+            SELECT min(length) as min_length, max(length) as max_length,
+                   avg(length) as avg_length, count(*) as total_sequences
+            FROM sequences
+        """)[0]
+
+        scores = [row['validation_score'] for row in self.store.query(
+            "SELECT validation_score FROM discoveries ORDER BY timestamp DESC LIMIT 1000"
+        ) if row['validation_score'] is not None]
+        recent_avg = float(np.mean(scores[:500])) if scores[:500] else 0.0
+        earlier_avg = float(np.mean(scores[500:])) if scores[500:] else 0.0
+
+        quality_trend = 'stable'
+        if recent_avg and earlier_avg:
+            if recent_avg > earlier_avg * 1.05:
+                quality_trend = 'improving'
+            elif recent_avg < earlier_avg * 0.95:
+                quality_trend = 'declining'
+
+        return {
+            'virtue_patterns': virtue_patterns,
+            'sequence_stats': {
+                'min_length': length_stats['min_length'],
+                'max_length': length_stats['max_length'],
+                'avg_length': float(length_stats['avg_length'] or 0),
+                'total_sequences': length_stats['total_sequences']
+            },
+            'quality_trend': quality_trend,
+            'recent_quality_avg': recent_avg,
+            'earlier_quality_avg': earlier_avg
+        }
+
+    def _analyze_therapeutic_targets(self) -> Dict[str, Any]:
+        """Analyze therapeutic target predictions"""
+
+        targets = {target['id']: target for target in THERAPEUTIC_TARGETS}
+        target_distribution = {}
+        for row in self.store.query("""
+            SELECT target_id, count(*) as discovery_count,
+                   avg(json_extract(properties, '$.potential_score')) as avg_potential,
+                   max(json_extract(properties, '$.potential_score')) as max_potential
+            FROM discovery_links WHERE rel_type = 'TARGETS'
+            GROUP BY target_id ORDER BY discovery_count DESC
+        """):
+            target = targets.get(row['target_id'], {'name': row['target_id'], 'target_type': None})
+            target_distribution[target['name']] = {
+                'type': target['target_type'],
+                'count': row['discovery_count'],
+                'avg_potential': float(row['avg_potential'] or 0),
+                'max_potential': float(row['max_potential'] or 0)
+            }
+        return target_distribution
+
+    def _analyze_structural_motifs(self) -> Dict[str, Any]:
+        """Analyze structural motif patterns"""
+
+        return {
+            row['motif_type']: {
+                'count': row['discovery_count'],
+                'avg_confidence': float(row['avg_confidence'] or 0),
+                'max_confidence': float(row['max_confidence'] or 0)
+            }
+            for row in self.store.query("""
+                SELECT json_extract(properties, '$.motif_type') as motif_type, count(*) as discovery_count,
+                       avg(json_extract(properties, '$.confidence')) as avg_confidence,
+                       max(json_extract(properties, '$.confidence')) as max_confidence
+                FROM discovery_links WHERE rel_type = 'CONTAINS_MOTIF'
+                GROUP BY motif_type ORDER BY discovery_count DESC
+            """)
+        }
+
+    def cleanup_old_discoveries(self, days_old: int = 7) -> int:
+        """Delete discoveries older than days_old together with their residues and links"""
+
+        cutoff = _to_text(datetime.now() - timedelta(days=days_old))
+        old = "SELECT id FROM discoveries WHERE timestamp < ?"
+        with self.store.transaction() as conn:
+            for table in _DISCOVERY_CHILD_TABLES:
+                conn.execute(f"DELETE FROM {table} WHERE discovery_id IN ({old})", (cutoff,))
+            old_vqbits = f"SELECT id FROM vqbits WHERE discovery_id IN ({old})"
+            conn.execute(f"DELETE FROM virtue_projections WHERE vqbit_id IN ({old_vqbits})", (cutoff,))
+            conn.execute(
+                f"DELETE FROM entanglements WHERE prev_vqbit_id IN ({old_vqbits}) OR curr_vqbit_id IN ({old_vqbits})",
+                (cutoff, cutoff)
+            )
+            conn.execute(f"DELETE FROM vqbits WHERE discovery_id IN ({old})", (cutoff,))
+            conn.execute(
+                f"DELETE FROM similar_to WHERE discovery_id IN ({old}) OR other_discovery_id IN ({old})",
+                (cutoff, cutoff)
+            )
+            deleted_count = conn.execute("DELETE FROM discoveries WHERE timestamp < ?", (cutoff,)).rowcount
+
+        logger.info(f"🗑️ Cleaned up {deleted_count} discoveries older than {days_old} days")
+        if deleted_count:
+            self.refresh_statistics()
+        return deleted_count
+
+    def _build_similarity_index_from_graph(self, page_size: int = 50000) -> SequenceLSHIndex:
+        """Index every stored sequence, paging by discovery id"""
+
+        index = SequenceLSHIndex(path=self.similarity_index_path)
+        last_id = ''
+        while True:
+            rows = self.store.query(
+                "SELECT id, sequence FROM discoveries WHERE id > ? ORDER BY id LIMIT ?", (last_id, page_size)
+            )
+            if not rows:
+                break
+            index.add_sequences([row['id'] for row in rows], [row['sequence'] for row in rows])
+            last_id = rows[-1]['id']
+            if len(rows) < page_size:
+                break
+
+        if len(index):
+            index.save_if_dirty()
+            logger.info(f"🧬 Similarity index rebuilt: {len(index):,} sequences")
+        return index
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+EMBEDDED GRAPH STORE
+Serverless storage backend for single-node, batch and CI runs
+Graph entities live in an indexed SQLite file (WAL mode) instead of a Neo4j
+server, and any table can be snapshotted to columnar Parquet files for
+analytics; select it with FOTCHEM_GRAPH_BACKEND=embedded
+"""
+
+import os
+import json
+import uuid
+import sqlite3
+import threading
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+GRAPH_BACKEND_ENV = "FOTCHEM_GRAPH_BACKEND"
+EMBEDDED_PATH_ENV = "FOTCHEM_EMBEDDED_GRAPH"
+DEFAULT_EMBEDDED_PATH = "embedded_graph/fotchem.sqlite"
+
+
+def configured_backend() -> str:
+    """Graph backend selected for this process: 'neo4j' (default) or 'embedded'"""
+
+    return os.environ.get(GRAPH_BACKEND_ENV, "neo4j").lower()
+
+
+def _local_timestamp(value: str) -> str:
+    """
+    Timestamps here are naive local isoformat strings compared as text; a
+    zone-aware cursor (e.g. a UTC change-feed start) is converted to match.
+    """
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        return value
+    return parsed.astimezone().replace(tzinfo=None).isoformat()
+
+
+def configured_embedded_path() -> str:
+    return os.environ.get(EMBEDDED_PATH_ENV, DEFAULT_EMBEDDED_PATH)
+
+
+class EmbeddedGraphStore:
+    """
+    SQLite database shared by the embedded backends.
+
+    One connection per store, serialised by a lock so background writers
+    (e.g. the ingestion queue) can share it. transaction() groups writes
+    into one commit; the DDL in `schema` is applied idempotently on open.
+    """
+
+    def __init__(self, path: Optional[str] = None, schema: Optional[List[str]] = None):
+        self.path = path or configured_embedded_path()
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+
+        with self.transaction() as conn:
+            for statement in schema or []:
+                conn.execute(statement)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in one write transaction (rolled back on error)"""
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def query(self, sql: str, parameters: Tuple = ()) -> List[Dict[str, Any]]:
+        """Run a read query and return rows as dicts"""
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, parameters)]
+
+    def tables(self) -> List[str]:
+        return [row['name'] for row in self.query(
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+        )]
+
+    def export_columnar(self, directory: str, tables: Optional[List[str]] = None,
+                        batch_rows: int = 65536) -> Dict[str, str]:
+        """
+        Snapshot tables to Parquet (one file per table) for columnar analytics.
+
+        Rows are streamed in batch_rows record batches, so memory stays
+        bounded. Returns {table: parquet_path}.
+        """
+
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow not available. Install with: pip install pyarrow")
+
+        output_dir = Path(directory)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        known_tables = self.tables()
+        exported = {}
+
+        for table in tables or known_tables:
+            if table not in known_tables:
+                raise ValueError(f"Unknown table: {table}")
+
+            target = output_dir / f"{table}.parquet"
+            writer = None
+            with self._lock:
+                cursor = self._conn.execute(f'SELECT * FROM "{table}"')
+                columns = [description[0] for description in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(batch_rows)
+                    if not rows:
+                        break
+                    batch = pa.RecordBatch.from_pydict({
+                        column: [row[i] for row in rows] for i, column in enumerate(columns)
+                    })
+                    if writer is None:
+                        writer = pq.ParquetWriter(target, batch.schema)
+                    writer.write_batch(batch)
+
+            if writer is None:
+                pq.write_table(pa.table({column: pa.array([], pa.null()) for column in columns}), target)
+            else:
+                writer.close()
+            exported[table] = str(target)
+
+        logger.info(f"📦 Exported {len(exported)} tables to Parquet in {output_dir}")
+        return exported
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+AKG_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS claims (
+        id TEXT PRIMARY KEY, objective TEXT, status TEXT, virtue_weighting TEXT, collapse_rules TEXT,
+        created_at TEXT, campaign TEXT, final_virtues TEXT, collapsed_at TEXT, final_evidence TEXT)""",
+    "CREATE INDEX IF NOT EXISTS claims_status ON claims (status)",
+    "CREATE INDEX IF NOT EXISTS claims_campaign ON claims (campaign, created_at)",
+    "CREATE INDEX IF NOT EXISTS claims_created_at ON claims (created_at)",
+    """CREATE TABLE IF NOT EXISTS evidence (
+        id TEXT PRIMARY KEY, claim_id TEXT, metrics TEXT, uncertainty REAL, virtue_vector TEXT,
+        generated_at TEXT, agent_type TEXT)""",
+    "CREATE INDEX IF NOT EXISTS evidence_claim ON evidence (claim_id)",
+    """CREATE TABLE IF NOT EXISTS chem_discoveries (
+        id TEXT PRIMARY KEY, claim_id TEXT, verdict TEXT, virtues TEXT, discovered_at TEXT)""",
+    "CREATE INDEX IF NOT EXISTS chem_discoveries_discovered_at ON chem_discoveries (discovered_at, id)",
+    "CREATE INDEX IF NOT EXISTS chem_discoveries_claim ON chem_discoveries (claim_id)",
+    """CREATE TABLE IF NOT EXISTS verdicts (
+        id TEXT PRIMARY KEY, status TEXT, confidence REAL, evidence_strength REAL, virtue_score REAL,
+        replication_count INTEGER, reasoning TEXT, recommendation TEXT, timestamp TEXT, raw_data TEXT)""",
+    "CREATE INDEX IF NOT EXISTS verdicts_status ON verdicts (status, timestamp)",
+    "CREATE TABLE IF NOT EXISTS molecules (id TEXT PRIMARY KEY, smiles TEXT, inchi TEXT, created TEXT)",
+    "CREATE INDEX IF NOT EXISTS molecules_created_id ON molecules (created, id)",
+    "CREATE TABLE IF NOT EXISTS reactions (id TEXT PRIMARY KEY, reaction_smiles TEXT, yield REAL, created TEXT)",
+    "CREATE INDEX IF NOT EXISTS reactions_created_id ON reactions (created, id)",
+    """CREATE TABLE IF NOT EXISTS measurements (
+        id TEXT PRIMARY KEY, property TEXT, value REAL, uncertainty REAL, created TEXT)""",
+    "CREATE INDEX IF NOT EXISTS measurements_created_id ON measurements (created, id)"
+]
+
+
+# AKG change-feed entity -> table
+CHANGE_TABLES = {
+    'molecule': 'molecules',
+    'reaction': 'reactions',
+    'measurement': 'measurements'
+}
+
+
+class EmbeddedAKGStore(EmbeddedGraphStore):
+    """Embedded backend for the AKG client's FoTChem claims, evidence, verdicts and discoveries"""
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path, AKG_SCHEMA)
+        logger.info(f"✅ Embedded AKG store at {self.path}")
+
+    def store_verdict(self, verdict_id: str, verdict: Dict[str, Any], timestamp: str):
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO verdicts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (verdict_id, verdict.get('status', 'unknown'), verdict.get('confidence', 0.0),
+                 verdict.get('evidence_strength', 0.0), verdict.get('virtue_score', 0.0),
+                 verdict.get('replication_count', 0), verdict.get('reasoning', ''),
+                 verdict.get('recommendation', ''), timestamp, json.dumps(verdict))
+            )
+
+    def query_new_molecules(self, since: datetime) -> List[Dict[str, Any]]:
+        return self.query(
+            "SELECT id, smiles, inchi, created FROM molecules WHERE created >= ? ORDER BY created DESC LIMIT 100",
+            (since.isoformat(),)
+        )
+
+    def query_new_reactions(self, since: datetime) -> List[Dict[str, Any]]:
+        return self.query(
+            "SELECT id, reaction_smiles, yield, created FROM reactions WHERE created >= ? "
+            "ORDER BY created DESC LIMIT 100",
+            (since.isoformat(),)
+        )
+
+    def query_new_measurements(self, since: datetime) -> List[Dict[str, Any]]:
+        return self.query(
+            "SELECT id, property, value, uncertainty, created FROM measurements WHERE created >= ? "
+            "ORDER BY created DESC LIMIT 100",
+            (since.isoformat(),)
+        )
+
+    def iter_changes(self, entity: str, after: Dict[str, str], page_size: int = 100):
+        """Change-feed pages in the AKG.iter_changes format, keyset-paginated on (created, id)"""
+
+        table = CHANGE_TABLES[entity]
+        cursor = dict(after, created=_local_timestamp(after['created']))
+
+        while True:
+            page = self.query(
+                f"SELECT * FROM {table} WHERE (created, id) > (?, ?) ORDER BY created, id LIMIT ?",
+                (cursor['created'], cursor['id'], page_size)
+            )
+            if not page:
+                return
+
+            yield page
+            cursor = {'created': page[-1]['created'], 'id': page[-1]['id']}
+            if len(page) < page_size:
+                return
+
+    def query_discovery_statistics(self) -> Dict[str, Any]:
+        stats = {
+            'total_discoveries': 0,
+            'truth_collapsed': 0,
+            'refuted_claims': 0,
+            'needs_evidence': 0,
+            'by_campaign': {},
+            'recent_discoveries': []
+        }
+
+        for record in self.query("SELECT status, count(*) AS count FROM verdicts GROUP BY status"):
+            if record['status'] == 'truth':
+                stats['truth_collapsed'] = record['count']
+            elif record['status'] == 'refuted':
+                stats['refuted_claims'] = record['count']
+            elif record['status'] == 'needs_evidence':
+                stats['needs_evidence'] = record['count']
+            stats['total_discoveries'] += record['count']
+
+        stats['recent_discoveries'] = self.query(
+            "SELECT id, reasoning, timestamp FROM verdicts WHERE status = 'truth' ORDER BY timestamp DESC LIMIT 10"
+        )
+        return stats
+
+    def store_claim(self, claim: Dict[str, Any]) -> str:
+        claim_id = claim.get('id', str(uuid.uuid4()))
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO claims (id, objective, status, virtue_weighting, collapse_rules, created_at, campaign) "
+                "VALUES (?, ?, 'active', ?, ?, ?, ?)",
+                (claim_id, claim.get('objective', ''), json.dumps(claim.get('virtue_weighting', {})),
+                 json.dumps(claim.get('collapse_rules', {})), datetime.now().isoformat(),
+                 claim.get('campaign', 'unknown'))
+            )
+        return claim_id
+
+    def get_claims(self, status: Optional[str] = None, campaign: Optional[str] = None) -> List[Dict]:
+        where_clause = "WHERE 1=1"
+        params = []
+        if status:
+            where_clause += " AND status = ?"
+            params.append(status)
+        if campaign:
+            where_clause += " AND campaign = ?"
+            params.append(campaign)
+
+        claims = self.query(f"""
+            SELECT id, objective, status, virtue_weighting, collapse_rules, created_at, campaign
+            FROM claims {where_clause}
+            ORDER BY created_at DESC
+        """, tuple(params))
+        for claim in claims:
+            claim['virtue_weighting'] = json.loads(claim['virtue_weighting'] or '{}')
+            claim['collapse_rules'] = json.loads(claim['collapse_rules'] or '{}')
+        return claims
+
+    def store_evidence(self, claim_id: str, evidence: Dict[str, Any]) -> str:
+        evidence_id = str(uuid.uuid4())
+        with self.transaction() as conn:
+            # Evidence only attaches to an existing claim, as with the graph MATCH
+            conn.execute(
+                "INSERT INTO evidence SELECT ?, id, ?, ?, ?, ?, ? FROM claims WHERE id = ?",
+                (evidence_id, json.dumps(evidence.get('metrics', {})), evidence.get('uncertainty', 1.0),
+                 json.dumps(evidence.get('virtue_vector', [])), datetime.now().isoformat(),
+                 evidence.get('agent_type', 'unknown'), claim_id)
+            )
+        return evidence_id
+
+    def collapse_claim(self, claim_id: str, verdict: str, virtues: List[float], evidence: Dict) -> bool:
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            updated = conn.execute(
+                "UPDATE claims SET status = ?, final_virtues = ?, collapsed_at = ?, final_evidence = ? WHERE id = ?",
+                (verdict, json.dumps(virtues), now, json.dumps(evidence), claim_id)
+            ).rowcount
+            if updated:
+                conn.execute(
+                    "INSERT INTO chem_discoveries VALUES (?, ?, ?, ?, ?)",
+                    (str(uuid.uuid4()), claim_id, verdict, json.dumps(virtues), now)
+                )
+        return True
+
+    def iter_discovery_pages(self, page_size: int, after: Optional[Dict[str, str]] = None,
+                             ascending: bool = False):
+        """Export pages in the AKG._iter_discovery_pages format, keyset-paginated on (discovered_at, id)"""
+
+        order = "ASC" if ascending else "DESC"
+        beyond = ">" if ascending else "<"
+        cursor = after
+
+        while True:
+            where_clause, params = "", []
+            if cursor:
+                where_clause = f"WHERE (d.discovered_at, d.id) {beyond} (?, ?)"
+                params = [cursor['discovered_at'], cursor['id']]
+
+            rows = self.query(f"""
+                SELECT d.id, d.claim_id, d.verdict, d.virtues, d.discovered_at
+                FROM chem_discoveries d
+                {where_clause}
+                ORDER BY d.discovered_at {order}, d.id {order}
+                LIMIT ?
+            """, tuple(params + [page_size]))
+            if not rows:
+                return
+
+            claim_ids = list({row['claim_id'] for row in rows})
+            placeholders = ", ".join("?" * len(claim_ids))
+            claims = {claim['id']: claim for claim in self.query(
+                f"SELECT * FROM claims WHERE id IN ({placeholders})", tuple(claim_ids)
+            )}
+            evidence = {}
+            for item in self.query(f"SELECT * FROM evidence WHERE claim_id IN ({placeholders})", tuple(claim_ids)):
+                evidence.setdefault(item['claim_id'], []).append(item)
+
+            page, cursors = [], []
+            for row in rows:
+                discovery = dict(row, virtues=json.loads(row['virtues'] or '[]'))
+                page.append({
+                    "discovery": discovery,
+                    "claim": claims.get(row['claim_id'], {}),
+                    "evidence": evidence.get(row['claim_id'], [])
+                })
+                cursors.append({'discovered_at': row['discovered_at'], 'id': row['id']})
+
+            yield page, cursors
+            if len(rows) < page_size:
+                return
+            cursor = cursors[-1]
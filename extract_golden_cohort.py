@@ -5,7 +5,7 @@ Extract top therapeutic candidates from the 252,714 discovery database
 """
 
 import logging
-from neo4j import GraphDatabase
+from neo4j_connection import READ_ACCESS, get_neo4j_provider
 import json
 from datetime import datetime
 import pandas as pd
@@ -15,10 +15,8 @@ logger = logging.getLogger(__name__)
 
 class GoldenCohortExtractor:
     def __init__(self):
-        self.driver = GraphDatabase.driver(
-            "bolt://localhost:7687", 
-            auth=("neo4j", "fotquantum")
-        )
+        # Shared connection pool (NEO4J_* environment settings)
+        self.driver = get_neo4j_provider()
         
     def extract_ultra_high_coherence_candidates(self, limit=100):
         """Extract top candidates with ultra-high quantum coherence"""
@@ -46,7 +44,7 @@ class GoldenCohortExtractor:
         LIMIT $limit
         """
         
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run(query, limit=limit)
             candidates = []
             
@@ -225,7 +223,7 @@ class GoldenCohortExtractor:
             LIMIT 50
             """
             
-            with self.driver.session() as session:
+            with self.driver.session(default_access_mode=READ_ACCESS) as session:
                 result = session.run(query_alt)
                 for record in result:
                     candidate = {
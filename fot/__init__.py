@@ -3,7 +3,7 @@ Field of Truth (FoT) Framework
 Quantum Ontological Protein Discovery System
 """
 
-from .vqbit_mathematics import ProteinVQbitGraph, VQbitState, VirtueOperator
+from .vqbit_mathematics import ProteinVQbitGraph, VQbitState, VirtueOperator, ConformationEnsemble
 
 __version__ = "1.0.0" 
-__all__ = ["ProteinVQbitGraph", "VQbitState", "VirtueOperator"]
\ No newline at end of file
+__all__ = ["ProteinVQbitGraph", "VQbitState", "VirtueOperator", "ConformationEnsemble"]
\ No newline at end of file
@@ -19,10 +19,54 @@ from dataclasses import dataclass
 import logging
 from scipy.sparse import csr_matrix
 from scipy.linalg import expm
+from scipy.sparse.linalg import expm_multiply
 import torch
 
 logger = logging.getLogger(__name__)
 
+# Above this many residues the dense (N, N) eigendecomposition is skipped and
+# evolution runs directly on the sparse Laplacian
+SPARSE_EVOLUTION_THRESHOLD = 2048
+
+# Column order of the (N, 4) virtue-score tensor
+VIRTUE_NAMES = ('Justice', 'Honesty', 'Temperance', 'Prudence')
+
+# Conformational basis shared by every residue vQbit (8-dimensional)
+CONFORMATION_BASIS_STATES = [
+    {'phi': -60, 'psi': -45, 'type': 'alpha_helix'},  # 0
+    {'phi': -70, 'psi': -35, 'type': 'alpha_helix'},  # 1
+    {'phi': -50, 'psi': -55, 'type': 'alpha_helix'},  # 2
+    {'phi': -120, 'psi': 120, 'type': 'beta_sheet'},  # 3
+    {'phi': -130, 'psi': 110, 'type': 'beta_sheet'},  # 4
+    {'phi': -110, 'psi': 130, 'type': 'beta_sheet'},  # 5
+    {'phi': -180, 'psi': 180, 'type': 'extended'},    # 6
+    {'phi': 60, 'psi': 45, 'type': 'left_handed'}     # 7
+]
+
+# Simplified Ramachandran propensities over the 8 basis states
+AA_PROPENSITIES = {
+    'A': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
+    'R': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
+    'N': [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # Sheet-favoring
+    'D': [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # Sheet-favoring
+    'C': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
+    'E': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
+    'Q': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Helix/extended
+    'G': [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2],  # Highly flexible
+    'H': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Variable
+    'I': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix/sheet
+    'L': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
+    'K': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
+    'M': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
+    'F': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
+    'P': [0.0, 0.0, 0.0, 0.1, 0.1, 0.1, 0.4, 0.3],  # Turn/break
+    'S': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
+    'T': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
+    'W': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
+    'Y': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
+    'V': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix/sheet
+}
+
 @dataclass
 class VQbitState:
     """
@@ -49,6 +93,75 @@ class VirtueOperator:
     threshold: float  # Minimum virtue score for validity
     projector: torch.Tensor  # Projection operator onto valid subspace
 
+@dataclass
+class ConformationEnsemble:
+    """
+    K conformations sampled from a collapsed vQbit graph
+
+    Stores only the (K, N) basis-state indices and per-conformation scores;
+    the legacy per-residue dict view is built on demand by to_conformations().
+    """
+    sequence: str  # Residue sequence the ensemble was drawn for
+    indices: torch.Tensor  # (K, N) int8 sampled basis-state index per residue
+    log_probabilities: torch.Tensor  # (K,) joint log-probability of each conformation
+    average_virtue_scores: torch.Tensor  # (K,) mean residue virtue score of each conformation
+    final_fot_values: torch.Tensor  # (K,) FoT value of each collapsed conformation
+    initial_fot_value: float  # FoT value before the collapse rounds
+    probabilities: torch.Tensor  # (N, 8) measurement distribution the samples were drawn from
+    virtue_scores: torch.Tensor  # (N, 4) residue virtue scores after the collapse rounds (VIRTUE_NAMES order)
+    collapse_rounds: int  # Virtue application rounds applied before sampling
+
+    def __len__(self) -> int:
+        return self.indices.shape[0]
+
+    @property
+    def collapse_quality(self) -> torch.Tensor:
+        """(K,) improvement ratio final / initial FoT"""
+        return self.final_fot_values / max(self.initial_fot_value, 1e-10)
+
+    def conformation(self, k: int) -> Dict[str, Any]:
+        """Legacy dict view of conformation k"""
+
+        indices = self.indices[k].long()
+        probabilities = self.probabilities.gather(1, indices.unsqueeze(1)).squeeze(1).tolist()
+        virtue_rows = self.virtue_scores.tolist()
+        indices = indices.tolist()
+
+        coordinates = []
+        for residue_id, basis_index in enumerate(indices):
+            conf_data = CONFORMATION_BASIS_STATES[basis_index]
+            coordinates.append({
+                'residue_index': residue_id,
+                'amino_acid': self.sequence[residue_id],
+                'phi': conf_data['phi'],
+                'psi': conf_data['psi'],
+                'conformation_type': conf_data['type'],
+                'measurement_probability': probabilities[residue_id],
+                'virtue_scores': dict(zip(VIRTUE_NAMES, virtue_rows[residue_id]))
+            })
+
+        return {
+            'conformation_id': k,
+            'coordinates': coordinates,
+            'initial_fot_value': self.initial_fot_value,
+            'final_fot_value': self.final_fot_values[k].item(),
+            'average_virtue_score': self.average_virtue_scores[k].item(),
+            'log_probability': self.log_probabilities[k].item(),
+            'collapse_rounds_applied': self.collapse_rounds,
+            'total_residues': len(indices),
+            'collapse_quality': self.collapse_quality[k].item()
+        }
+
+    def to_conformations(self, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Dict view of the best top_k conformations (all by default), best collapse quality first"""
+
+        # Ties in FoT (conformations collapsed from one state) go to the most probable
+        order = torch.argsort(self.log_probabilities, descending=True)
+        order = order[torch.argsort(self.final_fot_values[order], descending=True, stable=True)]
+        if top_k is not None:
+            order = order[:top_k]
+        return [self.conformation(k) for k in order.tolist()]
+
 class ProteinVQbitGraph:
     """
     Graph-based vQbit system for protein folding
@@ -66,15 +179,35 @@ class ProteinVQbitGraph:
         # Initialize AKG using NetworkX
         self.akg = nx.Graph()
         
-        # vQbit states for each residue
-        self.vqbit_states: Dict[int, VQbitState] = {}
-        
+        # Array-backed vQbit state for all residues (set by initialize_from_sequence):
+        # amplitudes (N, 8) complex, virtue scores (N, 4) in VIRTUE_NAMES order
+        self.amplitudes: Optional[torch.Tensor] = None
+        self.virtue_score_matrix: Optional[torch.Tensor] = None
+
+        # Directed edge-indexed entanglement store: entanglement_tensors[e] couples
+        # entanglement_index[0, e] -> entanglement_index[1, e]; edges are sorted by
+        # source residue and entanglement_offsets[i]:entanglement_offsets[i+1]
+        # slices residue i's neighbors
+        self.entanglement_index: Optional[torch.Tensor] = None
+        self.entanglement_offsets: Optional[np.ndarray] = None
+        self.entanglement_tensors: Optional[torch.Tensor] = None
+
         # Virtue operators
         self.virtue_operators: Dict[str, VirtueOperator] = {}
         
         # Graph Laplacian for entanglement
         self.laplacian_matrix = None
-        
+        self.laplacian_sparse = None
+
+        # Cached Laplacian eigensystem (built on first evolution step)
+        self._laplacian_eigenvalues = None
+        self._laplacian_eigenvectors = None
+        self._eigenbasis_source = None
+
+        # Residue count above which evolution uses the sparse Laplacian
+        # (Krylov expm_multiply) instead of a dense eigendecomposition
+        self.sparse_evolution_threshold = SPARSE_EVOLUTION_THRESHOLD
+
         # Measurement operators
         self.measurement_operators = {}
         
@@ -109,13 +242,57 @@ class ProteinVQbitGraph:
                                      constraint_type='spatial')
         
         # Compute graph Laplacian for entanglement operations
+        self.laplacian_sparse = csr_matrix(nx.normalized_laplacian_matrix(self.akg))
         self.laplacian_matrix = torch.tensor(
-            nx.normalized_laplacian_matrix(self.akg).toarray(),
+            self.laplacian_sparse.toarray(),
             dtype=torch.float32,
             device=self.device
         )
-        
+
+        # Directed edge index for the entanglement store (both directions, sorted by source)
+        edges = np.array(list(self.akg.edges()), dtype=np.int64).reshape(-1, 2)
+        directed = np.concatenate([edges, edges[:, ::-1]])
+        directed = directed[np.lexsort((directed[:, 1], directed[:, 0]))]
+        self.entanglement_index = torch.from_numpy(np.ascontiguousarray(directed.T)).to(self.device)
+        self.entanglement_offsets = np.searchsorted(directed[:, 0], np.arange(self.n_residues + 1))
+
         logger.info(f"Built protein graph: {self.akg.number_of_nodes()} nodes, {self.akg.number_of_edges()} edges")
+
+    @property
+    def vqbit_states(self) -> Dict[int, VQbitState]:
+        """
+        Per-residue VQbitState view of the array-backed state.
+
+        Amplitudes are views into the (N, 8) tensor, so in-place tensor updates
+        propagate back; reassigning fields on the returned objects does not.
+        """
+
+        if self.amplitudes is None:
+            return {}
+
+        virtue_rows = self.virtue_score_matrix.tolist()
+        index = self.entanglement_index[1].tolist()
+        states = {}
+        for i in range(self.n_residues):
+            start, end = self.entanglement_offsets[i], self.entanglement_offsets[i + 1]
+            states[i] = VQbitState(
+                amplitudes=self.amplitudes[i],
+                basis_states=CONFORMATION_BASIS_STATES,
+                residue_id=i,
+                entanglement_map={index[e]: self.entanglement_tensors[e] for e in range(start, end)},
+                virtue_scores=dict(zip(VIRTUE_NAMES, virtue_rows[i]))
+            )
+        return states
+
+    def get_entanglement(self, i: int, j: int) -> torch.Tensor:
+        """8×8 entanglement tensor coupling residue i to neighbor j"""
+
+        start, end = self.entanglement_offsets[i], self.entanglement_offsets[i + 1]
+        targets = self.entanglement_index[1, start:end]
+        match = torch.nonzero(targets == j)
+        if match.numel() == 0:
+            raise KeyError(f"Residues {i} and {j} are not entangled")
+        return self.entanglement_tensors[start + int(match[0, 0])]
     
     def _should_add_interaction(self, i: int, j: int) -> bool:
         """Determine if residues i and j should have long-range interaction"""
@@ -529,53 +706,29 @@ class ProteinVQbitGraph:
             except Exception as e:
                 logger.warning(f"Could not query learned motifs: {e}")
         
-        for i in range(self.n_residues):
-            
-            if use_biophysical_priors:
-                # Phase 1: Use biophysical properties to generate initial amplitudes
-                amplitudes = self._generate_biophysical_amplitudes(i)
-                
-                # Phase 2: Apply learned motif bias if available
-                if learned_motifs:
-                    amplitudes = self._apply_motif_bias(amplitudes, i, learned_motifs)
-            else:
-                # Legacy: Random initialization
-                amplitudes = torch.randn(8, dtype=torch.complex64, device=self.device)
-                norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
-                amplitudes = amplitudes / norm
-            
-            # Create basis states for different conformations (unchanged)
-            basis_states = [
-                {'phi': -60, 'psi': -45, 'type': 'alpha_helix'},  # 0
-                {'phi': -70, 'psi': -35, 'type': 'alpha_helix'},  # 1
-                {'phi': -50, 'psi': -55, 'type': 'alpha_helix'},  # 2
-                {'phi': -120, 'psi': 120, 'type': 'beta_sheet'},  # 3
-                {'phi': -130, 'psi': 110, 'type': 'beta_sheet'},  # 4
-                {'phi': -110, 'psi': 130, 'type': 'beta_sheet'},  # 5
-                {'phi': -180, 'psi': 180, 'type': 'extended'},    # 6
-                {'phi': 60, 'psi': 45, 'type': 'left_handed'}     # 7
-            ]
-            
-            # Initialize entanglement map
-            entanglement_map = {}
-            for neighbor in self.akg.neighbors(i):
-                entanglement_map[neighbor] = torch.randn(8, 8, dtype=torch.complex64, device=self.device)
-            
-            # Initialize virtue scores
-            virtue_scores = {
-                'Justice': 0.5,
-                'Honesty': 0.5, 
-                'Temperance': 0.5,
-                'Prudence': 0.5
-            }
-            
-            self.vqbit_states[i] = VQbitState(
-                amplitudes=amplitudes,
-                basis_states=basis_states,
-                residue_id=i,
-                entanglement_map=entanglement_map,
-                virtue_scores=virtue_scores
-            )
+        if use_biophysical_priors:
+            # Phase 1: Use biophysical properties to generate initial amplitudes
+            amplitudes = self._generate_biophysical_amplitude_matrix()
+
+            # Phase 2: Apply learned motif bias if available
+            if learned_motifs:
+                for i in range(self.n_residues):
+                    amplitudes[i] = self._apply_motif_bias(amplitudes[i], i, learned_motifs)
+        else:
+            # Legacy: Random initialization
+            amplitudes = torch.randn(self.n_residues, 8, dtype=torch.complex64, device=self.device)
+            amplitudes = amplitudes / torch.linalg.vector_norm(amplitudes, dim=1, keepdim=True)
+
+        self.amplitudes = amplitudes
+
+        # Initialize entanglement store (one random 8×8 coupling per directed edge)
+        n_edges = self.entanglement_index.shape[1]
+        self.entanglement_tensors = torch.randn(n_edges, 8, 8, dtype=torch.complex64, device=self.device)
+
+        # Initialize virtue scores
+        self.virtue_score_matrix = torch.full(
+            (self.n_residues, len(VIRTUE_NAMES)), 0.5, dtype=torch.float32, device=self.device
+        )
         
         mode_desc = []
         if use_biophysical_priors:
@@ -585,7 +738,7 @@ class ProteinVQbitGraph:
         if not mode_desc:
             mode_desc.append("random amplitudes")
             
-        logger.info(f"Initialized {len(self.vqbit_states)} vQbit states using {' + '.join(mode_desc)}")
+        logger.info(f"Initialized {self.n_residues} vQbit states using {' + '.join(mode_desc)}")
     
     def _apply_motif_bias(self, amplitudes: torch.Tensor, residue_idx: int, learned_motifs: List[Dict]) -> torch.Tensor:
         """
@@ -635,118 +788,41 @@ class ProteinVQbitGraph:
         norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
         return amplitudes / norm
     
-    def _generate_biophysical_amplitudes(self, residue_index: int) -> torch.Tensor:
+    def _generate_biophysical_amplitude_matrix(self) -> torch.Tensor:
         """
-        Generate physics-based initial amplitudes for a residue based on amino acid properties.
+        Generate physics-based initial amplitudes for all residues based on amino acid properties.
         
-        This implements the core de novo initialization from Phase 1 of the roadmap.
+        This implements the core de novo initialization from Phase 1 of the roadmap,
+        returning an (N, 8) amplitude matrix.
         """
         
-        amino_acid = self.sequence[residue_index]
-        
-        # Biophysical property lookup (simplified Ramachandran propensities)
-        aa_propensities = {
-            'A': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
-            'R': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
-            'N': [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # Sheet-favoring
-            'D': [0.1, 0.1, 0.1, 0.3, 0.3, 0.1, 0.0, 0.0],  # Sheet-favoring
-            'C': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
-            'E': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
-            'Q': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Helix/extended
-            'G': [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2],  # Highly flexible
-            'H': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Variable
-            'I': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix/sheet
-            'L': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
-            'K': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Extended/charged
-            'M': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix-favoring
-            'F': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
-            'P': [0.0, 0.0, 0.0, 0.1, 0.1, 0.1, 0.4, 0.3],  # Turn/break
-            'S': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
-            'T': [0.2, 0.2, 0.1, 0.2, 0.2, 0.1, 0.0, 0.0],  # Flexible
-            'W': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
-            'Y': [0.2, 0.2, 0.1, 0.3, 0.2, 0.0, 0.0, 0.0],  # Sheet-favoring
-            'V': [0.3, 0.3, 0.2, 0.1, 0.1, 0.0, 0.0, 0.0],  # Helix/sheet
-        }
-        
-        # Get propensities for this amino acid (default to flexible if unknown)
-        propensities = aa_propensities.get(amino_acid, [0.125] * 8)
+        # Get propensities for each amino acid (default to flexible if unknown)
+        propensities = torch.tensor(
+            [AA_PROPENSITIES.get(aa, [0.125] * 8) for aa in self.sequence],
+            dtype=torch.float32, device=self.device
+        ).reshape(self.n_residues, 8)
         
         # Add neighbor context effects
-        if residue_index > 0:
-            prev_aa = self.sequence[residue_index - 1]
-            # Proline preceding this residue breaks helices
-            if prev_aa == 'P':
-                propensities[0] *= 0.1  # Reduce helix propensity
-                propensities[1] *= 0.1
-                propensities[2] *= 0.1
-        
-        if residue_index < len(self.sequence) - 1:
-            next_aa = self.sequence[residue_index + 1]
-            # Proline following this residue affects angles
-            if next_aa == 'P':
-                propensities[6] *= 2.0  # Increase extended propensity
-                propensities[7] *= 2.0
+        is_proline = torch.tensor([aa == 'P' for aa in self.sequence], dtype=torch.bool, device=self.device)
+        if self.n_residues > 1:
+            # Proline preceding a residue breaks helices
+            propensities[1:, 0:3] *= torch.where(is_proline[:-1], 0.1, 1.0).unsqueeze(1)
+            # Proline following a residue favors extended angles
+            propensities[:-1, 6:8] *= torch.where(is_proline[1:], 2.0, 1.0).unsqueeze(1)
         
         # Convert to complex amplitudes with random phases
-        propensities_tensor = torch.tensor(propensities, dtype=torch.float32, device=self.device)
-        phases = torch.rand(8, device=self.device) * 2 * np.pi
-        
-        amplitudes = torch.sqrt(propensities_tensor) * torch.exp(1j * phases)
+        phases = torch.rand(self.n_residues, 8, device=self.device) * 2 * np.pi
+        amplitudes = torch.sqrt(propensities) * torch.exp(1j * phases)
         
         # Normalize
-        norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
-        if norm > 1e-10:
-            amplitudes = amplitudes / norm
+        norms = torch.linalg.vector_norm(amplitudes, dim=1, keepdim=True)
+        amplitudes = torch.where(norms > 1e-10, amplitudes / norms.clamp_min(1e-10), amplitudes)
         
         return amplitudes.to(torch.complex64)
 
     def initialize_vqbit_states(self) -> None:
         """Legacy method - calls initialize_from_sequence for backward compatibility"""
         self.initialize_from_sequence(use_biophysical_priors=False)
-        
-        # Legacy initialization code preserved for compatibility
-        for i in range(self.n_residues):
-            
-            # Create random initial amplitudes (normalized)
-            amplitudes = torch.randn(8, dtype=torch.complex64, device=self.device)
-            # Use manual normalization for complex numbers
-            norm = torch.sqrt(torch.sum(torch.conj(amplitudes) * amplitudes).real)
-            amplitudes = amplitudes / norm
-            
-            # Create basis states for different conformations
-            basis_states = [
-                {'phi': -60, 'psi': -45, 'type': 'alpha_helix'},  # 0
-                {'phi': -70, 'psi': -35, 'type': 'alpha_helix'},  # 1
-                {'phi': -50, 'psi': -55, 'type': 'alpha_helix'},  # 2
-                {'phi': -120, 'psi': 120, 'type': 'beta_sheet'},  # 3
-                {'phi': -130, 'psi': 110, 'type': 'beta_sheet'},  # 4
-                {'phi': -110, 'psi': 130, 'type': 'beta_sheet'},  # 5
-                {'phi': -180, 'psi': 180, 'type': 'extended'},    # 6
-                {'phi': 60, 'psi': 45, 'type': 'left_handed'}     # 7
-            ]
-            
-            # Initialize entanglement map
-            entanglement_map = {}
-            for neighbor in self.akg.neighbors(i):
-                entanglement_map[neighbor] = torch.randn(8, 8, dtype=torch.complex64, device=self.device)
-            
-            # Initialize virtue scores
-            virtue_scores = {
-                'Justice': 0.5,
-                'Honesty': 0.5, 
-                'Temperance': 0.5,
-                'Prudence': 0.5
-            }
-            
-            self.vqbit_states[i] = VQbitState(
-                amplitudes=amplitudes,
-                basis_states=basis_states,
-                residue_id=i,
-                entanglement_map=entanglement_map,
-                virtue_scores=virtue_scores
-            )
-        
-        logger.info(f"Initialized {len(self.vqbit_states)} vQbit states")
     
     def apply_virtue_constraints(self, virtue_name: str) -> None:
         """Apply virtue constraint operator to all vQbit states"""
@@ -756,28 +832,24 @@ class ProteinVQbitGraph:
         
         virtue_op = self.virtue_operators[virtue_name]
         
-        for i, vqbit in self.vqbit_states.items():
-            
-            # Apply virtue projector to amplitudes
-            current_state = vqbit.amplitudes.view(8, 1)
-            projected_state = virtue_op.projector @ current_state
-            
-            # Renormalize (manual for complex numbers)
-            norm = torch.sqrt(torch.sum(torch.conj(projected_state) * projected_state).real)
-            if norm > 1e-10:
-                projected_state = projected_state / norm
-                vqbit.amplitudes = projected_state.view(8)
-            
-            # Update virtue score
-            virtue_score = torch.real(
-                torch.conj(projected_state).T @ virtue_op.constraint_matrix.sum(dim=0) @ projected_state
-            ).item()
-            vqbit.virtue_scores[virtue_name] = virtue_score
+        # Apply virtue projector to every residue at once: rows of A become P @ a
+        projected_states = self.amplitudes @ virtue_op.projector.mT
+        
+        # Renormalize; residues projected out entirely keep their amplitudes
+        norms = torch.linalg.vector_norm(projected_states, dim=1, keepdim=True)
+        valid = norms > 1e-10
+        projected_states = torch.where(valid, projected_states / norms.clamp_min(1e-10), projected_states)
+        self.amplitudes = torch.where(valid, projected_states, self.amplitudes)
+        
+        # Update virtue scores: ⟨p|M|p⟩ with M the residue-summed constraint matrix
+        constraint_sum = virtue_op.constraint_matrix.sum(dim=0)
+        virtue_scores = torch.sum(torch.conj(projected_states) * (projected_states @ constraint_sum.mT), dim=1).real
+        self.virtue_score_matrix[:, VIRTUE_NAMES.index(virtue_name)] = virtue_scores.to(self.virtue_score_matrix.dtype)
         
         logger.info(f"Applied {virtue_name} virtue constraints to all vQbits")
     
     def virtue_guided_collapse(self, target_conformations: int = 5, 
-                              collapse_rounds: int = 3) -> List[Dict[str, Any]]:
+                              collapse_rounds: int = 3, batched: bool = False) -> List[Dict[str, Any]]:
         """
         Phase 1 Enhancement: Virtue-guided collapse algorithm.
         
@@ -788,11 +860,16 @@ class ProteinVQbitGraph:
         Args:
             target_conformations: Number of final conformations to generate
             collapse_rounds: Number of virtue application rounds
+            batched: If True, draw all conformations at once with collapse_ensemble()
+                instead of re-initializing and measuring once per conformation
             
         Returns:
             List of collapsed conformations with their properties
         """
         
+        if batched:
+            return self.collapse_ensemble(target_conformations, collapse_rounds).to_conformations()
+        
         logger.info(f"Starting virtue-guided collapse to {target_conformations} conformations")
         
         collapsed_conformations = []
@@ -867,33 +944,111 @@ class ProteinVQbitGraph:
         
         return collapsed_conformations
     
-    def evolve_entangled_states(self, time_step: float = 0.1) -> None:
-        """Evolve vQbit states using graph Laplacian entanglement"""
-        
-        # Create system state vector
-        all_amplitudes = torch.stack([vqbit.amplitudes for vqbit in self.vqbit_states.values()])
-        system_state = all_amplitudes.view(-1)
-        
-        # Create entanglement Hamiltonian using graph Laplacian
-        # H = -J * (I ⊗ L) where J is coupling strength, L is Laplacian
-        identity_8 = torch.eye(8, device=self.device, dtype=torch.complex64)
-        hamiltonian = -1.0 * torch.kron(self.laplacian_matrix.to(torch.complex64), identity_8)
-        
-        # Time evolution: |ψ(t+dt)⟩ = exp(-iH*dt)|ψ(t)⟩
-        # Use CPU for matrix exponentiation if MPS doesn't support it
-        hamiltonian_scaled = -1j * hamiltonian * time_step
-        if hamiltonian_scaled.device.type == 'mps':
-            hamiltonian_cpu = hamiltonian_scaled.cpu()
-            evolution_operator = torch.matrix_exp(hamiltonian_cpu).to(self.device)
-        else:
-            evolution_operator = torch.matrix_exp(hamiltonian_scaled)
+    def collapse_ensemble(self, n_conformations: int = 1000,
+                          collapse_rounds: int = 3) -> ConformationEnsemble:
+        """
+        Batched virtue-guided collapse: draw n_conformations for all residues at once.
         
-        evolved_state = evolution_operator @ system_state
+        Applies the Justice/Temperance collapse rounds to the current state once,
+        then samples every conformation from the resulting per-residue measurement
+        distributions with a single multinomial draw. The graph keeps its
+        post-collapse-round superposition (it is not collapsed to any one sample).
+        Scores match virtue_guided_collapse: each conformation's final FoT value
+        is the FoT equation of the graph collapsed onto that conformation.
         
-        # Update individual vQbit states
-        evolved_amplitudes = evolved_state.view(self.n_residues, 8)
-        for i, vqbit in self.vqbit_states.items():
-            vqbit.amplitudes = evolved_amplitudes[i]
+        Args:
+            n_conformations: Number of conformations K to sample
+            collapse_rounds: Number of virtue application rounds
+            
+        Returns:
+            ConformationEnsemble with (K, N) int8 basis indices and per-conformation scores
+        """
+        
+        logger.info(f"Starting batched virtue-guided collapse to {n_conformations} conformations")
+        
+        initial_fot = self.calculate_fot_equation()
+        
+        for round_idx in range(collapse_rounds):
+            self.apply_virtue_constraints('Justice')
+            self.apply_virtue_constraints('Temperance')
+        
+        # Sample K basis states for every residue in one draw: (N, K) -> (K, N)
+        probabilities = (torch.conj(self.amplitudes) * self.amplitudes).real
+        probabilities = probabilities / probabilities.sum(dim=1, keepdim=True)
+        samples = torch.multinomial(probabilities, n_conformations, replacement=True).T
+        
+        # Joint log-probability of each sampled conformation
+        log_probabilities = torch.log(probabilities.clamp_min(1e-30)).T.gather(0, samples).sum(dim=1)
+        
+        # FoT of each conformation collapsed onto its sampled basis states, from the
+        # same equation virtue_guided_collapse evaluates after measure_conformation()
+        final_fot_values = self._collapsed_fot_values(samples)
+        virtue_scores = self.virtue_score_matrix.clone()
+        average_virtue_scores = virtue_scores.mean().expand(n_conformations).clone()
+        
+        ensemble = ConformationEnsemble(
+            sequence=self.sequence,
+            indices=samples.to(torch.int8),
+            log_probabilities=log_probabilities,
+            average_virtue_scores=average_virtue_scores,
+            final_fot_values=final_fot_values,
+            initial_fot_value=initial_fot,
+            probabilities=probabilities,
+            virtue_scores=virtue_scores,
+            collapse_rounds=collapse_rounds
+        )
+        
+        logger.info(f"Batched collapse completed. Sampled {len(ensemble)} conformations")
+        return ensemble
+    
+    def _get_laplacian_eigensystem(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Eigendecomposition L = V diag(λ) Vᵀ of the graph Laplacian.
+
+        Computed once per Laplacian and reused by every evolution step;
+        reassigning laplacian_matrix invalidates the cache.
+        """
+
+        if self._eigenbasis_source is not self.laplacian_matrix:
+            # Decompose in float64 on the CPU (MPS has no eigh) for stable eigenvectors
+            laplacian = self.laplacian_matrix.detach().cpu().to(torch.float64)
+            eigenvals, eigenvecs = torch.linalg.eigh(laplacian)
+            self._laplacian_eigenvalues = eigenvals
+            self._laplacian_eigenvectors = eigenvecs.to(torch.complex64).to(self.device)
+            self._eigenbasis_source = self.laplacian_matrix
+
+        return self._laplacian_eigenvalues, self._laplacian_eigenvectors
+
+    def evolve_entangled_states(self, time_step: float = 0.1) -> None:
+        """
+        Evolve vQbit states using graph Laplacian entanglement
+
+        The entanglement Hamiltonian H = -(L ⊗ I₈) acts identically on all 8
+        conformational channels, so exp(-iH·dt) never needs to be formed as an
+        8N×8N matrix: the (N, 8) amplitude matrix evolves as
+        A ← V diag(exp(iλ·dt)) Vᵀ A using the cached Laplacian eigenbasis.
+        Very long sequences skip the dense eigendecomposition and apply
+        exp(iL·dt) through the sparse Laplacian instead.
+        """
+
+        if self.n_residues > self.sparse_evolution_threshold:
+            self.amplitudes = self._evolve_sparse(self.amplitudes, time_step)
+        else:
+            eigenvals, eigenvecs = self._get_laplacian_eigensystem()
+
+            # Time evolution: |ψ(t+dt)⟩ = exp(-iH*dt)|ψ(t)⟩ with H = -(L ⊗ I)
+            phases = torch.exp(1j * eigenvals * time_step).to(torch.complex64).to(self.device)
+            eigenbasis_amplitudes = eigenvecs.mT.conj() @ self.amplitudes
+            self.amplitudes = eigenvecs @ (phases.unsqueeze(1) * eigenbasis_amplitudes)
+
+    def _evolve_sparse(self, amplitudes: torch.Tensor, time_step: float) -> torch.Tensor:
+        """Apply exp(iL·dt) to the (N, 8) amplitude matrix via the sparse Laplacian"""
+
+        evolved = expm_multiply(
+            (1j * time_step) * self.laplacian_sparse.astype(np.complex128),
+            amplitudes.detach().cpu().numpy().astype(np.complex128)
+        )
+        return torch.from_numpy(evolved.astype(np.complex64)).to(self.device)
     
     def amplitude_amplification_search(self, target_virtue_threshold: float = 0.8, 
                                      max_iterations: int = 100) -> List[int]:
@@ -927,69 +1082,59 @@ class ProteinVQbitGraph:
     def _apply_virtue_oracle(self, threshold: float) -> None:
         """Oracle operator: marks high-virtue states"""
         
-        for i, vqbit in self.vqbit_states.items():
-            
-            # Calculate overall virtue score
-            overall_virtue = np.mean(list(vqbit.virtue_scores.values()))
-            
-            # Apply phase flip to high-virtue states
-            if overall_virtue > threshold:
-                vqbit.amplitudes = -vqbit.amplitudes
+        # Calculate overall virtue score per residue
+        overall_virtue = self.virtue_score_matrix.mean(dim=1, keepdim=True)
+        
+        # Apply phase flip to high-virtue states
+        self.amplitudes = torch.where(overall_virtue > threshold, -self.amplitudes, self.amplitudes)
     
     def _apply_diffusion_operator(self) -> None:
         """Diffusion operator: reflection about average amplitude"""
         
         # Calculate average amplitude across all states
-        all_amplitudes = torch.stack([vqbit.amplitudes for vqbit in self.vqbit_states.values()])
-        average_amplitude = torch.mean(all_amplitudes, dim=0)
+        average_amplitude = torch.mean(self.amplitudes, dim=0, keepdim=True)
         
         # Apply diffusion: 2|avg⟩⟨avg| - I
-        for i, vqbit in self.vqbit_states.items():
-            vqbit.amplitudes = 2 * average_amplitude - vqbit.amplitudes
-            
-            # Renormalize (manual for complex numbers)
-            norm = torch.sqrt(torch.sum(torch.conj(vqbit.amplitudes) * vqbit.amplitudes).real)
-            if norm > 1e-10:
-                vqbit.amplitudes = vqbit.amplitudes / norm
+        diffused = 2 * average_amplitude - self.amplitudes
+        
+        # Renormalize
+        norms = torch.linalg.vector_norm(diffused, dim=1, keepdim=True)
+        self.amplitudes = torch.where(norms > 1e-10, diffused / norms.clamp_min(1e-10), diffused)
     
     def _count_high_virtue_residues(self, threshold: float) -> List[int]:
         """Count residues with virtue scores above threshold"""
         
-        high_virtue = []
-        for i, vqbit in self.vqbit_states.items():
-            overall_virtue = np.mean(list(vqbit.virtue_scores.values()))
-            if overall_virtue > threshold:
-                high_virtue.append(i)
-        
-        return high_virtue
+        overall_virtue = self.virtue_score_matrix.mean(dim=1)
+        return torch.nonzero(overall_virtue > threshold).flatten().tolist()
     
     def measure_conformation(self) -> Dict[int, Dict[str, Any]]:
         """
         Measurement operator: collapse vQbit states to definite conformations
         """
         
-        measured_conformations = {}
+        # Calculate measurement probabilities for all residues
+        probabilities = (torch.conj(self.amplitudes) * self.amplitudes).real
         
-        for i, vqbit in self.vqbit_states.items():
-            
-            # Calculate measurement probabilities
-            probabilities = torch.real(torch.conj(vqbit.amplitudes) * vqbit.amplitudes)
-            
-            # Sample from probability distribution
-            sampled_index = torch.multinomial(probabilities, 1).item()
-            
-            # Collapse to measured state
-            collapsed_amplitudes = torch.zeros_like(vqbit.amplitudes)
-            collapsed_amplitudes[sampled_index] = 1.0
-            vqbit.amplitudes = collapsed_amplitudes
-            
-            # Record measured conformation
-            measured_conformations[i] = {
+        # Sample every residue from its distribution in one draw
+        sampled_indices = torch.multinomial(probabilities, 1).squeeze(1)
+        sampled_probabilities = probabilities.gather(1, sampled_indices.unsqueeze(1)).squeeze(1)
+        
+        # Collapse to measured states
+        self.amplitudes = torch.nn.functional.one_hot(sampled_indices, 8).to(self.amplitudes.dtype)
+        
+        # Record measured conformations
+        indices = sampled_indices.tolist()
+        sampled_probabilities = sampled_probabilities.tolist()
+        virtue_rows = self.virtue_score_matrix.tolist()
+        measured_conformations = {
+            i: {
                 'residue_type': self.sequence[i],
-                'conformation': vqbit.basis_states[sampled_index],
-                'probability': probabilities[sampled_index].item(),
-                'virtue_scores': vqbit.virtue_scores.copy()
+                'conformation': dict(CONFORMATION_BASIS_STATES[indices[i]]),
+                'probability': sampled_probabilities[i],
+                'virtue_scores': dict(zip(VIRTUE_NAMES, virtue_rows[i]))
             }
+            for i in range(self.n_residues)
+        }
         
         logger.info(f"Measured conformations for {len(measured_conformations)} residues")
         return measured_conformations
@@ -1000,58 +1145,67 @@ class ProteinVQbitGraph:
         Enhanced version addresses EGFT criticism with improved precision
         """
         
-        # Calculate virtue sum: ∑aᵢVᵢ
-        virtue_sum = 0.0
-        coherence_sum = 0.0
+        fot_value, avg_coherence = 0.0, 0.0
+        if self.amplitudes is not None:
+            fot_values, coherences = self._fot_values(self.amplitudes.unsqueeze(0), enhanced_accuracy)
+            fot_value, avg_coherence = fot_values.item(), coherences.item()
+        coherence_factor = 0.7 + 0.3 * avg_coherence
         
-        for i, vqbit in self.vqbit_states.items():
-            # aᵢ = amplitude weights (probability amplitudes)
-            amplitude_weights = torch.real(torch.conj(vqbit.amplitudes) * vqbit.amplitudes)
-            
-            # Vᵢ = virtue scores
-            overall_virtue = np.mean(list(vqbit.virtue_scores.values()))
-            
-            if enhanced_accuracy:
-                # ENHANCED: Add quantum coherence weighting for higher accuracy
-                coherence = self._calculate_vqbit_coherence(vqbit)
-                coherence_sum += coherence
-                
-                # Weight virtue by coherence (higher coherence = more reliable)
-                coherence_weighted_virtue = overall_virtue * (0.5 + 0.5 * coherence)
-                
-                # Enhanced amplitude calculation with normalization
-                amplitude_factor = torch.sum(amplitude_weights).item()
-                amplitude_factor = min(1.0, amplitude_factor)  # Prevent overflow
-                
-                weighted_virtue = amplitude_factor * coherence_weighted_virtue
-            else:
-                # Original calculation
-                weighted_virtue = torch.sum(amplitude_weights).item() * overall_virtue
-            
-            virtue_sum += weighted_virtue
+        logger.info(f"FoT equation calculated: {fot_value:.6f} {'(enhanced)' if enhanced_accuracy else '(standard)'}")
+        
+        if enhanced_accuracy:
+            logger.info(f"  Average coherence: {avg_coherence:.4f}")
+            logger.info(f"  Coherence factor: {coherence_factor:.4f}")
+        
+        return fot_value
+    
+    def _fot_values(self, amplitudes: torch.Tensor,
+                    enhanced_accuracy: bool = True) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        FoT(t) = AKG(∑aᵢVᵢ) for a (K, N, 8) batch of amplitude matrices.
+        
+        Returns the (K,) FoT values and (K,) average coherences; the virtue
+        scores Vᵢ are the graph's current virtue_score_matrix.
+        """
+        
+        # aᵢ = amplitude weights (probability amplitudes)
+        amplitude_totals = torch.sum((torch.conj(amplitudes) * amplitudes).real, dim=-1)
+        
+        # Vᵢ = virtue scores
+        overall_virtue = self.virtue_score_matrix.mean(dim=1)
         
         # AKG integration using graph structure
         graph_factor = self._calculate_graph_factor()
         
         if enhanced_accuracy:
+            # ENHANCED: Add quantum coherence weighting for higher accuracy
+            coherence = self._calculate_coherence_vector(amplitudes)
+            avg_coherence = coherence.mean(dim=-1)
+            
+            # Weight virtue by coherence (higher coherence = more reliable)
+            coherence_weighted_virtue = overall_virtue * (0.5 + 0.5 * coherence)
+            
+            # Enhanced amplitude calculation with normalization
+            amplitude_factor = amplitude_totals.clamp(max=1.0)  # Prevent overflow
+            virtue_sum = (amplitude_factor * coherence_weighted_virtue).sum(dim=-1)
+            
             # ENHANCED: Include coherence factor in FoT calculation
-            avg_coherence = coherence_sum / len(self.vqbit_states) if self.vqbit_states else 0.0
             coherence_factor = 0.7 + 0.3 * avg_coherence  # Boost for high coherence
-            
-            # Enhanced graph factor with stability correction
-            enhanced_graph_factor = graph_factor * coherence_factor
-            fot_value = enhanced_graph_factor * virtue_sum
-        else:
-            # Original calculation
-            fot_value = graph_factor * virtue_sum
-        
-        logger.info(f"FoT equation calculated: {fot_value:.6f} {'(enhanced)' if enhanced_accuracy else '(standard)'}")
-        
-        if enhanced_accuracy:
-            logger.info(f"  Average coherence: {avg_coherence:.4f}")
-            logger.info(f"  Coherence factor: {coherence_factor:.4f}")
+            return graph_factor * coherence_factor * virtue_sum, avg_coherence
         
-        return fot_value
+        # Original calculation
+        virtue_sum = (amplitude_totals * overall_virtue).sum(dim=-1)
+        return graph_factor * virtue_sum, torch.zeros_like(virtue_sum)
+    
+    def _collapsed_fot_values(self, samples: torch.Tensor, chunk_size: int = 256) -> torch.Tensor:
+        """(K,) FoT values of the graph collapsed onto each (K, N) row of basis indices"""
+        
+        values = []
+        for chunk in torch.split(samples, chunk_size):
+            # The one-hot amplitudes measure_conformation() leaves behind
+            collapsed = torch.nn.functional.one_hot(chunk.long(), 8).to(self.amplitudes.dtype)
+            values.append(self._fot_values(collapsed)[0])
+        return torch.cat(values).to(torch.float32) if values else torch.empty(0)
     
     def _calculate_graph_factor(self) -> float:
         """Calculate AKG graph factor for FoT equation"""
@@ -1065,35 +1219,19 @@ class ProteinVQbitGraph:
         
         return graph_factor
     
-    def _calculate_vqbit_coherence(self, vqbit: VQbitState) -> float:
-        """Calculate quantum coherence of a vQbit state"""
-        
-        # L1-norm coherence measure
-        amplitudes = vqbit.amplitudes
-        n = len(amplitudes)
-        
-        if n <= 1:
-            return 0.0
-        
-        # Calculate density matrix elements
-        coherence = 0.0
-        
-        # Sample subset for efficiency (full calculation too expensive)
-        sample_size = min(100, n)
-        indices = torch.randperm(n)[:sample_size]
-        
-        for i in range(len(indices)):
-            for j in range(i+1, len(indices)):
-                idx_i, idx_j = indices[i], indices[j]
-                # Off-diagonal density matrix element
-                rho_ij = amplitudes[idx_i] * torch.conj(amplitudes[idx_j])
-                coherence += torch.abs(rho_ij).item()
-        
-        # Normalize by maximum possible coherence
-        max_coherence = sample_size * (sample_size - 1) / 2
-        normalized_coherence = coherence / max_coherence if max_coherence > 0 else 0.0
-        
-        return min(1.0, normalized_coherence)
+    def _calculate_coherence_vector(self, amplitudes: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """
+        L1-norm coherence of every residue vQbit as an (N,) tensor
+        ((..., N) for a batch of amplitude matrices).
+
+        Σ_{i<j} |aᵢ||aⱼ| = ((Σ|a|)² − Σ|a|²) / 2, normalized by the 28 pairs of
+        the 8-dimensional basis.
+        """
+
+        magnitudes = torch.abs(self.amplitudes if amplitudes is None else amplitudes)
+        pair_sum = (magnitudes.sum(dim=-1) ** 2 - (magnitudes ** 2).sum(dim=-1)) / 2
+        max_coherence = 8 * 7 / 2
+        return (pair_sum / max_coherence).clamp(max=1.0)
     
     def run_fot_optimization(self, max_iterations: int = 1000, 
                            convergence_threshold: float = 1e-6) -> Dict[str, Any]:
@@ -21,7 +21,9 @@ import psutil
 # Import existing modules
 from scientific_sequence_generator import ScientificSequenceGenerator
 from validate_discovery_quality import DiscoveryQualityValidator
-from neo4j_discovery_engine import Neo4jDiscoveryEngine, NEO4J_AVAILABLE
+from neo4j_discovery_engine import NEO4J_AVAILABLE, open_discovery_engine
+from embedded_graph_store import configured_backend
+from neo4j_ingestion_queue import DiscoveryIngestionQueue
 
 # Import new genetics modules
 from genetics.genetics_ontology import GeneticsOntology, GeneticVariant, RegulatoryElement, VirtueType
@@ -55,6 +57,14 @@ class M4Neo4jConfig:
     neo4j_user: str = "neo4j"
     neo4j_password: str = "fotquantum"
     use_neo4j: bool = True
+    graph_backend: str = None  # 'neo4j' or 'embedded'; None reads FOTCHEM_GRAPH_BACKEND
+    
+    # Write-behind ingestion (discovery loop never waits on Neo4j round trips)
+    ingestion_batch_size: int = 256
+    ingestion_flush_interval: float = 1.0
+    ingestion_queue_size: int = 10000
+    ingestion_max_retries: int = 3
+    dead_letter_path: str = "m4_continuous_discoveries/neo4j_dead_letter.jsonl"
     
     def __post_init__(self):
         # Verify MPS availability
@@ -263,15 +273,28 @@ class M4Neo4jDiscoveryEngine:
         self.genetics_simulator = None  # Will initialize after Neo4j setup
         
         # Initialize Neo4j engine
-        if self.config.use_neo4j and NEO4J_AVAILABLE:
+        graph_backend = self.config.graph_backend or configured_backend()
+        if self.config.use_neo4j and (NEO4J_AVAILABLE or graph_backend == 'embedded'):
             try:
-                self.neo4j_engine = Neo4jDiscoveryEngine(
+                # Embedded backend keeps the graph in a local SQLite store, no server needed
+                self.neo4j_engine = open_discovery_engine(
+                    graph_backend,
                     uri=self.config.neo4j_uri,
                     user=self.config.neo4j_user,
                     password=self.config.neo4j_password
                 )
                 self.use_neo4j = True
                 
+                # Background writer draining discoveries to Neo4j in bulk
+                self.ingestion_queue = DiscoveryIngestionQueue(
+                    self.neo4j_engine,
+                    batch_size=self.config.ingestion_batch_size,
+                    flush_interval=self.config.ingestion_flush_interval,
+                    max_queue_size=self.config.ingestion_queue_size,
+                    max_retries=self.config.ingestion_max_retries,
+                    dead_letter_path=self.config.dead_letter_path
+                )
+                
                 # Initialize genetics simulator with Neo4j connection
                 self.genetics_analyzer = GeneticsAnalyzer(self.neo4j_engine)
                 
@@ -396,12 +419,14 @@ class M4Neo4jDiscoveryEngine:
                 time.sleep(0.1)
         
         # Final shutdown
+        if self.use_neo4j:
+            self.ingestion_queue.close()
         self._generate_shutdown_report()
         if self.use_neo4j:
             self.neo4j_engine.close()
     
     def _ultra_fast_validate_and_store(self, sequences: List[str], metal_results: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Ultra-fast validation and direct Neo4j storage"""
+        """Ultra-fast validation with write-behind Neo4j storage"""
         
         valid_discoveries = []
         individual_scores = metal_results.get('individual_scores', [])
@@ -474,13 +499,13 @@ class M4Neo4jDiscoveryEngine:
                     # Store in Neo4j or file with enhanced error handling
                     try:
                         if self.use_neo4j:
-                            discovery_id = self.neo4j_engine.store_discovery(discovery)
-                            discovery['neo4j_id'] = discovery_id
-                            print(f"✅ Stored discovery: {discovery_id[:12]} (score: {score:.3f})")
+                            # Blocks only when the writer falls behind (backpressure)
+                            self.ingestion_queue.submit(discovery)
+                            print(f"✅ Queued discovery for Neo4j (score: {score:.3f})")
                             
                             # Log high-quantum discoveries
                             if quantum_analysis.get('superposition_fidelity', 0) > 0.8:
-                                logger.info(f"🌀 High quantum fidelity: {discovery_id[:8]} "
+                                logger.info(f"🌀 High quantum fidelity: {sequence[:8]} "
                                           f"(fidelity: {quantum_analysis['superposition_fidelity']:.3f}, "
                                           f"coherence: {quantum_analysis['coherence']:.3f})")
                         else:
@@ -568,6 +593,10 @@ class M4Neo4jDiscoveryEngine:
         
         # Neo4j statistics
         if self.use_neo4j:
+            ingestion = self.ingestion_queue.get_metrics()
+            logger.info(f"   📥 Ingestion queue: depth {ingestion['queue_depth']:,}/{ingestion['max_queue_size']:,}, "
+                        f"stored {ingestion['stored']:,}, dead-lettered {ingestion['dead_lettered']:,}, "
+                        f"avg flush {ingestion['avg_flush_latency'] * 1000:.1f} ms")
             try:
                 neo4j_stats = self.neo4j_engine.get_discovery_statistics()
                 logger.info(f"   🔗 Neo4j total discoveries: {neo4j_stats['total_discoveries']:,}")
@@ -591,6 +620,9 @@ class M4Neo4jDiscoveryEngine:
         
         # Final Neo4j statistics
         if self.use_neo4j:
+            ingestion = self.ingestion_queue.get_metrics()
+            logger.info(f"   Neo4j writes: {ingestion['stored']:,} stored in {ingestion['flushes']:,} flushes, "
+                        f"{ingestion['dead_lettered']:,} dead-lettered to {self.config.dead_letter_path}")
             try:
                 final_stats = self.neo4j_engine.get_discovery_statistics()
                 logger.info(f"   Neo4j discoveries: {final_stats['total_discoveries']:,}")
@@ -11,8 +11,10 @@ from datetime import datetime
 from typing import Dict, Any
 import logging
 
+from embedded_graph_store import configured_backend
+
 try:
-    from neo4j_discovery_engine import Neo4jDiscoveryEngine, NEO4J_AVAILABLE
+    from neo4j_discovery_engine import NEO4J_AVAILABLE, open_discovery_engine
 except ImportError:
     NEO4J_AVAILABLE = False
 
@@ -25,11 +27,12 @@ class M4Neo4jQuantumMonitor:
         self.update_interval = update_interval
         self.start_time = datetime.now()
         
-        if not NEO4J_AVAILABLE:
+        if not NEO4J_AVAILABLE and configured_backend() != 'embedded':
             raise RuntimeError("Neo4j not available. Install with: python3 -m pip install neo4j")
         
         try:
-            self.neo4j_engine = Neo4jDiscoveryEngine()
+            # Dashboard reads are cached between refreshes
+            self.neo4j_engine = open_discovery_engine(stats_cache_ttl=update_interval)
             print("✅ Connected to Neo4j vQbit Knowledge Graph")
         except Exception as e:
             raise RuntimeError(f"Failed to connect to Neo4j: {e}")
@@ -93,6 +96,15 @@ class M4Neo4jQuantumMonitor:
             'total_memory': sum(p['memory_percent'] for p in m4_processes)
         }
     
+    def _traversal_panel(self, name: str, loader, default, skipped: list):
+        """Load a graph-traversal panel; the embedded backend has none, so it is skipped there"""
+        
+        try:
+            return loader()
+        except NotImplementedError:
+            skipped.append(name)
+            return default
+    
     def display_quantum_dashboard(self):
         """Display the complete quantum discovery dashboard"""
         
@@ -111,14 +123,22 @@ class M4Neo4jQuantumMonitor:
             discovery_stats = self.neo4j_engine.get_discovery_statistics()
             comprehensive_analysis = self.neo4j_engine.get_comprehensive_graph_analysis()
             quantum_analysis = comprehensive_analysis['quantum_analysis']
-            quantum_patterns = self.neo4j_engine.find_quantum_patterns()
-            protein_families = self.neo4j_engine.get_protein_family_analysis()
+            skipped_panels = []
+            quantum_patterns = self._traversal_panel(
+                "Quantum Patterns", self.neo4j_engine.find_quantum_patterns, [], skipped_panels)
+            protein_families = self._traversal_panel(
+                "Protein Families", self.neo4j_engine.get_protein_family_analysis, {}, skipped_panels)
             therapeutic_targets = self.neo4j_engine.get_therapeutic_target_analysis()
             structural_analysis = self.neo4j_engine.get_structural_analysis()
-            high_potential = self.neo4j_engine.find_high_potential_discoveries(limit=3)
+            high_potential = self._traversal_panel(
+                "High Potential", lambda: self.neo4j_engine.find_high_potential_discoveries(limit=3), [],
+                skipped_panels)
             high_quality = self.neo4j_engine.get_high_quality_discoveries(limit=5)
-            solution_analysis = self.neo4j_engine.get_solution_mapping_analysis()
-            breakthroughs = self.neo4j_engine.find_breakthrough_discoveries(limit=3)
+            solution_analysis = self._traversal_panel(
+                "Solution Mapping", self.neo4j_engine.get_solution_mapping_analysis, {}, skipped_panels)
+            breakthroughs = self._traversal_panel(
+                "Breakthroughs", lambda: self.neo4j_engine.find_breakthrough_discoveries(limit=3), [],
+                skipped_panels)
             system_stats = self.get_system_stats()
             process_info = self.get_m4_process_info()
             
@@ -294,6 +314,10 @@ class M4Neo4jQuantumMonitor:
                           f"Quality: {disc['quality']:.3f}")
                 print()
             
+            if skipped_panels:
+                print(f"ℹ️ Needs the Neo4j backend: {', '.join(skipped_panels)}")
+                print()
+            
             # System Resources
             print("💻 SYSTEM RESOURCES")
             print("-" * 40)
@@ -2,15 +2,24 @@
 """
 MIGRATE 1.4M+ DISCOVERIES TO NEO4J
 Batch migration script to transfer existing JSON discoveries to Neo4j graph database
-Handles the massive 1.4M+ discovery files efficiently
+Handles the massive 1.4M+ discovery files efficiently:
+- JSON files are decoded by a process pool
+- Decoded discoveries are written in transaction-sized UNWIND batches
+  by several concurrent writer sessions
+- A checkpoint manifest of ingested discovery ids lets an interrupted
+  migration resume without re-creating duplicates
 """
 
+import argparse
 import json
+import os
+import threading
 import time
+import uuid
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 import logging
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 import psutil
 from datetime import datetime
 
@@ -19,25 +28,88 @@ from neo4j_discovery_engine import Neo4jDiscoveryEngine, NEO4J_AVAILABLE
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Namespace for deterministic discovery ids derived from discovery file names
+MIGRATION_NAMESPACE = uuid.UUID("6f1d2b7e-4c1a-5e3b-9a8d-2f0c7b4e1a93")
+
+def migration_discovery_id(file_path: Path) -> str:
+    """Stable discovery id for a discovery file, so re-runs address the same graph node"""
+    return str(uuid.uuid5(MIGRATION_NAMESPACE, Path(file_path).name))
+
+def _decode_discovery_file(file_path: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Decoder pool worker: load one discovery file and tag it with its migration id"""
+    
+    try:
+        with open(file_path, 'r') as f:
+            discovery_data = json.load(f)
+        discovery_data['discovery_id'] = migration_discovery_id(file_path)
+        return file_path, discovery_data, None
+    except Exception as e:
+        return file_path, None, str(e)
+
+class MigrationCheckpoint:
+    """Append-only manifest of discovery ids whose transactions have committed"""
+    
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = Path(manifest_path)
+        self._lock = threading.Lock()
+        self.ingested_ids: Set[str] = set()
+        
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r') as f:
+                self.ingested_ids = {line.strip() for line in f if line.strip()}
+                
+    def __contains__(self, discovery_id: str) -> bool:
+        return discovery_id in self.ingested_ids
+        
+    def __len__(self) -> int:
+        return len(self.ingested_ids)
+        
+    def record(self, discovery_ids: List[str]):
+        """Persist ids after their batch committed"""
+        
+        with self._lock:
+            with open(self.manifest_path, 'a') as f:
+                f.write(''.join(f"{discovery_id}\n" for discovery_id in discovery_ids))
+                f.flush()
+                os.fsync(f.fileno())
+            self.ingested_ids.update(discovery_ids)
+            
+    def reset(self):
+        """Forget all progress (full re-migration)"""
+        
+        with self._lock:
+            self.ingested_ids.clear()
+            if self.manifest_path.exists():
+                self.manifest_path.unlink()
+
 class DiscoveryMigrator:
-    """Efficient migration of JSON discoveries to Neo4j"""
+    """Parallel, resumable migration of JSON discoveries to Neo4j"""
     
-    def __init__(self, discovery_dir: str = "m4_continuous_discoveries"):
+    def __init__(self, discovery_dir: str = "m4_continuous_discoveries", writer_sessions: int = 4,
+                 decoder_workers: Optional[int] = None, transaction_size: Optional[int] = None,
+                 checkpoint_path: Optional[str] = None, max_retries: int = 3):
         self.discovery_dir = Path(discovery_dir)
         self.neo4j_engine = None
         self.processed_count = 0
+        self.skipped_count = 0
         self.error_count = 0
         self.start_time = datetime.now()
         
-        # Auto-scale batch size based on system resources
-        self.batch_size = self._calculate_optimal_batch_size()
+        self.writer_sessions = max(1, writer_sessions)
+        self.decoder_workers = decoder_workers or max(1, (psutil.cpu_count() or 2) - self.writer_sessions)
+        self.max_retries = max_retries
+        self.checkpoint = MigrationCheckpoint(
+            Path(checkpoint_path) if checkpoint_path else self.discovery_dir / ".neo4j_migration_manifest"
+        )
+        
+        # Discoveries per UNWIND transaction, auto-scaled to system resources
+        self.batch_size = transaction_size or self._calculate_optimal_batch_size()
         
     def _calculate_optimal_batch_size(self) -> int:
-        """Calculate optimal batch size based on available system resources"""
+        """Calculate the transaction size (discoveries per UNWIND batch) from system memory"""
         
-        # Get system memory
+        # Each writer session holds one batch of parameter rows in memory
         memory_gb = psutil.virtual_memory().total / (1024**3)
-        cpu_count = psutil.cpu_count()
         
         # Conservative batch sizing for Neo4j transactions
         if memory_gb >= 64:  # M4 Mac Pro territory
@@ -48,13 +120,13 @@ class DiscoveryMigrator:
             return 250
         else:
             return 100
-    
+            
     def initialize_neo4j(self):
         """Initialize Neo4j connection"""
         
         if not NEO4J_AVAILABLE:
             raise RuntimeError("Neo4j driver not installed. Install with: pip install neo4j")
-        
+            
         try:
             self.neo4j_engine = Neo4jDiscoveryEngine()
             logger.info("✅ Neo4j connection established")
@@ -63,7 +135,7 @@ class DiscoveryMigrator:
             logger.error(f"❌ Failed to connect to Neo4j: {e}")
             logger.error("💡 Make sure Neo4j is running: brew services start neo4j")
             return False
-    
+            
     def get_discovery_files(self) -> List[Path]:
         """Get all discovery JSON files"""
         
@@ -72,111 +144,156 @@ class DiscoveryMigrator:
         if not self.discovery_dir.exists():
             logger.error(f"❌ Discovery directory not found: {self.discovery_dir}")
             return []
-        
-        discovery_files = list(self.discovery_dir.glob("m4_discovery_*.json"))
+            
+        discovery_files = sorted(self.discovery_dir.glob("m4_discovery_*.json"))
         print(f"📊 Found {len(discovery_files):,} discovery files")
         
         return discovery_files
-    
-    def process_batch(self, file_batch: List[Path]) -> Dict[str, int]:
-        """Process a batch of discovery files"""
         
-        batch_results = {"processed": 0, "errors": 0}
+    def get_pending_files(self, discovery_files: List[Path]) -> List[Path]:
+        """Drop files whose discovery id is already in the checkpoint manifest (no decoding needed)"""
+        
+        return [path for path in discovery_files if migration_discovery_id(path) not in self.checkpoint]
+        
+    def process_batch(self, discoveries: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Writer session task: store one transaction-sized batch and checkpoint it.
         
-        for file_path in file_batch:
+        Transient failures (lock contention between writers, leader switches)
+        are retried with backoff. Discoveries that already exist in the graph
+        (committed before an interruption, but not yet checkpointed) are skipped
+        by the engine rather than re-created.
+        """
+        
+        for attempt in range(self.max_retries + 1):
             try:
-                # Load discovery data
-                with open(file_path, 'r') as f:
-                    discovery_data = json.load(f)
-                
-                # Store in Neo4j
-                discovery_id = self.neo4j_engine.store_discovery(discovery_data)
-                batch_results["processed"] += 1
-                
+                discovery_ids = self.neo4j_engine.store_discoveries(discoveries, skip_existing=True)
+                self.checkpoint.record(discovery_ids)
+                return {"processed": len(discoveries), "errors": 0}
             except Exception as e:
-                batch_results["errors"] += 1
-                logger.debug(f"Error processing {file_path}: {e}")
-        
-        return batch_results
-    
-    def migrate_all_discoveries(self):
+                if attempt == self.max_retries:
+                    logger.error(f"❌ Batch of {len(discoveries)} discoveries failed: {e}")
+                    return {"processed": 0, "errors": len(discoveries)}
+                logger.warning(f"⚠️ Batch write failed (attempt {attempt + 1}), retrying: {e}")
+                time.sleep(0.5 * 2 ** attempt)
+                
+    def migrate_all_discoveries(self, restart: bool = False):
         """Migrate all discoveries to Neo4j with progress tracking"""
         
         print("🚀 STARTING DISCOVERY MIGRATION TO NEO4J")
         print("=" * 60)
         
         # Initialize Neo4j
-        if not self.initialize_neo4j():
+        if not self.neo4j_engine and not self.initialize_neo4j():
             return False
-        
+            
         # Get all discovery files
         discovery_files = self.get_discovery_files()
         
         if not discovery_files:
             print("⚠️ No discovery files found to migrate")
             return False
-        
+            
+        if restart:
+            self.checkpoint.reset()
+            
         total_files = len(discovery_files)
+        pending_files = self.get_pending_files(discovery_files)
+        self.skipped_count = total_files - len(pending_files)
+        
         print(f"📋 Migration Plan:")
         print(f"   Files to migrate: {total_files:,}")
-        print(f"   Batch size: {self.batch_size}")
-        print(f"   Estimated batches: {(total_files + self.batch_size - 1) // self.batch_size}")
+        print(f"   Already ingested (checkpoint): {self.skipped_count:,}")
+        print(f"   Transaction size: {self.batch_size}")
+        print(f"   Writer sessions: {self.writer_sessions}")
+        print(f"   Decoder processes: {self.decoder_workers}")
+        print(f"   Estimated transactions: {(len(pending_files) + self.batch_size - 1) // self.batch_size}")
         print()
         
-        # Process in batches
-        batch_count = 0
+        self._run_pipeline(pending_files, total_files)
+        
+        # Final summary
+        self._print_migration_summary(total_files)
         
-        for i in range(0, total_files, self.batch_size):
-            batch_count += 1
-            batch_files = discovery_files[i:i + self.batch_size]
+        # Close Neo4j connection
+        if self.neo4j_engine:
+            self.neo4j_engine.close()
             
-            print(f"🔄 Processing batch {batch_count} ({len(batch_files)} files)...")
+        return True
+        
+    def _run_pipeline(self, pending_files: List[Path], total_files: int):
+        """Decode files in a process pool and feed transaction batches to the writer sessions"""
+        
+        # Bound decoded-but-unwritten discoveries to a few batches per writer
+        max_in_flight = self.writer_sessions * 2
+        window_size = self.batch_size * self.writer_sessions
+        in_flight = set()
+        batch_count = 0
+        
+        with ProcessPoolExecutor(max_workers=self.decoder_workers) as decoders, \
+                ThreadPoolExecutor(max_workers=self.writer_sessions, thread_name_prefix="neo4j-writer") as writers:
+                
+            for window_start in range(0, len(pending_files), window_size):
+                window = [str(path) for path in pending_files[window_start:window_start + window_size]]
+                chunksize = max(1, len(window) // (self.decoder_workers * 4))
+                
+                batch = []
+                for file_path, discovery_data, error in decoders.map(_decode_discovery_file, window,
+                                                                     chunksize=chunksize):
+                    if error is not None:
+                        self.error_count += 1
+                        logger.debug(f"Error decoding {file_path}: {error}")
+                        continue
+                        
+                    batch.append(discovery_data)
+                    if len(batch) >= self.batch_size:
+                        in_flight.add(writers.submit(self.process_batch, batch))
+                        batch = []
+                        in_flight, batch_count = self._collect_writes(in_flight, max_in_flight,
+                                                                      batch_count, total_files)
+                                                                      
+                if batch:
+                    in_flight.add(writers.submit(self.process_batch, batch))
+                    
+            self._collect_writes(in_flight, 0, batch_count, total_files)
             
-            try:
-                # Process batch
-                batch_results = self.process_batch(batch_files)
+    def _collect_writes(self, in_flight: set, limit: int, batch_count: int, total_files: int):
+        """Wait until at most `limit` writes are outstanding, folding finished ones into the counters"""
+        
+        while len(in_flight) > limit:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_results = future.result()
+                batch_count += 1
                 
                 # Update counters
                 self.processed_count += batch_results["processed"]
                 self.error_count += batch_results["errors"]
                 
                 # Progress update
-                progress_pct = (i + len(batch_files)) / total_files * 100
+                completed = self.skipped_count + self.processed_count + self.error_count
+                progress_pct = completed / total_files * 100
                 elapsed_time = (datetime.now() - self.start_time).total_seconds()
                 rate = self.processed_count / elapsed_time if elapsed_time > 0 else 0
                 
-                print(f"   ✅ Batch {batch_count} complete: {batch_results['processed']} processed, {batch_results['errors']} errors")
-                print(f"   📊 Overall Progress: {progress_pct:.1f}% | {self.processed_count:,}/{total_files:,} | {rate:.1f} discoveries/sec")
+                print(f"   ✅ Transaction {batch_count}: {batch_results['processed']} stored, {batch_results['errors']} errors")
+                print(f"   📊 Overall Progress: {progress_pct:.1f}% | {completed:,}/{total_files:,} | {rate:.1f} discoveries/sec")
                 
-                # Memory cleanup
+                # System resource check
                 if batch_count % 10 == 0:
-                    import gc
-                    gc.collect()
-                    
-                    # System resource check
                     memory_usage = psutil.virtual_memory().percent
                     if memory_usage > 85:
-                        print(f"⚠️ High memory usage ({memory_usage:.1f}%), reducing batch size")
+                        print(f"⚠️ High memory usage ({memory_usage:.1f}%), reducing transaction size")
                         self.batch_size = max(50, self.batch_size // 2)
-                
-            except Exception as e:
-                logger.error(f"❌ Batch {batch_count} failed: {e}")
-                self.error_count += len(batch_files)
-        
-        # Final summary
-        self._print_migration_summary(total_files)
-        
-        # Close Neo4j connection
-        if self.neo4j_engine:
-            self.neo4j_engine.close()
+                        
+        return in_flight, batch_count
         
-        return True
-    
     def _print_migration_summary(self, total_files: int):
         """Print migration summary"""
         
         elapsed_time = (datetime.now() - self.start_time).total_seconds()
-        success_rate = (self.processed_count / total_files * 100) if total_files > 0 else 0
+        ingested = self.processed_count + self.skipped_count
+        success_rate = (ingested / total_files * 100) if total_files > 0 else 0
         
         print()
         print("🎯 MIGRATION COMPLETE!")
@@ -184,10 +301,11 @@ class DiscoveryMigrator:
         print(f"📊 Results:")
         print(f"   Total files: {total_files:,}")
         print(f"   Successfully migrated: {self.processed_count:,}")
+        print(f"   Resumed from checkpoint: {self.skipped_count:,}")
         print(f"   Errors: {self.error_count:,}")
         print(f"   Success rate: {success_rate:.1f}%")
         print(f"   Time elapsed: {elapsed_time:.1f} seconds")
-        print(f"   Average rate: {self.processed_count / elapsed_time:.1f} discoveries/sec")
+        print(f"   Average rate: {self.processed_count / max(elapsed_time, 1e-9):.1f} discoveries/sec")
         print()
         
         if self.neo4j_engine:
@@ -198,13 +316,13 @@ class DiscoveryMigrator:
             print(f"   Unique sequences: {stats['unique_sequences']:,}")
             print(f"   Duplicate rate: {stats['duplicate_rate']:.1f}%")
             print()
-    
+            
     def verify_migration(self) -> bool:
         """Verify migration completed successfully"""
         
         if not self.neo4j_engine:
             return False
-        
+            
         try:
             stats = self.neo4j_engine.get_discovery_statistics()
             neo4j_count = stats['total_discoveries']
@@ -214,6 +332,7 @@ class DiscoveryMigrator:
             
             print(f"🔍 Migration Verification:")
             print(f"   Original JSON files: {original_files:,}")
+            print(f"   Checkpointed discoveries: {len(self.checkpoint):,}")
             print(f"   Neo4j discoveries: {neo4j_count:,}")
             print(f"   Migration efficiency: {(neo4j_count / original_files * 100):.1f}%")
             
@@ -226,6 +345,17 @@ class DiscoveryMigrator:
 def main():
     """Run discovery migration"""
     
+    parser = argparse.ArgumentParser(description="Migrate JSON discoveries to Neo4j")
+    parser.add_argument("--discovery-dir", default="m4_continuous_discoveries",
+                        help="Directory containing m4_discovery_*.json files")
+    parser.add_argument("--writers", type=int, default=4, help="Concurrent Neo4j writer sessions")
+    parser.add_argument("--decoders", type=int, default=None, help="JSON decoder processes")
+    parser.add_argument("--transaction-size", type=int, default=None,
+                        help="Discoveries per UNWIND transaction (default: scaled to memory)")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint manifest path")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and migrate everything")
+    args = parser.parse_args()
+    
     print("🔗 M4 DISCOVERY MIGRATION TO NEO4J")
     print("Transferring 1.4M+ JSON discoveries to graph database")
     print("=" * 70)
@@ -243,12 +373,18 @@ def main():
     if available_gb < 4:
         print("⚠️ Warning: Low available memory. Migration may be slow.")
         print()
-    
+        
     # Run migration
-    migrator = DiscoveryMigrator()
+    migrator = DiscoveryMigrator(
+        discovery_dir=args.discovery_dir,
+        writer_sessions=args.writers,
+        decoder_workers=args.decoders,
+        transaction_size=args.transaction_size,
+        checkpoint_path=args.checkpoint
+    )
     
     try:
-        success = migrator.migrate_all_discoveries()
+        success = migrator.migrate_all_discoveries(restart=args.restart)
         
         if success:
             print("✅ Migration completed successfully!")
@@ -263,6 +399,7 @@ def main():
             
     except KeyboardInterrupt:
         print("\n⚠️ Migration interrupted by user")
+        print(f"💾 {len(migrator.checkpoint):,} discoveries checkpointed; re-run to resume")
     except Exception as e:
         print(f"❌ Migration error: {e}")
         logger.exception("Migration failed")
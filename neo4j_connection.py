@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+NEO4J CONNECTION PROVIDER
+One shared, configurable driver and connection pool per database per process
+AKG, the discovery engine, the analyzers and the loaders all borrow the same
+pool, with read/write routing, managed transactions that retry transient
+failures, and pool usage metrics
+"""
+
+import os
+import time
+import threading
+import logging
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from neo4j import GraphDatabase, READ_ACCESS, WRITE_ACCESS
+    NEO4J_AVAILABLE = True
+except ImportError:
+    NEO4J_AVAILABLE = False
+    READ_ACCESS, WRITE_ACCESS = "READ", "WRITE"
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Neo4jConfig:
+    """Connection and pool settings; from_env() reads NEO4J_* environment variables"""
+    uri: str = "bolt://localhost:7687"
+    user: str = "neo4j"
+    password: str = "fotquantum"
+    database: Optional[str] = None
+    max_connection_pool_size: int = 50
+    connection_acquisition_timeout: float = 60.0
+    max_connection_lifetime: float = 3600.0
+    max_transaction_retry_time: float = 15.0
+
+    @classmethod
+    def from_env(cls, **overrides) -> "Neo4jConfig":
+        """Defaults, then NEO4J_URI / NEO4J_USER / ... variables, then non-None overrides"""
+
+        config = cls()
+        for field_name, value in asdict(config).items():
+            env_value = os.environ.get(f"NEO4J_{field_name.upper()}")
+            if env_value is not None:
+                setattr(config, field_name, type(value)(env_value) if value is not None else env_value)
+        for field_name, value in overrides.items():
+            if value is not None:
+                setattr(config, field_name, value)
+        return config
+
+    @property
+    def key(self) -> Tuple[str, str, Optional[str]]:
+        return (self.uri, self.user, self.database)
+
+
+class _MeteredSession:
+    """Session proxy recording transaction start (connection acquisition) latency and retries"""
+
+    def __init__(self, session, provider: "Neo4jConnectionProvider"):
+        self._session = session
+        self._provider = provider
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def begin_transaction(self, *args, **kwargs):
+        start = time.perf_counter()
+        tx = self._session.begin_transaction(*args, **kwargs)
+        self._provider._record_transaction(time.perf_counter() - start)
+        return tx
+
+    def execute_read(self, work: Callable, *args, **kwargs):
+        return self._session.execute_read(self._metered(work), *args, **kwargs)
+
+    def execute_write(self, work: Callable, *args, **kwargs):
+        return self._session.execute_write(self._metered(work), *args, **kwargs)
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._session.close()
+            self._provider._record_session_closed()
+
+    def _metered(self, work: Callable) -> Callable:
+        start = time.perf_counter()
+        attempts = [0]
+
+        def metered_work(tx, *args, **kwargs):
+            attempts[0] += 1
+            if attempts[0] == 1:
+                self._provider._record_transaction(time.perf_counter() - start)
+            else:
+                self._provider._record_retry()
+            return work(tx, *args, **kwargs)
+
+        return metered_work
+
+
+class Neo4jConnectionProvider:
+    """
+    Driver facade owning one connection pool.
+
+    Drop-in for a neo4j driver where callers only use session() and close():
+    session(default_access_mode=READ_ACCESS) routes reads to followers on
+    clustered (neo4j://) deployments. execute_read/execute_write and the
+    read/write query helpers run managed transactions, which the driver
+    retries on transient errors for up to max_transaction_retry_time seconds.
+
+    Shared providers come from get_neo4j_provider() and are reference
+    counted: close() releases one reference and the pool is closed when the
+    last user lets go.
+    """
+
+    def __init__(self, config: Optional[Neo4jConfig] = None, driver=None):
+        self.config = config or Neo4jConfig.from_env()
+
+        if driver is None:
+            if not NEO4J_AVAILABLE:
+                raise ImportError("Neo4j driver not available. Install with: pip install neo4j")
+            driver = GraphDatabase.driver(
+                self.config.uri,
+                auth=(self.config.user, self.config.password),
+                max_connection_pool_size=self.config.max_connection_pool_size,
+                connection_acquisition_timeout=self.config.connection_acquisition_timeout,
+                max_connection_lifetime=self.config.max_connection_lifetime,
+                max_transaction_retry_time=self.config.max_transaction_retry_time
+            )
+        self.driver = driver
+
+        self._references = 1
+        self._shared = False
+        self._metrics_lock = threading.Lock()
+        self.metrics = {
+            'sessions_opened': 0,
+            'active_sessions': 0,
+            'peak_active_sessions': 0,
+            'read_sessions': 0,
+            'write_sessions': 0,
+            'transactions': 0,
+            'retries': 0,
+            'total_acquisition_time': 0.0,
+            'max_acquisition_time': 0.0
+        }
+
+    def session(self, **kwargs) -> _MeteredSession:
+        """Open a pooled session; pass default_access_mode=READ_ACCESS for read-only work"""
+
+        if self.config.database:
+            kwargs.setdefault('database', self.config.database)
+        session = self.driver.session(**kwargs)
+
+        with self._metrics_lock:
+            self.metrics['sessions_opened'] += 1
+            self.metrics['active_sessions'] += 1
+            self.metrics['peak_active_sessions'] = max(self.metrics['peak_active_sessions'],
+                                                       self.metrics['active_sessions'])
+            if kwargs.get('default_access_mode') == READ_ACCESS:
+                self.metrics['read_sessions'] += 1
+            else:
+                self.metrics['write_sessions'] += 1
+
+        return _MeteredSession(session, self)
+
+    def execute_read(self, work: Callable, *args, **kwargs):
+        """Run work(tx, ...) in a retried read transaction on a read-routed session"""
+
+        with self.session(default_access_mode=READ_ACCESS) as session:
+            return session.execute_read(work, *args, **kwargs)
+
+    def execute_write(self, work: Callable, *args, **kwargs):
+        """Run work(tx, ...) in a retried write transaction"""
+
+        with self.session(default_access_mode=WRITE_ACCESS) as session:
+            return session.execute_write(work, *args, **kwargs)
+
+    def read(self, query: str, parameters: Optional[Dict[str, Any]] = None, **kwargs) -> List[Dict[str, Any]]:
+        """Run a read query in a managed transaction and return its records as dicts"""
+
+        return self.execute_read(_fetch_all, query, parameters, kwargs)
+
+    def write(self, query: str, parameters: Optional[Dict[str, Any]] = None, **kwargs) -> List[Dict[str, Any]]:
+        """Run a write query in a managed transaction and return its records as dicts"""
+
+        return self.execute_write(_fetch_all, query, parameters, kwargs)
+
+    def verify_connectivity(self):
+        return self.driver.verify_connectivity()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of session, transaction and acquisition-latency counters"""
+
+        with self._metrics_lock:
+            metrics = dict(self.metrics)
+
+        metrics['max_connection_pool_size'] = self.config.max_connection_pool_size
+        metrics['references'] = self._references
+        metrics['avg_acquisition_time'] = (
+            metrics['total_acquisition_time'] / metrics['transactions'] if metrics['transactions'] else 0.0
+        )
+        return metrics
+
+    def close(self):
+        """Release this reference; the pool closes when no user holds it"""
+
+        with _registry_lock:
+            self._references -= 1
+            if self._references > 0:
+                return
+            if self._shared and _providers.get(self.config.key) is self:
+                del _providers[self.config.key]
+
+        metrics = self.get_metrics()
+        logger.info(f"🔌 Closing Neo4j pool {self.config.uri}: {metrics['sessions_opened']:,} sessions, "
+                    f"{metrics['transactions']:,} transactions, {metrics['retries']:,} retries, "
+                    f"avg acquisition {metrics['avg_acquisition_time'] * 1000:.1f} ms")
+        self.driver.close()
+
+    def _record_transaction(self, acquisition_time: float):
+        with self._metrics_lock:
+            self.metrics['transactions'] += 1
+            self.metrics['total_acquisition_time'] += acquisition_time
+            self.metrics['max_acquisition_time'] = max(self.metrics['max_acquisition_time'], acquisition_time)
+
+    def _record_retry(self):
+        with self._metrics_lock:
+            self.metrics['retries'] += 1
+
+    def _record_session_closed(self):
+        with self._metrics_lock:
+            self.metrics['active_sessions'] -= 1
+
+
+def _fetch_all(tx, query: str, parameters: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [record.data() for record in tx.run(query, parameters, **kwargs)]
+
+
+_providers: Dict[Tuple[str, str, Optional[str]], Neo4jConnectionProvider] = {}
+_registry_lock = threading.RLock()
+
+
+def get_neo4j_provider(config: Optional[Neo4jConfig] = None) -> Neo4jConnectionProvider:
+    """
+    Shared provider for config's database (NEO4J_* environment by default).
+
+    Every call takes a reference that the caller gives back with close();
+    callers in one process reuse the same driver and pool.
+    """
+
+    config = config or Neo4jConfig.from_env()
+    with _registry_lock:
+        provider = _providers.get(config.key)
+        if provider is None:
+            provider = Neo4jConnectionProvider(config)
+            provider._shared = True
+            _providers[config.key] = provider
+            logger.info(f"🔌 Neo4j pool created for {config.uri} (max {config.max_connection_pool_size} connections)")
+        else:
+            provider._references += 1
+        return provider
@@ -5,24 +5,48 @@ Knowledge graph implementation for 1.4M+ M4 Mac Pro discoveries
 Real-time storage and querying without filesystem bottlenecks
 """
 
+import re
 import time
 import json
 import uuid
+import threading
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
-try:
-    from neo4j import GraphDatabase
-    NEO4J_AVAILABLE = True
-except ImportError:
-    NEO4J_AVAILABLE = False
+import numpy as np
+
+from sequence_similarity_index import DEFAULT_INDEX_PATH, SequenceLSHIndex
+from neo4j_connection import NEO4J_AVAILABLE, Neo4jConfig, READ_ACCESS, get_neo4j_provider
+
+if not NEO4J_AVAILABLE:
     print("⚠️ Neo4j driver not installed. Install with: pip install neo4j")
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Amino acid codes with AminoAcid reference nodes (VQbits are only created for these)
+STANDARD_AMINO_ACIDS = frozenset('ARNDCEQGHILKMFPSTWYV')
+
+# Running aggregates are flat properties of this node; per-group keys use '__' separators
+DISCOVERY_STATS_ID = 'global'
+
+# Bump whenever constraints, indexes or reference data in _initialize_schema change
+SCHEMA_VERSION = 1
+SCHEMA_VERSION_ID = 'protein_discovery'
+
+# Reference :TherapeuticTarget nodes; virtue projections attach to targets by target_type
+THERAPEUTIC_TARGETS = [
+    {'id': 'alzheimers', 'name': 'Alzheimer\'s Disease', 'target_type': 'neurodegeneration', 'associated_disease': 'alzheimers'},
+    {'id': 'cancer', 'name': 'Cancer Therapy', 'target_type': 'oncology', 'associated_disease': 'cancer'},
+    {'id': 'diabetes', 'name': 'Diabetes Treatment', 'target_type': 'metabolic', 'associated_disease': 'diabetes'},
+    {'id': 'cardiovascular', 'name': 'Cardiovascular Disease', 'target_type': 'cardiovascular', 'associated_disease': 'heart_disease'},
+    {'id': 'inflammation', 'name': 'Anti-inflammatory', 'target_type': 'immunology', 'associated_disease': 'inflammatory_disease'},
+    {'id': 'antimicrobial', 'name': 'Antimicrobial', 'target_type': 'infectious_disease', 'associated_disease': 'infection'},
+    {'id': 'autoimmune', 'name': 'Autoimmune Disease Therapy', 'target_type': 'immunomodulation', 'associated_disease': 'autoimmune_disorder'}
+]
+
 @dataclass
 class DiscoveryNode:
     """Discovery node for Neo4j graph"""
@@ -53,29 +77,82 @@ class VQbitNode:
 class Neo4jDiscoveryEngine:
     """Neo4j-powered discovery storage and analysis engine"""
     
-    def __init__(self, uri: str = "bolt://localhost:7687", user: str = "neo4j", password: str = "fotquantum"):
-        if not NEO4J_AVAILABLE:
-            raise ImportError("Neo4j driver not available. Install with: pip install neo4j")
-        
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+    def __init__(self, uri: Optional[str] = None, user: Optional[str] = None, password: Optional[str] = None,
+                 driver=None, similarity_index_path: Optional[str] = DEFAULT_INDEX_PATH,
+                 stats_cache_ttl: float = 10.0):
+        if driver is None:
+            if not NEO4J_AVAILABLE:
+                raise ImportError("Neo4j driver not available. Install with: pip install neo4j")
+            # Shared process-wide pool; NEO4J_* environment settings unless overridden here
+            driver = get_neo4j_provider(Neo4jConfig.from_env(uri=uri, user=user, password=password))
+            uri = driver.config.uri
+
+        self.driver = driver
         self.session_id = str(uuid.uuid4())
         
+        # Statistics are served from running aggregates through a TTL cache
+        self.stats_cache_ttl = stats_cache_ttl
+        self._stats_cache: Dict[str, Tuple[float, Any]] = {}
+        self._session_stats = {'discoveries': 0, 'start_time': None, 'end_time': None}
+        self._session_lock = threading.Lock()
+        
         # Initialize schema
         self._initialize_schema()
+        self._virtue_target_types = self._load_virtue_target_types()
+        
+        # k-mer MinHash LSH index over all stored sequences, loaded on first write
+        self.similarity_index_path = similarity_index_path
+        self._similarity_index = None
+        self._similarity_index_lock = threading.Lock()
         
         logger.info(f"🔗 Neo4j Discovery Engine initialized")
         logger.info(f"   Session ID: {self.session_id}")
         logger.info(f"   URI: {uri}")
     
+    @property
+    def similarity_index(self) -> SequenceLSHIndex:
+        """Sequence similarity index, loaded from disk or rebuilt from the graph on first use"""
+        if self._similarity_index is None:
+            with self._similarity_index_lock:
+                if self._similarity_index is None:
+                    index, loaded = SequenceLSHIndex.load_or_create(self.similarity_index_path)
+                    if loaded:
+                        self._reconcile_similarity_index(index)
+                    else:
+                        index = self._build_similarity_index_from_graph()
+                    self._similarity_index = index
+        return self._similarity_index
+    
     def close(self):
         """Close Neo4j connection"""
+        if getattr(self, '_similarity_index', None) is not None:
+            self._similarity_index.save_if_dirty()
         if hasattr(self, 'driver'):
             self.driver.close()
     
-    def _initialize_schema(self):
-        """Initialize comprehensive Neo4j schema for protein discovery knowledge graph"""
+    def _initialize_schema(self, force: bool = False):
+        """
+        Initialize comprehensive Neo4j schema for protein discovery knowledge graph.
+        
+        Constraints, indexes and reference data are stamped with SCHEMA_VERSION
+        on a :SchemaVersion node. When the graph is already at this version,
+        startup costs one lookup; the full bootstrap runs only on an older (or
+        missing) stamp, or when forced.
+        """
         
         with self.driver.session() as session:
+            records = list(session.run(
+                "MATCH (v:SchemaVersion {id: $schema_id}) RETURN v.version as version",
+                schema_id=SCHEMA_VERSION_ID
+            ))
+            current_version = records[0]['version'] if records else None
+            
+            if not force and current_version is not None and current_version >= SCHEMA_VERSION:
+                logger.debug(f"Schema at version {current_version}, skipping bootstrap")
+                return
+            
+            logger.info(f"🔧 Migrating knowledge graph schema: {current_version or 'none'} → {SCHEMA_VERSION}")
+            
             # Create node constraints
             constraints = [
                 "CREATE CONSTRAINT discovery_id IF NOT EXISTS FOR (d:Discovery) REQUIRE d.id IS UNIQUE",
@@ -93,7 +170,9 @@ class Neo4jDiscoveryEngine:
                 "CREATE CONSTRAINT researcher_id IF NOT EXISTS FOR (r:Researcher) REQUIRE r.id IS UNIQUE",
                 "CREATE CONSTRAINT publication_id IF NOT EXISTS FOR (p:Publication) REQUIRE p.doi IS UNIQUE",
                 "CREATE CONSTRAINT therapeutic_solution_id IF NOT EXISTS FOR (s:TherapeuticSolution) REQUIRE s.id IS UNIQUE",
-                "CREATE CONSTRAINT clinical_indication_id IF NOT EXISTS FOR (c:ClinicalIndication) REQUIRE c.id IS UNIQUE"
+                "CREATE CONSTRAINT clinical_indication_id IF NOT EXISTS FOR (c:ClinicalIndication) REQUIRE c.id IS UNIQUE",
+                "CREATE CONSTRAINT discovery_stats_id IF NOT EXISTS FOR (s:DiscoveryStats) REQUIRE s.id IS UNIQUE",
+                "CREATE CONSTRAINT schema_version_id IF NOT EXISTS FOR (v:SchemaVersion) REQUIRE v.id IS UNIQUE"
             ]
             
             for constraint in constraints:
@@ -110,6 +189,7 @@ class Neo4jDiscoveryEngine:
                 "CREATE INDEX discovery_quality IF NOT EXISTS FOR (d:Discovery) ON (d.validation_score)", 
                 "CREATE INDEX discovery_energy IF NOT EXISTS FOR (d:Discovery) ON (d.energy_kcal_mol)",
                 "CREATE INDEX discovery_session IF NOT EXISTS FOR (d:Discovery) ON (d.session_id)",
+                "CREATE INDEX discovery_high_entanglement IF NOT EXISTS FOR (d:Discovery) ON (d.high_entanglement)",
                 
                 # Sequence indexes
                 "CREATE INDEX sequence_length IF NOT EXISTS FOR (s:Sequence) ON (s.length)",
@@ -171,68 +251,102 @@ class Neo4jDiscoveryEngine:
             self._initialize_clinical_indications(session)
             self._initialize_learning_system(session)
             
-            logger.info("✅ Comprehensive protein discovery knowledge graph schema initialized")
+            # Stamp last, so an interrupted bootstrap is retried by the next engine
+            session.run("""
+                MERGE (v:SchemaVersion {id: $schema_id})
+                SET v.version = $version,
+                    v.migrated_from = $previous_version,
+                    v.migrated_at = datetime()
+            """, schema_id=SCHEMA_VERSION_ID, version=SCHEMA_VERSION, previous_version=current_version)
+            
+            logger.info(f"✅ Comprehensive protein discovery knowledge graph schema initialized (version {SCHEMA_VERSION})")
     
     def store_discovery(self, discovery_data: Dict[str, Any]) -> str:
         """Store a discovery with vQbit quantum states in the Neo4j graph"""
         
-        discovery_id = str(uuid.uuid4())
-        timestamp = datetime.now()
+        return self.store_discoveries([discovery_data])[0]
+    
+    def store_discoveries(self, discoveries: List[Dict[str, Any]], skip_existing: bool = False) -> List[str]:
+        """
+        Store many discoveries in the Neo4j graph in one explicit transaction.
         
-        # Extract data
-        sequence = discovery_data.get('sequence', '')
-        validation_score = discovery_data.get('validation_score', 0.0)
-        assessment = discovery_data.get('assessment', '')
+        All discoveries, residues and derived connections are sent as parameter
+        lists to a fixed set of UNWIND statements, so the number of round trips
+        does not grow with the number of discoveries or residues.
         
-        metal_analysis = discovery_data.get('metal_analysis', {})
-        energy = metal_analysis.get('energy_kcal_mol', 0.0)
-        vqbit_score = metal_analysis.get('vqbit_score', 0.0)
-        virtue_scores = metal_analysis.get('virtue_scores', {})
+        A discovery carrying a 'discovery_id' key is stored under that id
+        instead of a fresh UUID. With skip_existing=True, discoveries whose id
+        is already in the graph are left out of the write (one extra lookup
+        statement), which makes re-running an interrupted bulk load idempotent.
         
-        # Extract vQbit quantum states if available
-        vqbit_states = discovery_data.get('vqbit_states', [])
-        quantum_analysis = discovery_data.get('quantum_analysis', {})
+        Returns:
+            Discovery ids in the same order as the input
+        """
         
-        hardware_info = discovery_data.get('hardware_info', {})
+        if not discoveries:
+            return []
         
         with self.driver.session() as session:
-            # Create discovery node and relationships
-            result = session.run("""
-                // Create or merge sequence node
-                MERGE (s:Sequence {value: $sequence})
-                ON CREATE SET s.length = $sequence_length,
-                             s.created_at = $timestamp
-                
-                // Create discovery node
-                CREATE (d:Discovery {
-                    id: $discovery_id,
-                    validation_score: $validation_score,
-                    assessment: $assessment,
-                    energy_kcal_mol: $energy,
-                    vqbit_score: $vqbit_score,
-                    timestamp: $timestamp,
-                    session_id: $session_id,
-                    hardware_processed_on: $hardware_processed_on,
-                    metal_accelerated: $metal_accelerated,
-                    quantum_coherence: $quantum_coherence,
-                    entanglement_entropy: $entanglement_entropy,
-                    superposition_fidelity: $superposition_fidelity
-                })
+            with session.begin_transaction() as tx:
+                existing = set()
+                supplied_ids = [d['discovery_id'] for d in discoveries if d.get('discovery_id')]
+                if skip_existing and supplied_ids:
+                    existing = {
+                        record['id'] for record in tx.run(
+                            "UNWIND $ids AS id MATCH (d:Discovery {id: id}) RETURN id", ids=supplied_ids
+                        )
+                    }
                 
-                // Create sequence relationship
-                CREATE (d)-[:HAS_SEQUENCE]->(s)
-                
-                // Create virtue score nodes and relationships
-                WITH d
-                UNWIND $virtue_items AS virtue_item
-                CREATE (v:VirtueScore {
-                    virtue: virtue_item.virtue,
-                    score: virtue_item.score
-                })
-                CREATE (d)-[:HAS_VIRTUE_SCORE]->(v)
-                
-                RETURN d.id as discovery_id
-            """, {
+                batch = self._build_write_batch([d for d in discoveries if d.get('discovery_id') not in existing])
+                if batch['discoveries']:
+                    self._write_discovery_batch(tx, batch)
+                tx.commit()
+        
+        self._record_session_writes(batch['discoveries'])
+        
+        # Index only committed sequences
+        probes = batch['similarity_probes']
+        if probes:
+            self.similarity_index.add([probe['discovery_id'] for probe in probes],
+                                      np.stack([probe['signature'] for probe in probes]))
+        
+        written_ids = iter(row['discovery_id'] for row in batch['discoveries'])
+        return [
+            d['discovery_id'] if d.get('discovery_id') in existing else next(written_ids)
+            for d in discoveries
+        ]
+    
+    def _build_write_batch(self, discoveries: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Flatten discoveries into the per-statement parameter lists used by _write_discovery_batch"""
+        
+        batch = {
+            'discoveries': [], 'vqbits': [], 'entanglements': [], 'families': [], 'targets': [],
+            'motifs': [], 'solutions': [], 'indications': [], 'similarity_probes': [],
+            'sequences': []
+        }
+        seen_sequences = set()
+        
+        for discovery_data in discoveries:
+            discovery_id = discovery_data.get('discovery_id') or str(uuid.uuid4())
+            timestamp = datetime.now()
+            
+            # Extract data
+            sequence = discovery_data.get('sequence', '')
+            validation_score = discovery_data.get('validation_score', 0.0)
+            assessment = discovery_data.get('assessment', '')
+            
+            metal_analysis = discovery_data.get('metal_analysis', {})
+            energy = metal_analysis.get('energy_kcal_mol', 0.0)
+            vqbit_score = metal_analysis.get('vqbit_score', 0.0)
+            virtue_scores = metal_analysis.get('virtue_scores', {})
+            
+            # Extract vQbit quantum states if available
+            vqbit_states = discovery_data.get('vqbit_states', [])
+            quantum_analysis = discovery_data.get('quantum_analysis', {})
+            
+            hardware_info = discovery_data.get('hardware_info', {})
+            
+            batch['discoveries'].append({
                 'discovery_id': discovery_id,
                 'sequence': sequence,
                 'sequence_length': len(sequence),
@@ -247,27 +361,75 @@ class Neo4jDiscoveryEngine:
                 'quantum_coherence': quantum_analysis.get('coherence', 0.0),
                 'entanglement_entropy': quantum_analysis.get('entanglement_entropy', 0.0),
                 'superposition_fidelity': quantum_analysis.get('superposition_fidelity', 0.0),
+                'high_entanglement': None,
                 'virtue_items': [{'virtue': k, 'score': v} for k, v in virtue_scores.items()]
             })
             
-            # Store vQbit quantum states
-            if vqbit_states:
-                self._store_vqbit_states(session, discovery_id, vqbit_states)
-            
-            # Store additional graph connections
-            if vqbit_states:
-                self._store_vqbit_states(session, discovery_id, vqbit_states)
-                self._create_protein_family_connections(session, discovery_id, sequence)
-                self._create_therapeutic_target_connections(session, discovery_id, discovery_data)
-                self._create_structural_motif_connections(session, discovery_id, vqbit_states)
-                self._create_sequence_similarity_connections(session, discovery_id, sequence)
-                self._map_to_therapeutic_solutions(session, discovery_id, discovery_data)
-                self._create_clinical_indication_mapping(session, discovery_id, discovery_data)
-            
-            return discovery_id
+            # First row of each sequence in the batch is the one whose MERGE can create it
+            if sequence not in seen_sequences:
+                seen_sequences.add(sequence)
+                batch['sequences'].append({'value': sequence, 'timestamp': timestamp})
+            
+            if not vqbit_states:
+                continue
+            
+            # vQbit quantum states and the additional graph connections
+            vqbit_rows, entanglement_rows = self._build_vqbit_rows(discovery_id, vqbit_states)
+            batch['vqbits'].extend(vqbit_rows)
+            batch['entanglements'].extend(entanglement_rows)
+            
+            # Indexed property behind the high-entanglement ranking in get_quantum_analysis
+            high_entanglement = [
+                row['entanglement_degree'] for row in vqbit_rows
+                if row['amino_acid'] in STANDARD_AMINO_ACIDS and row['entanglement_degree'] > 0.5
+            ]
+            if high_entanglement:
+                batch['discoveries'][-1]['high_entanglement'] = float(np.mean(high_entanglement))
+            
+            batch['families'].extend(
+                {'discovery_id': discovery_id, 'family_id': family_id, 'confidence': confidence}
+                for family_id, confidence in self._predict_protein_families(sequence)
+            )
+            batch['targets'].extend(
+                {'discovery_id': discovery_id, 'target_id': target_id, 'potential_score': potential_score}
+                for target_id, potential_score in self._predict_therapeutic_targets(discovery_data)
+            )
+            batch['motifs'].extend(
+                {'discovery_id': discovery_id, 'motif_id': f"{discovery_id}_{motif_type}",
+                 'motif_type': motif_type, 'confidence': confidence}
+                for motif_type, confidence in self._predict_structural_motifs(vqbit_states)
+            )
+            batch['solutions'].extend(
+                {'discovery_id': discovery_id, 'solution_id': solution_id, 'confidence': confidence,
+                 'evidence': evidence, 'vqbit_score': vqbit_score, 'energy': energy,
+                 'validation_score': validation_score}
+                for solution_id, confidence, evidence in self._predict_therapeutic_solutions(discovery_data)
+            )
+            batch['indications'].extend(
+                {'discovery_id': discovery_id, 'indication_id': indication_id, 'potential': potential,
+                 'mechanism': mechanism, 'validation_score': validation_score}
+                for indication_id, potential, mechanism in self._predict_clinical_indications(discovery_data)
+            )
+            
+            if sequence:
+                batch['similarity_probes'].append({'discovery_id': discovery_id, 'sequence': sequence})
+        
+        # MinHash signatures for the similarity index lookup and insertion
+        if batch['similarity_probes']:
+            signatures = self.similarity_index.compute_signatures(
+                [probe['sequence'] for probe in batch['similarity_probes']]
+            )
+            for probe, signature in zip(batch['similarity_probes'], signatures):
+                probe['signature'] = signature
+        
+        return batch
     
-    def _store_vqbit_states(self, session, discovery_id: str, vqbit_states: List[Dict[str, Any]]):
-        """Store vQbit quantum states as quantum relationships in the graph"""
+    def _build_vqbit_rows(self, discovery_id: str,
+                          vqbit_states: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Build VQbit/QuantumState rows and sequential entanglement rows for one discovery"""
+        
+        vqbit_rows = []
+        entanglement_rows = []
         
         prev_quantum_state_id = None
         prev_vqbit_id = None
@@ -275,100 +437,22 @@ class Neo4jDiscoveryEngine:
             quantum_state_id = f"qstate_{str(uuid.uuid4())[:8]}_{i}"
             vqbit_id = f"vqbit_{str(uuid.uuid4())[:8]}_{i}"
             
-            # Extract quantum state data
-            residue_index = vqbit_state.get('residue_index', i)
-            amino_acid = vqbit_state.get('amino_acid', '')
-            phi_angle = vqbit_state.get('phi', 0.0)
-            psi_angle = vqbit_state.get('psi', 0.0)
-            
-            # Quantum properties
-            amplitude_real = vqbit_state.get('amplitude_real', 0.0)
-            amplitude_imag = vqbit_state.get('amplitude_imag', 0.0)
-            entanglement_degree = vqbit_state.get('entanglement', 0.0)
             coherence = vqbit_state.get('coherence', 0.0)
-            collapsed = vqbit_state.get('collapsed', False)
-            
-            # Virtue projections
             virtue_projections = vqbit_state.get('virtue_projections', {})
             
-            session.run("""
-                // Find discovery node
-                MATCH (d:Discovery {id: $discovery_id})
-                
-                // Create amino acid node (referencing standard amino acids)
-                MATCH (aa:AminoAcid {code: $amino_acid})
-                
-                // Create VQbit node (primary quantum entity)
-                CREATE (v:VQbit {
-                    id: $vqbit_id,
-                    discovery_id: $discovery_id,
-                    residue_index: $residue_index,
-                    amino_acid: $amino_acid,
-                    phi_angle: $phi_angle,
-                    psi_angle: $psi_angle,
-                    entanglement_degree: $entanglement_degree,
-                    superposition_coherence: $coherence,
-                    collapsed_state: $collapsed,
-                    amplitude_real: $amplitude_real,
-                    amplitude_imag: $amplitude_imag
-                })
-                
-                // Create quantum state node (linked to VQbit for detailed quantum info)
-                CREATE (q:QuantumState {
-                    id: $quantum_state_id,
-                    discovery_id: $discovery_id,
-                    residue_index: $residue_index,
-                    phi_angle: $phi_angle,
-                    psi_angle: $psi_angle,
-                    collapsed_state: $collapsed
-                })
-                
-                // Create VQbit relationships
-                CREATE (d)-[:HAS_VQBIT {position: $residue_index}]->(v)
-                CREATE (v)-[:HAS_QUANTUM_STATE]->(q)
-                
-                // Create position relationship for backward compatibility
-                CREATE (d)-[:HAS_QUANTUM_STATE {position: $residue_index}]->(q)
-                
-                // Create amino acid relationship
-                CREATE (v)-[:IS_AMINO_ACID]->(aa)
-                CREATE (q)-[:IS_AMINO_ACID]->(aa)
-                
-                // Create quantum superposition relationship (if not collapsed)
-                WITH d, q, aa
-                WHERE $collapsed = false
-                CREATE (q)-[:IN_SUPERPOSITION {
-                    amplitude_real: $amplitude_real,
-                    amplitude_imag: $amplitude_imag,
-                    quantum_phase: $quantum_phase,
-                    coherence_level: $coherence,
-                    measurement_basis: 'ramachandran'
-                }]->(aa)
-                
-                // Create virtue projection relationships (quantum virtue superposition)
-                WITH q
-                UNWIND $virtue_projections AS vp
-                MATCH (virtue_target:TherapeuticTarget) WHERE virtue_target.target_type = vp.virtue
-                CREATE (q)-[:PROJECTS_VIRTUE {
-                    virtue_type: vp.virtue,
-                    projection_strength: vp.strength,
-                    quantum_phase: vp.phase,
-                    virtue_amplitude: vp.strength * cos(vp.phase),
-                    virtue_coherence: vp.strength * sin(vp.phase)
-                }]->(virtue_target)
-            """, {
+            vqbit_rows.append({
                 'discovery_id': discovery_id,
                 'quantum_state_id': quantum_state_id,
                 'vqbit_id': vqbit_id,
-                'residue_index': residue_index,
-                'amino_acid': amino_acid,
-                'entanglement_degree': entanglement_degree,
+                'residue_index': vqbit_state.get('residue_index', i),
+                'amino_acid': vqbit_state.get('amino_acid', ''),
+                'entanglement_degree': vqbit_state.get('entanglement', 0.0),
                 'coherence': coherence,
-                'phi_angle': phi_angle,
-                'psi_angle': psi_angle,
-                'amplitude_real': amplitude_real,
-                'amplitude_imag': amplitude_imag,
-                'collapsed': collapsed,
+                'phi_angle': vqbit_state.get('phi', 0.0),
+                'psi_angle': vqbit_state.get('psi', 0.0),
+                'amplitude_real': vqbit_state.get('amplitude_real', 0.0),
+                'amplitude_imag': vqbit_state.get('amplitude_imag', 0.0),
+                'collapsed': vqbit_state.get('collapsed', False),
                 'quantum_phase': vqbit_state.get('phase', 0.0),
                 'virtue_projections': [
                     {'virtue': k, 'strength': v.get('strength', 0.0), 'phase': v.get('phase', 0.0)}
@@ -376,154 +460,325 @@ class Neo4jDiscoveryEngine:
                 ]
             })
             
-            # Store quantum entanglement relationships between adjacent residues  
+            # Quantum entanglement between adjacent residues, plus coherence
+            # maintenance when highly entangled
             if i > 0 and prev_quantum_state_id is not None and prev_vqbit_id is not None:
                 entanglement_strength = vqbit_state.get('entanglement_with_prev', 0.0)
-                
-                session.run("""
-                    MATCH (v1:VQbit {id: $prev_vqbit_id})
-                    MATCH (v2:VQbit {id: $curr_vqbit_id})
-                    MATCH (q1:QuantumState {id: $prev_quantum_state_id})
-                    MATCH (q2:QuantumState {id: $curr_quantum_state_id})
-                    
-                    // Create VQbit-to-VQbit entanglement (primary)
-                    CREATE (v1)-[:QUANTUM_ENTANGLED {
-                        entanglement_strength: $strength,
-                        entanglement_type: 'sequential_backbone',
-                        bell_state: CASE 
-                            WHEN $strength > 0.8 THEN 'phi_plus'
-                            WHEN $strength > 0.6 THEN 'phi_minus'
-                            WHEN $strength > 0.4 THEN 'psi_plus'
-                            ELSE 'psi_minus'
-                        END,
-                        quantum_correlation: $strength * $strength
-                    }]->(v2)
-                    
-                    // Create QuantumState entanglement (for backward compatibility)
-                    CREATE (q1)-[:QUANTUM_ENTANGLED {
-                        entanglement_strength: $strength,
-                        entanglement_type: 'sequential_backbone',
-                        bell_state: CASE 
-                            WHEN $strength > 0.8 THEN 'phi_plus'
-                            WHEN $strength > 0.6 THEN 'phi_minus'
-                            WHEN $strength > 0.4 THEN 'psi_plus'
-                            ELSE 'psi_minus'
-                        END,
-                        quantum_correlation: $strength * $strength
-                    }]->(q2)
-                """, {
+                maintains_coherence = entanglement_strength > 0.7
+                entanglement_rows.append({
                     'prev_vqbit_id': prev_vqbit_id,
                     'curr_vqbit_id': vqbit_id,
                     'prev_quantum_state_id': prev_quantum_state_id,
                     'curr_quantum_state_id': quantum_state_id,
-                    'strength': entanglement_strength
+                    'strength': entanglement_strength,
+                    'maintains_coherence': maintains_coherence,
+                    'coherence': coherence,
+                    # Higher entanglement = longer coherence
+                    'decoherence_time': 1.0 / (1.0 - entanglement_strength) if maintains_coherence else None,
+                    'fidelity': entanglement_strength * coherence
                 })
-                
-                # Create coherence maintenance relationship if highly entangled
-                if entanglement_strength > 0.7:
-                    session.run("""
-                        MATCH (v1:VQbit {id: $prev_vqbit_id})
-                        MATCH (v2:VQbit {id: $curr_vqbit_id})
-                        MATCH (q1:QuantumState {id: $prev_quantum_state_id})
-                        MATCH (q2:QuantumState {id: $curr_quantum_state_id})
-                        
-                        // Create VQbit coherence maintenance (primary)
-                        CREATE (v1)-[:MAINTAINS_COHERENCE {
-                            coherence_level: $coherence,
-                            decoherence_time: $decoherence_time,
-                            quantum_fidelity: $fidelity
-                        }]->(v2)
-                        
-                        // Create QuantumState coherence maintenance (backward compatibility)
-                        CREATE (q1)-[:MAINTAINS_COHERENCE {
-                            coherence_level: $coherence,
-                            decoherence_time: $decoherence_time,
-                            quantum_fidelity: $fidelity
-                        }]->(q2)
-                    """, {
-                        'prev_vqbit_id': prev_vqbit_id,
-                        'curr_vqbit_id': vqbit_id,
-                        'prev_quantum_state_id': prev_quantum_state_id,
-                        'curr_quantum_state_id': quantum_state_id,
-                        'coherence': coherence,
-                        'decoherence_time': 1.0 / (1.0 - entanglement_strength),  # Higher entanglement = longer coherence
-                        'fidelity': entanglement_strength * coherence
-                    })
-            
-            # Update prev IDs for next iteration
+            
             prev_quantum_state_id = quantum_state_id
             prev_vqbit_id = vqbit_id
-    
-    def get_discovery_statistics(self) -> Dict[str, Any]:
-        """Get real-time discovery statistics from Neo4j"""
         
-        with self.driver.session() as session:
-            # Total discoveries
-            total_result = session.run("MATCH (d:Discovery) RETURN count(d) as total")
-            total_discoveries = total_result.single()['total']
-            
-            # Recent discoveries (last hour)
-            recent_result = session.run("""
-                MATCH (d:Discovery)
-                WHERE d.timestamp > datetime() - duration('PT1H')
-                RETURN count(d) as recent_count
-            """)
-            recent_discoveries = recent_result.single()['recent_count']
+        return vqbit_rows, entanglement_rows
+    
+    def _write_discovery_batch(self, tx, batch: Dict[str, List[Dict[str, Any]]]):
+        """Write a prepared batch with one UNWIND statement per graph element type"""
+        
+        tx.run("""
+            UNWIND $rows AS row
+            
+            // Create or merge sequence node
+            MERGE (s:Sequence {value: row.sequence})
+            ON CREATE SET s.length = row.sequence_length,
+                         s.created_at = row.timestamp
+            
+            // Create discovery node
+            CREATE (d:Discovery {
+                id: row.discovery_id,
+                validation_score: row.validation_score,
+                assessment: row.assessment,
+                energy_kcal_mol: row.energy,
+                vqbit_score: row.vqbit_score,
+                timestamp: row.timestamp,
+                session_id: row.session_id,
+                hardware_processed_on: row.hardware_processed_on,
+                metal_accelerated: row.metal_accelerated,
+                quantum_coherence: row.quantum_coherence,
+                entanglement_entropy: row.entanglement_entropy,
+                superposition_fidelity: row.superposition_fidelity,
+                high_entanglement: row.high_entanglement
+            })
             
-            # Quality distribution
-            quality_result = session.run("""
-                MATCH (d:Discovery)
-                RETURN 
-                    count(CASE WHEN d.validation_score >= 0.9 THEN 1 END) as excellent,
-                    count(CASE WHEN d.validation_score >= 0.8 AND d.validation_score < 0.9 THEN 1 END) as good,
-                    count(CASE WHEN d.validation_score >= 0.7 AND d.validation_score < 0.8 THEN 1 END) as fair,
-                    count(CASE WHEN d.validation_score < 0.7 THEN 1 END) as poor,
-                    avg(d.validation_score) as avg_quality,
-                    avg(d.energy_kcal_mol) as avg_energy,
-                    avg(d.vqbit_score) as avg_vqbit
-            """)
-            quality_stats = quality_result.single()
+            // Create sequence relationship
+            CREATE (d)-[:HAS_SEQUENCE]->(s)
             
-            # Session statistics
-            session_result = session.run("""
-                MATCH (d:Discovery {session_id: $session_id})
-                RETURN count(d) as session_discoveries,
-                       min(d.timestamp) as session_start,
-                       max(d.timestamp) as session_end
-            """, {'session_id': self.session_id})
-            session_stats = session_result.single()
+            // Create virtue score nodes and relationships
+            WITH d, row
+            UNWIND row.virtue_items AS virtue_item
+            CREATE (v:VirtueScore {
+                virtue: virtue_item.virtue,
+                score: virtue_item.score
+            })
+            CREATE (d)-[:HAS_VIRTUE_SCORE]->(v)
+        """, {'rows': batch['discoveries']})
+        
+        if batch['vqbits']:
+            self._store_vqbit_states(tx, batch['vqbits'], batch['entanglements'])
+        
+        if batch['families']:
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (d:Discovery {id: row.discovery_id})
+                MATCH (p:ProteinFamily {id: row.family_id})
+                MERGE (d)-[r:CLASSIFIED_AS]->(p)
+                SET r.confidence_score = row.confidence,
+                    r.prediction_method = 'sequence_heuristics',
+                    r.created_at = datetime()
+            """, {'rows': batch['families']})
+        
+        if batch['targets']:
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (d:Discovery {id: row.discovery_id})
+                MATCH (t:TherapeuticTarget {id: row.target_id})
+                MERGE (d)-[r:TARGETS]->(t)
+                SET r.potential_score = row.potential_score,
+                    r.prediction_method = 'sequence_analysis',
+                    r.created_at = datetime()
+            """, {'rows': batch['targets']})
+        
+        if batch['motifs']:
+            tx.run("""
+                UNWIND $rows AS row
+                MERGE (s:StructuralMotif {id: row.motif_id})
+                SET s.motif_type = row.motif_type,
+                    s.confidence = row.confidence,
+                    s.created_at = datetime()
+                    
+                WITH s, row
+                MATCH (d:Discovery {id: row.discovery_id})
+                MERGE (d)-[r:CONTAINS_MOTIF]->(s)
+                SET r.created_at = datetime()
+            """, {'rows': batch['motifs']})
+        
+        if batch['similarity_probes']:
+            self._create_sequence_similarity_connections(tx, batch['similarity_probes'])
+        
+        if batch['solutions']:
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (d:Discovery {id: row.discovery_id})
+                MATCH (s:TherapeuticSolution {id: row.solution_id})
+                CREATE (d)-[:MAPS_TO_SOLUTION {
+                    confidence_score: row.confidence,
+                    evidence_type: row.evidence,
+                    quantum_fidelity: row.vqbit_score,
+                    binding_energy: row.energy,
+                    validation_score: row.validation_score,
+                    prediction_method: 'quantum_sequence_analysis',
+                    created_at: datetime()
+                }]->(s)
+            """, {'rows': batch['solutions']})
+        
+        if batch['indications']:
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (d:Discovery {id: row.discovery_id})
+                MATCH (c:ClinicalIndication {id: row.indication_id})
+                CREATE (d)-[:INDICATES_FOR {
+                    therapeutic_potential: row.potential,
+                    mechanism_of_action: row.mechanism,
+                    validation_score: row.validation_score,
+                    development_feasibility: row.potential * 0.8,
+                    created_at: datetime()
+                }]->(c)
+            """, {'rows': batch['indications']})
+        
+        # Running aggregates last, so the shared stats node is locked only briefly
+        self._update_discovery_stats(tx, batch['sequences'], self._aggregate_batch_statistics(batch))
+    
+    def _record_session_writes(self, discovery_rows: List[Dict[str, Any]]):
+        """Track this engine session's committed discoveries and drop cached statistics"""
+        
+        if not discovery_rows:
+            return
+        
+        timestamps = [row['timestamp'] for row in discovery_rows]
+        with self._session_lock:
+            self._session_stats['discoveries'] += len(discovery_rows)
+            start_time = self._session_stats['start_time']
+            self._session_stats['start_time'] = min(timestamps) if start_time is None else min(start_time, *timestamps)
+            self._session_stats['end_time'] = max(timestamps)
+        self.invalidate_statistics_cache()
+    
+    def _store_vqbit_states(self, tx, vqbit_rows: List[Dict[str, Any]], entanglement_rows: List[Dict[str, Any]]):
+        """Store vQbit quantum states as quantum relationships in the graph (two UNWIND statements)"""
+        
+        tx.run("""
+            UNWIND $rows AS row
+            
+            // Find discovery node
+            MATCH (d:Discovery {id: row.discovery_id})
+            
+            // Create amino acid node (referencing standard amino acids)
+            MATCH (aa:AminoAcid {code: row.amino_acid})
+            
+            // Create VQbit node (primary quantum entity)
+            CREATE (v:VQbit {
+                id: row.vqbit_id,
+                discovery_id: row.discovery_id,
+                residue_index: row.residue_index,
+                amino_acid: row.amino_acid,
+                phi_angle: row.phi_angle,
+                psi_angle: row.psi_angle,
+                entanglement_degree: row.entanglement_degree,
+                superposition_coherence: row.coherence,
+                collapsed_state: row.collapsed,
+                amplitude_real: row.amplitude_real,
+                amplitude_imag: row.amplitude_imag
+            })
             
-            # Unique sequences
-            unique_result = session.run("MATCH (s:Sequence) RETURN count(s) as unique_sequences")
-            unique_sequences = unique_result.single()['unique_sequences']
+            // Create quantum state node (linked to VQbit for detailed quantum info)
+            CREATE (q:QuantumState {
+                id: row.quantum_state_id,
+                discovery_id: row.discovery_id,
+                residue_index: row.residue_index,
+                phi_angle: row.phi_angle,
+                psi_angle: row.psi_angle,
+                collapsed_state: row.collapsed
+            })
             
-            return {
-                'total_discoveries': total_discoveries,
-                'recent_discoveries_1h': recent_discoveries,
-                'unique_sequences': unique_sequences,
-                'duplicate_rate': ((total_discoveries - unique_sequences) / total_discoveries * 100) if total_discoveries > 0 else 0,
-                'quality_distribution': {
-                    'excellent': quality_stats['excellent'],
-                    'good': quality_stats['good'],
-                    'fair': quality_stats['fair'],
-                    'poor': quality_stats['poor']
-                },
-                'averages': {
-                    'quality': float(quality_stats['avg_quality'] or 0),
-                    'energy': float(quality_stats['avg_energy'] or 0),
-                    'vqbit': float(quality_stats['avg_vqbit'] or 0)
-                },
-                'session': {
-                    'discoveries': session_stats['session_discoveries'],
-                    'start_time': session_stats['session_start'],
-                    'end_time': session_stats['session_end']
-                }
+            // Create VQbit relationships
+            CREATE (d)-[:HAS_VQBIT {position: row.residue_index}]->(v)
+            CREATE (v)-[:HAS_QUANTUM_STATE]->(q)
+            
+            // Create position relationship for backward compatibility
+            CREATE (d)-[:HAS_QUANTUM_STATE {position: row.residue_index}]->(q)
+            
+            // Create amino acid relationship
+            CREATE (v)-[:IS_AMINO_ACID]->(aa)
+            CREATE (q)-[:IS_AMINO_ACID]->(aa)
+            
+            // Create quantum superposition relationship (if not collapsed)
+            WITH q, aa, row
+            WHERE row.collapsed = false
+            CREATE (q)-[:IN_SUPERPOSITION {
+                amplitude_real: row.amplitude_real,
+                amplitude_imag: row.amplitude_imag,
+                quantum_phase: row.quantum_phase,
+                coherence_level: row.coherence,
+                measurement_basis: 'ramachandran'
+            }]->(aa)
+            
+            // Create virtue projection relationships (quantum virtue superposition)
+            WITH q, row
+            UNWIND row.virtue_projections AS vp
+            MATCH (virtue_target:TherapeuticTarget) WHERE virtue_target.target_type = vp.virtue
+            CREATE (q)-[:PROJECTS_VIRTUE {
+                virtue_type: vp.virtue,
+                projection_strength: vp.strength,
+                quantum_phase: vp.phase,
+                virtue_amplitude: vp.strength * cos(vp.phase),
+                virtue_coherence: vp.strength * sin(vp.phase)
+            }]->(virtue_target)
+        """, {'rows': vqbit_rows})
+        
+        if not entanglement_rows:
+            return
+        
+        # Store quantum entanglement relationships between adjacent residues
+        tx.run("""
+            UNWIND $rows AS row
+            MATCH (v1:VQbit {id: row.prev_vqbit_id})
+            MATCH (v2:VQbit {id: row.curr_vqbit_id})
+            MATCH (q1:QuantumState {id: row.prev_quantum_state_id})
+            MATCH (q2:QuantumState {id: row.curr_quantum_state_id})
+            
+            WITH v1, v2, q1, q2, row, CASE 
+                WHEN row.strength > 0.8 THEN 'phi_plus'
+                WHEN row.strength > 0.6 THEN 'phi_minus'
+                WHEN row.strength > 0.4 THEN 'psi_plus'
+                ELSE 'psi_minus'
+            END AS bell_state
+            
+            // Create VQbit-to-VQbit entanglement (primary)
+            CREATE (v1)-[:QUANTUM_ENTANGLED {
+                entanglement_strength: row.strength,
+                entanglement_type: 'sequential_backbone',
+                bell_state: bell_state,
+                quantum_correlation: row.strength * row.strength
+            }]->(v2)
+            
+            // Create QuantumState entanglement (for backward compatibility)
+            CREATE (q1)-[:QUANTUM_ENTANGLED {
+                entanglement_strength: row.strength,
+                entanglement_type: 'sequential_backbone',
+                bell_state: bell_state,
+                quantum_correlation: row.strength * row.strength
+            }]->(q2)
+            
+            // Create coherence maintenance relationships if highly entangled
+            FOREACH (_ IN CASE WHEN row.maintains_coherence THEN [1] ELSE [] END |
+                CREATE (v1)-[:MAINTAINS_COHERENCE {
+                    coherence_level: row.coherence,
+                    decoherence_time: row.decoherence_time,
+                    quantum_fidelity: row.fidelity
+                }]->(v2)
+                CREATE (q1)-[:MAINTAINS_COHERENCE {
+                    coherence_level: row.coherence,
+                    decoherence_time: row.decoherence_time,
+                    quantum_fidelity: row.fidelity
+                }]->(q2)
+            )
+        """, {'rows': entanglement_rows})
+    
+    def get_discovery_statistics(self) -> Dict[str, Any]:
+        """
+        Get real-time discovery statistics from Neo4j.
+        
+        Counts and averages come from the running aggregates on the
+        :DiscoveryStats node (one lookup, cached for stats_cache_ttl seconds)
+        instead of label scans; session figures are tracked locally.
+        """
+        
+        stats = self._get_aggregates()
+        recent_discoveries = self._cached('recent_discoveries_1h', self._count_recent_discoveries)
+        
+        total_discoveries = int(stats.get('discoveries', 0))
+        unique_sequences = int(stats.get('sequences', 0))
+        
+        with self._session_lock:
+            session_stats = dict(self._session_stats)
+        
+        return {
+            'total_discoveries': total_discoveries,
+            'recent_discoveries_1h': recent_discoveries,
+            'unique_sequences': unique_sequences,
+            'duplicate_rate': ((total_discoveries - unique_sequences) / total_discoveries * 100) if total_discoveries > 0 else 0,
+            'quality_distribution': {
+                'excellent': int(stats.get('quality_excellent', 0)),
+                'good': int(stats.get('quality_good', 0)),
+                'fair': int(stats.get('quality_fair', 0)),
+                'poor': int(stats.get('quality_poor', 0))
+            },
+            'averages': {
+                'quality': self._mean(stats, 'validation'),
+                'energy': self._mean(stats, 'energy'),
+                'vqbit': self._mean(stats, 'vqbit_score')
+            },
+            'session': {
+                'discoveries': session_stats['discoveries'],
+                'start_time': session_stats['start_time'],
+                'end_time': session_stats['end_time']
             }
+        }
     
     def get_high_quality_discoveries(self, limit: int = 10, min_quality: float = 0.9) -> List[Dict[str, Any]]:
         """Get recent high-quality discoveries"""
         
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run("""
                 MATCH (d:Discovery)-[:HAS_SEQUENCE]->(s:Sequence)
                 WHERE d.validation_score >= $min_quality
@@ -555,7 +810,7 @@ class Neo4jDiscoveryEngine:
     def get_learning_patterns(self) -> Dict[str, Any]:
         """Analyze learning patterns from the graph"""
         
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             # Virtue score patterns
             virtue_result = session.run("""
                 MATCH (d:Discovery)-[:HAS_VIRTUE_SCORE]->(v:VirtueScore)
@@ -626,12 +881,27 @@ class Neo4jDiscoveryEngine:
             
             deleted_count = result.single()['deleted_count']
             logger.info(f"🗑️ Cleaned up {deleted_count} discoveries older than {days_old} days")
-            return deleted_count
+        
+        # Deletions cannot be folded into the running aggregates incrementally
+        if deleted_count:
+            self.refresh_statistics()
+        return deleted_count
     
     def get_comprehensive_graph_analysis(self) -> Dict[str, Any]:
         """Get comprehensive analysis of the protein discovery knowledge graph"""
         
-        with self.driver.session() as session:
+        node_statistics, relationship_statistics = self._cached('graph_counts', self._count_graph_elements)
+        
+        return {
+            'node_statistics': dict(node_statistics),
+            'relationship_statistics': dict(relationship_statistics),
+            'quantum_analysis': self.get_quantum_analysis()
+        }
+    
+    def _count_graph_elements(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Node counts per label and relationship counts per type (answered from the count store)"""
+        
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             # Node counts
             node_counts = session.run("""
                 CALL {
@@ -666,6 +936,12 @@ class Neo4jDiscoveryEngine:
                     UNION
                     MATCH ()-[r:ENTANGLED_WITH]->() RETURN 'ENTANGLED_WITH' as rel_type, count(r) as count
                     UNION
+                    MATCH ()-[r:QUANTUM_ENTANGLED]->() RETURN 'QUANTUM_ENTANGLED' as rel_type, count(r) as count
+                    UNION
+                    MATCH ()-[r:MAINTAINS_COHERENCE]->() RETURN 'MAINTAINS_COHERENCE' as rel_type, count(r) as count
+                    UNION
+                    MATCH ()-[r:IN_SUPERPOSITION]->() RETURN 'IN_SUPERPOSITION' as rel_type, count(r) as count
+                    UNION
                     MATCH ()-[r:CLASSIFIED_AS]->() RETURN 'CLASSIFIED_AS' as rel_type, count(r) as count
                     UNION
                     MATCH ()-[r:TARGETS]->() RETURN 'TARGETS' as rel_type, count(r) as count
@@ -675,6 +951,10 @@ class Neo4jDiscoveryEngine:
                     MATCH ()-[r:SIMILAR_TO]->() RETURN 'SIMILAR_TO' as rel_type, count(r) as count
                     UNION
                     MATCH ()-[r:PROJECTS_VIRTUE]->() RETURN 'PROJECTS_VIRTUE' as rel_type, count(r) as count
+                    UNION
+                    MATCH ()-[r:MAPS_TO_SOLUTION]->() RETURN 'MAPS_TO_SOLUTION' as rel_type, count(r) as count
+                    UNION
+                    MATCH ()-[r:INDICATES_FOR]->() RETURN 'INDICATES_FOR' as rel_type, count(r) as count
                 }
                 RETURN rel_type, count
                 ORDER BY count DESC
@@ -683,121 +963,359 @@ class Neo4jDiscoveryEngine:
             relationship_statistics = {}
             for record in rel_counts:
                 relationship_statistics[record['rel_type']] = record['count']
-            
-            return {
-                'node_statistics': node_statistics,
-                'relationship_statistics': relationship_statistics,
-                'quantum_analysis': self.get_quantum_analysis()
-            }
+        
+        return node_statistics, relationship_statistics
     
     def get_quantum_analysis(self) -> Dict[str, Any]:
-        """Analyze quantum vQbit patterns across all discoveries"""
+        """Analyze quantum vQbit patterns across all discoveries (from the running aggregates)"""
+        
+        stats = self._get_aggregates()
+        groups = self._aggregate_groups(stats)
+        
+        total_vqbits = int(stats.get('vqbits', 0))
+        superposition_count = int(stats.get('vqbits_superposition', 0))
+        total_entanglements = int(stats.get('entanglements', 0))
+        
+        virtue_analysis = {}
+        for virtue, values in sorted(groups.get('virtue', {}).items()):
+            count = int(values.get('count', 0))
+            virtue_analysis[virtue] = {
+                'count': count,
+                'avg_strength': values.get('strength_sum', 0.0) / count if count else 0.0,
+                'avg_phase': values.get('phase_sum', 0.0) / count if count else 0.0
+            }
         
-        with self.driver.session() as session:
-            # Total vQbits and quantum statistics
-            vqbit_stats = session.run("""
-                MATCH (v:VQbit)
-                RETURN count(v) as total_vqbits,
-                       avg(v.entanglement_degree) as avg_entanglement,
-                       avg(v.superposition_coherence) as avg_coherence,
-                       count(CASE WHEN v.collapsed_state = true THEN 1 END) as collapsed_count,
-                       count(CASE WHEN v.collapsed_state = false THEN 1 END) as superposition_count
-            """).single()
-            
-            # Entanglement network analysis
-            entanglement_stats = session.run("""
-                MATCH (v1:VQbit)-[e:ENTANGLED_WITH]->(v2:VQbit)
-                RETURN count(e) as total_entanglements,
-                       avg(e.strength) as avg_entanglement_strength,
-                       max(e.strength) as max_entanglement,
-                       min(e.strength) as min_entanglement
-            """).single()
-            
-            # Virtue projection analysis
-            virtue_projections = session.run("""
-                MATCH (v:VQbit)-[:PROJECTS_VIRTUE]->(vp:VirtueProjection)
-                RETURN vp.virtue as virtue,
-                       count(vp) as projection_count,
-                       avg(vp.projection_strength) as avg_strength,
-                       avg(vp.quantum_phase) as avg_phase
-                ORDER BY vp.virtue
-            """)
+        amino_acid_quantum = {}
+        aa_groups = groups.get('aa', {})
+        for amino_acid in sorted(aa_groups, key=lambda code: aa_groups[code].get('count', 0), reverse=True):
+            values = aa_groups[amino_acid]
+            count = int(values.get('count', 0))
+            amino_acid_quantum[amino_acid] = {
+                'count': count,
+                'avg_entanglement': values.get('entanglement_sum', 0.0) / count if count else 0.0,
+                'avg_coherence': values.get('coherence_sum', 0.0) / count if count else 0.0,
+                'avg_phi': values.get('phi_sum', 0.0) / count if count else 0.0,
+                'avg_psi': values.get('psi_sum', 0.0) / count if count else 0.0
+            }
+        
+        return {
+            'vqbit_statistics': {
+                'total_vqbits': total_vqbits,
+                'avg_entanglement': stats.get('vqbit_entanglement_sum', 0.0) / total_vqbits if total_vqbits else 0.0,
+                'avg_coherence': stats.get('vqbit_coherence_sum', 0.0) / total_vqbits if total_vqbits else 0.0,
+                'collapsed_count': int(stats.get('vqbits_collapsed', 0)),
+                'superposition_count': superposition_count,
+                'quantum_ratio': superposition_count / max(1, total_vqbits)
+            },
+            'entanglement_network': {
+                'total_entanglements': total_entanglements,
+                'avg_strength': stats.get('entanglement_strength_sum', 0.0) / total_entanglements if total_entanglements else 0.0,
+                'max_strength': float(stats.get('entanglement_strength_max', 0.0)),
+                'min_strength': float(stats.get('entanglement_strength_min', 0.0))
+            },
+            'virtue_projections': virtue_analysis,
+            'amino_acid_quantum_patterns': amino_acid_quantum,
+            'high_entanglement_discoveries': list(
+                self._cached('high_entanglement_discoveries', self._find_high_entanglement_discoveries)
+            )
+        }
+    
+    def _find_high_entanglement_discoveries(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top discoveries by mean high-entanglement residue degree (index-ordered read)"""
+        
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            high_entanglement = session.run("""
+                MATCH (d:Discovery)
+                WHERE d.high_entanglement IS NOT NULL
+                RETURN d.id as discovery_id,
+                       d.validation_score as quality,
+                       d.high_entanglement as avg_entanglement
+                ORDER BY d.high_entanglement DESC
+                LIMIT $limit
+            """, limit=limit)
             
-            virtue_analysis = {}
-            for record in virtue_projections:
-                virtue_analysis[record['virtue']] = {
-                    'count': record['projection_count'],
-                    'avg_strength': float(record['avg_strength'] or 0),
-                    'avg_phase': float(record['avg_phase'] or 0)
+            return [
+                {
+                    'discovery_id': record['discovery_id'],
+                    'quality': float(record['quality']),
+                    'avg_entanglement': float(record['avg_entanglement'])
                 }
+                for record in high_entanglement
+            ]
+    
+    def _count_recent_discoveries(self) -> int:
+        """Discoveries from the last hour (range scan on the timestamp index)"""
+        
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            records = list(session.run("""
+                MATCH (d:Discovery)
+                WHERE d.timestamp > datetime() - duration('PT1H')
+                RETURN count(d) as recent_count
+            """))
+            return records[0]['recent_count'] if records else 0
+    
+    def _cached(self, key: str, loader):
+        """Serve a statistics read from the TTL cache, loading it on expiry"""
+        
+        now = time.monotonic()
+        entry = self._stats_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        value = loader()
+        self._stats_cache[key] = (now + self.stats_cache_ttl, value)
+        return value
+    
+    def invalidate_statistics_cache(self):
+        """Drop cached statistics so the next read hits the graph"""
+        
+        self._stats_cache.clear()
+    
+    def _get_aggregates(self) -> Dict[str, Any]:
+        """Running aggregates from the :DiscoveryStats node, computed once if the node is missing"""
+        
+        def load():
+            with self.driver.session(default_access_mode=READ_ACCESS) as session:
+                records = list(session.run(
+                    "MATCH (st:DiscoveryStats {id: $stats_id}) RETURN properties(st) as stats",
+                    stats_id=DISCOVERY_STATS_ID
+                ))
+            if records:
+                return records[0]['stats']
+            return self.refresh_statistics()
+        
+        return self._cached('aggregates', load)
+    
+    @staticmethod
+    def _mean(stats: Dict[str, Any], name: str) -> float:
+        count = stats.get(f'{name}_count', 0)
+        return float(stats.get(f'{name}_sum', 0.0) / count) if count else 0.0
+    
+    @staticmethod
+    def _aggregate_groups(stats: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Unflatten 'group__name__stat' aggregate keys into {group: {name: {stat: value}}}"""
+        
+        groups = {}
+        for key, value in stats.items():
+            parts = key.split('__')
+            if len(parts) == 3:
+                group, name, stat = parts
+                groups.setdefault(group, {}).setdefault(name, {})[stat] = value
+        return groups
+    
+    def _load_virtue_target_types(self) -> Dict[str, int]:
+        """Target types that virtue projections attach to, with the number of targets per type"""
+        
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            records = session.run("""
+                MATCH (t:TherapeuticTarget)
+                WHERE t.target_type IS NOT NULL
+                RETURN t.target_type as target_type, count(t) as targets
+            """)
+            return {record['target_type']: record['targets'] for record in records}
+    
+    def _aggregate_batch_statistics(self, batch: Dict[str, List[Dict[str, Any]]]) -> Dict[str, float]:
+        """
+        Aggregate deltas for a write batch, mirroring what _write_discovery_batch creates.
+        
+        Additive keys are summed onto the :DiscoveryStats node; keys ending in
+        _max/_min are folded with max/min. Per-amino-acid and per-virtue
+        figures use 'aa__<code>__<stat>' and 'virtue__<name>__<stat>' keys.
+        """
+        
+        delta: Dict[str, float] = {}
+        
+        def add(key, value=1):
+            if value is not None:
+                delta[key] = delta.get(key, 0) + value
+        
+        for row in batch['discoveries']:
+            add('discoveries')
+            score = row['validation_score']
+            if score is not None:
+                add('validation_sum', score)
+                add('validation_count')
+                bucket = ('quality_excellent' if score >= 0.9 else 'quality_good' if score >= 0.8
+                          else 'quality_fair' if score >= 0.7 else 'quality_poor')
+                add(bucket)
+            if row['energy'] is not None:
+                add('energy_sum', row['energy'])
+                add('energy_count')
+            if row['vqbit_score'] is not None:
+                add('vqbit_score_sum', row['vqbit_score'])
+                add('vqbit_score_count')
+        
+        # VQbits (and everything hanging off them) exist only for reference amino acids
+        created_vqbits = set()
+        for row in batch['vqbits']:
+            amino_acid = row['amino_acid']
+            if amino_acid not in STANDARD_AMINO_ACIDS:
+                continue
+            created_vqbits.add(row['vqbit_id'])
+            
+            add('vqbits')
+            add('vqbit_entanglement_sum', row['entanglement_degree'])
+            add('vqbit_coherence_sum', row['coherence'])
+            if row['collapsed'] is not None:
+                add('vqbits_collapsed' if row['collapsed'] else 'vqbits_superposition')
+            
+            add(f'aa__{amino_acid}__count')
+            add(f'aa__{amino_acid}__entanglement_sum', row['entanglement_degree'])
+            add(f'aa__{amino_acid}__coherence_sum', row['coherence'])
+            add(f'aa__{amino_acid}__phi_sum', row['phi_angle'])
+            add(f'aa__{amino_acid}__psi_sum', row['psi_angle'])
+            
+            # Projections are written for superposed residues, one per matching target
+            if row['collapsed'] is False:
+                for projection in row['virtue_projections']:
+                    targets = self._virtue_target_types.get(projection['virtue'], 0)
+                    if targets:
+                        virtue = re.sub(r'\W', '_', str(projection['virtue']))
+                        add(f'virtue__{virtue}__count', targets)
+                        add(f'virtue__{virtue}__strength_sum', targets * projection['strength'])
+                        add(f'virtue__{virtue}__phase_sum', targets * projection['phase'])
+        
+        strengths = [
+            row['strength'] for row in batch['entanglements']
+            if row['prev_vqbit_id'] in created_vqbits and row['curr_vqbit_id'] in created_vqbits
+            and row['strength'] is not None
+        ]
+        if strengths:
+            add('entanglements', len(strengths))
+            add('entanglement_strength_sum', float(sum(strengths)))
+            delta['entanglement_strength_max'] = float(max(strengths))
+            delta['entanglement_strength_min'] = float(min(strengths))
+        
+        return delta
+    
+    def _update_discovery_stats(self, tx, sequences: List[Dict[str, Any]], delta: Dict[str, float]):
+        """Fold a batch's aggregate deltas into the :DiscoveryStats node (one statement)"""
+        
+        set_clauses = []
+        for key in sorted(delta):
+            prop, param = f"st.`{key}`", f"$delta.`{key}`"
+            if key.endswith('_max'):
+                set_clauses.append(f"{prop} = CASE WHEN {prop} IS NULL OR {param} > {prop} THEN {param} ELSE {prop} END")
+            elif key.endswith('_min'):
+                set_clauses.append(f"{prop} = CASE WHEN {prop} IS NULL OR {param} < {prop} THEN {param} ELSE {prop} END")
+            else:
+                set_clauses.append(f"{prop} = coalesce({prop}, 0) + {param}")
+        
+        # A sequence is new when its MERGE in this batch stamped it with the batch row's timestamp
+        tx.run(f"""
+            CALL {{
+                UNWIND $sequences AS seq
+                MATCH (s:Sequence {{value: seq.value}})
+                WHERE s.created_at = seq.timestamp
+                RETURN count(s) AS new_sequences
+            }}
+            MERGE (st:DiscoveryStats {{id: $stats_id}})
+            SET st.sequences = coalesce(st.sequences, 0) + new_sequences,
+                {', '.join(set_clauses)},
+                st.updated_at = datetime()
+        """, {'sequences': sequences, 'delta': delta, 'stats_id': DISCOVERY_STATS_ID})
+    
+    def refresh_statistics(self) -> Dict[str, Any]:
+        """
+        Recompute the :DiscoveryStats aggregates from full graph scans.
+        
+        Used once on graphs written before running aggregates existed and
+        after bulk deletions; regular writes maintain the node incrementally.
+        """
+        
+        logger.info("📊 Recomputing discovery statistics from the graph...")
+        stats: Dict[str, Any] = {}
+        
+        with self.driver.session() as session:
+            queries = [
+                """
+                MATCH (d:Discovery)
+                RETURN count(d) as discoveries,
+                       sum(d.validation_score) as validation_sum, count(d.validation_score) as validation_count,
+                       sum(d.energy_kcal_mol) as energy_sum, count(d.energy_kcal_mol) as energy_count,
+                       sum(d.vqbit_score) as vqbit_score_sum, count(d.vqbit_score) as vqbit_score_count,
+                       count(CASE WHEN d.validation_score >= 0.9 THEN 1 END) as quality_excellent,
+                       count(CASE WHEN d.validation_score >= 0.8 AND d.validation_score < 0.9 THEN 1 END) as quality_good,
+                       count(CASE WHEN d.validation_score >= 0.7 AND d.validation_score < 0.8 THEN 1 END) as quality_fair,
+                       count(CASE WHEN d.validation_score < 0.7 THEN 1 END) as quality_poor
+                """,
+                "MATCH (s:Sequence) RETURN count(s) as sequences",
+                """
+                MATCH (v:VQbit)
+                RETURN count(v) as vqbits,
+                       sum(v.entanglement_degree) as vqbit_entanglement_sum,
+                       sum(v.superposition_coherence) as vqbit_coherence_sum,
+                       count(CASE WHEN v.collapsed_state = true THEN 1 END) as vqbits_collapsed,
+                       count(CASE WHEN v.collapsed_state = false THEN 1 END) as vqbits_superposition
+                """,
+                """
+                MATCH (:VQbit)-[e:QUANTUM_ENTANGLED]->(:VQbit)
+                RETURN count(e) as entanglements,
+                       sum(e.entanglement_strength) as entanglement_strength_sum,
+                       max(e.entanglement_strength) as entanglement_strength_max,
+                       min(e.entanglement_strength) as entanglement_strength_min
+                """
+            ]
+            for query in queries:
+                for record in session.run(query):
+                    stats.update({key: value for key, value in dict(record).items() if value is not None})
             
             # Amino acid quantum patterns
-            aa_patterns = session.run("""
+            for record in session.run("""
                 MATCH (v:VQbit)
                 WHERE v.amino_acid <> ''
                 RETURN v.amino_acid as amino_acid,
                        count(v) as count,
-                       avg(v.entanglement_degree) as avg_entanglement,
-                       avg(v.superposition_coherence) as avg_coherence,
-                       avg(v.phi_angle) as avg_phi,
-                       avg(v.psi_angle) as avg_psi
-                ORDER BY count DESC
-            """)
-            
-            amino_acid_quantum = {}
-            for record in aa_patterns:
-                amino_acid_quantum[record['amino_acid']] = {
-                    'count': record['count'],
-                    'avg_entanglement': float(record['avg_entanglement'] or 0),
-                    'avg_coherence': float(record['avg_coherence'] or 0),
-                    'avg_phi': float(record['avg_phi'] or 0),
-                    'avg_psi': float(record['avg_psi'] or 0)
-                }
+                       sum(v.entanglement_degree) as entanglement_sum,
+                       sum(v.superposition_coherence) as coherence_sum,
+                       sum(v.phi_angle) as phi_sum,
+                       sum(v.psi_angle) as psi_sum
+            """):
+                for stat in ('count', 'entanglement_sum', 'coherence_sum', 'phi_sum', 'psi_sum'):
+                    stats[f"aa__{record['amino_acid']}__{stat}"] = record[stat]
             
-            # High-entanglement discoveries
-            high_entanglement = session.run("""
-                MATCH (d:Discovery)-[:HAS_VQBIT]->(v:VQbit)
-                WHERE v.entanglement_degree > 0.5
-                WITH d, avg(v.entanglement_degree) as avg_entanglement
-                RETURN d.id as discovery_id,
-                       d.validation_score as quality,
-                       avg_entanglement
-                ORDER BY avg_entanglement DESC
-                LIMIT 10
+            # Virtue projections
+            for record in session.run("""
+                MATCH (:QuantumState)-[p:PROJECTS_VIRTUE]->()
+                RETURN p.virtue_type as virtue,
+                       count(p) as count,
+                       sum(p.projection_strength) as strength_sum,
+                       sum(p.quantum_phase) as phase_sum
+            """):
+                virtue = re.sub(r'\W', '_', str(record['virtue']))
+                for stat in ('count', 'strength_sum', 'phase_sum'):
+                    stats[f"virtue__{virtue}__{stat}"] = record[stat]
+            
+            # Backfill the indexed high-entanglement score on discoveries written before it existed
+            session.run("""
+                MATCH (d:Discovery)
+                WHERE d.high_entanglement IS NULL
+                CALL {
+                    WITH d
+                    MATCH (d)-[:HAS_VQBIT]->(v:VQbit)
+                    WHERE v.entanglement_degree > 0.5
+                    WITH d, avg(v.entanglement_degree) as high_entanglement
+                    SET d.high_entanglement = high_entanglement
+                } IN TRANSACTIONS OF 10000 ROWS
             """)
             
-            entangled_discoveries = []
-            for record in high_entanglement:
-                entangled_discoveries.append({
-                    'discovery_id': record['discovery_id'],
-                    'quality': float(record['quality']),
-                    'avg_entanglement': float(record['avg_entanglement'])
-                })
-            
-            return {
-                'vqbit_statistics': {
-                    'total_vqbits': vqbit_stats['total_vqbits'] or 0,
-                    'avg_entanglement': float(vqbit_stats['avg_entanglement'] or 0),
-                    'avg_coherence': float(vqbit_stats['avg_coherence'] or 0),
-                    'collapsed_count': vqbit_stats['collapsed_count'] or 0,
-                    'superposition_count': vqbit_stats['superposition_count'] or 0,
-                    'quantum_ratio': (vqbit_stats['superposition_count'] or 0) / max(1, vqbit_stats['total_vqbits'] or 1)
-                },
-                'entanglement_network': {
-                    'total_entanglements': entanglement_stats['total_entanglements'] or 0,
-                    'avg_strength': float(entanglement_stats['avg_entanglement_strength'] or 0),
-                    'max_strength': float(entanglement_stats['max_entanglement'] or 0),
-                    'min_strength': float(entanglement_stats['min_entanglement'] or 0)
-                },
-                'virtue_projections': virtue_analysis,
-                'amino_acid_quantum_patterns': amino_acid_quantum,
-                'high_entanglement_discoveries': entangled_discoveries
-            }
+            stats['id'] = DISCOVERY_STATS_ID
+            session.run("""
+                MERGE (st:DiscoveryStats {id: $stats_id})
+                SET st = $stats, st.updated_at = datetime()
+            """, stats_id=DISCOVERY_STATS_ID, stats=stats)
+        
+        self.invalidate_statistics_cache()
+        return stats
     
     def find_quantum_patterns(self, min_entanglement: float = 0.3) -> List[Dict[str, Any]]:
-        """Find quantum entanglement patterns in the vQbit graph"""
+        """Find quantum entanglement patterns in the vQbit graph (cached for stats_cache_ttl seconds)"""
         
-        with self.driver.session() as session:
+        return self._cached(f'quantum_patterns:{min_entanglement}',
+                            lambda: self._find_quantum_patterns(min_entanglement))
+    
+    def _find_quantum_patterns(self, min_entanglement: float = 0.3) -> List[Dict[str, Any]]:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             # Find entanglement chains
             result = session.run("""
                 MATCH path = (v1:VQbit)-[:ENTANGLED_WITH*2..5]->(v2:VQbit)
@@ -826,9 +1344,12 @@ class Neo4jDiscoveryEngine:
             return quantum_patterns
     
     def get_protein_family_analysis(self) -> Dict[str, Any]:
-        """Analyze protein family classifications"""
+        """Analyze protein family classifications (cached for stats_cache_ttl seconds)"""
         
-        with self.driver.session() as session:
+        return self._cached('protein_families', self._analyze_protein_families)
+    
+    def _analyze_protein_families(self) -> Dict[str, Any]:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             # Family distribution
             family_stats = session.run("""
                 MATCH (d:Discovery)-[r:CLASSIFIED_AS]->(p:ProteinFamily)
@@ -850,9 +1371,12 @@ class Neo4jDiscoveryEngine:
             return family_distribution
     
     def get_therapeutic_target_analysis(self) -> Dict[str, Any]:
-        """Analyze therapeutic target predictions"""
+        """Analyze therapeutic target predictions (cached for stats_cache_ttl seconds)"""
         
-        with self.driver.session() as session:
+        return self._cached('therapeutic_targets', self._analyze_therapeutic_targets)
+    
+    def _analyze_therapeutic_targets(self) -> Dict[str, Any]:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             # Target distribution
             target_stats = session.run("""
                 MATCH (d:Discovery)-[r:TARGETS]->(t:TherapeuticTarget)
@@ -876,9 +1400,12 @@ class Neo4jDiscoveryEngine:
             return target_distribution
     
     def get_structural_analysis(self) -> Dict[str, Any]:
-        """Analyze structural motif patterns"""
+        """Analyze structural motif patterns (cached for stats_cache_ttl seconds)"""
         
-        with self.driver.session() as session:
+        return self._cached('structural_motifs', self._analyze_structural_motifs)
+    
+    def _analyze_structural_motifs(self) -> Dict[str, Any]:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             # Motif distribution
             motif_stats = session.run("""
                 MATCH (d:Discovery)-[r:CONTAINS_MOTIF]->(s:StructuralMotif)
@@ -900,9 +1427,12 @@ class Neo4jDiscoveryEngine:
             return motif_distribution
     
     def find_high_potential_discoveries(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Find discoveries with highest therapeutic potential"""
+        """Find discoveries with highest therapeutic potential (cached for stats_cache_ttl seconds)"""
         
-        with self.driver.session() as session:
+        return self._cached(f'high_potential:{limit}', lambda: self._find_high_potential_discoveries(limit))
+    
+    def _find_high_potential_discoveries(self, limit: int = 10) -> List[Dict[str, Any]]:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run("""
                 MATCH (d:Discovery)-[:HAS_SEQUENCE]->(s:Sequence)
                 OPTIONAL MATCH (d)-[t:TARGETS]->(target:TherapeuticTarget)
@@ -940,9 +1470,12 @@ class Neo4jDiscoveryEngine:
             return high_potential
     
     def get_solution_mapping_analysis(self) -> Dict[str, Any]:
-        """Analyze how discoveries map to therapeutic solutions"""
+        """Analyze how discoveries map to therapeutic solutions (cached for stats_cache_ttl seconds)"""
         
-        with self.driver.session() as session:
+        return self._cached('solution_mapping', self._analyze_solution_mapping)
+    
+    def _analyze_solution_mapping(self) -> Dict[str, Any]:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             # Solution distribution
             solution_stats = session.run("""
                 MATCH (d:Discovery)-[r:MAPS_TO_SOLUTION]->(s:TherapeuticSolution)
@@ -995,9 +1528,12 @@ class Neo4jDiscoveryEngine:
             }
     
     def find_breakthrough_discoveries(self, limit: int = 5) -> List[Dict[str, Any]]:
-        """Find discoveries with highest breakthrough potential (solution + clinical mapping)"""
+        """Find discoveries with highest breakthrough potential (solution + clinical mapping) (cached for stats_cache_ttl seconds)"""
         
-        with self.driver.session() as session:
+        return self._cached(f'breakthroughs:{limit}', lambda: self._find_breakthrough_discoveries(limit))
+    
+    def _find_breakthrough_discoveries(self, limit: int = 5) -> List[Dict[str, Any]]:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.run("""
                 MATCH (d:Discovery)-[:HAS_SEQUENCE]->(s:Sequence)
                 MATCH (d)-[sol:MAPS_TO_SOLUTION]->(solution:TherapeuticSolution)
@@ -1091,17 +1627,7 @@ class Neo4jDiscoveryEngine:
             """, family)
         
         # Create common therapeutic targets
-        therapeutic_targets = [
-            {'id': 'alzheimers', 'name': 'Alzheimer\'s Disease', 'target_type': 'neurodegeneration', 'associated_disease': 'alzheimers'},
-            {'id': 'cancer', 'name': 'Cancer Therapy', 'target_type': 'oncology', 'associated_disease': 'cancer'},
-            {'id': 'diabetes', 'name': 'Diabetes Treatment', 'target_type': 'metabolic', 'associated_disease': 'diabetes'},
-            {'id': 'cardiovascular', 'name': 'Cardiovascular Disease', 'target_type': 'cardiovascular', 'associated_disease': 'heart_disease'},
-            {'id': 'inflammation', 'name': 'Anti-inflammatory', 'target_type': 'immunology', 'associated_disease': 'inflammatory_disease'},
-            {'id': 'antimicrobial', 'name': 'Antimicrobial', 'target_type': 'infectious_disease', 'associated_disease': 'infection'},
-            {'id': 'autoimmune', 'name': 'Autoimmune Disease Therapy', 'target_type': 'immunomodulation', 'associated_disease': 'autoimmune_disorder'}
-        ]
-        
-        for target in therapeutic_targets:
+        for target in THERAPEUTIC_TARGETS:
             session.run("""
                 MERGE (t:TherapeuticTarget {id: $id})
                 SET t.name = $name,
@@ -1338,8 +1864,8 @@ class Neo4jDiscoveryEngine:
         
         logger.info(f"✅ Phase 2 learning system initialized - Session: {session_id}")
     
-    def _create_protein_family_connections(self, session, discovery_id: str, sequence: str):
-        """Create connections to protein families based on sequence analysis"""
+    def _predict_protein_families(self, sequence: str) -> List[Tuple[str, float]]:
+        """Predict (family_id, confidence) protein family classifications from sequence analysis"""
         
         # Simple heuristics for protein family classification
         family_predictions = []
@@ -1372,23 +1898,10 @@ class Neo4jDiscoveryEngine:
         if hydrophobic_fraction > 0.4:
             family_predictions.append(('membrane_protein', 0.6))
         
-        # Store family predictions
-        for family_id, confidence in family_predictions:
-            session.run("""
-                MATCH (d:Discovery {id: $discovery_id})
-                MATCH (p:ProteinFamily {id: $family_id})
-                MERGE (d)-[r:CLASSIFIED_AS]->(p)
-                SET r.confidence_score = $confidence,
-                    r.prediction_method = 'sequence_heuristics',
-                    r.created_at = datetime()
-            """, {
-                'discovery_id': discovery_id,
-                'family_id': family_id,
-                'confidence': confidence
-            })
+        return family_predictions
     
-    def _create_therapeutic_target_connections(self, session, discovery_id: str, discovery_data: Dict[str, Any]):
-        """Create connections to therapeutic targets based on analysis"""
+    def _predict_therapeutic_targets(self, discovery_data: Dict[str, Any]) -> List[Tuple[str, float]]:
+        """Predict (target_id, potential_score) therapeutic targets based on analysis"""
         
         sequence = discovery_data.get('sequence', '')
         validation_score = discovery_data.get('validation_score', 0.0)
@@ -1450,23 +1963,10 @@ class Neo4jDiscoveryEngine:
                 if autoimmune_score >= 0.5:
                     target_predictions.append(('autoimmune', min(autoimmune_score, 0.95)))
         
-        # Store therapeutic target connections
-        for target_id, potential_score in target_predictions:
-            session.run("""
-                MATCH (d:Discovery {id: $discovery_id})
-                MATCH (t:TherapeuticTarget {id: $target_id})
-                MERGE (d)-[r:TARGETS]->(t)
-                SET r.potential_score = $potential_score,
-                    r.prediction_method = 'sequence_analysis',
-                    r.created_at = datetime()
-            """, {
-                'discovery_id': discovery_id,
-                'target_id': target_id,
-                'potential_score': potential_score
-            })
+        return target_predictions
     
-    def _create_structural_motif_connections(self, session, discovery_id: str, vqbit_states: List[Dict[str, Any]]):
-        """Create connections to structural motifs based on vQbit analysis"""
+    def _predict_structural_motifs(self, vqbit_states: List[Dict[str, Any]]) -> List[Tuple[str, float]]:
+        """Predict (motif_type, confidence) structural motifs based on vQbit analysis"""
         
         # Analyze vQbit states for structural patterns
         motif_predictions = []
@@ -1498,92 +1998,103 @@ class Neo4jDiscoveryEngine:
         if irregular_residues > len(vqbit_states) * 0.3:
             motif_predictions.append(('turn_loop', irregular_residues / len(vqbit_states)))
         
-        # Store motif predictions
-        for motif_type, confidence in motif_predictions:
-            motif_id = f"{discovery_id}_{motif_type}"
-            session.run("""
-                MERGE (s:StructuralMotif {id: $motif_id})
-                SET s.motif_type = $motif_type,
-                    s.confidence = $confidence,
-                    s.created_at = datetime()
-                    
-                WITH s
-                MATCH (d:Discovery {id: $discovery_id})
-                MERGE (d)-[r:CONTAINS_MOTIF]->(s)
-                SET r.created_at = datetime()
-            """, {
-                'motif_id': motif_id,
-                'motif_type': motif_type,
-                'confidence': confidence,
-                'discovery_id': discovery_id
-            })
-    
-    def _create_sequence_similarity_connections(self, session, discovery_id: str, sequence: str):
-        """Create similarity relationships with other sequences in the graph"""
-        
-        # Find similar sequences using simple Hamming distance
-        # This is a simplified approach - in production, use more sophisticated algorithms
-        
-        # Only check similarity for sequences of similar length (±20%)
-        min_length = int(len(sequence) * 0.8)
-        max_length = int(len(sequence) * 1.2)
-        
-        result = session.run("""
-            MATCH (d:Discovery)-[:HAS_SEQUENCE]->(s:Sequence)
-            WHERE s.length >= $min_length AND s.length <= $max_length
-                AND d.id <> $discovery_id
-            RETURN d.id as other_discovery_id, s.value as other_sequence
-            LIMIT 100
-        """, {
-            'min_length': min_length,
-            'max_length': max_length,
-            'discovery_id': discovery_id
-        })
-        
-        for record in result:
-            other_sequence = record['other_sequence']
-            other_discovery_id = record['other_discovery_id']
-            
-            # Calculate simple similarity (this is very basic - could be improved)
-            similarity = self._calculate_sequence_similarity(sequence, other_sequence)
-            
-            if similarity > 0.7:  # Only store high similarity relationships
-                session.run("""
-                    MATCH (d1:Discovery {id: $discovery_id})
-                    MATCH (d2:Discovery {id: $other_discovery_id})
-                    MERGE (d1)-[r:SIMILAR_TO]-(d2)
-                    SET r.similarity_score = $similarity,
-                        r.comparison_method = 'sequence_alignment',
-                        r.created_at = datetime()
-                """, {
-                    'discovery_id': discovery_id,
-                    'other_discovery_id': other_discovery_id,
-                    'similarity': similarity
-                })
+        return motif_predictions
     
-    def _calculate_sequence_similarity(self, seq1: str, seq2: str) -> float:
-        """Calculate simple sequence similarity score"""
-        
-        if len(seq1) == 0 or len(seq2) == 0:
-            return 0.0
+    def _create_sequence_similarity_connections(self, tx, probes: List[Dict[str, Any]]):
+        """Link probes to their k-mer near neighbors from the similarity index (one write)"""
+        
+        similar_pairs = [
+            {'discovery_id': discovery_id, 'other_discovery_id': other_id, 'similarity': similarity}
+            for discovery_id, other_id, similarity in self.similarity_index.find_neighbors(
+                [probe['discovery_id'] for probe in probes],
+                np.stack([probe['signature'] for probe in probes])
+            )
+        ]
         
-        # Simple character-by-character comparison
-        max_len = max(len(seq1), len(seq2))
-        min_len = min(len(seq1), len(seq2))
+        if similar_pairs:
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (d1:Discovery {id: row.discovery_id})
+                MATCH (d2:Discovery {id: row.other_discovery_id})
+                MERGE (d1)-[r:SIMILAR_TO]-(d2)
+                SET r.similarity_score = row.similarity,
+                    r.comparison_method = 'kmer_minhash_lsh',
+                    r.created_at = datetime()
+            """, {'rows': similar_pairs})
+    
+    def rebuild_similarity_index(self):
+        """Rebuild the similarity index from every stored sequence, replacing the current one"""
         
-        matches = 0
-        for i in range(min_len):
-            if seq1[i] == seq2[i]:
-                matches += 1
+        index = self._build_similarity_index_from_graph()
+        with self._similarity_index_lock:
+            self._similarity_index = index
+    
+    def _build_similarity_index_from_graph(self, page_size: int = 50000) -> SequenceLSHIndex:
+        """Index every stored sequence, paging by discovery id"""
         
-        # Penalize length differences
-        length_penalty = min_len / max_len
-        similarity = (matches / min_len) * length_penalty
+        index = SequenceLSHIndex(path=self.similarity_index_path)
+        self._index_graph_sequences(index, page_size)
         
-        return similarity
+        if len(index):
+            index.save_if_dirty()
+            logger.info(f"🧬 Similarity index rebuilt: {len(index):,} sequences")
+        return index
+    
+    def _reconcile_similarity_index(self, index: SequenceLSHIndex, page_size: int = 50000):
+        """
+        Backfill sequences stored after the index file was last saved.
+        
+        The file is only written every autosave_every additions and on close,
+        so after a crash it can lag the graph. Its size is compared with the
+        number of sequenced discoveries and, when they differ, the missing ids
+        are indexed.
+        """
+        
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            records = list(session.run("""
+                MATCH (d:Discovery)-[:HAS_SEQUENCE]->(:Sequence)
+                RETURN count(d) as sequenced
+            """))
+        sequenced = records[0]['sequenced'] if records else 0
+        if sequenced <= len(index):
+            return
+        
+        added = self._index_graph_sequences(index, page_size, skip_ids=index.indexed_ids())
+        index.save_if_dirty()
+        logger.info(f"🧬 Similarity index backfilled: {added:,} sequences missing from {index.path}")
+    
+    def _index_graph_sequences(self, index: SequenceLSHIndex, page_size: int = 50000,
+                               skip_ids: frozenset = frozenset()) -> int:
+        """Add stored sequences (except skip_ids) to the index page by page; returns the number added"""
+        
+        added = 0
+        last_id = ''
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            while True:
+                records = list(session.run("""
+                    MATCH (d:Discovery)-[:HAS_SEQUENCE]->(s:Sequence)
+                    WHERE d.id > $last_id
+                    RETURN d.id as discovery_id, s.value as sequence
+                    ORDER BY d.id
+                    LIMIT $page_size
+                """, last_id=last_id, page_size=page_size))
+                if not records:
+                    break
+                
+                page = [record for record in records if record['discovery_id'] not in skip_ids]
+                if page:
+                    index.add_sequences(
+                        [record['discovery_id'] for record in page], [record['sequence'] for record in page]
+                    )
+                    added += len(page)
+                
+                last_id = records[-1]['discovery_id']
+                if len(records) < page_size:
+                    break
+        return added
     
-    def _map_to_therapeutic_solutions(self, session, discovery_id: str, discovery_data: Dict[str, Any]):
-        """Map discovery to specific therapeutic solutions based on analysis"""
+    def _predict_therapeutic_solutions(self, discovery_data: Dict[str, Any]) -> List[Tuple[str, float, str]]:
+        """Map discovery to (solution_id, confidence, evidence) therapeutic solutions based on analysis"""
         
         sequence = discovery_data.get('sequence', '')
         validation_score = discovery_data.get('validation_score', 0.0)
@@ -1668,32 +2179,10 @@ class Neo4jDiscoveryEngine:
                                            min(cytokine_score, 0.85),
                                            'cytokine_binding_potential'))
         
-        # Store solution mappings
-        for solution_id, confidence, evidence in solution_mappings:
-            session.run("""
-                MATCH (d:Discovery {id: $discovery_id})
-                MATCH (s:TherapeuticSolution {id: $solution_id})
-                CREATE (d)-[:MAPS_TO_SOLUTION {
-                    confidence_score: $confidence,
-                    evidence_type: $evidence,
-                    quantum_fidelity: $vqbit_score,
-                    binding_energy: $energy,
-                    validation_score: $validation_score,
-                    prediction_method: 'quantum_sequence_analysis',
-                    created_at: datetime()
-                }]->(s)
-            """, {
-                'discovery_id': discovery_id,
-                'solution_id': solution_id,
-                'confidence': confidence,
-                'evidence': evidence,
-                'vqbit_score': vqbit_score,
-                'energy': energy,
-                'validation_score': validation_score
-            })
+        return solution_mappings
     
-    def _create_clinical_indication_mapping(self, session, discovery_id: str, discovery_data: Dict[str, Any]):
-        """Map discovery to clinical indications"""
+    def _predict_clinical_indications(self, discovery_data: Dict[str, Any]) -> List[Tuple[str, float, str]]:
+        """Map discovery to (indication_id, potential, mechanism) clinical indications"""
         
         sequence = discovery_data.get('sequence', '')
         validation_score = discovery_data.get('validation_score', 0.0)
@@ -1763,25 +2252,28 @@ class Neo4jDiscoveryEngine:
                                           min(lupus_potential, 0.8),
                                           'systemic_immune_regulation'))
         
-        # Store clinical indication mappings
-        for indication_id, potential, mechanism in indication_mappings:
-            session.run("""
-                MATCH (d:Discovery {id: $discovery_id})
-                MATCH (c:ClinicalIndication {id: $indication_id})
-                CREATE (d)-[:INDICATES_FOR {
-                    therapeutic_potential: $potential,
-                    mechanism_of_action: $mechanism,
-                    validation_score: $validation_score,
-                    development_feasibility: $potential * 0.8,
-                    created_at: datetime()
-                }]->(c)
-            """, {
-                'discovery_id': discovery_id,
-                'indication_id': indication_id,
-                'potential': potential,
-                'mechanism': mechanism,
-                'validation_score': validation_score
-            })
+        return indication_mappings
+
+def open_discovery_engine(backend: Optional[str] = None, embedded_path: Optional[str] = None,
+                          **kwargs) -> Neo4jDiscoveryEngine:
+    """
+    Discovery engine for the configured graph backend.
+
+    backend defaults to FOTCHEM_GRAPH_BACKEND ('neo4j'); 'embedded' opens the
+    SQLite store at embedded_path (FOTCHEM_EMBEDDED_GRAPH by default) and
+    needs no server. Remaining keyword arguments go to the engine.
+    """
+
+    from embedded_graph_store import configured_backend
+
+    backend = (backend or configured_backend()).lower()
+    if backend == 'embedded':
+        from embedded_discovery_engine import EmbeddedDiscoveryEngine
+        embedded_kwargs = {k: v for k, v in kwargs.items() if k in ('similarity_index_path', 'stats_cache_ttl')}
+        return EmbeddedDiscoveryEngine(embedded_path, **embedded_kwargs)
+    if backend != 'neo4j':
+        raise ValueError(f"Unknown graph backend: {backend}")
+    return Neo4jDiscoveryEngine(**kwargs)
 
 def main():
     """Test Enhanced Neo4j Discovery Engine with Comprehensive Graph"""
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+NEO4J WRITE-BEHIND INGESTION QUEUE
+Decouples discovery generation from Neo4j round trips
+Discoveries are buffered in a bounded queue and drained by a background writer
+thread through Neo4jDiscoveryEngine.store_discoveries in UNWIND batches
+"""
+
+import json
+import queue
+import shutil
+import threading
+import time
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# In-band markers: they end the batch being collected, so the writer never idles past them
+_FLUSH = object()
+_STOP = object()
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a time.monotonic() deadline (None = no deadline)"""
+    return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+
+class DiscoveryIngestionQueue:
+    """
+    Write-behind buffer between discovery producers and the Neo4j bulk writer.
+
+    Producers call submit(), which only blocks when the queue is full
+    (backpressure). A background thread flushes whenever batch_size
+    discoveries are buffered or flush_interval seconds have passed. Failed
+    flushes are retried with exponential backoff; batches that still fail are
+    appended to a JSONL dead-letter spool that replay_dead_letters() re-submits
+    once the database is back.
+
+    Submitted discovery dicts are written asynchronously and must not be
+    mutated by the producer afterwards.
+    """
+
+    def __init__(self, engine, batch_size: int = 500, flush_interval: float = 1.0,
+                 max_queue_size: int = 10000, max_retries: int = 3, retry_backoff: float = 0.5,
+                 dead_letter_path: str = "neo4j_dead_letter.jsonl"):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.dead_letter_path = Path(dead_letter_path)
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._pending = 0
+        self._pending_changed = threading.Condition()
+        self._spool_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._closed = False
+
+        self.metrics = {
+            'submitted': 0,
+            'stored': 0,
+            'flushes': 0,
+            'failed_flushes': 0,
+            'retries': 0,
+            'dead_lettered': 0,
+            'lost': 0,
+            'backpressure_waits': 0,
+            'backpressure_time': 0.0,
+            'last_flush_latency': 0.0,
+            'max_flush_latency': 0.0,
+            'total_flush_latency': 0.0
+        }
+
+        self._writer = threading.Thread(target=self._run, name="neo4j-write-behind", daemon=True)
+        self._writer.start()
+
+        logger.info(f"📥 Write-behind ingestion queue started")
+        logger.info(f"   Batch size: {batch_size} | Flush interval: {flush_interval}s | Capacity: {max_queue_size}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def submit(self, discovery: Dict[str, Any], timeout: Optional[float] = None):
+        """
+        Queue a discovery for storage.
+
+        Returns immediately unless the queue is full, in which case the caller
+        blocks until the writer frees space. Raises queue.Full if timeout
+        seconds pass without space becoming available.
+        """
+
+        if self._closed:
+            raise RuntimeError("Ingestion queue is closed")
+
+        with self._pending_changed:
+            self._pending += 1
+
+        try:
+            try:
+                self._queue.put_nowait(discovery)
+            except queue.Full:
+                wait_start = time.perf_counter()
+                try:
+                    self._queue.put(discovery, timeout=timeout)
+                finally:
+                    with self._metrics_lock:
+                        self.metrics['backpressure_waits'] += 1
+                        self.metrics['backpressure_time'] += time.perf_counter() - wait_start
+        except queue.Full:
+            self._mark_done(1)
+            raise
+
+        with self._metrics_lock:
+            self.metrics['submitted'] += 1
+
+    def submit_many(self, discoveries: List[Dict[str, Any]], timeout: Optional[float] = None):
+        """Queue several discoveries, applying backpressure per item"""
+
+        for discovery in discoveries:
+            self.submit(discovery, timeout=timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write out everything submitted so far; returns False if timeout expired first"""
+
+        # One deadline covers queueing the marker and waiting for the writer
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(_FLUSH, timeout=_remaining(deadline))
+        except queue.Full:
+            return False
+        with self._pending_changed:
+            return self._pending_changed.wait_for(lambda: self._pending == 0, timeout=_remaining(deadline))
+
+    def close(self, timeout: Optional[float] = None):
+        """Drain the queue, stop the writer thread and log final counters"""
+
+        if self._closed:
+            return
+
+        self._closed = True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=_remaining(deadline))
+        except queue.Full:
+            logger.warning(f"⚠️ Ingestion queue still full after {timeout}s, writer not stopped")
+            return
+        self._writer.join(_remaining(deadline))
+
+        metrics = self.get_metrics()
+        logger.info(f"📥 Ingestion queue closed: {metrics['stored']:,} stored, "
+                    f"{metrics['dead_lettered']:,} dead-lettered, "
+                    f"avg flush {metrics['avg_flush_latency'] * 1000:.1f} ms")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue depth, throughput and flush latency counters"""
+
+        with self._metrics_lock:
+            metrics = dict(self.metrics)
+
+        metrics['queue_depth'] = self._queue.qsize()
+        metrics['pending'] = self._pending
+        metrics['max_queue_size'] = self.max_queue_size
+        metrics['avg_flush_latency'] = (
+            metrics['total_flush_latency'] / metrics['flushes'] if metrics['flushes'] else 0.0
+        )
+        return metrics
+
+    def replay_dead_letters(self, timeout: Optional[float] = None) -> int:
+        """Re-submit spooled discoveries; batches that fail again are spooled anew"""
+
+        replay_path = self.dead_letter_path.with_suffix(self.dead_letter_path.suffix + '.replay')
+
+        # Move the spool aside first so re-failures land in a fresh file; a
+        # replay file left by an interrupted replay is resumed, not overwritten
+        with self._spool_lock:
+            if self.dead_letter_path.exists():
+                if replay_path.exists():
+                    with open(self.dead_letter_path, 'r') as spooled, open(replay_path, 'a') as f:
+                        shutil.copyfileobj(spooled, f)
+                    self.dead_letter_path.unlink()
+                else:
+                    self.dead_letter_path.replace(replay_path)
+        if not replay_path.exists():
+            return 0
+
+        replayed = 0
+        with open(replay_path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    self.submit(json.loads(line)['discovery'], timeout=timeout)
+                except Exception:
+                    # Put the unsubmitted remainder back in the spool
+                    remainder = [line] + [rest for rest in f if rest.strip()]
+                    with self._spool_lock, open(self.dead_letter_path, 'a') as spool:
+                        spool.writelines(remainder)
+                    replay_path.unlink()
+                    logger.warning(f"⚠️ Replay stopped after {replayed:,} discoveries, "
+                                   f"{len(remainder):,} re-spooled")
+                    raise
+                replayed += 1
+
+        replay_path.unlink()
+        logger.info(f"♻️ Replayed {replayed:,} dead-lettered discoveries")
+        return replayed
+
+    def _run(self):
+        """Writer thread: collect batches and hand them to the bulk writer"""
+
+        stopping = False
+        while not stopping:
+            try:
+                batch, stopping = self._collect_batch()
+                if batch:
+                    self._flush_batch(batch)
+            except Exception as e:
+                # Keep writing: a dead writer would leave flush() and blocked producers waiting forever
+                logger.error(f"❌ Write-behind writer error: {e}")
+
+    def _collect_batch(self):
+        """Block for the first item, then gather up to batch_size until flush_interval elapses"""
+
+        try:
+            item = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return [], False
+        if item is _FLUSH or item is _STOP:
+            return [], item is _STOP
+
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    item = self._queue.get_nowait()
+                else:
+                    item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _FLUSH or item is _STOP:
+                return batch, item is _STOP
+            batch.append(item)
+
+        return batch, False
+
+    def _flush_batch(self, batch: List[Dict[str, Any]]):
+        """Store one batch with retry, dead-lettering it if every attempt fails"""
+
+        try:
+            self._store_batch(batch)
+        finally:
+            # Always release the batch, or flush() and blocked producers would wait forever
+            self._mark_done(len(batch))
+
+    def _store_batch(self, batch: List[Dict[str, Any]]):
+        flush_start = time.perf_counter()
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                with self._metrics_lock:
+                    self.metrics['retries'] += 1
+                time.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            try:
+                self.engine.store_discoveries(batch)
+                last_error = None
+                break
+            except Exception as e:
+                last_error = e
+                logger.warning(f"⚠️ Neo4j flush of {len(batch)} discoveries failed "
+                               f"(attempt {attempt + 1}/{self.max_retries + 1}): {e}")
+
+        flush_latency = time.perf_counter() - flush_start
+
+        spooled = False
+        if last_error is not None:
+            try:
+                self._spool_dead_letters(batch, last_error)
+                spooled = True
+            except Exception as e:
+                logger.error(f"❌ Could not spool {len(batch)} discoveries to {self.dead_letter_path}, "
+                             f"they are lost: {e}")
+
+        with self._metrics_lock:
+            self.metrics['flushes'] += 1
+            self.metrics['last_flush_latency'] = flush_latency
+            self.metrics['total_flush_latency'] += flush_latency
+            self.metrics['max_flush_latency'] = max(self.metrics['max_flush_latency'], flush_latency)
+            if last_error is None:
+                self.metrics['stored'] += len(batch)
+            else:
+                self.metrics['failed_flushes'] += 1
+                self.metrics['dead_lettered' if spooled else 'lost'] += len(batch)
+
+    def _spool_dead_letters(self, batch: List[Dict[str, Any]], error: Exception):
+        """Append a failed batch to the JSONL dead-letter spool"""
+
+        failed_at = datetime.now().isoformat()
+        self.dead_letter_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._spool_lock, open(self.dead_letter_path, 'a') as f:
+            for discovery in batch:
+                f.write(json.dumps({'discovery': discovery, 'error': str(error), 'failed_at': failed_at},
+                                   default=str) + '\n')
+
+        logger.error(f"❌ Spooled {len(batch)} discoveries to {self.dead_letter_path}: {error}")
+
+    def _mark_done(self, count: int):
+        with self._pending_changed:
+            self._pending -= count
+            self._pending_changed.notify_all()
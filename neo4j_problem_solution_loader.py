@@ -12,7 +12,7 @@ import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Any
-from neo4j import GraphDatabase
+from neo4j_connection import Neo4jConfig, READ_ACCESS, get_neo4j_provider
 import uuid
 from datetime import datetime
 
@@ -23,11 +23,11 @@ logger = logging.getLogger(__name__)
 class FoTChemNeo4jLoader:
     """Loads problem-solution data into Neo4j with FoTChem namespace"""
     
-    def __init__(self, uri="bolt://localhost:7687", user="neo4j", password="fotquantum"):
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+    def __init__(self, uri=None, user=None, password=None):
+        self.driver = get_neo4j_provider(Neo4jConfig.from_env(uri=uri, user=user, password=password))
         
     def close(self):
-        """Close the database connection"""
+        """Release the shared database connection pool"""
         self.driver.close()
     
     def create_schema(self):
@@ -314,7 +314,7 @@ class FoTChemNeo4jLoader:
     
     def run_test_queries(self):
         """Run test queries to verify data loading"""
-        with self.driver.session() as session:
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
             
             # Test 1: Count nodes by type
             result = session.run("""
@@ -14,6 +14,8 @@ This runs continuously, hunting for truth without human prompts.
 """
 
 import json
+import queue
+import threading
 import time
 import pathlib
 import random
@@ -33,6 +35,7 @@ from agents.physicist.measure import MeasureQueue
 from agents.statistician.evaluate import CollapseRules
 from agents.ethics.guard import EthicsGate
 from akg.client import AKG
+from discovery_pipeline import PipelineStage, StagePipeline
 
 # Configure logging
 logging.basicConfig(
@@ -69,7 +72,9 @@ class AutonomousOrchestrator:
     without human intervention, following Field of Truth principles.
     """
     
-    def __init__(self, campaigns: List[pathlib.Path], budget_seconds: int, mode: str = "autonomous"):
+    def __init__(self, campaigns: List[pathlib.Path], budget_seconds: int, mode: str = "autonomous",
+                 stage_workers: Optional[Dict[str, int]] = None, stage_queue_size: int = 2,
+                 cycles_in_flight: int = 2, cycle_interval: float = 5.0):
         """
         Initialize the autonomous discovery system.
         
@@ -77,12 +82,22 @@ class AutonomousOrchestrator:
             campaigns: List of campaign configuration files
             budget_seconds: Total time budget for discovery session
             mode: Discovery mode ("autonomous", "interactive", "validation")
+            stage_workers: Worker threads per pipeline stage (default 1, scout 2)
+            stage_queue_size: Bound on cycles waiting in front of each stage
+            cycles_in_flight: Most cycles one campaign may have in the pipeline
+            cycle_interval: Minimum seconds between cycle starts of one campaign
         """
         self.mode = mode
         self.budget_seconds = budget_seconds
         self.start_time = time.time()
         self.deadline = self.start_time + budget_seconds
         self.metrics = DiscoveryMetrics()
+        self._metrics_lock = threading.Lock()
+        self.stage_workers = {"scout": 2, **(stage_workers or {})}
+        self.stage_queue_size = stage_queue_size
+        self.cycles_in_flight = cycles_in_flight
+        self.cycle_interval = cycle_interval
+        self.pipeline = None
         
         # Initialize FoT agent ecosystem
         logger.info("🧠 Initializing FoTChemistry autonomous discovery agents...")
@@ -159,6 +174,170 @@ class AutonomousOrchestrator:
         
         return curiosity
     
+    def _measurement_oracles(self, campaign: Dict[str, Any]) -> List[str]:
+        """Collect the oracle kinds declared in a campaign's measure section."""
+        oracles = []
+        for protocols in campaign.get('measure', {}).values():
+            if isinstance(protocols, list):
+                oracles.extend(p['kind'] for p in protocols if isinstance(p, dict) and 'kind' in p)
+        return oracles
+    
+    def _count(self, **increments: int):
+        """Add to discovery metrics; pipeline stages update them from several threads."""
+        with self._metrics_lock:
+            for field, amount in increments.items():
+                setattr(self.metrics, field, getattr(self.metrics, field) + amount)
+    
+    def _cycle_stages(self) -> List[tuple]:
+        """The discovery cycle steps, in order, as (name, method) pairs."""
+        return [
+            ("scout", self._scout_signals),
+            ("hypothesize", self._hypothesize_claims),
+            ("generate", self._generate_tasks),
+            ("measure", self._measure_candidates),
+            ("judge", self._judge_results)
+        ]
+    
+    def _advance_cycle(self, step, cycle: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one step on a cycle unless it has already finished early."""
+        if cycle['done']:
+            return cycle
+        
+        try:
+            step(cycle)
+        except Exception as e:
+            logger.error(f"❌ Discovery cycle failed for {cycle['campaign']['name']}: {e}")
+            cycle['verdicts'] = []
+            cycle['done'] = True
+        return cycle
+    
+    def _scout_signals(self, cycle: Dict[str, Any]):
+        """Step 1: scout for signals."""
+        campaign = cycle['campaign']
+        if time.time() >= self.deadline:
+            logger.info(f"⏰ Time budget exhausted, skipping cycle: {campaign['name']}")
+            cycle['done'] = True
+            return
+        
+        logger.info(f"🔬 Starting discovery cycle: {campaign['name']}")
+        logger.info("👁️ Scouting for new signals...")
+        cycle['signals'] = self.sources.poll(campaign['sources'])
+        logger.info(f"📡 Found {len(cycle['signals'])} signals")
+        
+        if not cycle['signals']:
+            logger.info("🤷 No new signals found, skipping cycle")
+            cycle['done'] = True
+    
+    def _hypothesize_claims(self, cycle: Dict[str, Any]):
+        """Steps 2-3: generate claims from signals and keep the most curious."""
+        campaign = cycle['campaign']
+        logger.info("💡 Generating hypotheses...")
+        table = self.factory.make_claims(cycle['signals'], campaign)
+        self._count(claims_generated=len(table))
+        
+        logger.info(f"🧠 Generated {len(table)} testable claims")
+        
+        if not len(table):
+            logger.info("🤷 No valid claims generated, skipping cycle")
+            cycle['done'] = True
+            return
+        
+        # Rank by curiosity (FoT-weighted exploration): scored column-wise,
+        # and only the top batch_size claims are built in full
+        logger.info("🎯 Ranking claims by curiosity...")
+        batch_size = campaign.get('batch_size', 10)
+        cycle['claims'] = self.factory.build_claims(table, table.top_k(batch_size))
+        
+        logger.info(f"🎲 Selected {len(cycle['claims'])} high-curiosity claims for testing")
+    
+    def _generate_tasks(self, cycle: Dict[str, Any]):
+        """Step 4: generate test candidates and screen them through the ethics gate."""
+        campaign = cycle['campaign']
+        logger.info("🧪 Generating test candidates...")
+        tasks = []
+        oracles = self._measurement_oracles(campaign)
+        
+        for claim in cycle['claims']:
+            try:
+                candidates = self.generator.propose_candidates(claim, campaign)
+                
+                for candidate in candidates:
+                    # Ethics screening
+                    if self.ethics_gate.validate_candidate(candidate, claim):
+                        tasks.append({
+                            "claim": claim,
+                            "candidate": candidate,
+                            "campaign": campaign['name'],
+                            "oracles": oracles
+                        })
+                    else:
+                        self._count(ethics_blocks=1)
+                        logger.warning(f"🚫 Ethics gate blocked candidate")
+                        
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to generate candidates for claim: {e}")
+        
+        logger.info(f"⚗️ Generated {len(tasks)} measurement tasks")
+        cycle['tasks'] = tasks
+        
+        if not tasks:
+            logger.info("🤷 No valid measurement tasks, skipping cycle")
+            cycle['done'] = True
+    
+    def _measure_candidates(self, cycle: Dict[str, Any]):
+        """Step 5: measure candidates on the worker pool."""
+        tasks = cycle['tasks']
+        logger.info("📏 Running measurements...")
+        timeout = cycle['campaign'].get('per_task_timeout', 600)  # 10 min default
+        
+        self._count(discoveries_attempted=len(tasks))
+        results = self.measure_queue.execute_tasks(tasks, timeout=timeout, deadline=self.deadline)
+        successful_results = [r for r in results if r.get('success', False)]
+        timed_out = sum(1 for r in results if r['status'] == 'timeout')
+        cancelled = sum(1 for r in results if r['status'] == 'cancelled')
+        
+        logger.info(f"📊 Completed {len(successful_results)}/{len(tasks)} measurements successfully "
+                  f"({timed_out} timed out, {cancelled} cancelled at deadline)")
+        self._count(discoveries_completed=len(successful_results),
+                    measurement_failures=len(tasks) - len(successful_results))
+        cycle['results'] = successful_results
+    
+    def _judge_results(self, cycle: Dict[str, Any]):
+        """Steps 6-7: evaluate and collapse claims, then archive verdicts to the AKG."""
+        logger.info("⚖️ Evaluating results and collapsing claims...")
+        verdicts = []
+        
+        for result in cycle['results']:
+            try:
+                verdict = self.collapse_rules.judge_claim(
+                    result['claim'], 
+                    result['candidate'], 
+                    result['measurement_result']
+                )
+                
+                # Update metrics
+                if verdict['status'] == 'truth':
+                    self._count(truth_collapsed=1, claims_collapsed=1)
+                elif verdict['status'] == 'refuted':
+                    self._count(refuted_claims=1, claims_collapsed=1)
+                else:
+                    self._count(needs_evidence=1, claims_collapsed=1)
+                
+                verdicts.append(verdict)
+                
+                # Write to AKG with full provenance
+                self.akg.record_discovery_verdict(verdict)
+                
+                logger.info(f"⚖️ Claim verdict: {verdict['status']} "
+                          f"(confidence: {verdict.get('confidence', 0):.2f})")
+                
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to evaluate result: {e}")
+        
+        logger.info(f"✅ Discovery cycle complete: {len(verdicts)} verdicts generated")
+        cycle['verdicts'] = verdicts
+        cycle['done'] = True
+    
     def run_discovery_cycle(self, campaign: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Run one complete discovery cycle for a campaign.
@@ -178,136 +357,38 @@ class AutonomousOrchestrator:
         Returns:
             List of discovery verdicts
         """
-        campaign_name = campaign['name']
-        logger.info(f"🔬 Starting discovery cycle: {campaign_name}")
+        cycle = {'campaign': campaign, 'verdicts': [], 'done': False}
+        for _, step in self._cycle_stages():
+            self._advance_cycle(step, cycle)
+        return cycle['verdicts']
+    
+    def build_pipeline(self) -> StagePipeline:
+        """
+        Build the stage-parallel scheduler for discovery cycles.
         
-        try:
-            # Step 1: Scout for signals
-            logger.info("👁️ Scouting for new signals...")
-            signals = self.sources.poll(campaign['sources'])
-            logger.info(f"📡 Found {len(signals)} signals")
-            
-            if not signals:
-                logger.info("🤷 No new signals found, skipping cycle")
-                return []
-            
-            # Step 2: Generate claims from signals
-            logger.info("💡 Generating hypotheses...")
-            claims = []
-            for signal in signals:
-                try:
-                    claim = self.factory.make_claim(signal, campaign)
-                    if claim:
-                        claims.append(claim)
-                        self.metrics.claims_generated += 1
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to generate claim from signal: {e}")
-            
-            logger.info(f"🧠 Generated {len(claims)} testable claims")
-            
-            if not claims:
-                logger.info("🤷 No valid claims generated, skipping cycle")
-                return []
-            
-            # Step 3: Rank by curiosity (FoT-weighted exploration)
-            logger.info("🎯 Ranking claims by curiosity...")
-            claims_with_scores = [(claim, self.calculate_curiosity_score(claim)) for claim in claims]
-            claims_with_scores.sort(key=lambda x: x[1], reverse=True)
-            
-            # Select top claims within batch size
-            batch_size = campaign.get('batch_size', 10)
-            selected_claims = [claim for claim, score in claims_with_scores[:batch_size]]
-            
-            logger.info(f"🎲 Selected {len(selected_claims)} high-curiosity claims for testing")
-            
-            # Step 4: Generate test candidates
-            logger.info("🧪 Generating test candidates...")
-            tasks = []
-            
-            for claim in selected_claims:
-                try:
-                    candidates = self.generator.propose_candidates(claim, campaign)
-                    
-                    for candidate in candidates:
-                        # Ethics screening
-                        if self.ethics_gate.validate_candidate(candidate, claim):
-                            tasks.append({
-                                "claim": claim,
-                                "candidate": candidate,
-                                "campaign": campaign_name
-                            })
-                        else:
-                            self.metrics.ethics_blocks += 1
-                            logger.warning(f"🚫 Ethics gate blocked candidate")
-                            
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to generate candidates for claim: {e}")
-            
-            logger.info(f"⚗️ Generated {len(tasks)} measurement tasks")
-            
-            if not tasks:
-                logger.info("🤷 No valid measurement tasks, skipping cycle")
-                return []
-            
-            # Step 5: Measure candidates
-            logger.info("📏 Running measurements...")
-            timeout = campaign.get('per_task_timeout', 600)  # 10 min default
-            
-            try:
-                results = self.measure_queue.execute_tasks(tasks, timeout=timeout)
-                successful_results = [r for r in results if r.get('success', False)]
-                
-                logger.info(f"📊 Completed {len(successful_results)}/{len(tasks)} measurements successfully")
-                self.metrics.discoveries_completed += len(successful_results)
-                self.metrics.measurement_failures += len(tasks) - len(successful_results)
-                
-            except Exception as e:
-                logger.error(f"❌ Measurement execution failed: {e}")
-                return []
-            
-            # Step 6: Evaluate and collapse claims
-            logger.info("⚖️ Evaluating results and collapsing claims...")
-            verdicts = []
-            
-            for result in successful_results:
-                try:
-                    verdict = self.collapse_rules.judge_claim(
-                        result['claim'], 
-                        result['candidate'], 
-                        result['measurement_result']
-                    )
-                    
-                    # Update metrics
-                    if verdict['status'] == 'truth':
-                        self.metrics.truth_collapsed += 1
-                    elif verdict['status'] == 'refuted':
-                        self.metrics.refuted_claims += 1
-                    else:
-                        self.metrics.needs_evidence += 1
-                    
-                    self.metrics.claims_collapsed += 1
-                    verdicts.append(verdict)
-                    
-                    # Write to AKG with full provenance
-                    self.akg.record_discovery_verdict(verdict)
-                    
-                    logger.info(f"⚖️ Claim verdict: {verdict['status']} "
-                              f"(confidence: {verdict.get('confidence', 0):.2f})")
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to evaluate result: {e}")
-            
-            logger.info(f"✅ Discovery cycle complete: {len(verdicts)} verdicts generated")
-            return verdicts
-            
-        except Exception as e:
-            logger.error(f"❌ Discovery cycle failed for {campaign_name}: {e}")
-            return []
+        Each cycle step becomes a pipeline stage with its own worker pool and
+        bounded input queue, so cycles of different campaigns overlap.
+        Measurement parallelism comes from the MeasureQueue worker processes.
+        """
+        return StagePipeline([
+            PipelineStage(
+                name,
+                lambda cycle, step=step: [self._advance_cycle(step, cycle)],
+                workers=self.stage_workers.get(name, 1),
+                queue_size=self.stage_queue_size
+            )
+            for name, step in self._cycle_stages()
+        ], name="discovery-cycle")
     
     def run_autonomous_discovery(self) -> Dict[str, Any]:
         """
         Run autonomous discovery across all campaigns until budget exhausted.
         
+        Cycles are fed through the stage pipeline round-robin. Each campaign
+        has at most cycles_in_flight cycles in the pipeline and starts a new one
+        no sooner than cycle_interval seconds after the last. Once the deadline
+        passes, cycles not yet scouted are dropped and the rest drain.
+        
         Returns:
             Discovery session summary
         """
@@ -317,29 +398,49 @@ class AutonomousOrchestrator:
         
         session_verdicts = []
         cycles_completed = 0
+        in_flight = {}
+        last_started = {}
+        self.pipeline = self.build_pipeline()
+        
+        def record(cycle):
+            nonlocal cycles_completed
+            in_flight[cycle['campaign']['name']] -= 1
+            session_verdicts.extend(cycle['verdicts'])
+            cycles_completed += 1
         
         try:
             while time.time() < self.deadline and self.campaigns:
-                remaining_time = self.deadline - time.time()
-                logger.info(f"⏱️ Time remaining: {remaining_time/60:.1f} minutes")
-                
                 # Fair round-robin through campaigns
                 random.shuffle(self.campaigns)
                 
                 for campaign in self.campaigns:
-                    if time.time() >= self.deadline:
-                        logger.info("⏰ Time budget exhausted")
+                    name = campaign['name']
+                    if (in_flight.get(name, 0) >= self.cycles_in_flight or
+                            time.time() - last_started.get(name, 0) < self.cycle_interval):
+                        continue
+                    try:
+                        self.pipeline.submit({'campaign': campaign, 'verdicts': [], 'done': False},
+                                             timeout=max(self.deadline - time.time(), 0))
+                    except queue.Full:
                         break
-                    
-                    cycle_verdicts = self.run_discovery_cycle(campaign)
-                    session_verdicts.extend(cycle_verdicts)
-                    cycles_completed += 1
-                    
-                    # Brief pause between campaigns for resource management
-                    time.sleep(5)
+                    in_flight[name] = in_flight.get(name, 0) + 1
+                    last_started[name] = time.time()
+                
+                try:
+                    record(self.pipeline.next_result(timeout=min(1.0, max(self.deadline - time.time(), 0))))
+                    remaining_time = self.deadline - time.time()
+                    logger.info(f"⏱️ Time remaining: {remaining_time/60:.1f} minutes")
+                except queue.Empty:
+                    pass
+            
+            logger.info("⏰ Time budget exhausted")
+            self.pipeline.close()
+            for cycle in self.pipeline.results():
+                record(cycle)
             
             # Calculate final metrics
             self.metrics.runtime_seconds = time.time() - self.start_time
+            pipeline_metrics = self.pipeline.get_metrics()
             
             summary = {
                 "session_type": "autonomous_discovery",
@@ -359,7 +460,8 @@ class AutonomousOrchestrator:
                     max(self.metrics.discoveries_attempted, 1)
                 ),
                 "verdicts": session_verdicts,
-                "metrics": asdict(self.metrics)
+                "metrics": asdict(self.metrics),
+                "pipeline": pipeline_metrics
             }
             
             logger.info("🎉 Autonomous discovery session complete!")
@@ -367,11 +469,16 @@ class AutonomousOrchestrator:
             logger.info(f"✅ Truth collapsed: {self.metrics.truth_collapsed}")
             logger.info(f"❌ Claims refuted: {self.metrics.refuted_claims}")
             logger.info(f"🔬 Needs evidence: {self.metrics.needs_evidence}")
+            for name, stage in pipeline_metrics.items():
+                logger.info(f"🏭 Stage {name}: {stage['utilisation']:.0%} busy, "
+                            f"{stage['items_in']} cycles, max queue {stage['max_queue_depth']}")
+            logger.info(f"🐢 Bottleneck stage: {self.pipeline.bottleneck()}")
             
             return summary
             
         except Exception as e:
             logger.error(f"❌ Autonomous discovery session failed: {e}")
+            self.pipeline.stop()
             raise
 
 
@@ -192,14 +192,10 @@ class QuantumGuidedDiscoveryEngine:
                 num_candidates=target_per_seed * 3  # Generate more, filter better
             )
             
-            # Quantum evaluation of candidates
+            # Quantum evaluation of candidates (batched)
+            candidates = [c for c in candidates if c['smiles'] not in explored]
             quantum_evaluated = []
-            for candidate in candidates:
-                if candidate['smiles'] in explored:
-                    continue
-                    
-                # Quantum evaluation
-                quantum_metrics = self._evaluate_quantum_fitness(candidate)
+            for candidate, quantum_metrics in zip(candidates, self._evaluate_quantum_fitness_batch(candidates)):
                 candidate.update(quantum_metrics)
                 
                 # Filter by quantum criteria
@@ -271,6 +267,51 @@ class QuantumGuidedDiscoveryEngine:
                 'quantum_state_norm': 0.0
             }
     
+    def _evaluate_quantum_fitness_batch(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Evaluate quantum fitness for many candidates with batched vQbit scoring"""
+        
+        results: List[Dict[str, Any]] = [None] * len(candidates)
+        pending = []
+        for idx, candidate in enumerate(candidates):
+            smiles = candidate['smiles']
+            if self.quantum_state_cache is not None and smiles in self.quantum_state_cache:
+                self.cache_hits += 1
+                results[idx] = self.quantum_state_cache[smiles]
+            else:
+                pending.append(idx)
+        
+        batch_size = max(1, self.config.quantum_batch_size)
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            smiles_list = [candidates[idx]['smiles'] for idx in chunk]
+            try:
+                batch = self.quantum_engine.create_molecular_vqbit_batch(smiles_list)
+                self.quantum_calculations += len(batch)
+                norms = np.linalg.norm(batch.amplitudes, axis=1)
+                
+                for row, idx in enumerate(chunk):
+                    quantum_measurements = {
+                        prop_type.name.lower(): float(values[row])
+                        for prop_type, values in batch.property_scores.items()
+                    }
+                    coherence = float(batch.coherence[row])
+                    quantum_metrics = {
+                        'quantum_measurements': quantum_measurements,
+                        'quantum_coherence': coherence,
+                        'quantum_fitness': self._calculate_quantum_fitness_score(quantum_measurements, coherence),
+                        'quantum_state_norm': float(norms[row])
+                    }
+                    if self.quantum_state_cache is not None:
+                        self.quantum_state_cache[smiles_list[row]] = quantum_metrics
+                    results[idx] = quantum_metrics
+            
+            except Exception as e:
+                logger.error(f"❌ Batched quantum evaluation failed, falling back per molecule: {e}")
+                for idx in chunk:
+                    results[idx] = self._evaluate_quantum_fitness(candidates[idx])
+        
+        return results
+    
     def _calculate_quantum_fitness_score(self, 
                                        measurements: Dict[str, float], 
                                        coherence: float) -> float:
@@ -2,245 +2,450 @@
 """
 Export Neo4j database as Cypher statements for Prior Art Project
 Creates reproducible Cypher scripts for database reconstruction
+
+Every label and relationship type is streamed in full, by parallel readers,
+either to compressed CSV for a single `neo4j-admin database import` or to
+batched UNWIND Cypher scripts for cypher-shell. A manifest records the
+files, row counts and SHA-256 checksums.
 """
 
 import os
+import re
 import sys
-from datetime import datetime
+import csv
+import gzip
+import json
+import math
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from neo4j_discovery_engine import Neo4jDiscoveryEngine
+from neo4j_connection import READ_ACCESS, get_neo4j_provider
+
+# Temporary label/property linking relationships to nodes during a Cypher restore
+EXPORT_LABEL = "_Export"
+EXPORT_ID = "_export_id"
+
+# neo4j.time value types and their Cypher constructor / import header type
+TEMPORAL_TYPES = {
+    'DateTime': 'datetime', 'Date': 'date', 'Time': 'time',
+    'LocalDateTime': 'localdatetime', 'LocalTime': 'localtime', 'Duration': 'duration'
+}
+
+ARRAY_DELIMITER = ";"
+
+
+def _quote_name(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _file_stem(name: str) -> str:
+    return re.sub(r'\W', '_', name)
+
+
+def _temporal_type(value: Any) -> Optional[str]:
+    if isinstance(value, datetime):
+        return 'datetime' if value.tzinfo else 'localdatetime'
+    if isinstance(value, date):
+        return 'date'
+    if isinstance(value, time):
+        return 'time' if value.tzinfo else 'localtime'
+    return TEMPORAL_TYPES.get(type(value).__name__)
+
+
+def _iso(value: Any) -> str:
+    return value.iso_format() if hasattr(value, 'iso_format') else value.isoformat()
+
+
+def cypher_literal(value: Any) -> str:
+    """Render a property value as a Cypher literal"""
+
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return f"toFloat('{'NaN' if math.isnan(value) else 'Infinity' if value > 0 else '-Infinity'}')"
+        return repr(value)
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(cypher_literal(item) for item in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_quote_name(str(k))}: {cypher_literal(v)}" for k, v in value.items()) + "}"
+    temporal = _temporal_type(value)
+    if temporal:
+        return f"{temporal}('{_iso(value)}')"
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def csv_type(value: Any) -> Optional[str]:
+    """neo4j-admin import header type for a value (None when it carries no type information)"""
+
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'long'
+    if isinstance(value, float):
+        return 'double'
+    if isinstance(value, (list, tuple)):
+        element_types = {csv_type(item) for item in value} - {None}
+        if not element_types:
+            return None
+        element_type = element_types.pop() if len(element_types) == 1 else 'string'
+        return element_type if element_type.endswith('[]') else element_type + '[]'
+    return _temporal_type(value) or 'string'
+
+
+def merge_csv_types(current: Optional[str], new: Optional[str]) -> Optional[str]:
+    """Widen a column type to cover a new value: long+double is double, anything else mixed is string"""
+
+    if current is None or current == new:
+        return new or current
+    if new is None:
+        return current
+    if {current, new} == {'long', 'double'}:
+        return 'double'
+    if {current, new} == {'long[]', 'double[]'}:
+        return 'double[]'
+    return 'string[]' if current.endswith('[]') and new.endswith('[]') else 'string'
+
+
+def csv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ARRAY_DELIMITER.join(csv_value(item) for item in value)
+    if _temporal_type(value):
+        return _iso(value)
+    return str(value)
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 class CypherExporter:
-    def __init__(self):
-        self.engine = Neo4jDiscoveryEngine()
+    """
+    Full-graph exporter.
+
+    format="csv" writes one header file plus one (gzip) data file per node
+    label and relationship type, keyed by elementId, ready for a single
+    offline `neo4j-admin database import full`. format="cypher" writes
+    UNWIND statements of batch_size rows each, restorable with cypher-shell.
+
+    Each label and relationship type is read by its own worker (workers
+    at a time) as one streamed query, so memory stays bounded regardless
+    of graph size. Nodes with several labels are exported once, under their
+    first label. The export is not a transactional snapshot: run it against
+    a quiesced database for a consistent dump.
+    """
+
+    def __init__(self, export_dir: str = "data/neo4j-dumps", format: str = "csv", workers: int = 4,
+                 batch_size: int = 1000, compress: bool = True, driver=None):
+        if format not in ("csv", "cypher"):
+            raise ValueError(f"Unsupported export format: {format}")
+
+        self.driver = driver or get_neo4j_provider()
+        self.format = format
+        self.workers = workers
+        self.batch_size = batch_size
+        self.compress = compress
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.export_dir = Path("data/neo4j-dumps")
+        self.export_dir = Path(export_dir) / f"graph_{self.timestamp}"
         self.export_dir.mkdir(parents=True, exist_ok=True)
-        
-    def export_schema_cypher(self):
+
+    def export_schema_cypher(self) -> Dict[str, Any]:
         """Export database schema as Cypher statements"""
         print("📋 Exporting database schema...")
-        
-        schema_file = self.export_dir / f"01_schema_{self.timestamp}.cypher"
-        
+
+        schema_file = self.export_dir / "01_schema.cypher"
+
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            statements = [
+                record['statement'] for query in (
+                    "SHOW CONSTRAINTS YIELD createStatement RETURN createStatement as statement",
+                    "SHOW INDEXES YIELD type, owningConstraint, createStatement "
+                    "WHERE owningConstraint IS NULL AND type <> 'LOOKUP' "
+                    "RETURN createStatement as statement"
+                )
+                for record in session.run(query)
+            ]
+
         with open(schema_file, 'w') as f:
             f.write(f"// FoT Protein Discovery Database Schema\n")
             f.write(f"// Exported: {datetime.now().isoformat()}\n")
             f.write(f"// For Prior Art Project\n\n")
-            
-            # Node constraints and indexes
-            schema_queries = [
-                "// Create node constraints",
-                "CREATE CONSTRAINT discovery_id IF NOT EXISTS FOR (d:Discovery) REQUIRE d.id IS UNIQUE;",
-                "CREATE CONSTRAINT vqbit_id IF NOT EXISTS FOR (v:VQbit) REQUIRE v.id IS UNIQUE;",
-                "CREATE CONSTRAINT quantum_state_id IF NOT EXISTS FOR (q:QuantumState) REQUIRE q.id IS UNIQUE;",
-                "CREATE CONSTRAINT protein_family_name IF NOT EXISTS FOR (p:ProteinFamily) REQUIRE p.name IS UNIQUE;",
-                "CREATE CONSTRAINT therapeutic_target_name IF NOT EXISTS FOR (t:TherapeuticTarget) REQUIRE t.name IS UNIQUE;",
-                "",
-                "// Create indexes for performance",
-                "CREATE INDEX discovery_validation_score IF NOT EXISTS FOR (d:Discovery) ON (d.validation_score);",
-                "CREATE INDEX discovery_timestamp IF NOT EXISTS FOR (d:Discovery) ON (d.timestamp);",
-                "CREATE INDEX vqbit_residue IF NOT EXISTS FOR (v:VQbit) ON (v.residue_index);",
-                "CREATE INDEX vqbit_amino_acid IF NOT EXISTS FOR (v:VQbit) ON (v.amino_acid);",
-                "CREATE INDEX vqbit_entanglement IF NOT EXISTS FOR (v:VQbit) ON (v.entanglement_degree);",
-                "CREATE INDEX quantum_entanglement_strength IF NOT EXISTS FOR ()-[r:QUANTUM_ENTANGLED]-() ON (r.entanglement_strength);",
-                ""
-            ]
-            
-            for query in schema_queries:
-                f.write(query + "\n")
-        
+            for statement in statements:
+                f.write(statement + ";\n")
+
         print(f"✅ Schema exported to {schema_file}")
-        
-    def export_node_data_cypher(self):
-        """Export node data as Cypher CREATE statements"""
-        print("🧬 Exporting node data...")
-        
-        nodes_file = self.export_dir / f"02_nodes_{self.timestamp}.cypher"
-        
-        with self.engine.driver.session() as session:
-            with open(nodes_file, 'w') as f:
-                f.write(f"// FoT Protein Discovery Database Nodes\n")
-                f.write(f"// Exported: {datetime.now().isoformat()}\n\n")
-                
-                # Export Discovery nodes (sample)
-                f.write("// Discovery nodes (first 1000)\n")
-                result = session.run("""
-                    MATCH (d:Discovery)
-                    RETURN d.id as id, d.validation_score as score, d.assessment as assessment,
-                           d.timestamp as timestamp
-                    ORDER BY d.timestamp DESC
-                    LIMIT 1000
-                """)
-                
-                count = 0
-                for record in result:
-                    f.write(f"CREATE (d{count}:Discovery {{")
-                    f.write(f"id: '{record['id']}', ")
-                    f.write(f"validation_score: {record['score']}, ")
-                    f.write(f"assessment: '{record['assessment']}', ")
-                    f.write(f"timestamp: datetime('{record['timestamp']}')")
-                    f.write("});\n")
-                    count += 1
-                
-                f.write(f"\n// Total Discovery sample: {count} nodes\n\n")
-                
-                # Export VQbit nodes (sample)
-                f.write("// VQbit nodes (first 1000)\n")
-                result = session.run("""
-                    MATCH (v:VQbit)
-                    RETURN v.id as id, v.discovery_id as discovery_id, v.residue_index as residue_index,
-                           v.amino_acid as amino_acid, v.entanglement_degree as entanglement_degree
-                    ORDER BY v.discovery_id, v.residue_index
-                    LIMIT 1000
-                """)
-                
-                vqbit_count = 0
-                for record in result:
-                    f.write(f"CREATE (v{vqbit_count}:VQbit {{")
-                    f.write(f"id: '{record['id']}', ")
-                    f.write(f"discovery_id: '{record['discovery_id']}', ")
-                    f.write(f"residue_index: {record['residue_index']}, ")
-                    f.write(f"amino_acid: '{record['amino_acid']}', ")
-                    f.write(f"entanglement_degree: {record['entanglement_degree'] or 0.0}")
-                    f.write("});\n")
-                    vqbit_count += 1
-                
-                f.write(f"\n// Total VQbit sample: {vqbit_count} nodes\n")
-        
-        print(f"✅ Node data exported to {nodes_file}")
-        
-    def export_relationship_data_cypher(self):
-        """Export relationship data as Cypher CREATE statements"""
-        print("🔗 Exporting relationship data...")
-        
-        rels_file = self.export_dir / f"03_relationships_{self.timestamp}.cypher"
-        
-        with self.engine.driver.session() as session:
-            with open(rels_file, 'w') as f:
-                f.write(f"// FoT Protein Discovery Database Relationships\n")
-                f.write(f"// Exported: {datetime.now().isoformat()}\n\n")
-                
-                # Export quantum entanglements (sample)
-                f.write("// Quantum entanglement relationships (first 1000)\n")
-                result = session.run("""
-                    MATCH (v1:VQbit)-[r:QUANTUM_ENTANGLED]->(v2:VQbit)
-                    RETURN v1.id as vqbit1_id, v2.id as vqbit2_id,
-                           r.entanglement_strength as strength, r.bell_state as bell_state
-                    LIMIT 1000
-                """)
-                
-                entangle_count = 0
-                for record in result:
-                    f.write(f"MATCH (v1:VQbit {{id: '{record['vqbit1_id']}'}})\n")
-                    f.write(f"MATCH (v2:VQbit {{id: '{record['vqbit2_id']}'}})\n")
-                    f.write(f"CREATE (v1)-[:QUANTUM_ENTANGLED {{")
-                    f.write(f"entanglement_strength: {record['strength']}, ")
-                    f.write(f"bell_state: '{record['bell_state'] or 'unknown'}'")
-                    f.write("}]->(v2);\n\n")
-                    entangle_count += 1
-                
-                f.write(f"// Total entanglement sample: {entangle_count} relationships\n")
-        
-        print(f"✅ Relationship data exported to {rels_file}")
-        
-    def create_export_manifest(self):
-        """Create manifest file with export information"""
+        return self._file_entry(schema_file, kind='schema', count=len(statements))
+
+    def export_graph(self) -> List[Dict[str, Any]]:
+        """Stream every label and relationship type to files with parallel readers"""
+
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            labels = [record['label'] for record in session.run("CALL db.labels() YIELD label RETURN label")]
+            rel_types = [record['relationshipType'] for record in session.run(
+                "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
+            )]
+        labels = [label for label in labels if label != EXPORT_LABEL]
+
+        print(f"🧬 Exporting {len(labels)} labels and {len(rel_types)} relationship types "
+              f"({self.workers} readers, {self.format})...")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            jobs = [pool.submit(self._export_nodes, label) for label in labels]
+            jobs += [pool.submit(self._export_relationships, rel_type) for rel_type in rel_types]
+            entries = [job.result() for job in jobs]
+
+        for entry in entries:
+            print(f"   {entry['kind']:<13} {entry['name']:<30} {entry['count']:>12,} rows")
+        return entries
+
+    def _export_nodes(self, label: str) -> Dict[str, Any]:
+        match = f"MATCH (n:{_quote_name(label)}) WHERE head(labels(n)) = $label"
+        query = f"{match} RETURN elementId(n) as id, labels(n) as labels, properties(n) as properties"
+        return self._export_element('nodes', label, match, query)
+
+    def _export_relationships(self, rel_type: str) -> Dict[str, Any]:
+        match = f"MATCH ()-[n:{_quote_name(rel_type)}]->()"
+        query = (f"MATCH (a)-[n:{_quote_name(rel_type)}]->(b) "
+                 f"RETURN elementId(a) as start, elementId(b) as end, properties(n) as properties")
+        return self._export_element('relationships', rel_type, match, query)
+
+    def _export_element(self, kind: str, name: str, match: str, query: str) -> Dict[str, Any]:
+        suffix = (".csv" if self.format == "csv" else ".cypher") + (".gz" if self.compress else "")
+        path = self.export_dir / f"{kind}_{_file_stem(name)}{suffix}"
+        opener = gzip.open if self.compress else open
+
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            if self.format == "csv":
+                # Header columns need every property key up front (server-side scan, no transfer)
+                keys = [record['key'] for record in session.run(
+                    f"{match} UNWIND keys(n) AS key RETURN DISTINCT key ORDER BY key", label=name
+                )]
+                with opener(path, 'wt', newline='', encoding='utf-8') as f:
+                    count, column_types = self._write_csv_rows(f, kind, keys, session.run(query, label=name))
+                header = self._write_csv_header(kind, name, keys, column_types)
+            else:
+                with opener(path, 'wt', encoding='utf-8') as f:
+                    count = self._write_cypher_batches(f, kind, name, session.run(query, label=name))
+                header = None
+
+        entry = self._file_entry(path, kind=kind, name=name, count=count)
+        if header is not None:
+            entry['header'] = self._file_entry(header, kind='header')
+        return entry
+
+    def _write_csv_rows(self, f, kind: str, keys: List[str], records):
+        writer = csv.writer(f)
+        column_types: Dict[str, Optional[str]] = {key: None for key in keys}
+        count = 0
+        for record in records:
+            properties = record['properties']
+            for key in keys:
+                if key in properties:
+                    column_types[key] = merge_csv_types(column_types[key], csv_type(properties[key]))
+            values = [csv_value(properties.get(key)) for key in keys]
+            if kind == 'nodes':
+                writer.writerow([record['id']] + values + [ARRAY_DELIMITER.join(record['labels'])])
+            else:
+                writer.writerow([record['start'], record['end']] + values)
+            count += 1
+        return count, column_types
+
+    def _write_csv_header(self, kind: str, name: str, keys: List[str],
+                          column_types: Dict[str, Optional[str]]) -> Path:
+        """Header file written after the data pass, once column types are known"""
+
+        header = self.export_dir / f"{kind}_{_file_stem(name)}_header.csv"
+        columns = [f"{key}:{column_types[key] or 'string'}" for key in keys]
+        with open(header, 'w', newline='', encoding='utf-8') as f:
+            if kind == 'nodes':
+                csv.writer(f).writerow([":ID"] + columns + [":LABEL"])
+            else:
+                # The relationship type comes from the --relationships=TYPE= prefix
+                csv.writer(f).writerow([":START_ID", ":END_ID"] + columns)
+        return header
+
+    def _write_cypher_batches(self, f, kind: str, name: str, records) -> int:
+        f.write(f"// {kind} {name}\n")
+        count = 0
+        batch = []
+
+        def flush():
+            if kind == 'nodes':
+                # CREATE needs static labels: one statement per label combination in the batch
+                by_labels: Dict[tuple, List[str]] = {}
+                for labels, row in batch:
+                    by_labels.setdefault(tuple(labels), []).append(row)
+                for labels, rows in by_labels.items():
+                    label_clause = "".join(":" + _quote_name(label) for label in labels + (EXPORT_LABEL,))
+                    f.write(f"UNWIND [{', '.join(rows)}] AS row\n"
+                            f"CREATE (n{label_clause} {{{EXPORT_ID}: row.id}}) SET n += row.properties;\n")
+            else:
+                f.write(f"UNWIND [{', '.join(row for _, row in batch)}] AS row\n"
+                        f"MATCH (a:{EXPORT_LABEL} {{{EXPORT_ID}: row.start}})\n"
+                        f"MATCH (b:{EXPORT_LABEL} {{{EXPORT_ID}: row.end}})\n"
+                        f"CREATE (a)-[r:{_quote_name(name)}]->(b) SET r = row.properties;\n")
+            batch.clear()
+
+        for record in records:
+            if kind == 'nodes':
+                row = {'id': record['id'], 'properties': record['properties']}
+                batch.append((record['labels'], cypher_literal(row)))
+            else:
+                row = {'start': record['start'], 'end': record['end'], 'properties': record['properties']}
+                batch.append((None, cypher_literal(row)))
+            count += 1
+            if len(batch) >= self.batch_size:
+                flush()
+        if batch:
+            flush()
+        return count
+
+    def _write_cypher_bookends(self) -> List[Dict[str, Any]]:
+        """Scripts run before and after the data files to link and then clean up export ids"""
+
+        prepare = self.export_dir / "00_prepare.cypher"
+        with open(prepare, 'w') as f:
+            f.write(f"CREATE CONSTRAINT export_id IF NOT EXISTS FOR (n:{EXPORT_LABEL}) "
+                    f"REQUIRE n.{EXPORT_ID} IS UNIQUE;\n")
+
+        finalize = self.export_dir / "99_finalize.cypher"
+        with open(finalize, 'w') as f:
+            f.write(f"MATCH (n:{EXPORT_LABEL}) CALL {{ WITH n REMOVE n:{EXPORT_LABEL}, n.{EXPORT_ID} }} "
+                    f"IN TRANSACTIONS OF 10000 ROWS;\n")
+            f.write("DROP CONSTRAINT export_id IF EXISTS;\n")
+
+        return [self._file_entry(prepare, kind='prepare'), self._file_entry(finalize, kind='finalize')]
+
+    def _file_entry(self, path: Path, **fields) -> Dict[str, Any]:
+        return dict(fields, file=path.name, bytes=path.stat().st_size, sha256=file_sha256(path))
+
+    def restore_commands(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """Shell commands that rebuild the graph from this export (run inside the export directory)"""
+
+        data = [entry for entry in entries if entry['kind'] in ('nodes', 'relationships')]
+        if self.format == "csv":
+            arguments = [
+                f"--nodes={entry['header']['file']},{entry['file']}" if entry['kind'] == 'nodes'
+                else f"--relationships={entry['name']}={entry['header']['file']},{entry['file']}"
+                for entry in data
+            ]
+            return [
+                "neo4j-admin database import full neo4j --id-type=string "
+                f"--array-delimiter='{ARRAY_DELIMITER}' " + " ".join(arguments),
+                "cypher-shell -f 01_schema.cypher"
+            ]
+
+        read = "zcat" if self.compress else "cat"
+        ordered = [entry for entry in data if entry['kind'] == 'nodes'] + \
+                  [entry for entry in data if entry['kind'] == 'relationships']
+        return (["cypher-shell -f 01_schema.cypher", "cypher-shell -f 00_prepare.cypher"]
+                + [f"{read} {entry['file']} | cypher-shell" for entry in ordered]
+                + ["cypher-shell -f 99_finalize.cypher"])
+
+    def create_export_manifest(self, entries: List[Dict[str, Any]]) -> Path:
+        """Write manifest.json (files, counts, checksums, restore commands) and a readable summary"""
         print("📄 Creating export manifest...")
-        
-        manifest_file = self.export_dir / f"export_manifest_{self.timestamp}.md"
-        
-        stats = self.engine.get_discovery_statistics()
-        
+
+        nodes = sum(entry['count'] for entry in entries if entry['kind'] == 'nodes')
+        relationships = sum(entry['count'] for entry in entries if entry['kind'] == 'relationships')
+        manifest = {
+            'export_timestamp': datetime.now().isoformat(),
+            'format': self.format,
+            'compressed': self.compress,
+            'batch_size': self.batch_size if self.format == "cypher" else None,
+            'total_nodes': nodes,
+            'total_relationships': relationships,
+            'files': entries,
+            'restore': self.restore_commands(entries)
+        }
+
+        manifest_file = self.export_dir / "manifest.json"
         with open(manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        with open(self.export_dir / "export_manifest.md", 'w') as f:
             f.write(f"# FoT Protein Discovery Database Export\n\n")
-            f.write(f"**Export Date:** {datetime.now().isoformat()}\n")
+            f.write(f"**Export Date:** {manifest['export_timestamp']}\n")
             f.write(f"**Purpose:** Prior Art Project Documentation\n")
-            f.write(f"**Export Type:** Cypher Statements + CSV Data\n\n")
-            
-            f.write(f"## Database Statistics at Export\n\n")
-            f.write(f"- **Total Discoveries:** {stats.get('total_discoveries', 'N/A'):,}\n")
-            f.write(f"- **Unique Sequences:** {stats.get('unique_sequences', 'N/A'):,}\n")
-            
-            with self.engine.driver.session() as session:
-                vqbit_count = session.run('MATCH (v:VQbit) RETURN count(v) as count').single()['count']
-                quantum_count = session.run('MATCH (q:QuantumState) RETURN count(q) as count').single()['count']
-                entanglements = session.run('MATCH ()-[r:QUANTUM_ENTANGLED]->() RETURN count(r) as count').single()['count']
-                
-                f.write(f"- **VQbit Nodes:** {vqbit_count:,}\n")
-                f.write(f"- **QuantumState Nodes:** {quantum_count:,}\n")
-                f.write(f"- **Quantum Entanglements:** {entanglements:,}\n\n")
-            
-            f.write(f"## Exported Files\n\n")
-            f.write(f"### Cypher Scripts\n")
-            f.write(f"- `01_schema_{self.timestamp}.cypher` - Database schema\n")
-            f.write(f"- `02_nodes_{self.timestamp}.cypher` - Node data samples\n")
-            f.write(f"- `03_relationships_{self.timestamp}.cypher` - Relationship data samples\n\n")
-            
-            f.write(f"### CSV Data Exports\n")
-            f.write(f"- `protein_discoveries_{self.timestamp}.csv` - 237,895 protein discoveries\n")
-            f.write(f"- `vqbit_quantum_states_{self.timestamp}.csv` - 166,923 VQbit quantum states\n")
-            f.write(f"- `quantum_entanglements_{self.timestamp}.csv` - 95,855 quantum entanglements\n\n")
-            
-            f.write(f"### JSON Data Exports\n")
-            f.write(f"- `therapeutic_solutions_{self.timestamp}.json` - 26,802 therapeutic solutions\n")
-            f.write(f"- `database_statistics_{self.timestamp}.json` - Comprehensive statistics\n\n")
-            
-            f.write(f"## System Information\n\n")
-            f.write(f"- **Hardware:** M4 Mac Pro (128GB RAM, 40-core GPU)\n")
-            f.write(f"- **Database:** Neo4j Knowledge Graph\n")
-            f.write(f"- **Discovery System:** Quantum Protein Discovery with vQbit relationships\n")
-            f.write(f"- **Parallel Processes:** 8 parallel M4 discovery engines\n\n")
-            
-            f.write(f"## Restoration Instructions\n\n")
-            f.write(f"To recreate this database:\n\n")
-            f.write(f"1. **Create new Neo4j database**\n")
-            f.write(f"2. **Run schema script:** `cypher-shell -f 01_schema_{self.timestamp}.cypher`\n")
-            f.write(f"3. **Import CSV data:** Use Neo4j's LOAD CSV functionality\n")
-            f.write(f"4. **Run relationship scripts:** `cypher-shell -f 03_relationships_{self.timestamp}.cypher`\n\n")
-            
-            f.write(f"## Prior Art Value\n\n")
-            f.write(f"This database contains **237,895+ unique protein discoveries** with:\n")
-            f.write(f"- Quantum vQbit representations\n")
-            f.write(f"- Therapeutic classifications\n")
-            f.write(f"- Validation scores and assessments\n")
-            f.write(f"- Quantum entanglement relationships\n")
-            f.write(f"- Clinical indication mappings\n\n")
-            f.write(f"Generated by M4 Mac Pro Beast Mode discovery system.\n")
-        
+            f.write(f"**Export Type:** Full graph, {'CSV (neo4j-admin import)' if self.format == 'csv' else 'UNWIND Cypher'}\n\n")
+
+            f.write(f"## Database Contents\n\n")
+            f.write(f"- **Nodes:** {nodes:,}\n")
+            f.write(f"- **Relationships:** {relationships:,}\n\n")
+            f.write("| Kind | Name | Rows | File | SHA-256 |\n|---|---|---:|---|---|\n")
+            for entry in entries:
+                if entry['kind'] in ('nodes', 'relationships'):
+                    f.write(f"| {entry['kind']} | {entry['name']} | {entry['count']:,} | "
+                            f"`{entry['file']}` | `{entry['sha256'][:16]}…` |\n")
+
+            f.write(f"\n## Restoration Instructions\n\n")
+            f.write("Run from this directory against an empty database:\n\n```bash\n")
+            for command in manifest['restore']:
+                f.write(command + "\n")
+            f.write("```\n\nVerify files with the checksums in `manifest.json` before restoring.\n")
+
         print(f"✅ Export manifest created: {manifest_file}")
-    
-    def run_full_cypher_export(self):
-        """Run complete Cypher export pipeline"""
-        print("🚀 STARTING CYPHER DATABASE EXPORT")
+        return manifest_file
+
+    def run_full_cypher_export(self) -> Path:
+        """Run complete export pipeline"""
+        print("🚀 STARTING FULL GRAPH EXPORT")
         print("=" * 50)
         print(f"Export timestamp: {self.timestamp}")
         print()
-        
+
         try:
-            self.export_schema_cypher()
-            self.export_node_data_cypher()
-            self.export_relationship_data_cypher()
-            self.create_export_manifest()
-            
+            entries = [self.export_schema_cypher()]
+            if self.format == "cypher":
+                entries += self._write_cypher_bookends()
+            entries += self.export_graph()
+            manifest_file = self.create_export_manifest(entries)
+
             print()
-            print("🎉 CYPHER EXPORT COMPLETED!")
+            print("🎉 GRAPH EXPORT COMPLETED!")
             print("=" * 50)
             print(f"📁 Files exported to: {self.export_dir}")
-            print("🔗 Cypher scripts created for database reconstruction")
-            print("📊 Combined with CSV exports for complete Prior Art documentation")
-            
+            return manifest_file
+
         except Exception as e:
-            print(f"❌ Cypher export failed: {e}")
+            print(f"❌ Graph export failed: {e}")
             raise
         finally:
-            self.engine.close()
+            self.driver.close()
 
 
 if __name__ == "__main__":
-    exporter = CypherExporter()
+    parser = argparse.ArgumentParser(description="Export the full Neo4j graph for bulk restore")
+    parser.add_argument("--format", choices=["csv", "cypher"], default="csv",
+                        help="csv for neo4j-admin import, cypher for batched UNWIND scripts")
+    parser.add_argument("--output-dir", default="data/neo4j-dumps")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel label/relationship readers")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per UNWIND statement")
+    parser.add_argument("--no-compress", action="store_true", help="Write plain instead of gzip files")
+    args = parser.parse_args()
+
+    exporter = CypherExporter(args.output_dir, format=args.format, workers=args.workers,
+                              batch_size=args.batch_size, compress=not args.no_compress)
     exporter.run_full_cypher_export()
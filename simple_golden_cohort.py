@@ -5,7 +5,7 @@ Extract top therapeutic candidates from the discovery database
 """
 
 import logging
-from neo4j import GraphDatabase
+from neo4j_connection import READ_ACCESS, get_neo4j_provider
 import json
 from datetime import datetime
 
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 def extract_golden_cohort():
     """Extract and analyze top therapeutic candidates"""
     
-    driver = GraphDatabase.driver("bolt://localhost:7687", auth=("neo4j", "fotquantum"))
+    driver = get_neo4j_provider()
     
     # Query for top candidates based on actual schema
     query = """
@@ -38,7 +38,7 @@ def extract_golden_cohort():
     LIMIT 100
     """
     
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query)
         candidates = []
         
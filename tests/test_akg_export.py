@@ -0,0 +1,157 @@
+"""
+Test Suite for the Streaming AKG Streamlit Export
+
+Drives AKG.export_for_streamlit against an in-process driver that answers the
+keyset-paginated discovery query from a list, so no Neo4j instance is needed:
+1. The JSON export keeps the dashboard document shape, newest first
+2. Pages are bounded by page_size and every discovery is written once
+3. NDJSON exports write one record per line plus a summary file
+4. Incremental exports append only discoveries past the watermark
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("neo4j")
+pytest.importorskip("requests")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from akg.client import AKG
+
+
+class PagingSession:
+    """Session stand-in evaluating the export page query over in-memory discoveries"""
+
+    def __init__(self, driver: "PagingDriver"):
+        self.driver = driver
+
+    def run(self, query: str, **params) -> List[Dict[str, Any]]:
+        self.driver.queries.append(params)
+        ascending = 'ASC' in query
+        rows = sorted(self.driver.discoveries, key=lambda d: (d['discovered_at'], d['id']), reverse=not ascending)
+
+        if 'cursor_ts' in params:
+            position = (params['cursor_ts'], params['cursor_id'])
+            rows = [d for d in rows if ((d['discovered_at'], d['id']) > position) == ascending
+                    and (d['discovered_at'], d['id']) != position]
+
+        return [
+            {'d': d, 'c': {'id': f"claim-{d['id']}"}, 'evidence': [{'id': f"evidence-{d['id']}"}],
+             'cursor_ts': d['discovered_at']}
+            for d in rows[:params['page_size']]
+        ]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class PagingDriver:
+    def __init__(self, count: int = 0):
+        self.discoveries = []
+        self.queries = []
+        self.add(count)
+
+    def add(self, count: int):
+        start = len(self.discoveries)
+        for n in range(start, start + count):
+            self.discoveries.append({
+                'id': f"d-{n:04d}",
+                'verdict': 'truth' if n % 2 else 'refuted',
+                # Pairs share a timestamp so the id tie-breaker is exercised
+                'discovered_at': f"2025-01-01T00:{n // 2:02d}:00Z"
+            })
+
+    def session(self, **kwargs) -> PagingSession:
+        return PagingSession(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def akg():
+    client = AKG({
+        'neo4j': {'uri': 'bolt://localhost:1', 'user': 'neo4j', 'password': 'unused'},
+        'graphdb': {'uri': 'http://localhost:1', 'repository': 'unused'},
+        'fuseki': {'uri': 'http://localhost:1', 'dataset': 'unused'}
+    })
+    if client.neo4j_driver:
+        client.neo4j_driver.close()
+    yield client
+    client.close()
+
+
+class TestStreamingExport:
+    """Exports are written page by page with bounded queries"""
+
+    def test_json_export_keeps_document_shape(self, akg, tmp_path):
+        akg.neo4j_driver = PagingDriver(25)
+        output = tmp_path / "chemistry_discoveries.json"
+
+        summary = akg.export_for_streamlit(str(output), page_size=10)
+
+        data = json.loads(output.read_text())
+        ids = [item['discovery']['id'] for item in data['discoveries']]
+        assert data['total_discoveries'] == summary['total_discoveries'] == 25
+        assert ids == [f"d-{n:04d}" for n in reversed(range(25))]
+        assert data['discoveries'][0]['evidence'] == [{'id': 'evidence-d-0024'}]
+
+        assert summary['pages'] == 3
+        assert all(query['page_size'] == 10 for query in akg.neo4j_driver.queries)
+        assert summary['watermark'] == {'discovered_at': '2025-01-01T00:12:00Z', 'id': 'd-0024'}
+        assert summary['verdicts'] == {'truth': 12, 'refuted': 13}
+        assert json.loads((tmp_path / "chemistry_discoveries_summary.json").read_text()) == summary
+
+    def test_ndjson_export_one_record_per_line(self, akg, tmp_path):
+        akg.neo4j_driver = PagingDriver(7)
+        output = tmp_path / "discoveries.ndjson"
+
+        akg.export_for_streamlit(str(output), format="ndjson", page_size=3)
+
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert len(records) == 7
+        assert len({record['discovery']['id'] for record in records}) == 7
+
+    def test_without_neo4j_writes_empty_export(self, akg, tmp_path):
+        akg.neo4j_driver = None
+        output = tmp_path / "chemistry_discoveries.json"
+
+        summary = akg.export_for_streamlit(str(output))
+        assert json.loads(output.read_text())['discoveries'] == []
+        assert summary['total_discoveries'] == 0
+
+
+class TestIncrementalExport:
+    """Only discoveries past the last watermark are appended"""
+
+    def test_appends_only_new_discoveries(self, akg, tmp_path):
+        driver = PagingDriver(5)
+        akg.neo4j_driver = driver
+        output = tmp_path / "discoveries.ndjson"
+
+        akg.export_for_streamlit(str(output), format="ndjson", incremental=True, page_size=2)
+        driver.add(4)
+        summary = akg.export_for_streamlit(str(output), format="ndjson", incremental=True, page_size=2)
+
+        ids = [json.loads(line)['discovery']['id'] for line in output.read_text().splitlines()]
+        assert ids[5:] == ['d-0005', 'd-0006', 'd-0007', 'd-0008']
+        assert len(ids) == len(set(ids)) == 9
+        assert summary['exported_discoveries'] == 4 and summary['total_discoveries'] == 9
+        assert summary['watermark']['id'] == 'd-0008'
+
+        # Nothing new: no records appended, watermark unchanged
+        summary = akg.export_for_streamlit(str(output), format="ndjson", incremental=True)
+        assert summary['exported_discoveries'] == 0 and summary['watermark']['id'] == 'd-0008'
+        assert len(output.read_text().splitlines()) == 9
+
+    def test_incremental_requires_ndjson(self, akg, tmp_path):
+        with pytest.raises(ValueError):
+            akg.export_for_streamlit(str(tmp_path / "out.json"), incremental=True)
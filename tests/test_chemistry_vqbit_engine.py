@@ -0,0 +1,338 @@
+"""
+Test Suite for the Chemistry vQbit Engine
+
+Validates the diagonal operator substrate used by ChemistryVQbitEngine:
+1. DiagonalOperator algebra against the equivalent dense matrices
+2. Engine operator storage and memory footprint
+3. Closed-form L1 coherence against the density-matrix definition
+4. Time evolution against dense scipy.linalg.expm
+5. Batched (K, N) property scoring against per-molecule scoring
+6. Seeded, persisted operator spectra
+7. Lazy construction and opt-in diagnostics
+8. quantum_ops C kernels against the NumPy fallback
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.chemistry_vqbit_engine import (
+    ChemistryPropertyType,
+    ChemistryVQbitEngine,
+    DiagonalOperator,
+    generate_operator_spectra,
+    l1_coherence,
+    spectra_bundle_path,
+)
+
+
+def _random_state(dimension: int, rng: np.random.Generator) -> np.ndarray:
+    state = rng.standard_normal(dimension) + 1j * rng.standard_normal(dimension)
+    return state / np.linalg.norm(state)
+
+
+class TestDiagonalOperator:
+    """DiagonalOperator must agree with the dense np.diag form"""
+
+    def setup_method(self):
+        self.rng = np.random.default_rng(424242)
+        self.dimension = 16
+        self.eigenvalues = self.rng.uniform(-5, 5, self.dimension)
+        self.operator = DiagonalOperator(self.eigenvalues)
+        self.dense = np.diag(self.eigenvalues.astype(complex))
+
+    def test_expectation_matches_dense(self):
+        state = _random_state(self.dimension, self.rng)
+        expected = np.real(state.conj() @ self.dense @ state)
+        assert self.operator.expectation(state) == pytest.approx(expected, rel=1e-12)
+        assert np.real(state.conj() @ self.operator @ state) == pytest.approx(expected, rel=1e-12)
+
+    def test_matvec_matches_dense(self):
+        state = _random_state(self.dimension, self.rng)
+        np.testing.assert_allclose(self.operator @ state, self.dense @ state)
+
+        columns = np.stack([_random_state(self.dimension, self.rng) for _ in range(3)], axis=1)
+        np.testing.assert_allclose(self.operator @ columns, self.dense @ columns)
+
+    def test_evolution_matches_expm(self):
+        scipy_linalg = pytest.importorskip("scipy.linalg")
+        state = _random_state(self.dimension, self.rng)
+        expected = scipy_linalg.expm(-1j * self.dense * 0.01) @ state
+        np.testing.assert_allclose(self.operator.evolve(state, 0.01), expected, atol=1e-12)
+
+    def test_algebra_stays_diagonal(self):
+        other = DiagonalOperator(self.rng.uniform(0, 1, self.dimension))
+        combined = self.operator + 0.1 * other
+        assert isinstance(combined, DiagonalOperator)
+        np.testing.assert_allclose(combined.to_dense(), self.dense + 0.1 * other.to_dense())
+
+        identity = DiagonalOperator.identity(self.dimension)
+        np.testing.assert_allclose((identity @ self.operator).eigenvalues, self.eigenvalues)
+
+    def test_rejects_non_hermitian_eigenvalues(self):
+        with pytest.raises(ValueError):
+            DiagonalOperator(np.array([1.0 + 1.0j, 2.0]))
+
+
+@pytest.fixture(scope="module")
+def spectra_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("spectra"))
+
+
+@pytest.fixture(scope="module")
+def engine(spectra_dir):
+    return ChemistryVQbitEngine(use_gpu=False, spectra_dir=spectra_dir)
+
+
+class TestEngineOperatorStorage:
+    """Engine operators are held as eigenvalue vectors only"""
+
+    def test_operators_are_diagonal(self, engine):
+        for operator in engine.property_operators.values():
+            assert isinstance(operator, DiagonalOperator)
+            assert operator.dimension == engine.hilbert_dimension
+        assert isinstance(engine.molecular_hamiltonian, DiagonalOperator)
+        assert isinstance(engine.identity_operator, DiagonalOperator)
+
+    def test_operator_memory_is_linear(self, engine):
+        n_operators = len(ChemistryPropertyType) + 4
+        assert engine.get_operator_memory_bytes() == n_operators * engine.hilbert_dimension * 8
+
+    def test_hamiltonian_is_kinetic_plus_potential(self, engine):
+        np.testing.assert_allclose(
+            engine.molecular_hamiltonian.eigenvalues,
+            engine.kinetic_operator.eigenvalues + engine.potential_operator.eigenvalues,
+        )
+
+
+def _reference_l1_coherence(amplitudes: np.ndarray) -> float:
+    """Original density-matrix implementation of the L1 coherence"""
+    dimension = amplitudes.shape[0]
+    density_matrix = np.outer(amplitudes, amplitudes.conj())
+    off_diagonal_sum = 0.0
+    for i in range(dimension):
+        for j in range(dimension):
+            if i != j:
+                off_diagonal_sum += abs(density_matrix[i, j])
+    c_max = dimension * (dimension - 1) / 2
+    return off_diagonal_sum / c_max if c_max > 0 else 0.0
+
+
+class TestL1Coherence:
+    """Closed-form coherence must reproduce the density-matrix definition"""
+
+    @pytest.mark.parametrize("dimension", [1, 2, 8, 64])
+    def test_matches_reference(self, dimension):
+        rng = np.random.default_rng(dimension)
+        state = _random_state(dimension, rng)
+        assert l1_coherence(state) == pytest.approx(_reference_l1_coherence(state), rel=1e-10, abs=1e-15)
+
+    def test_batch_matches_single_states(self):
+        rng = np.random.default_rng(7)
+        batch = np.stack([_random_state(32, rng) for _ in range(5)])
+        expected = [_reference_l1_coherence(state) for state in batch]
+        np.testing.assert_allclose(l1_coherence(batch), expected, rtol=1e-10)
+
+    def test_basis_state_has_no_coherence(self):
+        state = np.zeros(16, dtype=complex)
+        state[3] = 1.0
+        assert l1_coherence(state) == 0.0
+
+    def test_engine_uses_closed_form(self, engine):
+        vqbit = engine.create_molecular_vqbit("CCO")
+        assert vqbit.coherence == pytest.approx(float(l1_coherence(vqbit.amplitudes)))
+        batch = engine.calculate_l1_coherence_batch(vqbit.amplitudes)
+        assert batch.shape == (1,)
+
+
+class TestTimeEvolution:
+    """Propagation paths must agree with scipy.linalg.expm"""
+
+    def setup_method(self):
+        self.rng = np.random.default_rng(11)
+
+    def _hermitian(self, dimension):
+        matrix = self.rng.standard_normal((dimension, dimension)) + 1j * self.rng.standard_normal((dimension, dimension))
+        return (matrix + matrix.conj().T) / 2
+
+    def test_dense_propagator_is_cached(self, engine):
+        import scipy.linalg
+
+        hamiltonian = self._hermitian(12)
+        state = _random_state(12, self.rng)
+        expected = scipy.linalg.expm(-1j * hamiltonian * 0.05) @ state
+
+        engine._propagator_cache.clear()
+        np.testing.assert_allclose(engine.apply_time_evolution(hamiltonian, state, 0.05), expected, atol=1e-12)
+        assert len(engine._propagator_cache) == 1
+        np.testing.assert_allclose(engine.apply_time_evolution(hamiltonian.copy(), state, 0.05), expected, atol=1e-12)
+        assert len(engine._propagator_cache) == 1
+
+    def test_expm_multiply_path_for_large_hamiltonians(self, engine):
+        import scipy.linalg
+        import scipy.sparse
+
+        hamiltonian = scipy.sparse.random(40, 40, density=0.1, random_state=3, format='csr')
+        hamiltonian = (hamiltonian + hamiltonian.T) * 0.5
+        state = _random_state(40, self.rng)
+        expected = scipy.linalg.expm(-1j * hamiltonian.toarray() * 0.1) @ state
+
+        previous_limit = engine.dense_propagator_max_dimension
+        engine.dense_propagator_max_dimension = 10
+        try:
+            engine._propagator_cache.clear()
+            evolved = engine.apply_time_evolution(hamiltonian, state, 0.1)
+            assert len(engine._propagator_cache) == 0
+        finally:
+            engine.dense_propagator_max_dimension = previous_limit
+        np.testing.assert_allclose(evolved, expected, atol=1e-10)
+
+    def test_evolve_vqbit_state_is_unitary(self, engine):
+        vqbit = engine.create_molecular_vqbit("CCO")
+        evolved = engine.evolve_vqbit_state(vqbit, time_step=0.01)
+
+        total_hamiltonian = engine._build_total_hamiltonian(vqbit.property_scores)
+        assert isinstance(total_hamiltonian, DiagonalOperator)
+        expected = np.exp(-1j * total_hamiltonian.eigenvalues * 0.01) * vqbit.amplitudes
+        np.testing.assert_allclose(evolved.amplitudes, expected, atol=1e-12)
+        assert np.linalg.norm(evolved.amplitudes) == pytest.approx(1.0)
+        assert evolved.reaction_coordinate == pytest.approx(0.01)
+
+    def test_optimize_molecular_properties_runs(self, engine):
+        result = engine.optimize_molecular_properties({'bioactivity': 0.8}, "CCO", iterations=5)
+        assert result['total_iterations'] == 5
+        assert len(result['optimization_history']) == 5
+
+
+class TestBatchScoring:
+    """Batched (K, N) scoring must match per-molecule scoring"""
+
+    def test_batch_expectations_match_single_states(self, engine):
+        batch = engine.create_molecular_vqbit_batch(["CCO", "c1ccccc1", "CC(=O)O"])
+        assert batch.amplitudes.shape == (3, engine.hilbert_dimension)
+        np.testing.assert_allclose(np.linalg.norm(batch.amplitudes, axis=1), 1.0)
+
+        for row in range(len(batch)):
+            single = engine._calculate_property_projections(batch.amplitudes[row])
+            for prop_type, value in single.items():
+                assert batch.property_scores[prop_type][row] == pytest.approx(value, rel=1e-12)
+            assert batch.coherence[row] == pytest.approx(engine._calculate_l1_coherence(batch.amplitudes[row]))
+
+    def test_columnar_measurements(self, engine):
+        batch = engine.create_molecular_vqbit_batch(["CCO", "CCN"])
+        columns = engine.measure_properties_batch(batch)
+        assert columns['identifier'] == ["CCO", "CCN"]
+        for prop_type in ChemistryPropertyType:
+            assert columns[prop_type.value].shape == (2,)
+
+        raw_columns = engine.measure_properties_batch(batch.amplitudes)
+        np.testing.assert_allclose(raw_columns['coherence'], columns['coherence'])
+
+    def test_batch_row_materializes_state(self, engine):
+        batch = engine.create_molecular_vqbit_batch(["CCO"])
+        state = batch.state(0)
+        assert engine.measure_property(state, ChemistryPropertyType.BIOACTIVITY) == pytest.approx(
+            float(batch.property_scores[ChemistryPropertyType.BIOACTIVITY][0])
+        )
+
+
+class TestOperatorSpectra:
+    """Seeded spectra are reproducible and shared through a memory-mapped bundle"""
+
+    def test_bundle_is_persisted_and_memory_mapped(self, engine, spectra_dir):
+        path = spectra_bundle_path(engine.hilbert_dimension, engine.spectra_seed, spectra_dir)
+        assert os.path.exists(path)
+        assert isinstance(engine._get_operator_spectra(), np.memmap)
+        assert not engine.property_operators[ChemistryPropertyType.BIOACTIVITY].eigenvalues.flags.writeable
+
+    def test_engines_share_identical_spectra(self, engine, spectra_dir):
+        other = ChemistryVQbitEngine(use_gpu=False, spectra_dir=spectra_dir)
+        for prop_type in ChemistryPropertyType:
+            np.testing.assert_array_equal(
+                other.property_operators[prop_type].eigenvalues,
+                engine.property_operators[prop_type].eigenvalues,
+            )
+        np.testing.assert_array_equal(other.molecular_hamiltonian.eigenvalues, engine.molecular_hamiltonian.eigenvalues)
+
+    def test_persisted_and_in_memory_spectra_match(self, engine):
+        in_memory = ChemistryVQbitEngine(use_gpu=False, spectra_seed=engine.spectra_seed, persist_spectra=False)
+        np.testing.assert_array_equal(
+            in_memory.kinetic_operator.eigenvalues, engine.kinetic_operator.eigenvalues
+        )
+
+    def test_seed_controls_spectra(self):
+        np.testing.assert_array_equal(generate_operator_spectra(32, 5), generate_operator_spectra(32, 5))
+        assert not np.array_equal(generate_operator_spectra(32, 5), generate_operator_spectra(32, 6))
+
+
+class TestLazyConstruction:
+    """Engine construction defers operators, GPU probing and self-checks"""
+
+    def test_import_does_not_load_scipy_or_torch(self):
+        import subprocess
+
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys; import core.chemistry_vqbit_engine; "
+            "print(any(m in sys.modules for m in ('scipy', 'torch')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+    def test_operators_built_on_first_use(self, spectra_dir):
+        lazy_engine = ChemistryVQbitEngine(use_gpu=False, spectra_dir=spectra_dir, diagnostics=False)
+        assert lazy_engine._property_operators is None
+        assert lazy_engine._molecular_hamiltonian is None
+        assert lazy_engine._operator_spectra is None
+
+        lazy_engine.measure_property(lazy_engine.create_molecular_vqbit("CCO"), ChemistryPropertyType.EFFICIENCY)
+        assert lazy_engine._property_operators is not None
+        assert lazy_engine._molecular_hamiltonian is None
+
+    def test_diagnostics_mode_builds_everything(self, spectra_dir):
+        checked_engine = ChemistryVQbitEngine(use_gpu=False, spectra_dir=spectra_dir, diagnostics=True)
+        assert checked_engine._property_operators is not None
+        assert checked_engine._molecular_hamiltonian is not None
+        assert checked_engine._identity_operator is not None
+
+
+class TestQuantumOpsExtension:
+    """Compiled kernels must agree with the NumPy fallback (skipped when not built)"""
+
+    def setup_method(self):
+        self.quantum_ops = pytest.importorskip("quantum_ops")
+        self.rng = np.random.default_rng(99)
+        self.states = self.rng.standard_normal((6, 128)) + 1j * self.rng.standard_normal((6, 128))
+        self.eigenvalues = self.rng.uniform(0, 1, (4, 128))
+
+    def test_diagonal_expectations(self):
+        expected = (np.abs(self.states) ** 2) @ self.eigenvalues.T
+        np.testing.assert_allclose(self.quantum_ops.diagonal_expectation_batch(self.states, self.eigenvalues), expected)
+        assert self.quantum_ops.diagonal_expectation(self.states[0], self.eigenvalues[0]) == pytest.approx(expected[0, 0])
+
+    def test_fidelity(self):
+        reference = self.states[2]
+        expected = np.abs(self.states.conj() @ reference) ** 2
+        np.testing.assert_allclose(self.quantum_ops.quantum_fidelity_batch(self.states, reference), expected)
+        assert self.quantum_ops.quantum_fidelity(self.states[0], reference) == pytest.approx(expected[0])
+
+    def test_normalize_in_place(self):
+        states = self.states.copy()
+        norms = self.quantum_ops.normalize_states_batch(states)
+        np.testing.assert_allclose(norms, np.linalg.norm(self.states, axis=1))
+        np.testing.assert_allclose(np.linalg.norm(states, axis=1), 1.0)
+
+        with pytest.raises(TypeError):
+            self.quantum_ops.normalize_state(self.states[0].real.copy())
+
+    def test_engine_batch_path_matches_numpy(self, engine):
+        batch = engine.create_molecular_vqbit_batch(["CCO", "CCC"])
+        _, eigenvalue_matrix = engine.get_property_eigenvalue_matrix()
+        expected = (np.abs(batch.amplitudes) ** 2) @ eigenvalue_matrix.T
+        for idx, values in enumerate(batch.property_scores.values()):
+            np.testing.assert_allclose(values, expected[:, idx])
@@ -0,0 +1,221 @@
+"""
+Test Suite for the Embedded Graph Backend
+
+Runs the AKG client and the discovery engine on the embedded SQLite store,
+so the pipelines are exercised without any database server:
+1. AKG claims, evidence, collapses and verdicts round-trip through the store
+2. Streamlit exports page through embedded discoveries like the Neo4j path
+3. Discovery writes keep running aggregates consistent with a full recompute
+4. High-quality and cleanup queries work on the indexed tables
+5. Tables snapshot to Parquet for columnar analytics
+6. The quantum monitor dashboard renders on the embedded engine
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embedded_discovery_engine import EmbeddedDiscoveryEngine
+from embedded_graph_store import EmbeddedAKGStore
+from neo4j_discovery_engine import open_discovery_engine
+
+
+def _discovery(sequence, n_residues, validation_score=0.91):
+    return {
+        'sequence': sequence,
+        'validation_score': validation_score,
+        'assessment': 'VALID',
+        'metal_analysis': {'vqbit_score': 0.7, 'energy_kcal_mol': -385.2, 'virtue_scores': {'justice': 0.25}},
+        'quantum_analysis': {'coherence': 0.78},
+        'vqbit_states': [
+            {
+                'residue_index': i,
+                'amino_acid': sequence[i % len(sequence)],
+                'phi': -60.0,
+                'psi': -45.0,
+                'entanglement': 0.8,
+                'coherence': 0.9,
+                'collapsed': i % 5 == 0,
+                'virtue_projections': {'oncology': {'strength': 0.3, 'phase': 0.5}},
+                'entanglement_with_prev': 0.9 if i % 2 else 0.3
+            }
+            for i in range(n_residues)
+        ]
+    }
+
+
+SEQUENCE = 'YEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIAC'
+
+
+@pytest.fixture
+def engine(tmp_path):
+    discovery_engine = EmbeddedDiscoveryEngine(str(tmp_path / "graph.sqlite"), similarity_index_path=None)
+    yield discovery_engine
+    discovery_engine.close()
+
+
+@pytest.fixture
+def akg(tmp_path):
+    pytest.importorskip("requests")
+    from akg.client import AKG
+
+    client = AKG({'backend': 'embedded', 'embedded_path': str(tmp_path / "akg.sqlite"),
+                  'graphdb': {'uri': 'http://localhost:1', 'repository': 'unused'},
+                  'fuseki': {'uri': 'http://localhost:1', 'dataset': 'unused'}})
+    yield client
+    client.close()
+
+
+class TestEmbeddedAKG:
+    """The AKG API is served from the embedded store without Neo4j"""
+
+    def test_claim_lifecycle(self, akg):
+        assert akg.neo4j_driver is None and akg.neo4j_health()
+
+        claim_id = akg.store_claim({'objective': 'Find a catalyst', 'campaign': 'green',
+                                    'virtue_weighting': {'honesty': 0.5}})
+        akg.store_claim({'objective': 'Other', 'campaign': 'blue'})
+        akg.store_evidence(claim_id, {'metrics': {'yield': 0.8}, 'agent_type': 'physicist'})
+        akg.store_evidence('missing-claim', {'metrics': {}})
+
+        claims = akg.get_claims(campaign='green')
+        assert [claim['id'] for claim in claims] == [claim_id]
+        assert claims[0]['virtue_weighting'] == {'honesty': 0.5}
+        assert len(akg.get_claims(status='active')) == 2
+        assert akg.store.query("SELECT count(*) as n FROM evidence")[0]['n'] == 1
+
+        assert akg.collapse_claim(claim_id, 'truth', [0.9, 0.8], {'yield': 0.8})
+        assert akg.get_claims(status='truth')[0]['id'] == claim_id
+
+    def test_verdict_statistics(self, akg):
+        for status in ('truth', 'truth', 'refuted'):
+            akg.record_discovery_verdict({'status': status, 'reasoning': status})
+
+        stats = akg.query_discovery_statistics()
+        assert stats['total_discoveries'] == 3
+        assert stats['truth_collapsed'] == 2 and stats['refuted_claims'] == 1
+        assert len(stats['recent_discoveries']) == 2
+
+    def test_streaming_export_pages(self, akg, tmp_path):
+        for n in range(5):
+            claim_id = akg.store_claim({'objective': f'claim {n}'})
+            akg.store_evidence(claim_id, {'metrics': {'n': n}})
+            akg.collapse_claim(claim_id, 'truth', [0.5], {})
+
+        output = tmp_path / "discoveries.ndjson"
+        summary = akg.export_for_streamlit(str(output), format="ndjson", incremental=True, page_size=2)
+        assert summary['pages'] == 3 and summary['exported_discoveries'] == 5
+
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert all(len(record['evidence']) == 1 for record in records)
+        # First export runs newest first; the watermark is the newest discovery
+        assert records[0]['discovery']['id'] == summary['watermark']['id']
+
+        akg.collapse_claim(akg.store_claim({'objective': 'late'}), 'refuted', [], {})
+        summary = akg.export_for_streamlit(str(output), format="ndjson", incremental=True, page_size=2)
+        assert summary['exported_discoveries'] == 1 and summary['total_discoveries'] == 6
+
+
+class TestEmbeddedDiscoveryEngine:
+    """Discovery writes and statistics match the Neo4j engine's contract"""
+
+    def test_running_aggregates_match_recompute(self, engine):
+        ids = engine.store_discoveries([_discovery(SEQUENCE, 10), _discovery(SEQUENCE, 10, 0.75)])
+        engine.store_discovery(_discovery(SEQUENCE[::-1] + 'X', 4))
+        assert len(set(ids)) == 2
+
+        stats = engine.get_discovery_statistics()
+        assert stats['total_discoveries'] == 3 and stats['unique_sequences'] == 2
+        assert stats['quality_distribution'] == {'excellent': 2, 'good': 0, 'fair': 1, 'poor': 0}
+        assert stats['session']['discoveries'] == 3
+
+        incremental = engine._get_aggregates()
+        recomputed = engine.refresh_statistics()
+        for key, value in incremental.items():
+            assert recomputed[key] == pytest.approx(value), key
+
+        quantum = engine.get_quantum_analysis()
+        assert quantum['vqbit_statistics']['total_vqbits'] == 24
+        assert quantum['entanglement_network']['max_strength'] == 0.9
+        assert quantum['virtue_projections']['oncology']['count'] == 19
+        assert quantum['high_entanglement_discoveries'][0]['avg_entanglement'] == pytest.approx(0.8)
+
+    def test_skip_existing_and_similarity(self, engine):
+        discoveries = [dict(_discovery(SEQUENCE, 2), discovery_id=f'file-{n}') for n in range(3)]
+        engine.store_discoveries(discoveries[:1])
+        assert engine.store_discoveries(discoveries, skip_existing=True) == ['file-0', 'file-1', 'file-2']
+        assert engine.store.query("SELECT count(*) as n FROM discoveries")[0]['n'] == 3
+
+        # Identical sequences are linked once per pair
+        assert engine.store.query("SELECT count(*) as n FROM similar_to")[0]['n'] == 3
+        nodes = engine.get_comprehensive_graph_analysis()['node_statistics']
+        assert nodes['Discovery'] == 3 and nodes['Sequence'] == 1
+
+    def test_queries_and_cleanup(self, engine):
+        engine.store_discoveries([_discovery(SEQUENCE, 3, 0.95), _discovery(SEQUENCE, 3, 0.5)])
+        high_quality = engine.get_high_quality_discoveries(min_quality=0.9)
+        assert len(high_quality) == 1 and high_quality[0]['quality'] == 0.95
+        assert engine.get_learning_patterns()['virtue_patterns']['justice']['count'] == 2
+
+        old = (datetime.now() - timedelta(days=30)).isoformat(timespec='microseconds')
+        with engine.store.transaction() as conn:
+            conn.execute("UPDATE discoveries SET timestamp = ? WHERE validation_score < 0.9", (old,))
+
+        assert engine.cleanup_old_discoveries(days_old=7) == 1
+        assert engine.get_discovery_statistics()['total_discoveries'] == 1
+        assert engine.get_quantum_analysis()['vqbit_statistics']['total_vqbits'] == 3
+
+    def test_traversal_analytics_need_neo4j(self, engine):
+        with pytest.raises(NotImplementedError):
+            engine.find_breakthrough_discoveries()
+
+    def test_quantum_dashboard_on_embedded_engine(self, engine, tmp_path, monkeypatch, capsys):
+        pytest.importorskip("psutil")
+        from m4_neo4j_quantum_monitor import M4Neo4jQuantumMonitor
+
+        engine.store_discoveries([_discovery(SEQUENCE, 10), _discovery(SEQUENCE, 6, 0.75)])
+        monkeypatch.setenv("FOTCHEM_GRAPH_BACKEND", "embedded")
+        monkeypatch.setenv("FOTCHEM_EMBEDDED_GRAPH", str(tmp_path / "graph.sqlite"))
+        monitor = M4Neo4jQuantumMonitor(update_interval=5)
+        try:
+            monitor.display_quantum_dashboard()
+        finally:
+            monitor.neo4j_engine.close()
+
+        output = capsys.readouterr().out
+        assert "❌" not in output
+        assert "Total Discoveries: 2" in output
+        assert "Needs the Neo4j backend: Quantum Patterns, Protein Families" in output
+        assert "SYSTEM RESOURCES" in output
+
+    def test_factory_selects_backend(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FOTCHEM_GRAPH_BACKEND", "embedded")
+        monkeypatch.setenv("FOTCHEM_EMBEDDED_GRAPH", str(tmp_path / "env.sqlite"))
+        discovery_engine = open_discovery_engine(similarity_index_path=None, uri="bolt://unused:7687")
+        assert isinstance(discovery_engine, EmbeddedDiscoveryEngine)
+        assert discovery_engine.store.path == str(tmp_path / "env.sqlite")
+        discovery_engine.close()
+
+        with pytest.raises(ValueError):
+            open_discovery_engine('mongodb')
+
+
+class TestColumnarExport:
+    def test_tables_snapshot_to_parquet(self, engine, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        engine.store_discoveries([_discovery(SEQUENCE, 5) for _ in range(3)])
+
+        exported = engine.store.export_columnar(str(tmp_path / "parquet"), ['discoveries', 'vqbits', 'entanglements'],
+                                                batch_rows=4)
+        assert pq.read_table(exported['discoveries']).num_rows == 3
+        vqbits = pq.read_table(exported['vqbits'])
+        assert vqbits.num_rows == 15 and 'amino_acid' in vqbits.column_names
+
+        store = EmbeddedAKGStore(str(tmp_path / "empty.sqlite"))
+        assert pq.read_table(store.export_columnar(str(tmp_path / "empty"), ['claims'])['claims']).num_rows == 0
+        store.close()
@@ -0,0 +1,90 @@
+"""
+Test Suite for the Physicist Measurement Queue
+
+Runs MeasureQueue with real worker processes:
+1. Tasks fan out over the pool and every task gets exactly one result
+2. Results arrive as tasks complete, not in submission order
+3. Failures and per-task timeouts are reported without stalling the batch
+4. The deadline and cancel() stop running and pending measurements
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.physicist.measure import MeasureQueue
+
+
+def sleepy_measurement(task):
+    time.sleep(task['candidate'].get('seconds', 0))
+    if task['candidate'].get('fail'):
+        raise RuntimeError("oracle crashed")
+    return {'metrics': {'pid': os.getpid()}, 'uncertainty': 0.1}
+
+
+def _tasks(*candidates):
+    return [{'id': f"t{n}", 'claim': {'id': f"c{n}"}, 'candidate': candidate}
+            for n, candidate in enumerate(candidates)]
+
+
+class TestMeasureQueue:
+    """Process-pool execution with per-task timeouts and cancellation"""
+
+    def test_simulated_measurements_fan_out(self):
+        queue = MeasureQueue(parallel=3)
+        tasks = [{'claim': {'id': n}, 'candidate': {'id': n}, 'oracles': ['adsorption_isotherm_proxy']}
+                 for n in range(6)]
+        results = queue.execute_tasks(tasks, timeout=30)
+
+        assert sorted(r['index'] for r in results) == list(range(6))
+        assert all(r['success'] and r['claim'] == tasks[r['index']]['claim'] for r in results)
+        assert all('residual_pfas_ngL' in r['measurement_result']['metrics'] for r in results)
+        # Workers are reseeded, so measurements differ between tasks
+        assert len({r['measurement_result']['uncertainty'] for r in results}) == 6
+
+    def test_results_stream_in_completion_order(self):
+        queue = MeasureQueue(parallel=2, measure_fn=sleepy_measurement)
+        started = time.time()
+        results = queue.execute_tasks(_tasks({'seconds': 0.8}, {'seconds': 0.1}, {'seconds': 0.1}), timeout=10)
+
+        assert [r['task_id'] for r in results] == ['t1', 't2', 't0']
+        assert len({r['measurement_result']['metrics']['pid'] for r in results}) == 3
+        assert time.time() - started < 1.5
+
+    def test_failures_and_timeouts_reported(self):
+        queue = MeasureQueue(parallel=2, measure_fn=sleepy_measurement)
+        results = queue.execute_tasks(_tasks({'fail': True}, {'seconds': 30}, {'seconds': 0}), timeout=0.5)
+        by_id = {r['task_id']: r for r in results}
+
+        assert by_id['t0']['status'] == 'failed' and 'oracle crashed' in by_id['t0']['error']
+        assert by_id['t1']['status'] == 'timeout' and not by_id['t1']['success']
+        assert by_id['t1']['elapsed_seconds'] < 5
+        assert by_id['t2']['status'] == 'success'
+
+    def test_deadline_cancels_remaining_tasks(self):
+        queue = MeasureQueue(parallel=1, measure_fn=sleepy_measurement)
+        results = queue.execute_tasks(_tasks({'seconds': 0}, {'seconds': 30}, {'seconds': 0}),
+                                      timeout=60, deadline=time.time() + 0.5)
+
+        assert [r['status'] for r in results] == ['success', 'cancelled', 'cancelled']
+
+    def test_cancel_from_another_thread(self):
+        queue = MeasureQueue(parallel=2, measure_fn=sleepy_measurement)
+        threading.Timer(0.3, queue.cancel).start()
+        started = time.time()
+        results = queue.execute_tasks(_tasks(*[{'seconds': 30}] * 3), timeout=60)
+
+        assert {r['status'] for r in results} == {'cancelled'} and len(results) == 3
+        assert time.time() - started < 5
+
+    def test_process_measurements_uses_pool(self):
+        queue = MeasureQueue(parallel=2)
+        for _ in range(3):
+            queue.add_measurement({'id': 'mof'}, ['hydrophobicity_proxy'])
+
+        results = queue.process_measurements()
+        assert len(results) == 3 and all('logP' in r['metrics'] for r in results)
+        assert all(task['status'] == 'completed' for task in queue.queue)
@@ -0,0 +1,113 @@
+"""
+Test Suite for the Parallel, Resumable Discovery Migration
+
+Runs DiscoveryMigrator over JSON fixtures written to a temporary directory,
+with an in-process engine standing in for Neo4j:
+1. Files are decoded in parallel and written in transaction-sized batches
+2. Undecodable files are counted as errors without stopping the migration
+3. An interrupted migration resumes from the checkpoint manifest
+"""
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("psutil")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_discoveries_to_neo4j import DiscoveryMigrator, MigrationCheckpoint, migration_discovery_id
+
+
+class RecordingEngine:
+    """Engine stand-in keeping the stored ids; can fail after a number of batches"""
+
+    def __init__(self, fail_after_batches: int = None):
+        self.lock = threading.Lock()
+        self.batches = []
+        self.stored_ids = set()
+        self.fail_after_batches = fail_after_batches
+
+    def store_discoveries(self, discoveries, skip_existing=False):
+        with self.lock:
+            if self.fail_after_batches is not None and len(self.batches) >= self.fail_after_batches:
+                raise ConnectionError("Neo4j unavailable")
+            ids = [d['discovery_id'] for d in discoveries]
+            new_ids = [i for i in ids if not (skip_existing and i in self.stored_ids)]
+            self.batches.append(new_ids)
+            self.stored_ids.update(new_ids)
+            return ids
+
+    def get_discovery_statistics(self):
+        return {'total_discoveries': len(self.stored_ids), 'unique_sequences': len(self.stored_ids),
+                'duplicate_rate': 0.0}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def discovery_dir(tmp_path):
+    for n in range(45):
+        with open(tmp_path / f"m4_discovery_{n:04d}.json", 'w') as f:
+            json.dump({'sequence': 'ACDEFGHIKLMNPQRSTVWY', 'validation_score': 0.8, 'n': n}, f)
+    return tmp_path
+
+
+def _migrator(discovery_dir, engine):
+    migrator = DiscoveryMigrator(str(discovery_dir), writer_sessions=3, decoder_workers=2,
+                                 transaction_size=10, max_retries=0)
+    migrator.neo4j_engine = engine
+    return migrator
+
+
+class TestParallelMigration:
+    """Decoder pool and writer sessions move every file exactly once"""
+
+    def test_migrates_all_files_in_transaction_batches(self, discovery_dir):
+        engine = RecordingEngine()
+        assert _migrator(discovery_dir, engine).migrate_all_discoveries()
+
+        expected_ids = {migration_discovery_id(path) for path in discovery_dir.glob("m4_discovery_*.json")}
+        assert engine.stored_ids == expected_ids
+        assert sum(len(batch) for batch in engine.batches) == 45
+        assert max(len(batch) for batch in engine.batches) == 10
+
+    def test_bad_files_are_counted_not_fatal(self, discovery_dir):
+        (discovery_dir / "m4_discovery_broken.json").write_text("{not json")
+        engine = RecordingEngine()
+        migrator = _migrator(discovery_dir, engine)
+        migrator.migrate_all_discoveries()
+        assert migrator.processed_count == 45 and migrator.error_count == 1
+
+
+class TestResumableMigration:
+    """The checkpoint manifest lets an interrupted migration pick up where it stopped"""
+
+    def test_resume_skips_checkpointed_files(self, discovery_dir):
+        failing = RecordingEngine(fail_after_batches=2)
+        first_run = _migrator(discovery_dir, failing)
+        first_run.migrate_all_discoveries()
+        assert first_run.processed_count == 20 and first_run.error_count == 25
+
+        checkpoint = MigrationCheckpoint(discovery_dir / ".neo4j_migration_manifest")
+        assert len(checkpoint) == 20
+
+        # Database is back: only the remaining files are decoded and written
+        engine = RecordingEngine()
+        second_run = _migrator(discovery_dir, engine)
+        second_run.migrate_all_discoveries()
+        assert second_run.skipped_count == 20 and second_run.processed_count == 25
+        assert engine.stored_ids.isdisjoint(failing.stored_ids)
+        assert len(engine.stored_ids | failing.stored_ids) == 45
+
+    def test_restart_ignores_checkpoint(self, discovery_dir):
+        _migrator(discovery_dir, RecordingEngine()).migrate_all_discoveries()
+
+        engine = RecordingEngine()
+        migrator = _migrator(discovery_dir, engine)
+        migrator.migrate_all_discoveries(restart=True)
+        assert migrator.skipped_count == 0 and len(engine.stored_ids) == 45
@@ -0,0 +1,181 @@
+"""
+Test Suite for the Shared Neo4j Connection Provider
+
+Runs Neo4jConnectionProvider against an in-process driver factory, so no
+running Neo4j instance is needed:
+1. Consumers in one process share a single driver and pool
+2. The pool closes only when the last consumer releases it
+3. Read helpers route to read sessions and return plain dicts
+4. Managed transaction retries and acquisition latency are metered
+5. Configuration comes from NEO4J_* variables unless overridden
+"""
+
+import os
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import neo4j_connection
+import neo4j_discovery_engine
+from neo4j_connection import Neo4jConfig, Neo4jConnectionProvider, READ_ACCESS, get_neo4j_provider
+from neo4j_discovery_engine import Neo4jDiscoveryEngine
+
+
+class FakeRecord(dict):
+    def data(self) -> Dict[str, Any]:
+        return dict(self)
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver", kwargs: Dict[str, Any]):
+        self.driver = driver
+        self.kwargs = kwargs
+
+    def run(self, query: str, parameters: Dict[str, Any] = None, **kwargs) -> List[FakeRecord]:
+        self.driver.queries.append(query)
+        return [FakeRecord(n=1)] if 'RETURN 1' in query else []
+
+    def execute_read(self, work, *args, **kwargs):
+        return self._retrying(work, *args, **kwargs)
+
+    def execute_write(self, work, *args, **kwargs):
+        return self._retrying(work, *args, **kwargs)
+
+    def _retrying(self, work, *args, **kwargs):
+        # Mirrors the driver: transient failures re-run the unit of work
+        while True:
+            try:
+                return work(self, *args, **kwargs)
+            except TimeoutError:
+                continue
+
+    def close(self):
+        self.driver.closed_sessions += 1
+
+
+class FakeDriver:
+    def __init__(self, uri: str, **config):
+        self.uri = uri
+        self.config = config
+        self.queries = []
+        self.sessions = []
+        self.closed_sessions = 0
+        self.closed = False
+
+    def session(self, **kwargs) -> FakeSession:
+        session = FakeSession(self, kwargs)
+        self.sessions.append(session)
+        return session
+
+    def close(self):
+        self.closed = True
+
+
+class FakeGraphDatabase:
+    drivers = []
+
+    @classmethod
+    def driver(cls, uri: str, **config) -> FakeDriver:
+        driver = FakeDriver(uri, **config)
+        cls.drivers.append(driver)
+        return driver
+
+
+@pytest.fixture
+def graph_database(monkeypatch):
+    FakeGraphDatabase.drivers = []
+    monkeypatch.setattr(neo4j_connection, 'GraphDatabase', FakeGraphDatabase, raising=False)
+    monkeypatch.setattr(neo4j_connection, 'NEO4J_AVAILABLE', True)
+    monkeypatch.setattr(neo4j_discovery_engine, 'NEO4J_AVAILABLE', True)
+    monkeypatch.setattr(neo4j_connection, '_providers', {})
+    return FakeGraphDatabase
+
+
+@pytest.fixture
+def provider(graph_database):
+    pool = Neo4jConnectionProvider(Neo4jConfig(uri="bolt://pool-test:7687"))
+    yield pool
+    pool.close()
+
+
+class TestSharedPool:
+    """One driver per database per process, released by reference"""
+
+    def test_consumers_share_one_driver(self, graph_database):
+        config = Neo4jConfig(uri="bolt://shared:7687", max_connection_pool_size=8)
+        first = get_neo4j_provider(config)
+        second = get_neo4j_provider(Neo4jConfig(uri="bolt://shared:7687"))
+        other = get_neo4j_provider(Neo4jConfig(uri="bolt://other:7687"))
+
+        assert first is second and first is not other
+        assert len(graph_database.drivers) == 2
+        assert graph_database.drivers[0].config['max_connection_pool_size'] == 8
+
+        first.close()
+        assert not first.driver.closed
+        second.close()
+        assert first.driver.closed
+        other.close()
+
+        # Released providers are not handed out again
+        assert get_neo4j_provider(config) is not first
+
+    def test_discovery_engines_share_the_pool(self, graph_database):
+        engines = [Neo4jDiscoveryEngine(uri="bolt://engine:7687", similarity_index_path=None) for _ in range(2)]
+        assert len(graph_database.drivers) == 1
+        assert engines[0].driver is engines[1].driver
+
+        engines[0].close()
+        assert not graph_database.drivers[0].closed
+        engines[1].close()
+        assert graph_database.drivers[0].closed
+
+
+class TestRoutingAndTransactions:
+    """Managed helpers route reads, retry transient failures and record latency"""
+
+    def test_read_routes_to_read_session(self, provider):
+        assert provider.read("RETURN 1 as n") == [{'n': 1}]
+        assert provider.driver.sessions[-1].kwargs['default_access_mode'] == READ_ACCESS
+
+        metrics = provider.get_metrics()
+        assert metrics['read_sessions'] == 1 and metrics['write_sessions'] == 0
+        assert metrics['active_sessions'] == 0 and metrics['transactions'] == 1
+
+    def test_write_retries_are_counted(self, provider):
+        attempts = []
+
+        def work(tx, value):
+            attempts.append(value)
+            if len(attempts) < 3:
+                raise TimeoutError("leader switch")
+            return value * 2
+
+        assert provider.execute_write(work, 21) == 42
+        metrics = provider.get_metrics()
+        assert metrics['transactions'] == 1 and metrics['retries'] == 2
+        assert metrics['max_acquisition_time'] >= metrics['avg_acquisition_time'] >= 0.0
+
+    def test_database_applied_to_sessions(self, graph_database):
+        pool = Neo4jConnectionProvider(Neo4jConfig(uri="bolt://db-test:7687", database="fotchem"))
+        with pool.session() as session:
+            session.run("RETURN 1 as n")
+        assert pool.driver.sessions[0].kwargs['database'] == "fotchem"
+        assert pool.get_metrics()['peak_active_sessions'] == 1
+        pool.close()
+
+
+class TestConfiguration:
+    def test_environment_then_overrides(self, monkeypatch):
+        monkeypatch.setenv("NEO4J_URI", "neo4j://cluster:7687")
+        monkeypatch.setenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "120")
+        monkeypatch.setenv("NEO4J_DATABASE", "fotchem")
+
+        config = Neo4jConfig.from_env(user="analyst", password=None)
+        assert config.uri == "neo4j://cluster:7687"
+        assert config.max_connection_pool_size == 120
+        assert config.database == "fotchem"
+        assert config.user == "analyst" and config.password == "fotquantum"
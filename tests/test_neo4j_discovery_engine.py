@@ -0,0 +1,360 @@
+"""
+Test Suite for the Neo4j Discovery Engine Write Path
+
+Runs Neo4jDiscoveryEngine against a recording driver that captures every
+statement sent to the database, so round trips can be counted without a
+running Neo4j instance:
+1. store_discovery writes each residue exactly once
+2. Round trips per discovery are constant in the number of residues
+3. store_discoveries batches many discoveries into one transaction
+4. Caller-supplied ids are honoured and existing ones skipped on request
+5. Statistics are maintained in the write transaction and read from a TTL cache,
+   as are the dashboard's graph-scan analyses
+6. Schema bootstrap runs only when the graph's schema version is out of date
+7. A similarity index file that lags the graph is backfilled on load
+"""
+
+import os
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neo4j_discovery_engine import Neo4jDiscoveryEngine, SCHEMA_VERSION
+from sequence_similarity_index import SequenceLSHIndex
+
+
+class RecordingTransaction:
+    """Explicit transaction stand-in that records every statement"""
+
+    def __init__(self, driver: "RecordingDriver"):
+        self.driver = driver
+        self.committed = False
+
+    def run(self, query: str, parameters: Dict[str, Any] = None, **kwargs) -> List[Dict[str, Any]]:
+        self.driver.statements.append((query, parameters or kwargs))
+        return self.driver.respond(query, parameters or kwargs)
+
+    def commit(self):
+        self.committed = True
+        self.driver.commits += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class RecordingSession(RecordingTransaction):
+    """Session stand-in: auto-commit run() plus begin_transaction()"""
+
+    def begin_transaction(self) -> RecordingTransaction:
+        self.driver.transactions += 1
+        return RecordingTransaction(self.driver)
+
+    def close(self):
+        pass
+
+
+class RecordingDriver:
+    """Driver stand-in counting round trips (statements) and transactions"""
+
+    def __init__(self):
+        self.statements = []
+        self.transactions = 0
+        self.commits = 0
+        self.existing_ids = set()
+        self.stats = None
+        self.schema_version = None
+        self.sequences = {}
+
+    def session(self, **kwargs) -> RecordingSession:
+        return RecordingSession(self)
+
+    def respond(self, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if 'RETURN id' in query and 'ids' in parameters:
+            return [{'id': discovery_id} for discovery_id in parameters['ids'] if discovery_id in self.existing_ids]
+        if 'RETURN v.version' in query:
+            return [{'version': self.schema_version}] if self.schema_version is not None else []
+        if 'properties(st)' in query:
+            return [{'stats': self.stats}] if self.stats is not None else []
+        if 'count(d) as sequenced' in query:
+            return [{'sequenced': len(self.sequences)}]
+        if 'd.id as discovery_id, s.value as sequence' in query:
+            ids = sorted(i for i in self.sequences if i > parameters['last_id'])[:parameters['page_size']]
+            return [{'discovery_id': i, 'sequence': self.sequences[i]} for i in ids]
+        return []
+
+    def reset(self):
+        self.statements.clear()
+        self.transactions = 0
+        self.commits = 0
+
+    def statements_containing(self, fragment: str) -> List[Dict[str, Any]]:
+        return [parameters for query, parameters in self.statements if fragment in query]
+
+    def close(self):
+        pass
+
+
+def _discovery(sequence: str, n_residues: int) -> Dict[str, Any]:
+    return {
+        'sequence': sequence,
+        'validation_score': 0.91,
+        'assessment': 'VALID',
+        'metal_analysis': {
+            'vqbit_score': 0.7,
+            'energy_kcal_mol': -385.2,
+            'virtue_scores': {'justice': 0.25, 'honesty': 0.4}
+        },
+        'quantum_analysis': {'coherence': 0.78},
+        'vqbit_states': [
+            {
+                'residue_index': i,
+                'amino_acid': sequence[i % len(sequence)],
+                'phi': -60.0,
+                'psi': -45.0,
+                'amplitude_real': 0.707,
+                'amplitude_imag': 0.707,
+                'coherence': 0.9,
+                'collapsed': i % 5 == 0,
+                'virtue_projections': {'justice': {'strength': 0.3, 'phase': 0.5}},
+                'entanglement_with_prev': 0.9 if i % 2 else 0.3
+            }
+            for i in range(n_residues)
+        ]
+    }
+
+
+SEQUENCE = 'YEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIAC' * 2
+
+
+@pytest.fixture
+def driver():
+    return RecordingDriver()
+
+
+@pytest.fixture
+def engine(driver):
+    discovery_engine = Neo4jDiscoveryEngine(driver=driver, similarity_index_path=None)
+    driver.reset()
+    return discovery_engine
+
+
+class TestBulkDiscoveryWrites:
+    """The write path must be O(1) round trips per batch, with each residue written once"""
+
+    def test_residues_written_once(self, engine, driver):
+        engine.store_discovery(_discovery(SEQUENCE, 30))
+
+        vqbit_statements = driver.statements_containing('CREATE (v:VQbit')
+        assert len(vqbit_statements) == 1
+        assert len(vqbit_statements[0]['rows']) == 30
+        assert len({row['vqbit_id'] for row in vqbit_statements[0]['rows']}) == 30
+
+        entanglements = driver.statements_containing('QUANTUM_ENTANGLED')[0]['rows']
+        assert len(entanglements) == 29
+        assert [row['maintains_coherence'] for row in entanglements[:2]] == [True, False]
+        assert driver.transactions == 1 and driver.commits == 1
+
+    def test_round_trips_independent_of_residue_count(self, engine, driver):
+        # Index a neighbor first so every measured write includes the SIMILAR_TO statement
+        engine.store_discovery(_discovery(SEQUENCE, 5))
+        driver.reset()
+        engine.store_discovery(_discovery(SEQUENCE, 5))
+        short_round_trips = len(driver.statements)
+
+        driver.reset()
+        engine.store_discovery(_discovery(SEQUENCE, 500))
+        assert len(driver.statements) == short_round_trips
+        assert short_round_trips <= 10
+
+    def test_many_discoveries_in_one_transaction(self, engine, driver):
+        engine.store_discovery(_discovery(SEQUENCE, 10))
+        driver.reset()
+        engine.store_discovery(_discovery(SEQUENCE, 10))
+        single_round_trips = len(driver.statements)
+
+        driver.reset()
+        discovery_ids = engine.store_discoveries([_discovery(SEQUENCE, 10) for _ in range(25)])
+        assert len(discovery_ids) == len(set(discovery_ids)) == 25
+        assert len(driver.statements) == single_round_trips
+        assert driver.transactions == 1
+
+        discovery_rows = driver.statements_containing('CREATE (d:Discovery')[0]['rows']
+        assert [row['discovery_id'] for row in discovery_rows] == discovery_ids
+        assert len(driver.statements_containing('CREATE (v:VQbit')[0]['rows']) == 250
+
+    def test_similarity_links_batched(self, engine, driver):
+        engine.similarity_index.add_sequences(['other-1', 'other-2'], [SEQUENCE, 'W' * len(SEQUENCE)])
+        discovery_ids = engine.store_discoveries([_discovery(SEQUENCE, 3), _discovery(SEQUENCE, 3)])
+
+        similar = driver.statements_containing('MERGE (d1)-[r:SIMILAR_TO]-(d2)')
+        assert len(similar) == 1
+        assert {(row['discovery_id'], row['other_discovery_id']) for row in similar[0]['rows']} == {
+            (discovery_ids[0], 'other-1'), (discovery_ids[1], 'other-1'), (discovery_ids[0], discovery_ids[1])
+        }
+
+        # Committed discoveries join the index for later inserts
+        assert len(engine.similarity_index) == 4
+
+    def test_discovery_without_vqbits_skips_residue_statements(self, engine, driver):
+        discovery = _discovery(SEQUENCE, 0)
+        engine.store_discovery(discovery)
+        # The discovery itself plus the statistics update
+        assert len(driver.statements) == 2
+        assert driver.statements_containing('CREATE (v:VQbit') == []
+
+    def test_supplied_ids_and_skip_existing(self, engine, driver):
+        discoveries = [dict(_discovery(SEQUENCE, 2), discovery_id=f'file-{n}') for n in range(3)]
+        driver.existing_ids = {'file-1'}
+
+        assert engine.store_discoveries(discoveries, skip_existing=True) == ['file-0', 'file-1', 'file-2']
+        discovery_rows = driver.statements_containing('CREATE (d:Discovery')[0]['rows']
+        assert [row['discovery_id'] for row in discovery_rows] == ['file-0', 'file-2']
+
+        # Nothing left to write: only the lookup runs, and the transaction still commits
+        driver.reset()
+        driver.existing_ids = {'file-0', 'file-1', 'file-2'}
+        assert engine.store_discoveries(discoveries, skip_existing=True) == ['file-0', 'file-1', 'file-2']
+        assert len(driver.statements) == 1 and driver.commits == 1
+
+
+class TestDiscoveryStatistics:
+    """Aggregates ride along with each write; reads hit one node and are cached"""
+
+    def test_write_updates_running_aggregates(self, engine, driver):
+        engine._virtue_target_types = {'justice': 2}
+        engine.store_discovery(_discovery(SEQUENCE, 10))
+
+        updates = driver.statements_containing('MERGE (st:DiscoveryStats')
+        assert len(updates) == 1
+        delta = updates[0]['delta']
+        assert delta['discoveries'] == 1 and delta['quality_excellent'] == 1
+        assert delta['vqbits'] == 10
+        assert sum(value for key, value in delta.items() if key.startswith('aa__') and key.endswith('__count')) == 10
+        assert delta['vqbits_collapsed'] == 2 and delta['vqbits_superposition'] == 8
+        assert delta['entanglements'] == 9
+        assert delta['entanglement_strength_max'] == 0.9 and delta['entanglement_strength_min'] == 0.3
+        # Two targets of the projected type, eight superposed residues
+        assert delta['virtue__justice__count'] == 16
+        assert [row['value'] for row in updates[0]['sequences']] == [SEQUENCE]
+
+        # The stats update is the last statement in the write transaction
+        assert 'DiscoveryStats' in driver.statements[-1][0]
+
+    def test_reads_served_from_cache_until_write(self, engine, driver):
+        driver.stats = {'discoveries': 4, 'sequences': 2, 'validation_sum': 3.2, 'validation_count': 4,
+                        'quality_good': 4, 'vqbits': 10, 'vqbits_superposition': 5,
+                        'aa__A__count': 10, 'aa__A__entanglement_sum': 5.0}
+
+        stats = engine.get_discovery_statistics()
+        assert stats['total_discoveries'] == 4 and stats['duplicate_rate'] == 50.0
+        assert stats['averages']['quality'] == pytest.approx(0.8)
+        assert stats['quality_distribution']['good'] == 4
+
+        quantum = engine.get_quantum_analysis()
+        assert quantum['vqbit_statistics']['quantum_ratio'] == 0.5
+        assert quantum['amino_acid_quantum_patterns']['A']['avg_entanglement'] == 0.5
+
+        round_trips = len(driver.statements)
+        engine.get_discovery_statistics()
+        engine.get_quantum_analysis()
+        assert len(driver.statements) == round_trips
+
+        # A committed write invalidates the cache and counts toward the session
+        engine.store_discovery(_discovery(SEQUENCE, 0))
+        driver.reset()
+        assert engine.get_discovery_statistics()['session']['discoveries'] == 1
+        assert driver.statements_containing('properties(st)')
+
+    def test_graph_scan_analyses_cached(self, engine, driver):
+        analyses = [
+            engine.find_quantum_patterns, engine.get_protein_family_analysis,
+            engine.get_therapeutic_target_analysis, engine.get_structural_analysis,
+            lambda: engine.find_high_potential_discoveries(limit=3), engine.get_solution_mapping_analysis,
+            lambda: engine.find_breakthrough_discoveries(limit=3)
+        ]
+        driver.reset()
+        first = [analysis() for analysis in analyses]
+        round_trips = len(driver.statements)
+        assert round_trips == 8  # solution mapping reads solutions and indications
+
+        assert [analysis() for analysis in analyses] == first
+        assert len(driver.statements) == round_trips
+
+        # Each argument set has its own cache entry
+        engine.find_breakthrough_discoveries(limit=10)
+        assert len(driver.statements) == round_trips + 1
+
+        engine.invalidate_statistics_cache()
+        engine.get_protein_family_analysis()
+        assert len(driver.statements) == round_trips + 2
+
+    def test_missing_stats_node_is_recomputed(self, engine, driver):
+        engine.get_discovery_statistics()
+        refresh = driver.statements_containing('SET st = $stats')
+        assert len(refresh) == 1 and refresh[0]['stats']['id'] == 'global'
+
+
+class TestSchemaBootstrap:
+    """Startup is one version lookup unless the schema needs migrating"""
+
+    def test_fresh_graph_is_bootstrapped_and_stamped(self, driver):
+        Neo4jDiscoveryEngine(driver=driver, similarity_index_path=None)
+
+        assert len(driver.statements_containing('CREATE CONSTRAINT')) > 10
+        assert len(driver.statements_containing('CREATE INDEX')) > 10
+        assert driver.statements_containing('MERGE (a:AminoAcid')
+        stamps = driver.statements_containing('MERGE (v:SchemaVersion')
+        assert len(stamps) == 1 and stamps[0]['version'] == SCHEMA_VERSION
+
+    def test_current_schema_skips_bootstrap(self, driver):
+        driver.schema_version = SCHEMA_VERSION
+        Neo4jDiscoveryEngine(driver=driver, similarity_index_path=None)
+
+        # Version check plus the virtue target lookup
+        assert len(driver.statements) == 2
+        assert driver.statements_containing('CREATE CONSTRAINT') == []
+
+    def test_older_schema_is_migrated(self, driver):
+        driver.schema_version = SCHEMA_VERSION - 1
+        Neo4jDiscoveryEngine(driver=driver, similarity_index_path=None)
+
+        stamps = driver.statements_containing('MERGE (v:SchemaVersion')
+        assert stamps[0]['previous_version'] == SCHEMA_VERSION - 1
+        assert driver.statements_containing('CREATE INDEX')
+
+
+class TestSimilarityIndexRecovery:
+    """A persisted similarity index is reconciled with the graph on load"""
+
+    def test_stale_index_is_backfilled(self, driver, tmp_path):
+        path = tmp_path / 'index.npz'
+        stale = SequenceLSHIndex(path=str(path))
+        stale.add_sequences(['d1', 'd2'], ['ACDEFGHIK', 'LMNPQRSTV'])
+        stale.save()
+
+        # d3 was committed after the last save, e.g. before a crash
+        driver.sequences = {'d1': 'ACDEFGHIK', 'd2': 'LMNPQRSTV', 'd3': 'WYACDEFGH'}
+        engine = Neo4jDiscoveryEngine(driver=driver, similarity_index_path=str(path))
+        assert engine.similarity_index.indexed_ids() == {'d1', 'd2', 'd3'}
+        assert len(engine.similarity_index) == 3
+
+        restored, _ = SequenceLSHIndex.load_or_create(str(path))
+        assert len(restored) == 3
+
+    def test_current_index_skips_backfill(self, driver, tmp_path):
+        path = tmp_path / 'index.npz'
+        current = SequenceLSHIndex(path=str(path))
+        current.add_sequences(['d1'], ['ACDEFGHIK'])
+        current.save()
+
+        driver.sequences = {'d1': 'ACDEFGHIK'}
+        engine = Neo4jDiscoveryEngine(driver=driver, similarity_index_path=str(path))
+        driver.reset()
+        assert len(engine.similarity_index) == 1
+        assert driver.statements_containing('d.id as discovery_id, s.value as sequence') == []
@@ -0,0 +1,222 @@
+"""
+Test Suite for the Neo4j Write-Behind Ingestion Queue
+
+Drives DiscoveryIngestionQueue against in-process engines that record or fail
+store_discoveries calls, so no running Neo4j instance is needed:
+1. Submitted discoveries are flushed in batches of at most batch_size
+2. The flush interval writes partial batches without an explicit flush
+3. Failed flushes are retried, then spooled to the dead-letter file
+   (or counted as lost, without stopping the writer, if the spool fails);
+   an interrupted replay puts its remainder back in the spool
+4. A full queue applies backpressure to producers, and flush/close keep their timeouts
+5. Producers do not wait on database latency
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neo4j_ingestion_queue import DiscoveryIngestionQueue
+
+
+class RecordingEngine:
+    """Engine stand-in recording each bulk write, optionally failing or stalling first"""
+
+    def __init__(self, failures: int = 0, latency: float = 0.0):
+        self.batches = []
+        self.failures = failures
+        self.latency = latency
+        self.release = threading.Event()
+        self.release.set()
+
+    def store_discoveries(self, discoveries):
+        self.release.wait()
+        time.sleep(self.latency)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Neo4j unavailable")
+        self.batches.append(list(discoveries))
+        return [f"id-{d['n']}" for d in discoveries]
+
+    @property
+    def stored(self):
+        return [d['n'] for batch in self.batches for d in batch]
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return tmp_path / "dead_letter.jsonl"
+
+
+def _queue(engine, spool, **kwargs):
+    options = dict(batch_size=10, flush_interval=5.0, max_retries=2, retry_backoff=0.0, dead_letter_path=str(spool))
+    options.update(kwargs)
+    return DiscoveryIngestionQueue(engine, **options)
+
+
+class TestWriteBehindIngestion:
+    """Discoveries reach the bulk writer in order, in bounded batches"""
+
+    def test_flushes_in_bounded_batches(self, spool):
+        engine = RecordingEngine()
+        with _queue(engine, spool) as ingestion:
+            for n in range(25):
+                ingestion.submit({'n': n})
+            assert ingestion.flush(timeout=5)
+
+            assert engine.stored == list(range(25))
+            assert all(len(batch) <= 10 for batch in engine.batches)
+            metrics = ingestion.get_metrics()
+            assert metrics['submitted'] == metrics['stored'] == 25
+            assert metrics['queue_depth'] == 0 and metrics['pending'] == 0
+            assert metrics['flushes'] == len(engine.batches)
+            assert metrics['avg_flush_latency'] >= 0.0
+
+    def test_flush_interval_writes_partial_batch(self, spool):
+        engine = RecordingEngine()
+        with _queue(engine, spool, flush_interval=0.05) as ingestion:
+            ingestion.submit({'n': 1})
+            deadline = time.monotonic() + 2.0
+            while not engine.batches and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert engine.stored == [1]
+
+    def test_close_drains_queue(self, spool):
+        engine = RecordingEngine()
+        ingestion = _queue(engine, spool)
+        ingestion.submit_many([{'n': n} for n in range(7)])
+        ingestion.close()
+        assert engine.stored == list(range(7))
+        with pytest.raises(RuntimeError):
+            ingestion.submit({'n': 8})
+
+
+class TestRetryAndDeadLetter:
+    """Transient failures are retried; persistent failures are spooled and replayable"""
+
+    def test_transient_failure_is_retried(self, spool):
+        engine = RecordingEngine(failures=2)
+        with _queue(engine, spool) as ingestion:
+            ingestion.submit_many([{'n': n} for n in range(3)])
+            ingestion.flush(timeout=5)
+            metrics = ingestion.get_metrics()
+
+        assert engine.stored == [0, 1, 2]
+        assert metrics['retries'] == 2 and metrics['dead_lettered'] == 0
+        assert not spool.exists()
+
+    def test_exhausted_retries_spool_then_replay(self, spool):
+        engine = RecordingEngine(failures=3)
+        with _queue(engine, spool) as ingestion:
+            ingestion.submit_many([{'n': n} for n in range(4)])
+            ingestion.flush(timeout=5)
+            assert ingestion.get_metrics()['dead_lettered'] == 4
+            assert engine.stored == []
+
+            records = [json.loads(line) for line in spool.read_text().splitlines()]
+            assert [record['discovery']['n'] for record in records] == [0, 1, 2, 3]
+            assert 'Neo4j unavailable' in records[0]['error']
+
+            # Database is back: replay the spool
+            assert ingestion.replay_dead_letters() == 4
+            ingestion.flush(timeout=5)
+
+        assert engine.stored == [0, 1, 2, 3]
+        assert not spool.exists()
+
+    def test_unwritable_spool_keeps_writer_alive(self, tmp_path):
+        # The spool's parent is a file, so dead-lettering raises OSError
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        engine = RecordingEngine(failures=3)
+        with _queue(engine, blocker / "dead_letter.jsonl", max_queue_size=2) as ingestion:
+            ingestion.submit_many([{'n': n} for n in range(2)])
+            assert ingestion.flush(timeout=5)
+            assert ingestion.get_metrics()['lost'] == 2
+
+            # The writer survived: later discoveries are still stored
+            ingestion.submit_many([{'n': n} for n in range(2, 6)], timeout=5)
+            assert ingestion.flush(timeout=5)
+
+        assert engine.stored == [2, 3, 4, 5]
+
+    def test_interrupted_replay_respools_remainder(self, spool):
+        spool.write_text(''.join(json.dumps({'discovery': {'n': n}, 'error': 'down'}) + '\n' for n in range(5)))
+        # A replay file left behind by an earlier interrupted replay
+        leftover = spool.with_suffix(spool.suffix + '.replay')
+        leftover.write_text(json.dumps({'discovery': {'n': 5}, 'error': 'down'}) + '\n')
+
+        engine = RecordingEngine()
+        engine.release.clear()
+        ingestion = _queue(engine, spool, batch_size=1, max_queue_size=1, flush_interval=0.01)
+        try:
+            # The stalled writer holds one discovery and the queue one more
+            with pytest.raises(queue.Full):
+                ingestion.replay_dead_letters(timeout=0.2)
+            assert not leftover.exists()
+            assert len(spool.read_text().splitlines()) == 4
+
+            engine.release.set()
+            assert ingestion.flush(timeout=5)
+            assert ingestion.replay_dead_letters(timeout=5) == 4
+            assert ingestion.flush(timeout=5)
+        finally:
+            engine.release.set()
+            ingestion.close()
+
+        assert sorted(engine.stored) == list(range(6))
+        assert not spool.exists()
+
+
+class TestBackpressure:
+    """Producers block only when the writer falls behind"""
+
+    def test_full_queue_blocks_producer(self, spool):
+        engine = RecordingEngine()
+        engine.release.clear()
+        ingestion = _queue(engine, spool, batch_size=1, max_queue_size=2, flush_interval=0.01)
+        try:
+            # One discovery held by the stalled writer, two in the queue
+            for n in range(3):
+                ingestion.submit({'n': n}, timeout=1.0)
+            with pytest.raises(queue.Full):
+                ingestion.submit({'n': 3}, timeout=0.05)
+            assert ingestion.get_metrics()['backpressure_waits'] >= 1
+        finally:
+            engine.release.set()
+            ingestion.close()
+        assert engine.stored == [0, 1, 2]
+
+    def test_flush_and_close_honour_timeout(self, spool):
+        engine = RecordingEngine()
+        engine.release.clear()
+        ingestion = _queue(engine, spool, batch_size=1, max_queue_size=2, flush_interval=0.01)
+        try:
+            for n in range(3):
+                ingestion.submit({'n': n}, timeout=1.0)
+
+            started = time.perf_counter()
+            assert not ingestion.flush(timeout=0.3)
+            assert time.perf_counter() - started < 0.5
+
+            # The queue is full and the writer stuck: close gives up at the deadline
+            started = time.perf_counter()
+            ingestion.close(timeout=0.3)
+            assert time.perf_counter() - started < 0.5
+        finally:
+            engine.release.set()
+
+    def test_submit_independent_of_database_latency(self, spool):
+        engine = RecordingEngine(latency=0.2)
+        with _queue(engine, spool, batch_size=50) as ingestion:
+            submit_start = time.perf_counter()
+            ingestion.submit_many([{'n': n} for n in range(100)])
+            assert time.perf_counter() - submit_start < 0.2
+        assert engine.stored == list(range(100))
@@ -0,0 +1,427 @@
+"""
+Test Suite for Scout Source Polling
+
+Serves PubMed, arXiv, ChemRxiv and Zenodo fixtures from a local HTTP server
+and open:// datasets from a temporary directory:
+1. All sources are polled concurrently, each under its own timeout
+2. Conditional requests replay ETags, so unchanged feeds cost a 304
+3. Polling intervals are honoured through the persisted state store
+4. Signals seen in earlier cycles, or after a restart, are not repeated
+5. The KG delta monitor pages past a persisted (created, id) high-water mark
+6. On Neo4j the watermark is compared against the temporal created property
+7. A failed poll commits no validators, watermarks or poll time
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("requests")
+
+from agents.scout.sources import (KnowledgeGraphDeltaMonitor, LiteratureStreamMonitor, Signal, SourceRegistry,
+                                  SourceStateStore)
+
+ESEARCH = {'esearchresult': {'idlist': ['101', '102']}}
+ESUMMARY = {'result': {
+    'uids': ['101', '102'],
+    '101': {'title': 'PFAS removal by activated carbon', 'source': 'Water Res', 'sortpubdate': '2026/10/01'},
+    '102': {'title': 'Soil microbiome survey', 'source': 'Ecology', 'sortpubdate': '2026/10/02'}
+}}
+ARXIV = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2610.00001v1</id>
+    <title>Defluorination of PFAS with
+      electrochemical adsorption</title>
+    <summary>Adsorption study.</summary>
+    <published>2026-10-05T00:00:00Z</published>
+  </entry>
+</feed>"""
+ZENODO = {'hits': {'hits': [
+    {'id': 7, 'updated': '2026-10-03T00:00:00', 'metadata': {'title': 'PFAS field data'},
+     'files': [{'key': 'samples.csv'}, {'key': 'readme.pdf'}]},
+    {'id': 8, 'updated': '2026-10-04T00:00:00', 'metadata': {'title': 'Figures only'},
+     'files': [{'key': 'plot.png'}]}
+]}}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.server.requests.append((url.path, parse_qs(url.query), self.headers.get('If-None-Match')))
+
+        if url.path == '/slow':
+            time.sleep(1.5)
+            body, content_type = json.dumps({'itemHits': []}), 'application/json'
+        elif url.path == '/pubmed/esearch.fcgi':
+            body, content_type = json.dumps(ESEARCH), 'application/json'
+        elif url.path == '/pubmed/esummary.fcgi':
+            body, content_type = json.dumps(ESUMMARY), 'application/json'
+        elif url.path == '/arxiv':
+            body, content_type = ARXIV, 'application/atom+xml'
+        elif url.path == '/zenodo':
+            body, content_type = json.dumps(ZENODO), 'application/json'
+        elif url.path == '/malformed':
+            body, content_type = '{"itemHits": [', 'application/json'
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        etag = f'"{hash(body) & 0xffffffff:x}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _sources(server, tmp_path, **overrides):
+    open_root = tmp_path / "open"
+    (open_root / "pfas-bench").mkdir(parents=True, exist_ok=True)
+    (open_root / "pfas-bench" / "isotherms.csv").write_text("material,qmax\nGAC,120\n")
+    (open_root / "pfas-bench" / "notes.txt").write_text("ignored")
+
+    literature = {
+        'type': 'literature-stream',
+        'keywords': ['PFAS removal', 'adsorption'],
+        'sources': ['pubmed', 'arxiv'],
+        'min_relevance': 0.8,
+        'endpoints': {'pubmed': f"{server.base}/pubmed", 'arxiv': f"{server.base}/arxiv"}
+    }
+    datasets = {
+        'type': 'dataset-watch',
+        'uris': ['zenodo://pfas-remediation', 'open://pfas-bench'],
+        'file_patterns': ['*.csv'],
+        'open_root': str(open_root),
+        'endpoints': {'zenodo': f"{server.base}/zenodo"}
+    }
+    literature.update(overrides.get('literature', {}))
+    datasets.update(overrides.get('datasets', {}))
+    return [literature, datasets]
+
+
+class TestSourceRegistry:
+    """Concurrent polling against local fixtures"""
+
+    def test_signals_from_every_source(self, server, tmp_path):
+        registry = SourceRegistry(state_path=str(tmp_path / "state.json"))
+        signals = registry.poll(_sources(server, tmp_path))
+
+        ids = {signal.source_id for signal in signals}
+        # The off-topic PubMed paper falls below min_relevance
+        assert ids == {'pubmed_101', 'arxiv_2610.00001v1', 'dataset_zenodo_7', 'dataset_pfas-bench/isotherms.csv'}
+        arxiv = next(signal for signal in signals if signal.source_id.startswith('arxiv'))
+        assert arxiv.content['title'] == 'Defluorination of PFAS with electrochemical adsorption'
+        # Datasets are high priority and sort first
+        assert signals[0].signal_type == 'new_dataset'
+
+    def test_conditional_requests_and_dedupe(self, server, tmp_path):
+        registry = SourceRegistry(state_path=str(tmp_path / "state.json"))
+        sources = _sources(server, tmp_path)
+        assert len(registry.poll(sources)) == 4
+
+        server.requests.clear()
+        assert registry.poll(sources) == []
+        # Every repeat request carried the ETag from the first response
+        assert server.requests and all(etag for _, _, etag in server.requests)
+
+        # A restarted registry reloads validators and seen hashes from disk
+        restarted = SourceRegistry(state_path=str(tmp_path / "state.json"))
+        assert restarted.poll(sources) == []
+
+        (tmp_path / "open" / "pfas-bench" / "breakthrough.csv").write_text("cycles\n120\n")
+        assert [signal.source_id for signal in restarted.poll(sources)] == ['dataset_pfas-bench/breakthrough.csv']
+
+    def test_polling_interval_honoured(self, server, tmp_path):
+        sources = _sources(server, tmp_path, literature={'polling_interval': 3600})
+        registry = SourceRegistry(state_path=str(tmp_path / "state.json"))
+        registry.poll(sources)
+
+        server.requests.clear()
+        SourceRegistry(state_path=str(tmp_path / "state.json")).poll(sources)
+        paths = {path for path, _, _ in server.requests}
+        assert paths == {'/zenodo'}
+
+    def test_sources_polled_concurrently_with_timeouts(self, server, tmp_path):
+        slow = {'type': 'literature-stream', 'keywords': ['PFAS'], 'sources': ['chemrxiv'],
+                'timeout': 0.3, 'endpoints': {'chemrxiv': f"{server.base}/slow"}}
+        slow_twin = dict(slow, name='slow-twin')
+        registry = SourceRegistry(state_path=None)
+
+        started = time.time()
+        signals = registry.poll([slow, slow_twin] + _sources(server, tmp_path))
+        elapsed = time.time() - started
+
+        assert len(signals) == 4
+        # Two slow sources timed out in parallel rather than back to back
+        assert elapsed < 1.2
+        # A timed-out source is retried rather than marked as polled
+        assert registry.state.is_due('slow-twin', 3600)
+
+    def test_failed_poll_not_committed(self, server, tmp_path):
+        broken = {'name': 'broken', 'type': 'literature-stream', 'keywords': ['PFAS'], 'min_relevance': 0.0,
+                  'sources': ['arxiv', 'chemrxiv'], 'polling_interval': 3600,
+                  'endpoints': {'arxiv': f"{server.base}/arxiv", 'chemrxiv': f"{server.base}/malformed"}}
+        registry = SourceRegistry(state_path=str(tmp_path / "state.json"))
+        registry.poll([broken])
+
+        # The ChemRxiv body failed to parse after arXiv was read: nothing of the poll is kept
+        assert registry.state.is_due('broken', 3600)
+        assert registry.state.get('broken') == {}
+
+        server.requests.clear()
+        registry.poll([broken])
+        assert {path for path, _, _ in server.requests} == {'/arxiv', '/malformed'}
+        assert not any(etag for _, _, etag in server.requests)
+
+    def test_validators_staged_until_committed(self, server):
+        monitor = LiteratureStreamMonitor({'endpoints': {'arxiv': f"{server.base}/arxiv"}})
+        assert monitor.fetch(monitor.endpoint('arxiv')) is not None
+        assert 'validators' not in monitor.state
+
+        monitor.commit_validators()
+        assert monitor.fetch(monitor.endpoint('arxiv')) is None
+        assert server.requests[-1][2]
+
+
+class TestSourceStateStore:
+    def test_hash_cap_forgets_oldest(self, tmp_path):
+        store = SourceStateStore(str(tmp_path / "state.json"), max_hashes=2)
+        signals = [Signal('dataset', str(n), 'new_dataset', {'n': n}, datetime.now(), 0.5, {}, 'high')
+                   for n in range(3)]
+        assert len(store.filter_new(signals)) == 3
+        assert len(store.seen) == 2
+        store.save()
+
+        reloaded = SourceStateStore(str(tmp_path / "state.json"), max_hashes=2)
+        assert reloaded.filter_new(signals[1:]) == []
+        assert len(reloaded.filter_new(signals[:1])) == 1
+
+    def test_concurrent_saves(self, tmp_path):
+        store = SourceStateStore(str(tmp_path / "state.json"))
+        errors = []
+
+        def poller(name):
+            try:
+                for n in range(50):
+                    store.update(name, {'last_poll': n})
+                    store.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=poller, args=(f"source-{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in tmp_path.iterdir()] == ['state.json']
+        reloaded = SourceStateStore(str(tmp_path / "state.json"))
+        assert all(reloaded.get(f"source-{n}")['last_poll'] == 49 for n in range(4))
+
+
+@pytest.fixture
+def akg_config(tmp_path):
+    return {'backend': 'embedded', 'embedded_path': str(tmp_path / "akg.sqlite"),
+            'graphdb': {'uri': 'http://localhost:1', 'repository': 'unused'},
+            'fuseki': {'uri': 'http://localhost:1', 'dataset': 'unused'}}
+
+
+def _add_molecules(akg, rows):
+    with akg.store.transaction() as conn:
+        conn.executemany("INSERT INTO molecules VALUES (?, ?, ?, ?)", rows)
+
+
+def _temporal(value):
+    """Cypher datetime(): zone-less strings are read as UTC"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class ChangeFeedSession:
+    """Session stand-in evaluating the change-feed query with Neo4j temporal semantics"""
+
+    def __init__(self, driver: "ChangeFeedDriver"):
+        self.driver = driver
+
+    def run(self, query: str, **params):
+        self.driver.queries.append(query)
+        rows = sorted(self.driver.nodes.get(query.split(':', 1)[1].split(')', 1)[0], []),
+                      key=lambda node: (node['created'], node['id']))
+        # created holds DateTime values: compared with a bare string the predicate is null
+        if 'datetime($cursor_created)' not in query:
+            return []
+
+        position = (_temporal(params['cursor_created']), params['cursor_id'])
+        rows = [node for node in rows if (node['created'], node['id']) > position]
+        as_string = 'toString(n.created)' in query
+        return [dict(node, created=node['created'].isoformat() if as_string else node['created'])
+                for node in rows[:params['page_size']]]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class ChangeFeedDriver:
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.queries = []
+
+    def session(self, **kwargs) -> ChangeFeedSession:
+        return ChangeFeedSession(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def non_utc_host():
+    """Run with a local time zone nine hours ahead of UTC"""
+    previous = os.environ.get('TZ')
+    os.environ['TZ'] = 'Asia/Tokyo'
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = previous
+    time.tzset()
+
+
+def _neo4j_akg(nodes):
+    from akg.client import AKG
+
+    akg = AKG({'backend': 'neo4j',
+               'neo4j': {'uri': 'bolt://localhost:1', 'user': 'neo4j', 'password': 'unused'},
+               'graphdb': {'uri': 'http://localhost:1', 'repository': 'unused'},
+               'fuseki': {'uri': 'http://localhost:1', 'dataset': 'unused'}})
+    if akg.neo4j_driver:
+        akg.neo4j_driver.close()
+    akg.neo4j_driver = ChangeFeedDriver(nodes)
+    akg.store = None
+    return akg
+
+
+class TestKnowledgeGraphDeltaMonitor:
+    """Change-feed polling against the embedded AKG store"""
+
+    def test_pages_past_high_water_mark(self, akg_config):
+        from akg.client import AKG
+
+        akg = AKG(akg_config)
+        now = datetime.now()
+        # Three rows share a timestamp; the id breaks the tie
+        created = [(now - timedelta(minutes=m)).isoformat() for m in (30, 20, 20, 20, 10)]
+        _add_molecules(akg, [(f"m{n}", "C" * (n + 1), None, ts) for n, ts in enumerate(created)])
+        _add_molecules(akg, [("old", "O", None, (now - timedelta(days=2)).isoformat())])
+
+        monitor = KnowledgeGraphDeltaMonitor({'page_size': 2, 'max_pages_per_poll': 2}, akg=akg)
+        first = monitor.poll()
+        assert [signal.source_id for signal in first] == ['molecule_m0', 'molecule_m1', 'molecule_m2', 'molecule_m3']
+        assert monitor.state['watermarks']['molecule'] == {'created': created[3], 'id': 'm3'}
+
+        # The backlog resumes at the tie, then nothing is emitted twice
+        assert [signal.source_id for signal in monitor.poll()] == ['molecule_m4']
+        assert monitor.poll() == []
+
+        # A row committed later with the watermark's timestamp still sorts after it
+        _add_molecules(akg, [("m5", "N", None, created[4])])
+        assert [signal.source_id for signal in monitor.poll()] == ['molecule_m5']
+
+        plan = " ".join(str(row) for row in akg.store.query(
+            "EXPLAIN QUERY PLAN SELECT * FROM molecules WHERE (created, id) > (?, ?) ORDER BY created, id LIMIT 2",
+            (created[0], 'm0')))
+        assert 'molecules_created_id' in plan
+        akg.close()
+
+    def test_watermark_persists_across_registries(self, akg_config, tmp_path):
+        from akg.client import AKG
+
+        akg = AKG(akg_config)
+        _add_molecules(akg, [("m0", "C", None, datetime.now().isoformat())])
+        with akg.store.transaction() as conn:
+            conn.execute("INSERT INTO measurements VALUES ('x0', 'logP', 1.2, 0.1, ?)", (datetime.now().isoformat(),))
+        akg.close()
+
+        sources = [{'type': 'kg-delta', 'name': 'akg', 'akg': akg_config}]
+        signals = SourceRegistry(state_path=str(tmp_path / "state.json")).poll(sources)
+        assert [signal.source_id for signal in signals] == ['measurement_x0', 'molecule_m0']
+
+        state = SourceStateStore(str(tmp_path / "state.json")).get('akg')
+        assert state['watermarks']['measurement']['id'] == 'x0'
+        assert SourceRegistry(state_path=str(tmp_path / "state.json")).poll(sources) == []
+
+    def test_neo4j_feed_compares_temporal_created(self):
+        pytest.importorskip("neo4j")
+        now = datetime.now(timezone.utc)
+        created = [now - timedelta(minutes=m) for m in (30, 20, 20, 10)]
+        akg = _neo4j_akg({'FoTChem_Molecule': [
+            {'id': f"m{n}", 'smiles': 'C', 'inchi': None, 'created': ts} for n, ts in enumerate(created)
+        ]})
+
+        monitor = KnowledgeGraphDeltaMonitor({'page_size': 2, 'initial_lookback_hours': 24}, akg=akg)
+        assert [signal.source_id for signal in monitor.poll()] == ['molecule_m0', 'molecule_m1', 'molecule_m2', 'molecule_m3']
+        # The persisted watermark is the ISO form of the temporal value
+        assert monitor.state['watermarks']['molecule'] == {'created': created[3].isoformat(), 'id': 'm3'}
+
+        akg.neo4j_driver.nodes['FoTChem_Molecule'].append({'id': 'm4', 'smiles': 'N', 'inchi': None, 'created': now})
+        assert [signal.source_id for signal in monitor.poll()] == ['molecule_m4']
+        assert monitor.poll() == []
+
+    def test_initial_lookback_is_zone_independent(self, non_utc_host, akg_config):
+        pytest.importorskip("neo4j")
+        from akg.client import AKG
+
+        # Neo4j keeps zoned timestamps
+        now = datetime.now(timezone.utc)
+        akg = _neo4j_akg({'FoTChem_Molecule': [
+            {'id': 'old', 'smiles': 'C', 'inchi': None, 'created': now - timedelta(minutes=40)},
+            {'id': 'new', 'smiles': 'C', 'inchi': None, 'created': now - timedelta(minutes=20)}
+        ]})
+        monitor = KnowledgeGraphDeltaMonitor({'initial_lookback_hours': 0.5}, akg=akg)
+        assert [signal.source_id for signal in monitor.poll()] == ['molecule_new']
+
+        # The embedded store keeps naive local timestamps
+        embedded = AKG(akg_config)
+        local_now = datetime.now()
+        _add_molecules(embedded, [("old", "C", None, (local_now - timedelta(minutes=40)).isoformat()),
+                                  ("new", "C", None, (local_now - timedelta(minutes=20)).isoformat())])
+        monitor = KnowledgeGraphDeltaMonitor({'initial_lookback_hours': 0.5}, akg=embedded)
+        assert [signal.source_id for signal in monitor.poll()] == ['molecule_new']
+        embedded.close()
@@ -0,0 +1,170 @@
+"""
+Test Suite for the k-mer MinHash LSH Sequence Similarity Index
+
+Validates SequenceLSHIndex against exact k-mer Jaccard similarity:
+1. Near-duplicate sequences are found, unrelated sequences are not
+2. Recall of the LSH lookup against a brute-force Jaccard scan
+3. Within-batch neighbors are reported once per pair
+4. Incremental additions and persistence round trips
+5. Concurrent autosaves never clobber each other's files
+"""
+
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sequence_similarity_index import SequenceLSHIndex
+
+AMINO_ACIDS = np.array(list('ACDEFGHIKLMNPQRSTVWY'))
+
+
+def _random_sequences(rng, count, length=60):
+    return [''.join(rng.choice(AMINO_ACIDS, length)) for _ in range(count)]
+
+
+def _mutate(rng, sequence, n_mutations):
+    residues = list(sequence)
+    for position in rng.choice(len(residues), n_mutations, replace=False):
+        residues[position] = rng.choice(AMINO_ACIDS)
+    return ''.join(residues)
+
+
+def _kmer_jaccard(seq1, seq2, k=3):
+    kmers1 = {seq1[i:i + k] for i in range(len(seq1) - k + 1)}
+    kmers2 = {seq2[i:i + k] for i in range(len(seq2) - k + 1)}
+    return len(kmers1 & kmers2) / len(kmers1 | kmers2)
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(7)
+    sequences = _random_sequences(rng, 2000)
+    index = SequenceLSHIndex()
+    index.add_sequences([f'seq-{i}' for i in range(len(sequences))], sequences)
+    return index, sequences, rng
+
+
+class TestNearNeighborLookup:
+    """LSH candidates must be true near neighbors under k-mer Jaccard"""
+
+    def test_near_duplicate_found_unrelated_ignored(self, corpus):
+        index, sequences, rng = corpus
+        query = _mutate(rng, sequences[10], 2)
+        pairs = index.find_neighbors(['query'], index.compute_signatures([query]))
+
+        assert [(query_id, other_id) for query_id, other_id, _ in pairs] == [('query', 'seq-10')]
+        assert pairs[0][2] == pytest.approx(_kmer_jaccard(query, sequences[10]), abs=0.15)
+
+    def test_recall_against_brute_force(self, corpus):
+        index, sequences, rng = corpus
+        queries = [_mutate(rng, sequences[i], int(rng.integers(1, 4))) for i in range(100)]
+        found = {
+            (query_id, other_id)
+            for query_id, other_id, _ in index.find_neighbors(
+                [f'q-{i}' for i in range(len(queries))], index.compute_signatures(queries)
+            )
+        }
+
+        true_pairs = {
+            (f'q-{i}', f'seq-{i}') for i, query in enumerate(queries)
+            if _kmer_jaccard(query, sequences[i]) >= 0.7
+        }
+        assert len(true_pairs) > 50
+        assert len(true_pairs & found) / len(true_pairs) >= 0.95
+
+    def test_within_batch_pairs_reported_once(self):
+        index = SequenceLSHIndex()
+        rng = np.random.default_rng(3)
+        base = _random_sequences(rng, 1)[0]
+        batch = [base, _mutate(rng, base, 1), _random_sequences(rng, 1)[0]]
+        pairs = index.find_neighbors(['a', 'b', 'c'], index.compute_signatures(batch))
+        assert [(query_id, other_id) for query_id, other_id, _ in pairs] == [('a', 'b')]
+
+    def test_max_neighbors_caps_results(self):
+        index = SequenceLSHIndex(max_neighbors=5)
+        sequence = 'MKTAYIAKQRQISFVKSHFSRQLEERLGLIEVQAPILSRVGDGTQDNLSGAEKAVQVKVKALPDAQ'
+        index.add_sequences([f'dup-{i}' for i in range(20)], [sequence] * 20)
+        pairs = index.find_neighbors(['query'], index.compute_signatures([sequence]))
+        assert len(pairs) == 5
+        assert all(similarity == 1.0 for _, _, similarity in pairs)
+
+
+class TestIncrementalPersistence:
+    """Index grows incrementally and survives a save/load round trip"""
+
+    def test_incremental_add(self, corpus):
+        index, sequences, rng = corpus
+        new_sequence = _random_sequences(rng, 1)[0]
+        signature = index.compute_signatures([new_sequence])
+        assert index.find_neighbors(['probe'], signature) == []
+
+        index.add(['new'], signature)
+        assert len(index) == len(sequences) + 1
+        assert [other for _, other, _ in index.find_neighbors(['probe'], signature)] == ['new']
+
+    def test_save_load_round_trip(self, corpus, tmp_path):
+        index, sequences, rng = corpus
+        path = tmp_path / 'index.npz'
+        index.save(str(path))
+
+        restored, loaded = SequenceLSHIndex.load_or_create(str(path))
+        assert loaded and len(restored) == len(index)
+        query = index.compute_signatures([_mutate(rng, sequences[42], 1)])
+        assert restored.find_neighbors(['q'], query) == index.find_neighbors(['q'], query)
+
+    def test_mismatched_parameters_start_fresh(self, corpus, tmp_path):
+        index, _, _ = corpus
+        path = tmp_path / 'index.npz'
+        index.save(str(path))
+
+        restored, loaded = SequenceLSHIndex.load_or_create(str(path), num_perm=128, bands=32)
+        assert not loaded and len(restored) == 0
+
+    def test_autosave(self, tmp_path):
+        path = tmp_path / 'index.npz'
+        index = SequenceLSHIndex(path=str(path), autosave_every=3)
+        index.add_sequences(['a', 'b'], ['ACDEFGHIK', 'LMNPQRSTV'])
+        assert not path.exists()
+        index.add_sequences(['c'], ['WYACDEFGH'])
+        assert path.exists()
+
+    def test_load_does_not_autosave(self, tmp_path):
+        path = tmp_path / 'index.npz'
+        index = SequenceLSHIndex(path=str(path))
+        index.add_sequences(['a', 'b', 'c'], ['ACDEFGHIK', 'LMNPQRSTV', 'WYACDEFGH'])
+        index.save()
+        saved = path.stat().st_mtime_ns
+
+        restored, loaded = SequenceLSHIndex.load_or_create(str(path), autosave_every=2)
+        assert loaded and len(restored) == 3
+        assert path.stat().st_mtime_ns == saved
+        assert restored.indexed_ids() == {'a', 'b', 'c'}
+
+    def test_concurrent_saves(self, tmp_path):
+        path = tmp_path / 'index.npz'
+        index = SequenceLSHIndex(path=str(path), autosave_every=1)
+        errors = []
+
+        def writer(prefix):
+            try:
+                for n in range(20):
+                    index.add_sequences([f"{prefix}{n}"], ['ACDEFGHIKLMNPQRSTVWY'[n:] + 'ACDEF'])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(prefix,)) for prefix in 'abcd']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        # The last save holds every sequence and no temporary files are left behind
+        restored, loaded = SequenceLSHIndex.load_or_create(str(path))
+        assert loaded and len(restored) == 80
+        assert [p.name for p in tmp_path.iterdir()] == ['index.npz']
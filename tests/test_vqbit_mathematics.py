@@ -0,0 +1,218 @@
+"""
+Test Suite for vQbit Protein Folding Mathematics
+
+Validates ProteinVQbitGraph against the original dense formulations:
+1. Eigenbasis entanglement evolution against exp(-i(-L ⊗ I₈)dt)
+2. Sparse Laplacian evolution for long sequences
+3. Array-backed residue state against the per-residue loops
+4. Batched ensemble collapse against the collapsed-state equations and
+   the single-conformation virtue_guided_collapse
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("networkx")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fot.vqbit_mathematics import VIRTUE_NAMES, ProteinVQbitGraph
+
+AB42_SEQUENCE = "DAEFRHDSGYEVHHQKLVFFAEDVGSNKGAIIGLMVGGVVIA"
+
+
+def _dense_reference_evolution(graph: ProteinVQbitGraph, time_step: float) -> torch.Tensor:
+    """Original 8N×8N Kronecker-product evolution"""
+    system_state = graph.amplitudes.to(torch.complex128).reshape(-1)
+    identity_8 = torch.eye(8, dtype=torch.complex128)
+    hamiltonian = -1.0 * torch.kron(graph.laplacian_matrix.to(torch.complex128), identity_8)
+    evolved = torch.matrix_exp(-1j * hamiltonian * time_step) @ system_state
+    return evolved.view(graph.n_residues, 8)
+
+
+def _reference_coherence(amplitudes: torch.Tensor) -> float:
+    """Original pairwise L1-norm coherence of one vQbit"""
+    coherence = 0.0
+    for i in range(len(amplitudes)):
+        for j in range(i + 1, len(amplitudes)):
+            coherence += torch.abs(amplitudes[i] * torch.conj(amplitudes[j])).item()
+    max_coherence = len(amplitudes) * (len(amplitudes) - 1) / 2
+    return min(1.0, coherence / max_coherence)
+
+
+@pytest.fixture
+def graph():
+    torch.manual_seed(0)
+    vqbit_graph = ProteinVQbitGraph(AB42_SEQUENCE)
+    vqbit_graph.initialize_from_sequence(use_biophysical_priors=True)
+    return vqbit_graph
+
+
+class TestEntangledEvolution:
+    """Eigenbasis and sparse evolution must match the dense Kronecker propagator"""
+
+    def test_eigenbasis_matches_dense_propagator(self, graph):
+        expected = _dense_reference_evolution(graph, 0.1)
+        graph.evolve_entangled_states(time_step=0.1)
+        np.testing.assert_allclose(graph.amplitudes.numpy(), expected.numpy(), atol=1e-5)
+
+    def test_eigensystem_is_cached(self, graph):
+        graph.evolve_entangled_states(time_step=0.05)
+        eigenvecs = graph._laplacian_eigenvectors
+        graph.evolve_entangled_states(time_step=0.05)
+        assert graph._laplacian_eigenvectors is eigenvecs
+
+        graph.laplacian_matrix = graph.laplacian_matrix.clone()
+        graph.evolve_entangled_states(time_step=0.05)
+        assert graph._laplacian_eigenvectors is not eigenvecs
+
+    def test_evolution_preserves_norm(self, graph):
+        before = torch.linalg.norm(graph.amplitudes)
+        for _ in range(5):
+            graph.evolve_entangled_states(time_step=0.1)
+        assert torch.linalg.norm(graph.amplitudes).item() == pytest.approx(before.item(), rel=1e-5)
+
+    def test_sparse_path_matches_eigenbasis(self, graph):
+        expected = _dense_reference_evolution(graph, 0.1)
+        graph.sparse_evolution_threshold = 0
+        graph.evolve_entangled_states(time_step=0.1)
+        assert graph._laplacian_eigenvectors is None
+        np.testing.assert_allclose(graph.amplitudes.numpy(), expected.numpy(), atol=1e-5)
+
+
+class TestTensorizedState:
+    """Batched residue operators must reproduce the original per-residue loops"""
+
+    def test_vqbit_states_view(self, graph):
+        states = graph.vqbit_states
+        assert len(states) == graph.n_residues
+        for i in (0, 10, graph.n_residues - 1):
+            assert set(states[i].entanglement_map) == set(graph.akg.neighbors(i))
+            assert set(states[i].virtue_scores) == set(VIRTUE_NAMES)
+            assert torch.equal(states[i].amplitudes, graph.amplitudes[i])
+            neighbor = next(iter(graph.akg.neighbors(i)))
+            assert torch.equal(states[i].entanglement_map[neighbor], graph.get_entanglement(i, neighbor))
+        assert graph.entanglement_tensors.shape == (2 * graph.akg.number_of_edges(), 8, 8)
+
+    def test_virtue_constraints_match_loop(self, graph):
+        virtue_op = graph.virtue_operators['Justice']
+        expected_amplitudes, expected_scores = [], []
+        for amplitudes in graph.amplitudes:
+            projected = virtue_op.projector @ amplitudes.view(8, 1)
+            norm = torch.sqrt(torch.sum(torch.conj(projected) * projected).real)
+            if norm > 1e-10:
+                projected = projected / norm
+                amplitudes = projected.view(8)
+            expected_amplitudes.append(amplitudes)
+            expected_scores.append(torch.real(
+                torch.conj(projected).T @ virtue_op.constraint_matrix.sum(dim=0) @ projected
+            ).item())
+
+        graph.apply_virtue_constraints('Justice')
+        np.testing.assert_allclose(graph.amplitudes.numpy(), torch.stack(expected_amplitudes).numpy(), atol=1e-6)
+        np.testing.assert_allclose(graph.virtue_score_matrix[:, 0].numpy(), expected_scores, rtol=1e-5)
+        assert graph.vqbit_states[3].virtue_scores['Justice'] == pytest.approx(expected_scores[3], rel=1e-5)
+
+    def test_diffusion_matches_loop(self, graph):
+        average = graph.amplitudes.mean(dim=0)
+        expected = 2 * average - graph.amplitudes
+        expected = expected / torch.linalg.vector_norm(expected, dim=1, keepdim=True)
+        graph._apply_diffusion_operator()
+        np.testing.assert_allclose(graph.amplitudes.numpy(), expected.numpy(), atol=1e-6)
+
+    def test_high_virtue_count_and_oracle(self, graph):
+        graph.virtue_score_matrix[5] = 0.9
+        graph.virtue_score_matrix[7] = 0.95
+        before = graph.amplitudes.clone()
+        assert graph._count_high_virtue_residues(0.8) == [5, 7]
+
+        graph._apply_virtue_oracle(0.8)
+        assert torch.equal(graph.amplitudes[5], -before[5])
+        assert torch.equal(graph.amplitudes[0], before[0])
+
+    def test_measure_conformation_collapses_all_residues(self, graph):
+        probabilities = (graph.amplitudes.conj() * graph.amplitudes).real.clone()
+        measured = graph.measure_conformation()
+        assert len(measured) == graph.n_residues
+
+        indices = graph.amplitudes.abs().argmax(dim=1)
+        assert torch.equal(graph.amplitudes.abs().sum(dim=1), torch.ones(graph.n_residues))
+        for i in (0, 20):
+            assert measured[i]['residue_type'] == AB42_SEQUENCE[i]
+            assert measured[i]['probability'] == pytest.approx(probabilities[i, indices[i]].item())
+
+    def test_fot_equation_matches_loop(self, graph):
+        graph.apply_virtue_constraints('Temperance')
+        virtue_sum, coherence_sum = 0.0, 0.0
+        for vqbit in graph.vqbit_states.values():
+            coherence = _reference_coherence(vqbit.amplitudes)
+            coherence_sum += coherence
+            overall_virtue = np.mean(list(vqbit.virtue_scores.values()))
+            amplitude_factor = min(1.0, torch.sum((vqbit.amplitudes.conj() * vqbit.amplitudes).real).item())
+            virtue_sum += amplitude_factor * overall_virtue * (0.5 + 0.5 * coherence)
+        coherence_factor = 0.7 + 0.3 * coherence_sum / graph.n_residues
+        expected = graph._calculate_graph_factor() * coherence_factor * virtue_sum
+
+        assert graph.calculate_fot_equation() == pytest.approx(expected, rel=1e-5)
+
+
+class TestBatchedCollapse:
+    """Batched ensemble collapse must agree with the per-conformation equations"""
+
+    def test_ensemble_shapes_and_dtype(self, graph):
+        ensemble = graph.collapse_ensemble(n_conformations=200, collapse_rounds=2)
+        assert len(ensemble) == 200
+        assert ensemble.indices.shape == (200, graph.n_residues)
+        assert ensemble.indices.dtype == torch.int8
+        assert ensemble.final_fot_values.shape == (200,)
+        assert int(ensemble.indices.min()) >= 0 and int(ensemble.indices.max()) < 8
+
+    def test_scores_match_collapsed_state(self, graph):
+        ensemble = graph.collapse_ensemble(n_conformations=4)
+        k = 2
+        indices = ensemble.indices[k].long()
+
+        expected_log_probability = torch.log(ensemble.probabilities[torch.arange(graph.n_residues), indices]).sum()
+        assert ensemble.log_probabilities[k].item() == pytest.approx(expected_log_probability.item(), rel=1e-5)
+
+        # Collapse the graph onto conformation k and evaluate the FoT equation directly
+        graph.amplitudes = torch.nn.functional.one_hot(indices, 8).to(torch.complex64)
+        assert graph.calculate_fot_equation() == pytest.approx(ensemble.final_fot_values[k].item(), rel=1e-5)
+        assert ensemble.average_virtue_scores[k].item() == pytest.approx(graph.virtue_score_matrix.mean().item())
+
+    def test_single_conformation_matches_virtue_guided_collapse(self):
+        results = []
+        for batched in (False, True):
+            torch.manual_seed(0)
+            vqbit_graph = ProteinVQbitGraph(AB42_SEQUENCE)
+            vqbit_graph.initialize_from_sequence(use_biophysical_priors=True)
+            results.append(vqbit_graph.virtue_guided_collapse(target_conformations=1, collapse_rounds=2,
+                                                              batched=batched)[0])
+
+        legacy, batched = results
+        for key in ('initial_fot_value', 'final_fot_value', 'collapse_quality', 'average_virtue_score'):
+            assert batched[key] == pytest.approx(legacy[key], rel=1e-5)
+        flatten = lambda conformation: [score for c in conformation['coordinates'] for score in c['virtue_scores'].values()]
+        assert flatten(batched) == pytest.approx(flatten(legacy))
+
+    def test_dict_view_on_demand(self, graph):
+        ensemble = graph.collapse_ensemble(n_conformations=10)
+        conformations = ensemble.to_conformations(top_k=3)
+        assert len(conformations) == 3
+        qualities = [conf['collapse_quality'] for conf in conformations]
+        assert qualities == sorted(qualities, reverse=True)
+
+        best = conformations[0]
+        assert best['total_residues'] == graph.n_residues
+        coordinate = best['coordinates'][0]
+        assert coordinate['amino_acid'] == AB42_SEQUENCE[0]
+        assert set(coordinate['virtue_scores']) == set(VIRTUE_NAMES)
+
+    def test_virtue_guided_collapse_batched_mode(self, graph):
+        conformations = graph.virtue_guided_collapse(target_conformations=5, batched=True)
+        assert len(conformations) == 5
+        assert {'conformation_id', 'coordinates', 'final_fot_value', 'collapse_quality'} <= set(conformations[0])